@@ -0,0 +1,585 @@
+# Classification (U)
+
+"""Program:  binlog_apply.py
+
+    Description:  Parallel applier of mysql_log_admin.py (-a, -k).
+        Dispatches the transactions to a number of mysql client sessions by
+        their logical clock and keeps the restore checkpoint.
+
+    Usage:
+        import binlog_apply
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import subprocess
+import re
+import time
+import collections
+import threading
+import json
+import queue
+
+# Local
+try:
+    from . import binlog_filter
+    from . import binlog_tee
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import binlog_filter
+    import binlog_tee
+    import version
+
+__version__ = version.__version__
+
+# Parallel applier (-a): the logical clock of the GTID events, the marker
+#   each session returns when a transaction is committed, the mysql client
+#   options of a session and the transactions queued on a session.
+APPLY_CLOCK = re.compile(rb"last_committed=(\d+)\s+sequence_number=(\d+)")
+APPLY_MARK = b"mla:"
+APPLY_OPTS = ["--batch", "--skip-column-names", "--unbuffered"]
+APPLY_DEPTH = 64
+
+# Restore checkpoint (-k): end position and rotation of an event and the
+#   least number of seconds between checkpoint writes.
+APPLY_POS = re.compile(rb"\send_log_pos\s+(\d+)")
+APPLY_ROTATE = re.compile(rb"\tRotate to (\S+)\s+pos: (\d+)$", re.M)
+CHECKPOINT_SECS = 1.0
+
+# Fast restore profile (-q): session settings written before the binary logs
+#   and restored after them, the checks the binary logs turn back on and the
+#   mysql client options.
+PROFILE_START = (
+    b"SET @mla_sql_log_bin = @@session.sql_log_bin,"
+    b" @mla_unique_checks = @@session.unique_checks,"
+    b" @mla_foreign_key_checks = @@session.foreign_key_checks;\n"
+    b"SET @@session.sql_log_bin = 0, @@session.unique_checks = 0,"
+    b" @@session.foreign_key_checks = 0;\n")
+PROFILE_END = (
+    b"SET @@session.sql_log_bin = @mla_sql_log_bin,"
+    b" @@session.unique_checks = @mla_unique_checks,"
+    b" @@session.foreign_key_checks = @mla_foreign_key_checks;\n")
+PROFILE_CHECKS = re.compile(rb"(@@session\.(?:foreign_key|unique)_checks=)1")
+PROFILE_OPTS = ["--max-allowed-packet=1073741824"]
+
+
+def read_applier(idx, rfile, acks):
+
+    """Function:  read_applier
+
+    Description:  Reads the output of a mysql client session of the parallel
+        applier and queues the committed transaction numbers, then queues
+        None when the session exits.
+
+    Arguments:
+        (input) idx -> Number of the session
+        (input) rfile -> Standard out of the mysql client
+        (input) acks -> Queue of the session number and transaction number
+
+    """
+
+    with rfile:
+        for line in rfile:
+            if line.startswith(APPLY_MARK):
+                acks.put((idx, int(line[len(APPLY_MARK):])))
+
+    acks.put((idx, None))
+
+
+def wait_applier(state):
+
+    """Function:  wait_applier
+
+    Description:  Waits for the next transaction committed by a session of
+        the parallel applier.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+
+    """
+
+    idx, txn = state["acks"].get()
+
+    if txn is None:
+        raise ValueError(
+            f"mysql client session {idx + 1} exited with"
+            f" {state['procs'][idx].wait()}")
+
+    del state["outstanding"][txn]
+    state["depth"][idx] -= 1
+
+    if state["ckpt"]:
+        state["units"][txn][3] = True
+        save_checkpoint(state)
+
+
+def start_unit(state, clock=None, barrier=False):
+
+    """Function:  start_unit
+
+    Description:  Picks the mysql client sessions of the next transaction
+        and writes the session state it is missing.  A barrier waits for all
+        sessions to be idle and goes to every session.  A transaction waits
+        until the transactions at or below its last_committed are committed,
+        or are only queued on one session, which it is queued behind.  A
+        transaction without a logical clock is queued on the first session
+        behind all the transactions before it.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+        (input) clock -> Tuple of last_committed and sequence_number or None
+        (input) barrier -> True|False - Apply on every session
+
+    """
+
+    depth = state["depth"]
+
+    if barrier:
+        while state["outstanding"]:
+            wait_applier(state)
+
+        state["unit"], state["targets"] = 0, list(range(len(depth)))
+
+    else:
+        last_committed, seq = clock or (None, -1)
+
+        while True:
+            deps = {idx for idx, dep in state["outstanding"].values()
+                    if last_committed is None or dep <= last_committed}
+
+            if clock is None:
+                idx, ready = 0, deps <= {0}
+
+            elif deps:
+                idx, ready = min(deps), len(deps) == 1
+
+            else:
+                idx, ready = depth.index(min(depth)), True
+
+            if ready and depth[idx] < APPLY_DEPTH:
+                break
+
+            wait_applier(state)
+
+        state["txns"] += 1
+        state["unit"], state["targets"] = state["txns"], [idx]
+        state["outstanding"][state["txns"]] = (idx, seq)
+        depth[idx] += 1
+
+    for idx in state["targets"]:
+        session = state["sessions"][idx]
+        state["procs"][idx].stdin.write(b"".join(
+            line for key, line in state["session"].items()
+            if session.get(key) != line))
+
+
+def end_unit(state):
+
+    """Function:  end_unit
+
+    Description:  Finishes the current transaction or barrier of the
+        parallel applier.  A transaction is followed by the marker its
+        session returns once it is committed.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+
+    """
+
+    if state["unit"] is not None:
+        for idx in state["targets"]:
+            state["sessions"][idx] = dict(state["session"])
+
+            if state["unit"]:
+                state["procs"][idx].stdin.write(
+                    b"SELECT '" + APPLY_MARK + str(state["unit"]).encode()
+                    + b"'/*!*/;\n")
+
+            state["procs"][idx].stdin.flush()
+
+    state["unit"], state["targets"] = None, []
+
+
+def read_checkpoint(ckpt_file):
+
+    """Function:  read_checkpoint
+
+    Description:  Reads the restore checkpoint file.
+
+    Arguments:
+        (input) ckpt_file -> Path to the checkpoint file
+        (output) -> Dictionary of the checkpoint or None if there is none
+
+    """
+
+    if not os.path.isfile(ckpt_file):
+        return None
+
+    with open(ckpt_file, encoding="UTF-8") as fhdr:
+        return json.load(fhdr)
+
+
+def write_checkpoint(ckpt_file, data):
+
+    """Function:  write_checkpoint
+
+    Description:  Writes the restore checkpoint file to disk and then
+        replaces the old checkpoint with it, so a failure while writing
+        keeps the old checkpoint.
+
+    Arguments:
+        (input) ckpt_file -> Path to the checkpoint file
+        (input) data -> Dictionary of the checkpoint
+
+    """
+
+    tmp_file = ckpt_file + ".tmp"
+
+    with open(tmp_file, "w", encoding="UTF-8") as fhdr:
+        json.dump(data, fhdr)
+        fhdr.flush()
+        os.fsync(fhdr.fileno())
+
+    os.replace(tmp_file, ckpt_file)
+
+
+def save_checkpoint(state, force=False):
+
+    """Function:  save_checkpoint
+
+    Description:  Moves the restore checkpoint past the transactions that
+        are committed in binary log order, and writes it at most once every
+        CHECKPOINT_SECS seconds.  The transactions committed past the
+        checkpoint are kept in it, so they are not applied again.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+        (input) force -> True|False - Write the checkpoint now
+
+    """
+
+    ckpt, units = state["ckpt"], state["units"]
+
+    while units and next(iter(units.values()))[3]:
+        ckpt["binlog"], _, ckpt["pos"], _ = units.popitem(last=False)[1]
+
+    if ckpt["binlog"] and (
+            force or time.time() - ckpt["time"] >= CHECKPOINT_SECS):
+        write_checkpoint(ckpt["path"], {
+            "binlog": ckpt["binlog"], "pos": ckpt["pos"],
+            "applied": [[binlog, start] for binlog, start, _, done
+                        in units.values() if done]})
+        ckpt["time"] = time.time()
+
+
+def track_unit(state, start, lines):
+
+    """Function:  track_unit
+
+    Description:  Keeps the binary log and the start and end positions of
+        the current transaction for the restore checkpoint.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+        (input) start -> Position of the event
+        (input) lines -> List of the event lines
+
+    """
+
+    unit = state["unit"]
+    header = b"".join(lines[:2])
+
+    if unit not in (None, 0) and unit not in state["units"]:
+        state["units"][unit] = [state["binlog"], start, start, unit < 0]
+
+    match = APPLY_POS.search(header)
+
+    if match and unit in state["units"]:
+        state["units"][unit][2] = int(match.group(1))
+
+    match = APPLY_ROTATE.search(header)
+
+    if match:
+        state["binlog"] = match.group(1).decode("utf-8")
+
+        if unit in state["units"]:
+            state["units"][unit][0] = state["binlog"]
+            state["units"][unit][2] = int(match.group(2))
+
+
+def close_unit(state, kind, lines):
+
+    """Function:  close_unit
+
+    Description:  Tracks the end of a transaction of the parallel applier
+        that has no GTID event.  An Xid or XA_prepare event and a COMMIT or
+        ROLLBACK statement end it, and a statement outside BEGIN or XA START
+        is a transaction of its own.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+        (input) kind -> Event type
+        (input) lines -> List of the event lines
+
+    """
+
+    if kind in (b"Xid", b"XA_prepare"):
+        state["closed"] = True
+
+    elif kind == b"Query":
+        stmt = binlog_filter.query_stmt(lines).upper()
+
+        if stmt == b"BEGIN" or stmt.startswith(binlog_filter.CATALOG_XA_START):
+            state["in_txn"] = True
+
+        elif stmt in binlog_filter.FILTER_TXN:
+            state["closed"] = True
+
+        else:
+            state["closed"] = not state["in_txn"]
+
+
+def route_event(state, kind, lines):
+
+    """Function:  route_event
+
+    Description:  Writes an event to the mysql client sessions of the
+        parallel applier.  A GTID event starts a new transaction, while the
+        header, format description and trailer are barriers.  Without GTID
+        events (i.e. gtid_mode=OFF before MySQL 5.7), the first event after
+        a barrier or after the end of a transaction starts a transaction
+        without a logical clock, so each is its own unit of the restore
+        checkpoint.  With the fast restore profile, the unique and foreign
+        key checks the events turn on are left off.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+        (input) kind -> Event type
+        (input) lines -> List of the event lines
+
+    """
+
+    start = int(lines[0][5:]) if lines[0].startswith(b"# at ") else 0
+
+    if kind == b"Start" and state["files"]:
+        # Each binary log of the command starts with a format description,
+        #   also one that ends in a Stop event instead of a Rotate.
+        state["binlog"] = state["files"].pop(0)
+
+    if kind in binlog_filter.APPLY_BARRIER:
+        end_unit(state)
+        start_unit(state, barrier=True)
+
+    elif kind in binlog_filter.APPLY_TXN or state["unit"] in (None, 0) \
+            or state["closed"]:
+        match = APPLY_CLOCK.search(b"".join(lines[:2])) \
+            if kind in binlog_filter.APPLY_TXN else None
+        end_unit(state)
+        state.update(
+            gtid=kind in binlog_filter.APPLY_TXN, closed=False, in_txn=False)
+
+        # Transactions committed past the checkpoint are not applied again.
+        if (state["binlog"], start) in state["skip"]:
+            state["skipped"] -= 1
+            state["unit"] = state["skipped"]
+
+        else:
+            start_unit(
+                state, clock=(int(match.group(1)), int(match.group(2)))
+                if match else None)
+
+    if not state["gtid"] and state["unit"] != 0:
+        close_unit(state, kind, lines)
+
+    if state["ckpt"]:
+        track_unit(state, start, lines)
+
+    for line in lines:
+        match = binlog_filter.APPLY_SESSION.match(line)
+
+        if match:
+            if state["profile"]:
+                line = PROFILE_CHECKS.sub(rb"\g<1>0", line)
+
+            state["session"][match.group(1)] = line
+
+        for idx in state["targets"]:
+            state["procs"][idx].stdin.write(line)
+
+    state["bytes"] += sum(len(line) for line in lines)
+
+
+def apply_binlog(                                       # pylint:disable=R0913
+        binlog_cmds, cmd, workers, binlogs=None, ckpt_file=None, resume=None,
+        profile=False, throttle=None, filt=None):
+
+    """Function:  apply_binlog
+
+    Description:  Restores the binary logs through a number of mysql client
+        sessions.  The transactions are dispatched by the logical clock of
+        the GTID events, so transactions that do not depend on each other
+        are applied at the same time, while a transaction is only applied
+        after the transactions it depends on are committed.  The binary logs
+        are applied one after the other, as the logical clock starts again
+        in each binary log.  If a checkpoint file is passed, the position
+        of the committed transactions is kept in it, also when the restore
+        fails.  With the fast restore profile, each session does not write
+        the binary log of the target and skips the unique and foreign key
+        checks until the end of the restore.  If a throttle is passed, the
+        events are applied at its feed rate.  If a filter is passed, only
+        the transactions it keeps are applied.
+
+    Arguments:
+        (input) binlog_cmds -> List of mysqlbinlog command line lists
+        (input) cmd -> mysql client command line list
+        (input) workers -> Number of mysql client sessions
+        (input) binlogs -> List of the binary log names of each command
+        (input) ckpt_file -> Path to the checkpoint file
+        (input) resume -> Dictionary of the checkpoint resumed from
+        (input) profile -> True|False - Use the fast restore profile
+        (input) throttle -> Dictionary of the restore throttle or None
+        (input) filt -> Dictionary of the binary log filter or None
+        (output) -> Tuple of bytes and transactions restored
+
+    """
+
+    state = {"procs": [], "acks": queue.Queue(), "outstanding": {},
+             "depth": [0] * workers,
+             "sessions": [{} for _ in range(workers)],
+             "session": {}, "unit": None, "targets": [], "txns": 0,
+             "bytes": 0, "binlog": None, "skipped": 0, "ckpt": None,
+             "units": collections.OrderedDict(), "skip": set(),
+             "profile": profile, "files": [], "gtid": False, "closed": False,
+             "in_txn": False}
+    resume = resume or {}
+
+    if ckpt_file:
+        state["ckpt"] = {"path": ckpt_file, "time": time.time(),
+                         "binlog": resume.get("binlog"),
+                         "pos": resume.get("pos")}
+        state["skip"] = {
+            tuple(item) for item in resume.get("applied", [])}
+
+    try:
+        start_appliers(state, cmd, workers)
+
+        for cnt, binlog_cmd in enumerate(binlog_cmds):
+            state["files"] = list(binlogs[cnt]) if binlogs else []
+            state["binlog"] = state["files"][0] if state["files"] else None
+            feed_applier(state, binlog_cmd, throttle, filt)
+
+        while state["outstanding"]:
+            wait_applier(state)
+
+    except BrokenPipeError as msg:
+        raise ValueError(f"mysql client session exited: {msg}") from msg
+
+    finally:
+        for proc in state["procs"]:
+            try:
+                if profile:
+                    proc.stdin.write(PROFILE_END)
+
+                proc.stdin.close()
+
+            except BrokenPipeError:
+                pass
+
+            proc.wait()
+
+        if state["ckpt"]:
+            flush_checkpoint(state)
+
+    failed = [proc.returncode for proc in state["procs"] if proc.returncode]
+
+    if failed:
+        raise ValueError(f"mysql client sessions exited with {failed}")
+
+    return state["bytes"], state["txns"]
+
+
+def start_appliers(state, cmd, workers):
+
+    """Function:  start_appliers
+
+    Description:  Starts the mysql client sessions of the parallel applier,
+        each with a thread reading the markers it returns.  With the fast
+        restore profile, the profile is set at the start of each session.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+        (input) cmd -> mysql client command line list
+        (input) workers -> Number of mysql client sessions
+
+    """
+
+    for idx in range(workers):
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            cmd + APPLY_OPTS + (PROFILE_OPTS if state["profile"] else []),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        state["procs"].append(proc)
+
+        if state["profile"]:
+            proc.stdin.write(PROFILE_START)
+
+        threading.Thread(target=read_applier,
+                         args=(idx, proc.stdout, state["acks"]),
+                         daemon=True).start()
+
+
+def feed_applier(state, binlog_cmd, throttle=None, filt=None):
+
+    """Function:  feed_applier
+
+    Description:  Runs a mysqlbinlog command and routes its events to the
+        mysql client sessions of the parallel applier.  A failed mysqlbinlog
+        command raises ValueError before its partial transaction is applied.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+        (input) binlog_cmd -> mysqlbinlog command line list
+        (input) throttle -> Dictionary of the restore throttle or None
+        (input) filt -> Dictionary of the binary log filter or None
+
+    """
+
+    with subprocess.Popen(binlog_cmd, stdout=subprocess.PIPE) as proc:
+        events = binlog_filter.split_binlog_events(proc.stdout)
+
+        for kind, lines in binlog_filter.filter_binlog_events(events, filt) \
+                if filt else events:
+            fed = state["bytes"]
+            route_event(state, kind, lines)
+
+            if throttle:
+                binlog_tee.throttle_wait(throttle, state["bytes"] - fed)
+
+    binlog_tee.check_binlog_cmds([proc.returncode])
+    end_unit(state)
+
+
+def flush_checkpoint(state):
+
+    """Function:  flush_checkpoint
+
+    Description:  Marks the transactions the mysql client sessions committed
+        before they exited and writes the restore checkpoint.
+
+    Arguments:
+        (input) state -> Dictionary of the parallel applier state
+
+    """
+
+    while not state["acks"].empty():
+        _, txn = state["acks"].get_nowait()
+
+        if txn in state["units"]:
+            state["units"][txn][3] = True
+
+    save_checkpoint(state, force=True)
@@ -0,0 +1,655 @@
+# Classification (U)
+
+"""Program:  binlog_catalog.py
+
+    Description:  Event catalogue of mysql_log_admin.py (-C).  Decodes the
+        events of the binary logs, with their row counts, into a SQLite
+        catalogue that is added to incrementally.
+
+    Usage:
+        import binlog_catalog
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import struct
+import sqlite3
+import uuid
+
+# Local
+try:
+    from .mysql_lib import mysql_libs
+    from . import binlog_reader
+    from . import binlog_stream
+    from . import binlog_filter
+    from . import binlog_fetch
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_reader
+    import binlog_stream
+    import binlog_filter
+    import binlog_fetch
+    import version
+
+__version__ = version.__version__
+
+# Rows events, which start with the table id of their Table_map event, the
+#   rows events with a before and after image of each row, the rows events
+#   with extra data after the flags and the partial JSON update rows event.
+ROWS_EVENTS = (23, 24, 25, 30, 31, 32, 39)
+ROWS_UPDATE = (24, 31, 39)
+ROWS_V2 = (30, 31, 32, 39)
+PARTIAL_UPDATE_ROWS_EVENT = 39
+
+# Column types of the Table_map event with a fixed value size, the bytes of
+#   metadata of the other column types and the bytes of each number of
+#   decimal digits left over from the groups of nine.
+COLUMN_SIZES = {1: 1, 2: 2, 3: 4, 6: 0, 7: 4, 8: 8, 9: 3, 10: 3, 11: 3,
+                12: 8, 13: 1, 14: 3}
+COLUMN_META = {4: 1, 5: 1, 15: 2, 16: 2, 17: 1, 18: 1, 19: 1, 245: 1,
+               246: 2, 247: 2, 248: 2, 252: 1, 253: 2, 254: 2, 255: 1}
+DECIMAL_BYTES = (0, 1, 1, 2, 2, 3, 3, 4, 4, 4)
+
+# Event type names as displayed by mysqlbinlog.
+EVENT_TYPES = {
+    1: "Start_v3", 2: "Query", 3: "Stop", 4: "Rotate", 5: "Intvar",
+    6: "Load", 8: "Create_file", 9: "Append_block", 10: "Exec_load",
+    11: "Delete_file", 12: "New_load", 13: "RAND", 14: "User_var",
+    15: "Start", 16: "Xid", 17: "Begin_load_query",
+    18: "Execute_load_query", 19: "Table_map", 23: "Write_rows_v1",
+    24: "Update_rows_v1", 25: "Delete_rows_v1", 26: "Incident",
+    27: "Heartbeat", 28: "Ignorable", 29: "Rows_query", 30: "Write_rows",
+    31: "Update_rows", 32: "Delete_rows", 33: "GTID", 34: "Anonymous_GTID",
+    35: "Previous-GTIDs", 36: "Transaction_context", 37: "View_change",
+    38: "XA_prepare", 39: "Update_rows_partial", 40: "Transaction_payload",
+    41: "Heartbeat_v2"}
+
+# Event catalogue (-C) tables and indexes and the number of events written
+#   in each database transaction.  The binlogs table has the position each
+#   binary log is read up to.
+CATALOG_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS events (binlog TEXT NOT NULL,"
+    " pos INTEGER NOT NULL, txn_pos INTEGER NOT NULL, ts INTEGER NOT NULL,"
+    " type TEXT NOT NULL, server_id INTEGER NOT NULL, gtid TEXT, db TEXT,"
+    " tbl TEXT, size INTEGER NOT NULL, nrows INTEGER,"
+    " PRIMARY KEY (binlog, pos))"
+    " WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS events_ts ON events (ts)",
+    "CREATE INDEX IF NOT EXISTS events_tbl ON events (tbl, ts)",
+    "CREATE INDEX IF NOT EXISTS events_gtid ON events (gtid)",
+    "CREATE INDEX IF NOT EXISTS events_txn ON events (binlog, txn_pos)",
+    "CREATE TABLE IF NOT EXISTS binlogs (binlog TEXT PRIMARY KEY,"
+    " pos INTEGER NOT NULL, crc INTEGER NOT NULL, closed INTEGER NOT NULL)")
+CATALOG_BATCH = 10000
+
+
+def read_packed_int(data, pos):
+
+    """Function:  read_packed_int
+
+    Description:  Reads a length encoded integer of a binary log event.
+
+    Arguments:
+        (input) data -> Event body
+        (input) pos -> Offset of the integer
+        (output) -> Tuple of the integer and the offset after it
+
+    """
+
+    first = data[pos]
+
+    if first < 251:
+        return first, pos + 1
+
+    size = {252: 2, 253: 3, 254: 8}.get(first)
+
+    if size is None:
+        raise ValueError(f"Length encoded integer {first:#x} at {pos}")
+
+    return int.from_bytes(data[pos + 1:pos + 1 + size], "little"), \
+        pos + 1 + size
+
+
+def table_map_columns(body):
+
+    """Function:  table_map_columns
+
+    Description:  Returns the type and metadata of each column of a Table_map
+        event.
+
+    Arguments:
+        (input) body -> Table_map event body
+        (output) -> List of (column type, metadata bytes) or None if a column
+            type is not known
+
+    """
+
+    try:
+        pos = 12 + body[8] + body[10 + body[8]]
+        ncols, pos = read_packed_int(body, pos)
+        types = body[pos:pos + ncols]
+        _, pos = read_packed_int(body, pos + ncols)
+
+    except (IndexError, ValueError):
+        return None
+
+    columns = []
+
+    for ctype in types:
+        if ctype in COLUMN_SIZES:
+            columns.append((ctype, b""))
+
+        elif ctype in COLUMN_META:
+            columns.append((ctype, body[pos:pos + COLUMN_META[ctype]]))
+            pos += COLUMN_META[ctype]
+
+        else:
+            return None
+
+    return columns
+
+
+def fixed_size(ctype, meta):
+
+    """Function:  fixed_size
+
+    Description:  Returns the size of the values of a column whose values
+        all have the same size in a row image of a rows event.
+
+    Arguments:
+        (input) ctype -> Column type from the Table_map event
+        (input) meta -> Column metadata bytes from the Table_map event
+        (output) size -> Size of the values in bytes or None if it depends
+            on the value
+
+    """
+
+    size = None
+
+    if ctype in COLUMN_SIZES:
+        size = COLUMN_SIZES[ctype]
+
+    elif ctype in (4, 5):
+        size = meta[0]
+
+    elif ctype in (17, 18, 19):
+        # TIMESTAMP2, DATETIME2 and TIME2 with fractional seconds.
+        size = {17: 4, 18: 5, 19: 3}[ctype] + (meta[0] + 1) // 2
+
+    elif ctype == 16:
+        size = meta[1] + (meta[0] > 0)
+
+    elif ctype == 246:
+        intg, frac = meta[0] - meta[1], meta[1]
+        size = intg // 9 * 4 + DECIMAL_BYTES[intg % 9] + frac // 9 * 4 \
+            + DECIMAL_BYTES[frac % 9]
+
+    elif ctype in (247, 248, 254) and meta[0] in (247, 248):
+        # ENUM and SET.
+        size = meta[1]
+
+    return size
+
+
+def length_prefix(ctype, meta):
+
+    """Function:  length_prefix
+
+    Description:  Returns the size of the length prefix of the values of a
+        column whose value size is read from the value.
+
+    Arguments:
+        (input) ctype -> Column type from the Table_map event
+        (input) meta -> Column metadata bytes from the Table_map event
+        (output) -> Size of the length prefix in bytes
+
+    """
+
+    if ctype in (245, 252, 255):
+        return meta[0]
+
+    if ctype in (15, 253):
+        max_len = meta[0] | meta[1] << 8
+
+    elif meta[0] & 0x30 != 0x30:
+        # CHAR longer than 255 bytes keeps the high bits in the type byte.
+        max_len = ((meta[0] & 0x30) ^ 0x30) << 4 | meta[1]
+
+    else:
+        max_len = meta[1]
+
+    return 1 if max_len < 256 else 2
+
+
+def column_size(data, pos, ctype, meta):
+
+    """Function:  column_size
+
+    Description:  Returns the size of a column value in a row image of a
+        rows event.
+
+    Arguments:
+        (input) data -> Rows event body
+        (input) pos -> Offset of the column value
+        (input) ctype -> Column type from the Table_map event
+        (input) meta -> Column metadata bytes from the Table_map event
+        (output) size -> Size of the value in bytes
+
+    """
+
+    size = fixed_size(ctype, meta)
+
+    if size is None:
+        prefix = length_prefix(ctype, meta)
+        size = prefix + int.from_bytes(data[pos:pos + prefix], "little")
+
+    return size
+
+
+def row_layout(image, columns):
+
+    """Function:  row_layout
+
+    Description:  Returns the layout of a row image, so its values are
+        skipped without looking up the column types again.  The values of a
+        column are skipped by its fixed size and, for the columns whose value
+        size is read from the value, by the length prefix and the length in
+        it.  For a row without NULL values, the fixed sizes between the
+        length prefixed values are added together.
+
+    Arguments:
+        (input) image -> List of the column numbers in the row image
+        (input) columns -> List of (column type, metadata)
+        (output) layout -> List of (bytes before, length prefix bytes) of the
+            length prefixed values of a row without NULL values
+        (output) fixed -> Bytes after the last length prefixed value
+        (output) sizes -> List of (fixed bytes, length prefix bytes) of each
+            column in the row image
+
+    """
+
+    layout, fixed, sizes = [], 0, []
+
+    for col in image:
+        size = fixed_size(*columns[col])
+
+        if size is None:
+            sizes.append((0, length_prefix(*columns[col])))
+            layout.append((fixed, sizes[-1][1]))
+            fixed = 0
+
+        else:
+            sizes.append((size, 0))
+            fixed += size
+
+    return layout, fixed, sizes
+
+
+def skip_image(body, pos, layout):
+
+    """Function:  skip_image
+
+    Description:  Returns the offset after a row image of a rows event.
+
+    Arguments:
+        (input) body -> Rows event body
+        (input) pos -> Offset of the row image
+        (input) layout -> Layout of the row image from row_layout
+        (output) pos -> Offset after the row image
+
+    """
+
+    nulls = body[pos:pos + (len(layout[2]) + 7) // 8]
+    pos += len(nulls)
+
+    if not any(nulls):
+        for before, prefix in layout[0]:
+            pos += before
+            pos += prefix + int.from_bytes(body[pos:pos + prefix], "little")
+
+        return pos + layout[1]
+
+    for cnt, (size, prefix) in enumerate(layout[2]):
+        if not nulls[cnt >> 3] >> (cnt & 7) & 1:
+            pos += size + prefix \
+                + int.from_bytes(body[pos:pos + prefix], "little")
+
+    return pos
+
+
+def count_rows(body, code, columns, crc=0):
+
+    """Function:  count_rows
+
+    Description:  Counts the rows of a rows event by walking the row images
+        with the column types of its Table_map event.
+
+    Arguments:
+        (input) body -> Rows event body
+        (input) code -> Rows event type code
+        (input) columns -> List of (column type, metadata) or None
+        (input) crc -> Checksum length of the events
+        (output) rows -> Number of rows or None if it is not known
+
+    """
+
+    if columns is None or code == PARTIAL_UPDATE_ROWS_EVENT:
+        return None
+
+    end = len(body) - crc
+
+    try:
+        pos = 8 + struct.unpack_from("<H", body, 8)[0] \
+            if code in ROWS_V2 else 8
+        ncols, pos = read_packed_int(body, pos)
+
+        if ncols != len(columns):
+            return None
+
+        images = []
+
+        for _ in range(2 if code in ROWS_UPDATE else 1):
+            bitmap = body[pos:pos + (ncols + 7) // 8]
+            images.append(row_layout(
+                [col for col in range(ncols)
+                 if bitmap[col >> 3] >> (col & 7) & 1], columns))
+            pos += len(bitmap)
+
+        rows = 0
+
+        while pos < end:
+            for layout in images:
+                pos = skip_image(body, pos, layout)
+
+            rows += 1
+
+    except (IndexError, ValueError, struct.error):
+        return None
+
+    return rows if pos == end else None
+
+
+def open_catalog(catalog_file):
+
+    """Function:  open_catalog
+
+    Description:  Opens the event catalogue SQLite database and creates its
+        tables and indexes if they do not exist, and adds the nrows column
+        to the events table of a catalogue created without it.  The database
+        is written ahead, so it can be queried while events are added.
+
+    Arguments:
+        (input) catalog_file -> Path to the event catalogue database file
+        (output) conn -> SQLite connection
+
+    """
+
+    conn = sqlite3.connect(catalog_file)
+
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        with conn:
+            for stmt in CATALOG_SCHEMA:
+                conn.execute(stmt)
+
+            if "nrows" not in [row[1] for row in conn.execute(
+                    "PRAGMA table_info(events)")]:
+                conn.execute("ALTER TABLE events ADD COLUMN nrows INTEGER")
+
+    except sqlite3.Error:
+        conn.close()
+        raise
+
+    return conn
+
+
+def catalog_query(body, crc, began):
+
+    """Function:  catalog_query
+
+    Description:  Returns the database and table of a Query event for the
+        event catalogue and whether the event opens or ends a transaction.
+        BEGIN and XA START open a transaction, an XA transaction ends at its
+        XA_prepare event.  DDL and statements outside a transaction end on
+        their own.
+
+    Arguments:
+        (input) body -> Query event body
+        (input) crc -> Checksum length of the event
+        (input) began -> True|False - A transaction is open
+        (output) dbase -> Database name
+        (output) table -> Table name of a DDL statement or None
+        (output) began -> True|False - A transaction is open
+        (output) end -> True|False - Event ends a transaction
+
+    """
+
+    dbase, stmt = binlog_reader.query_event(body, crc)
+    stmt_upper = stmt.upper()
+
+    if stmt_upper == b"BEGIN" \
+            or stmt_upper.startswith(binlog_filter.CATALOG_XA_START):
+        return dbase, None, True, False
+
+    dbase, table = binlog_filter.ddl_table(stmt, dbase) or (dbase, None)
+
+    return dbase, table, began, \
+        not began or stmt_upper in binlog_filter.FILTER_TXN
+
+
+def catalog_events(events, crc=0, count=False):
+
+    """Function:  catalog_events
+
+    Description:  Groups the events of a binary log into transactions and
+        yields the catalogue rows of the events of each transaction once its
+        end is read.  Events outside a transaction are yielded on their own.
+        The events of a transaction whose end is not read are not yielded.
+        With count, the rows of rows events are counted with the columns of
+        their Table_map event.
+
+    Arguments:
+        (input) events -> Iterable of BinlogEvent records with their bodies
+        (input) crc -> Checksum length of the events before the first
+            Format_description event
+        (input) count -> True|False - Count the rows of rows events
+        (output) -> Generator of (list of rows, position after the last
+            event, checksum length).  A row is (pos, txn_pos, ts, type,
+            server_id, gtid, db, tbl, size, nrows)
+
+    """
+
+    rows, gtid, began, tables = [], None, False, {}
+
+    for event in events:
+        code, body = event.type_code, event.body
+        dbase = table = nrows = None
+
+        if code == binlog_reader.FORMAT_DESCRIPTION_EVENT:
+            crc = binlog_reader.fde_checksum(body)
+
+        if code in (binlog_reader.GTID_LOG_EVENT,
+                    binlog_reader.ANONYMOUS_GTID_LOG_EVENT):
+            rows, began, tables = [], False, {}
+            gtid = f"{uuid.UUID(bytes=body[1:17])}:" \
+                f"{struct.unpack_from('<q', body, 17)[0]}" \
+                if code == binlog_reader.GTID_LOG_EVENT else None
+            end = False
+
+        elif code == binlog_reader.TABLE_MAP_EVENT:
+            dbase, table = binlog_reader.table_map_name(body)
+            tables[int.from_bytes(body[:6], "little")] = \
+                dbase, table, table_map_columns(body)
+            end = False
+
+        elif code in ROWS_EVENTS:
+            dbase, table, columns = tables.get(
+                int.from_bytes(body[:6], "little"), (None, None, None))
+            nrows = count_rows(body, code, columns, crc) if count else None
+            end = False
+
+        elif code == binlog_reader.QUERY_EVENT:
+            dbase, table, began, end = catalog_query(body, crc, began)
+
+        elif code in (binlog_reader.XID_EVENT,
+                      binlog_reader.XA_PREPARE_LOG_EVENT):
+            end = True
+
+        elif code == binlog_reader.TRANSACTION_PAYLOAD_EVENT:
+            end = not began
+
+        else:
+            end = not rows
+
+        rows.append((
+            event.offset, rows[0][0] if rows else event.offset,
+            event.timestamp, EVENT_TYPES.get(code, str(code)),
+            event.server_id, gtid, dbase or None, table, event.event_size,
+            nrows))
+
+        if end:
+            yield rows, event.offset + event.event_size, crc
+            rows, gtid, began, tables = [], None, False, {}
+
+
+def write_catalog(                                      # pylint:disable=R0913
+        conn, binlog, rows, pos, crc, closed=False):
+
+    """Function:  write_catalog
+
+    Description:  Adds the rows of a binary log to the event catalogue and
+        moves the position the binary log is read up to, in one database
+        transaction.
+
+    Arguments:
+        (input) conn -> SQLite connection
+        (input) binlog -> Binary log name
+        (input) rows -> List of rows from catalog_events
+        (input) pos -> Position the binary log is read up to
+        (input) crc -> Checksum length of the events
+        (input) closed -> True|False - Binary log is read to its end
+
+    """
+
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?,"
+            " ?, ?)", [(binlog,) + row for row in rows])
+        conn.execute("INSERT OR REPLACE INTO binlogs VALUES (?, ?, ?, ?)",
+                     (binlog, pos, crc, int(closed)))
+
+
+def catalog_binlog(                                     # pylint:disable=R0913
+        conn, binlog, events, start_pos=None, crc=0, closed=False,
+        count=False):
+
+    """Function:  catalog_binlog
+
+    Description:  Adds the events of a binary log to the event catalogue in
+        batches of CATALOG_BATCH events, each batch ending at the end of a
+        transaction.
+
+    Arguments:
+        (input) conn -> SQLite connection
+        (input) binlog -> Binary log name
+        (input) events -> Iterable of BinlogEvent records from start_pos
+        (input) start_pos -> Position the binary log is read up to or None
+        (input) crc -> Checksum length of the events
+        (input) closed -> True|False - Binary log is no longer written to
+        (input) count -> True|False - Count the rows of rows events
+        (output) added -> Number of events added
+
+    """
+
+    batch, added = [], 0
+    pos, checksum = start_pos or len(binlog_reader.BINLOG_MAGIC), crc
+
+    for rows, pos, checksum in catalog_events(events, crc, count):
+        batch.extend(rows)
+
+        if len(batch) >= CATALOG_BATCH:
+            write_catalog(conn, binlog, batch, pos, checksum)
+            added += len(batch)
+            batch = []
+
+    write_catalog(conn, binlog, batch, pos, checksum, closed)
+
+    return added + len(batch)
+
+
+def catalog_log(server, args, opt_arg_list=None):      # pylint:disable=W0613
+
+    """Function:  catalog_log
+
+    Description:  Adds the events of the binary logs that are not in the
+        event catalogue (-C) yet.  Each binary log is read with the native
+        binary log reader from the position it was last read up to, from
+        the local copy or streamed from the server with -P.  Binary logs that
+        are read to their end once they are closed are not read again.  The
+        rows of rows events are counted with -U.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list ->  Not used, mysqlbinlog is not run
+
+    """
+
+    binlog_list = [row["Log_name"] for row in mysql_libs.fetch_logs(server)]
+    counts = {"read": 0, "added": 0}
+
+    try:
+        binlog_dir = args.get_val("-b") \
+            or binlog_fetch.sync_mirror(server, args, binlog_list)
+        conn = open_catalog(args.get_val("-C"))
+
+    except (OSError, sqlite3.Error) as msg:
+        print(f"catalog_log:  Error encountered: {msg}")
+        return
+
+    try:
+        progress = {
+            row[0]: row[1:] for row in conn.execute(
+                "SELECT binlog, pos, crc, closed FROM binlogs")}
+
+        for cnt, binlog in enumerate(binlog_list):
+            pos, crc, closed = progress.get(binlog, (None, 0, 0))
+
+            if closed:
+                continue
+
+            if binlog_dir and os.path.isfile(os.path.join(binlog_dir, binlog)):
+                events = binlog_reader.read_binlog_events(
+                    os.path.join(binlog_dir, binlog), pos, body=True)
+
+            elif args.get_val("-P"):
+                events = binlog_stream.stream_binlog_events(
+                    server, binlog, pos, body=True)
+
+            else:
+                continue
+
+            counts["added"] += catalog_binlog(
+                conn, binlog, events, pos, crc, cnt < len(binlog_list) - 1,
+                args.arg_exist("-U"))
+            counts["read"] += 1
+
+    except (OSError, ValueError, sqlite3.Error) as msg:
+        print(f"catalog_log:  Error encountered: {msg}")
+
+    finally:
+        conn.close()
+
+    if args.get_val("-x"):
+        print(f"Binary logs read: {counts['read']},"
+              f" Events added: {counts['added']}", file=sys.stderr)
@@ -0,0 +1,842 @@
+# Classification (U)
+
+"""Program:  binlog_display.py
+
+    Description:  Binary log display of mysql_log_admin.py (-D).  Writes
+        the mysqlbinlog output of the binary logs, decoded at the same time
+        and merged in order, or follows the binary logs as new entries are
+        written (-w).
+
+    Usage:
+        import binlog_display
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import subprocess
+import re
+import time
+import collections
+import tempfile
+import shutil
+import io
+import contextlib
+import errno
+
+# Local
+try:
+    from .mysql_lib import mysql_libs
+    from . import binlog_reader
+    from . import binlog_filter
+    from . import binlog_fetch
+    from . import binlog_search
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_reader
+    import binlog_filter
+    import binlog_fetch
+    import binlog_search
+    import version
+
+__version__ = version.__version__
+
+# Bytes of decoded output held in memory for each binary log before it is
+#   spilled to disk, when binary logs are decoded at the same time.
+SPOOL_BYTES = 67108864
+
+# Session lines mysqlbinlog only writes when the value differs from the last
+#   one it wrote, so each run writes them again for its first query (-n):
+#   the flags are written as a single SET of the changed flags, the thread
+#   id only once and the character set comment with character_set_client.
+SESSION_LINE = re.compile(
+    rb"(?:/\*!\d+ )?SET @@session\.(pseudo_thread_id|foreign_key_checks|"
+    rb"sql_auto_is_null|unique_checks|autocommit|sql_mode|"
+    rb"auto_increment_increment|character_set_client|time_zone|"
+    rb"lc_time_names|collation_database|default_collation_for_utf8mb4|"
+    rb"sql_require_primary_key|default_table_encryption)=|(use) `")
+SESSION_FLAGS = (b"foreign_key_checks", b"sql_auto_is_null",
+                 b"unique_checks", b"autocommit")
+SESSION_PAIR = re.compile(rb"@@session\.(\w+)=([^,/]*)")
+SESSION_CHARSET = b"/*!\\C "
+SESSION_END = b"/*!*/;\n"
+
+# Decoded binary logs each worker can hold ahead of the output when the
+#   binary logs are merged without a memory budget (-n, -M).
+MERGE_TASKS = 2
+
+# mysqlbinlog output lines used by follow mode (-w) to track the transaction
+#   boundaries and the event timestamps: event start, event header with its
+#   end position and type, the statements that open and close a transaction
+#   and the end of an Xid event or of a statement.
+FOLLOW_POS = re.compile(
+    rb"^# at (?P<at>\d+)$"
+    rb"|^#\d{6}\s+\d?\d:\d\d:\d\d\s+server id\s+\d+\s+end_log_pos\s+"
+    rb"(?P<end>\d+)\s+(?:CRC32\s+\w+\s+)?(?P<kind>\w+)"
+    rb"(?:\s+to (?P<binlog>\S+)\s+pos: (?P<pos>\d+))?"
+    rb"|^(?P<begin>BEGIN$|XA START)"
+    rb"|^(?P<close>COMMIT$|ROLLBACK$|XA (?:PREPARE|COMMIT|ROLLBACK))"
+    rb"|^(?P<term>COMMIT/\*!\*/;|/\*!\*/;)$", re.M)
+
+# Follow mode reconnect backoff in seconds and number of latencies kept.
+FOLLOW_BACKOFF = 1
+FOLLOW_BACKOFF_MAX = 60
+FOLLOW_LATENCIES = 100000
+
+
+def copy_binlog(lines, out):
+
+    """Function:  copy_binlog
+
+    Description:  Copies the mysqlbinlog output to the output file as bytes
+        without decoding it.  The mysqlbinlog pipe is spliced to the output
+        file in the kernel where os.splice is available, otherwise it is
+        copied in COPY_BYTES blocks.  It is also copied in blocks if the
+        output file does not support splice, but other write errors are
+        raised.
+
+    Arguments:
+        (input) lines -> File handler or list of mysqlbinlog output lines
+        (input) out -> Binary output file
+
+    """
+
+    out.flush()
+
+    if not hasattr(lines, "fileno"):
+        for item in lines:
+            out.write(
+                item if isinstance(item, bytes) else item.encode("utf-8"))
+
+    else:
+        if hasattr(os, "splice"):
+            try:
+                while os.splice(lines.fileno(), out.fileno(),
+                                binlog_fetch.COPY_BYTES):
+                    pass
+
+            except io.UnsupportedOperation:
+                # Output is not a file (i.e. a -u request), copy it.
+                pass
+
+            except OSError as err:
+                # Output does not support splice, copy what is left.
+                if err.errno not in (errno.EINVAL, errno.ENOSYS,
+                                     errno.EBADF):
+                    raise
+
+        shutil.copyfileobj(lines, out, binlog_fetch.COPY_BYTES)
+
+    out.flush()
+
+
+def session_line(item):
+
+    """Function:  session_line
+
+    Description:  Returns the session state set by a line of mysqlbinlog
+        output, if it is a line mysqlbinlog only writes when the state
+        changes.
+
+    Arguments:
+        (input) item -> Line of mysqlbinlog output
+        (output) -> Session key, "flags" for the flags, or None
+        (output) -> Dictionary of the session state set by the line
+
+    """
+
+    match = SESSION_LINE.match(item)
+
+    if not match:
+        return None, {}
+
+    key = match.group(1) or match.group(2)
+
+    if key in SESSION_FLAGS:
+        return b"flags", dict(SESSION_PAIR.findall(item))
+
+    return key, {key: item}
+
+
+def scan_spool(lines, spool, start_pos=None):
+
+    """Function:  scan_spool
+
+    Description:  Writes the mysqlbinlog output to a spool file and records
+        the offsets of the first event and of the mysqlbinlog trailer, and
+        the first and last session lines after the first event.
+
+    Arguments:
+        (input) lines -> Iterable of mysqlbinlog output lines
+        (input) spool -> Spool file
+        (input) start_pos -> Position of the first event to merge
+        (output) start -> Offset of the first event or None
+        (output) end -> Offset of the trailer or None
+        (output) -> Session tuple: dictionary of session key to the (start
+            offset, end offset, line) of its first line and dictionary of
+            the session state after the last line
+
+    """
+
+    start = end = charset = None
+    prev_offset, prev_item = 0, b""
+    first, last = {}, {}
+
+    for item in lines:
+
+        if not isinstance(item, bytes):
+            item = item.encode("utf-8")
+
+        offset = spool.tell()
+
+        if start is None and item.startswith(b"# at ") \
+           and (start_pos is None or int(item[5:]) >= start_pos):
+            start = offset
+
+        elif item == binlog_filter.DELIMITER_END:
+            end = prev_offset \
+                if prev_item.startswith(binlog_filter.GTID_AUTOMATIC) \
+                else offset
+
+        elif start is not None and item[:1] in (b"S", b"u", b"/"):
+            key, values = session_line(item)
+
+            if key:
+                first.setdefault(key, (
+                    offset if charset is None else charset,
+                    offset + len(item), item))
+                last.update(values)
+
+        charset = offset if item.startswith(SESSION_CHARSET) else None
+        spool.write(item)
+        prev_offset, prev_item = offset, item
+
+    return start, end, (first, last)
+
+
+def spool_binlog(                                       # pylint:disable=R0913
+        server, binlog, start_dt=None, stop_dt=None, opt_arg_list=None,
+        bin_path=None, binlog_dir=None, start_pos=None, filt=None):
+
+    """Function:  spool_binlog
+
+    Description:  Runs mysqlbinlog against a single binary log and writes the
+        output to a spool file, which is held in memory until it is larger
+        than SPOOL_BYTES and then spilled to disk.  The offsets of the first
+        event and of the mysqlbinlog trailer and the session lines are
+        recorded so the output of several runs can be merged into the
+        output of a single run.
+        The binary log is read from the local binary log directory if it
+        is there.  If a start position is passed, the first event is the
+        first one at or after it, so the format description event that
+        mysqlbinlog writes before a range of a binary log is skipped.  If a
+        filter is passed, only the transactions it keeps are spooled.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) start_dt -> Start datetime
+        (input) stop_dt -> Stop datetime
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to MySQL binary directory
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) start_pos -> Position of the first event to merge
+        (input) filt -> Dictionary of the binary log filter or None
+        (output) spool -> Spool file with the mysqlbinlog output
+        (output) start -> Offset of the first event
+        (output) end -> Offset of the trailer
+        (output) session -> Session tuple from scan_spool
+
+    """
+
+    ((binlog_dir, _),) = binlog_fetch.group_binlogs([binlog], binlog_dir)
+
+    with contextlib.ExitStack() as stack:
+        spool = stack.enter_context(
+            tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES))
+        lines = binlog_fetch.fetch_binlog(
+            server, start_dt, stop_dt, [binlog], opt_arg_list, bin_path,
+            binlog_dir)
+        start, end, session = scan_spool(
+            binlog_filter.filter_binlog(lines, filt) if filt else lines,
+            spool, start_pos)
+
+        # The caller closes the spool file once it has been merged.
+        stack.pop_all()
+
+    end = spool.tell() if end is None else end
+    start = end if start is None else start
+
+    return spool, start, end, session
+
+
+def session_edits(first, state):
+
+    """Function:  session_edits
+
+    Description:  Returns the edits that drop or shorten the first session
+        lines of a mysqlbinlog run that a single mysqlbinlog run would not
+        have written, as the session state was already set by the earlier
+        runs.
+
+    Arguments:
+        (input) first -> Dictionary of session key to the (start offset, end
+            offset, line) of its first line in the run
+        (input) state -> Dictionary of the session state before the run
+        (output) edits -> List of (start offset, end offset, replacement)
+
+    """
+
+    edits = []
+
+    for key, (begin, stop, item) in first.items():
+        if key == b"pseudo_thread_id":
+            data = b"" if key in state else item
+
+        elif key == b"flags":
+            changed = [b"@@session." + name + b"=" + value
+                       for name, value in SESSION_PAIR.findall(item)
+                       if state.get(name) != value]
+            data = b"SET " + b", ".join(changed) + SESSION_END if changed \
+                else b""
+
+        else:
+            data = b"" if state.get(key) == item else item
+
+        if data != item:
+            edits.append((begin, stop, data))
+
+    return sorted(edits)
+
+
+def write_spool(spool, out, begin, stop, edits=None):
+
+    """Function:  write_spool
+
+    Description:  Copies a range of a spool file to the output file in
+        COPY_BYTES blocks, with the edits applied.
+
+    Arguments:
+        (input) spool -> Spool file
+        (input) out -> Binary output file
+        (input) begin -> Offset of the start of the range
+        (input) stop -> Offset of the end of the range
+        (input) edits -> List of (start offset, end offset, replacement)
+            within the range in offset order
+
+    """
+
+    spool.seek(begin)
+
+    for edit_begin, edit_end, data in list(edits or []) + [(stop, stop, b"")]:
+        remain = edit_begin - spool.tell()
+
+        while remain > 0:
+            block = spool.read(min(binlog_fetch.COPY_BYTES, remain))
+            out.write(block)
+            remain -= len(block)
+
+        out.write(data)
+        spool.seek(edit_end)
+
+
+def write_spools(results, out, count):
+
+    """Function:  write_spools
+
+    Description:  Writes the spooled mysqlbinlog runs to the output file as
+        the output of a single run.  The header is only written from the
+        first run and the trailer from the last run, and the session lines
+        a single run would not have written are dropped.
+
+    Arguments:
+        (input) results -> Iterable of spool_binlog results in order
+        (input) out -> Binary output file
+        (input) count -> Number of runs
+
+    """
+
+    state = {}
+
+    for cnt, (spool, start, end, (first, last)) in enumerate(results):
+        with spool:
+            size = spool.tell()
+            write_spool(
+                spool, out, 0 if cnt == 0 else start,
+                size if cnt == count - 1 else end,
+                session_edits(first, state) if cnt else [])
+
+        state.update(last)
+
+    out.flush()
+
+
+def spool_tasks(                                        # pylint:disable=R0913
+        server, args, binlog_list, opt_arg_list=None, pos_args=None,
+        binlog_dir=None, stop_args=None, chunks=None, sizes=None,
+        filt=None):
+
+    """Function:  spool_tasks
+
+    Description:  Returns the spool_binlog arguments and the size of each
+        mysqlbinlog run of the binary logs, one per binary log or per range
+        of a binary log with chunks.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) pos_args -> Arguments only for the first binary log
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) stop_args -> Arguments only for the last binary log
+        (input) chunks -> Dictionary of binary log name to list of (start
+            position, stop position) ranges
+        (input) sizes -> Dictionary of binary log name to size
+        (input) filt -> Dictionary of the binary log filter or None
+        (output) -> List of spool_binlog argument tuples
+        (output) -> List of run sizes in bytes
+
+    """
+
+    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
+    pos_args = [] if pos_args is None else list(pos_args)
+    stop_args = [] if stop_args is None else list(stop_args)
+    sizes = {} if sizes is None else sizes
+    tasks = [(binlog, start_pos, stop_pos) for binlog in binlog_list
+             for start_pos, stop_pos in (chunks or {}).get(
+                 binlog, [(None, None)])]
+    last = len(tasks) - 1
+
+    return ([(server, binlog, args.get_val("-s"), args.get_val("-t"),
+              opt_arg_list
+              + ([f"--start-position={start_pos}"] if start_pos
+                 else pos_args if cnt == 0 else [])
+              + ([f"--stop-position={stop_pos}"] if stop_pos
+                 else stop_args if cnt == last else []),
+              args.get_val("-p"), binlog_dir,
+              start_pos if cnt and tasks[cnt - 1][0] == binlog else None,
+              filt)
+             for cnt, (binlog, start_pos, stop_pos) in enumerate(tasks)],
+            [max((stop_pos or sizes.get(binlog) or 0)
+                 - (start_pos or len(binlog_reader.BINLOG_MAGIC)), 0)
+             for binlog, start_pos, stop_pos in tasks])
+
+
+def merge_binlogs(                                      # pylint:disable=R0913
+        server, args, binlog_list, opt_arg_list=None, pos_args=None,
+        out=None, binlog_dir=None, stop_args=None, chunks=None, sizes=None,
+        filt=None):
+
+    """Function:  merge_binlogs
+
+    Description:  Decodes the binary logs at the same time in a pool of -n
+        workers and writes the output to the output file, or standard out,
+        in binary log order, byte for byte as a single mysqlbinlog run.
+        The output of the later binary logs is spooled until the earlier
+        binary logs are written.  A binary log with chunks is decoded as one
+        mysqlbinlog run per range and the ranges are merged in order like
+        binary logs.  The runs are scheduled largest first by
+        schedule_tasks within the -M memory budget, and each worker holds
+        at most MERGE_TASKS runs ahead of the output.  If a filter is
+        passed, each binary log is filtered by its worker.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) pos_args -> Arguments only for the first binary log
+        (input) out -> Binary output file, default is standard out
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) stop_args -> Arguments only for the last binary log
+        (input) chunks -> Dictionary of binary log name to list of (start
+            position, stop position) ranges
+        (input) sizes -> Dictionary of binary log name to size
+        (input) filt -> Dictionary of the binary log filter or None
+
+    """
+
+    workers = int(args.get_val("-n", def_val=1))
+    arg_list, task_sizes = spool_tasks(
+        server, args, binlog_list, opt_arg_list, pos_args, binlog_dir,
+        stop_args, chunks, sizes, filt)
+
+    if out is None:
+        sys.stdout.flush()
+        out = sys.stdout.buffer
+
+    write_spools(
+        binlog_fetch.schedule_tasks(
+            spool_binlog, arg_list, workers, sizes=task_sizes,
+            mem_bytes=int(args.get_val("-M")) * 1048576
+            if args.get_val("-M") else None,
+            max_held=workers * MERGE_TASKS),
+        out, len(arg_list))
+
+
+def scan_follow(data, state):
+
+    """Function:  scan_follow
+
+    Description:  Updates the follow state from complete lines of mysqlbinlog
+        output: the binary log and position of the last transaction
+        boundary, which is the start of a GTID event, the end of a
+        transaction or a rotation, and the latency of each event since its
+        timestamp.  Format description, rotate and previous GTIDs events
+        are not counted, as they are sent again with their old timestamps
+        when mysqlbinlog is restarted.
+
+    Arguments:
+        (input) data -> Complete lines of mysqlbinlog output
+        (input) state -> Follow state dictionary
+        (output) cut -> Output offset of the last transaction boundary in
+            the lines or None
+
+    """
+
+    now = time.time()
+    cut = None
+
+    for match in FOLLOW_POS.finditer(data):
+        offset = state["scanned"] + match.start()
+
+        if match.group("at"):
+            state["at"] = (int(match.group("at")), offset)
+
+        elif match.group("kind"):
+            state["end"] = int(match.group("end"))
+
+            if match.group("kind") in binlog_filter.APPLY_TXN and state["at"]:
+                state.update(open=False, closing=False)
+                state["pos"], cut = state["at"]
+
+            elif match.group("binlog"):
+                state["binlog"] = match.group("binlog").decode("utf-8")
+                state["pos"] = int(match.group("pos"))
+                cut = offset + len(match.group()) + 1
+
+        elif match.group("begin"):
+            state["open"] = True
+
+        elif match.group("close"):
+            state["closing"] = True
+
+        elif state["end"] and (match.group("term") == b"COMMIT/*!*/;"
+                               or not state["open"] or state["closing"]):
+            state.update(open=False, closing=False, pos=state["end"])
+            cut = offset + len(match.group()) + 1
+
+    state["scanned"] += len(data)
+
+    for match in binlog_filter.FOLLOW_HEADER.finditer(data):
+        if match.group(2) not in (b"Start", b"Rotate", b"Previous"):
+            state["events"] += 1
+            state["latency"].append(now - time.mktime(time.strptime(
+                match.group(1).decode("utf-8"), "%y%m%d %H:%M:%S")))
+
+    return cut
+
+
+def follow_binlog(cmd, out, state):
+
+    """Function:  follow_binlog
+
+    Description:  Runs a mysqlbinlog --stop-never command and writes its
+        output to the output file up to the last transaction boundary as
+        soon as it is read, tracking the position and event latencies in
+        the follow state.  The output after the last boundary is held, and
+        only written if mysqlbinlog exits without an error, so a restart
+        from the boundary neither repeats nor splits a transaction.
+
+    Arguments:
+        (input) cmd -> mysqlbinlog command line list
+        (input) out -> Binary output file
+        (input) state -> Follow state dictionary
+        (output) -> mysqlbinlog return code
+
+    """
+
+    tail = held = b""
+    state.update(scanned=0, at=None, open=False, closing=False)
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        cmd, stdout=subprocess.PIPE)
+
+    try:
+        while True:
+            data = os.read(proc.stdout.fileno(), binlog_fetch.COPY_BYTES)
+
+            if not data:
+                break
+
+            data = tail + data
+            cut = data.rfind(b"\n") + 1
+            held += data[:cut]
+            tail = data[cut:]
+            cut = scan_follow(data[:cut], state)
+
+            if cut is not None:
+                # Offset in held of the boundary, held ends at scanned.
+                cut += len(held) - state["scanned"]
+                out.write(held[:cut])
+                out.flush()
+                held = held[cut:]
+
+        # The output is closed, wait for the exit code.
+        proc.wait()
+
+    finally:
+        proc.stdout.close()
+
+        if proc.poll() is None:
+            proc.terminate()
+
+        if not proc.wait():
+            out.write(held + tail)
+            out.flush()
+
+    return proc.returncode
+
+
+def latency_stats(state):
+
+    """Function:  latency_stats
+
+    Description:  Summarizes the event latencies in the follow state.
+
+    Arguments:
+        (input) state -> Follow state dictionary
+        (output) -> Latency summary string
+
+    """
+
+    latency = sorted(state["latency"])
+
+    if not latency:
+        return f"Events: {state['events']}"
+
+    def pct(fraction):
+
+        """Function:  pct
+
+        Description:  Returns a latency percentile in milliseconds.
+
+        Arguments:
+            (input) fraction -> Percentile as a fraction
+            (output) -> Latency in milliseconds
+
+        """
+
+        return latency[int(fraction * (len(latency) - 1))] * 1000
+
+    return (f"Events: {state['events']}, Latency ms: avg"
+            f" {sum(latency) / len(latency) * 1000:.0f}, p50 {pct(0.5):.0f},"
+            f" p99 {pct(0.99):.0f}, max {latency[-1] * 1000:.0f}")
+
+
+def follow_log_entries(                                 # pylint:disable=R0913
+        server, args, binlog_list, opt_arg_list, pos_args, out):
+
+    """Function:  follow_log_entries
+
+    Description:  Follows the binary logs with mysqlbinlog --stop-never,
+        which keeps one connection open across binary log rotations, and
+        writes new events as they arrive.  Without -f or -s, follows from
+        the end of the active binary log.  If mysqlbinlog exits with an
+        error, it is restarted from the last transaction boundary written,
+        after a delay that doubles up to FOLLOW_BACKOFF_MAX seconds while no
+        new events arrive.  The latency stats are printed to standard error
+        at the end.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) pos_args -> Arguments only for the first binary log
+        (input) out -> Binary output file
+
+    """
+
+    state = {"binlog": None, "pos": None, "end": None, "events": 0,
+             "latency": collections.deque(maxlen=FOLLOW_LATENCIES)}
+    start_dt = args.get_val("-s")
+    opt_arg_list = list(opt_arg_list) + ["--stop-never"]
+
+    if args.get_val("-f") or start_dt:
+        state["binlog"] = binlog_list[0]
+        cmd_args = list(pos_args)
+
+    else:
+        logs = mysql_libs.fetch_logs(server)
+        state["binlog"] = logs[-1]["Log_name"]
+        state["pos"] = logs[-1]["File_size"]
+        cmd_args = [f"--start-position={state['pos']}"]
+
+    backoff = FOLLOW_BACKOFF
+
+    try:
+        while True:
+            events = state["events"]
+            status = follow_binlog(
+                binlog_fetch.crt_binlog_cmd(
+                    server, start_dt, args.get_val("-t"), [state["binlog"]],
+                    opt_arg_list + cmd_args, args.get_val("-p")),
+                out, state)
+
+            if not status:
+                break
+
+            if state["events"] > events:
+                backoff = FOLLOW_BACKOFF
+
+            print(f"follow_log_entries:  mysqlbinlog exited with {status},"
+                  f" restarting at {state['binlog']}:{state['pos']} in"
+                  f" {backoff} seconds", file=sys.stderr)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, FOLLOW_BACKOFF_MAX)
+
+            # Restart from the last transaction boundary written, not the
+            #   start datetime, once there is one.
+            if state["pos"] is not None:
+                start_dt = None
+                cmd_args = [f"--start-position={state['pos']}"]
+
+    except KeyboardInterrupt:
+        pass
+
+    print(latency_stats(state), file=sys.stderr)
+
+
+def write_log_entries(                                  # pylint:disable=R0913
+        server, args, binlog_list, opt_arg_list, pos_args, out,
+        stop_args=None):
+
+    """Function:  write_log_entries
+
+    Description:  Writes the binary log entries to the output file as bytes.
+        If more than one worker is requested, the binary logs are decoded
+        at the same time and merged in order, with the binary logs larger
+        than the -j chunk size split into ranges.  If -m is passed, the
+        mirrored binary logs are decoded from the mirror directory.  If -w
+        is passed, the binary logs are followed for new events.  If the
+        filter options are passed, only the transactions they keep are
+        written and the binary logs the Bloom filters rule out are not read.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) pos_args -> Arguments only for the first binary log
+        (input) out -> Binary output file
+        (input) stop_args -> Arguments only for the last binary log
+
+    """
+
+    stop_args = [] if stop_args is None else list(stop_args)
+
+    if args.get_val("-w"):
+        follow_log_entries(
+            server, args, binlog_list, opt_arg_list, pos_args, out)
+        return
+
+    workers = int(args.get_val("-n", def_val=1))
+    filt = binlog_filter.crt_filter(args)
+    binlog_dir = binlog_fetch.sync_mirror(server, args, binlog_list)
+    binlog_list, pos_args, stop_args = binlog_filter.prune_bloom_binlogs(
+        server, args, binlog_list, pos_args, stop_args,
+        args.get_val("-b") or binlog_dir)
+    sizes = {row["Log_name"]: row.get("File_size")
+             for row in mysql_libs.fetch_logs(server)} if workers > 1 else {}
+    chunks = binlog_reader.chunk_binlogs(
+        args, binlog_list, sizes, pos_args, stop_args)
+
+    if workers > 1 and (len(binlog_list) > 1 or chunks):
+        merge_binlogs(
+            server, args, binlog_list, opt_arg_list, pos_args, out,
+            binlog_dir, stop_args, chunks, sizes, filt)
+
+    else:
+        groups = list(binlog_fetch.group_binlogs(binlog_list, binlog_dir))
+        copy_binlogs(server, args, [
+            (group_dir, group, list(opt_arg_list)
+             + (list(pos_args) if cnt == 0 else [])
+             + (stop_args if cnt == len(groups) - 1 else []))
+            for cnt, (group_dir, group) in enumerate(groups)], out, filt)
+
+
+def copy_binlogs(server, args, runs, out, filt=None):
+
+    """Function:  copy_binlogs
+
+    Description:  Decodes each run of binary logs with mysqlbinlog in turn
+        and copies the output to the output file, through the binary log
+        filter if one is passed.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) runs -> List of (binary log directory or None, binary log
+            names, mysqlbinlog arguments)
+        (input) out -> Binary output file
+        (input) filt -> Dictionary of the binary log filter or None
+
+    """
+
+    for binlog_dir, binlogs, opt_args in runs:
+        lines = binlog_fetch.fetch_binlog(
+            server, opt_arg_list=opt_args, start_dt=args.get_val("-s"),
+            stop_dt=args.get_val("-t"), binlog_files=binlogs,
+            bin_path=args.get_val("-p"), binlog_dir=binlog_dir)
+        copy_binlog(
+            binlog_filter.filter_binlog(lines, filt) if filt else lines, out)
+
+
+def fetch_log_entries(server, args, opt_arg_list):
+
+    """Function:  fetch_log_entries
+
+    Description:  Prints out the binary log entries that are between the start
+        and stop datetimes, or writes them to the output file if -o is
+        passed.  The entries are copied as bytes without being decoded.
+        The worker utilisation is printed to standard error if -x is passed.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list ->  Arguments to be added to command line
+
+    """
+
+    opt_arg_list = list(opt_arg_list)
+    status, binlog_list = binlog_fetch.process_logs_list(server, args)
+
+    if status[0]:
+        binlog_list, pos_args, stop_args = binlog_search.plan_binlog_pos(
+            server, args, binlog_list, opt_arg_list)
+
+        if args.get_val("-o"):
+            with open(args.get_val("-o"), "wb") as out:
+                write_log_entries(
+                    server, args, binlog_list, opt_arg_list, pos_args, out,
+                    stop_args)
+
+        else:
+            sys.stdout.flush()
+            write_log_entries(
+                server, args, binlog_list, opt_arg_list, pos_args,
+                sys.stdout.buffer, stop_args)
+
+        if args.get_val("-x"):
+            print(binlog_fetch.worker_stats(), file=sys.stderr)
+
+    else:
+        print(f"Error encountered: {status[1]}")
@@ -0,0 +1,848 @@
+# Classification (U)
+
+"""Program:  binlog_fetch.py
+
+    Description:  Binary log sources of mysql_log_admin.py.  Creates the
+        mysqlbinlog command line, picks the binary logs between the start
+        and stop datetimes, keeps the local mirror of the closed binary logs
+        (-m) and schedules the workers that read binary logs at the same
+        time (-n).
+
+    Usage:
+        import binlog_fetch
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import subprocess
+import re
+import itertools
+import time
+import concurrent.futures
+import tempfile
+import shutil
+
+# Local
+try:
+    from .lib import gen_libs
+    from .mysql_lib import mysql_libs
+    from . import binlog_reader
+    from . import binlog_stream
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import lib.gen_libs as gen_libs                     # pylint:disable=R0402
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_reader
+    import binlog_stream
+    import version
+
+__version__ = version.__version__
+
+# Default disk budget in megabytes of the binary log mirror directory (-z).
+MIRROR_MBYTES = 10240
+
+# Block size for copying mysqlbinlog output to the output file.
+COPY_BYTES = 1048576
+
+# Worker time of the scheduled tasks since the last report (-x).
+WORKER_STATS = {"tasks": 0, "busy": 0.0, "slots": 0.0}
+
+
+def crt_binlog_cmd(                                     # pylint:disable=R0913
+        server, start_dt=None, stop_dt=None, binlog_files=None,
+        opt_arg_list=None, bin_path=None, binlog_dir=None):
+
+    """Function:  crt_binlog_cmd
+
+    Description:  Creates the mysqlbinlog command line for the binary log
+        file names passed and/or the start and/or stop datetimes.  If a
+        binary log directory is passed, the binary logs are read from the
+        local files in the directory instead of from the server.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) start_dt -> Start datetime
+        (input) stop_dr -> Stop datetime
+        (input) binlog_files -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to Mysql binary directory
+        (input) binlog_dir -> Directory path to local binary log files
+        (output) -> mysqlbinlog command line list
+
+    """
+
+    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
+
+    if bin_path is None:
+        bin_path = ""
+
+    if binlog_files is None:
+        # List of binary logs.
+        binlog_files = [
+            row["Log_name"] for row in mysql_libs.fetch_logs(server)]
+
+    else:
+        binlog_files = list(binlog_files)
+
+    if binlog_dir:
+        binlog_files = [
+            os.path.join(binlog_dir, binlog) for binlog in binlog_files]
+        opt_arg_list = [
+            arg for arg in opt_arg_list
+            if arg != "--read-from-remote-server"]
+
+    cmd = mysql_libs.crt_cmd(server, bin_path + "mysqlbinlog")
+
+    if opt_arg_list:
+        for arg in opt_arg_list:
+            cmd = gen_libs.add_cmd(cmd, arg=arg)
+
+    if start_dt:
+        cmd = gen_libs.add_cmd(cmd, arg=f"--start-datetime={start_dt}")
+
+    if stop_dt:
+        cmd = gen_libs.add_cmd(cmd, arg=f"--stop-datetime={stop_dt}")
+
+    return cmd + binlog_files
+
+
+def fetch_binlog(                                       # pylint:disable=R0913
+        server, start_dt=None, stop_dt=None, binlog_files=None,
+        opt_arg_list=None, bin_path=None, binlog_dir=None):
+
+    """Function:  fetch_binlog
+
+    Description:  Returns a list of binary log entries based on the binary log
+        file names passed and/or the start and/or stop datetimes.
+        Returns the entries as a file.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) start_dt -> Start datetime
+        (input) stop_dr -> Stop datetime
+        (input) binlog_files -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to Mysql binary directory
+        (input) binlog_dir -> Directory path to local binary log files
+        (output) -> File handler to list of log entries
+
+    """
+
+    cmd = crt_binlog_cmd(
+        server, start_dt, stop_dt, binlog_files, opt_arg_list, bin_path,
+        binlog_dir)
+
+    # Return a file handler with log entries.
+    return iter(subprocess.Popen(cmd, stdout=subprocess.PIPE).stdout)
+
+
+def dt_to_ts(dtime):
+
+    """Function:  dt_to_ts
+
+    Description:  Converts a "YYYY-MM-DD HH:MM:SS" datetime string in local
+        time, the same way mysqlbinlog interprets --start-datetime and
+        --stop-datetime, into a Unix timestamp.
+
+    Arguments:
+        (input) dtime -> Datetime string or None
+        (output) -> Unix timestamp or None
+
+    """
+
+    if not dtime:
+        return None
+
+    return int(time.mktime(time.strptime(dtime, "%Y-%m-%d %H:%M:%S")))
+
+
+def fetch_first_ts(                                     # pylint:disable=R0913
+        server, binlog, opt_arg_list=None, bin_path=None, binlog_dir=None,
+        remote=False):
+
+    """Function:  fetch_first_ts
+
+    Description:  Probes a binary log for the timestamp of its first event
+        (i.e. format description event).  Reads the event header from the
+        local binary log file if a binary log directory is passed, from the
+        replication stream if remote is set, otherwise has mysqlbinlog read
+        only the first few hundred bytes of the binary log.  A binary log
+        that is not in the binary log directory is read from the server.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to Mysql binary directory
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) remote -> True|False - Use the replication stream client
+        (output) -> Unix timestamp of first event or None
+
+    """
+
+    local = bool(binlog_dir) and os.path.isfile(
+        os.path.join(binlog_dir, binlog))
+
+    if local or remote:
+        events = binlog_reader.read_binlog_events(
+            os.path.join(binlog_dir, binlog)) if local \
+            else binlog_stream.stream_binlog_events(server, binlog)
+
+        try:
+            event = next(events, None)
+
+        finally:
+            events.close()
+
+        return event.timestamp if event else None
+
+    return mysqlbinlog_first_ts(server, binlog, opt_arg_list, bin_path)
+
+
+def mysqlbinlog_first_ts(server, binlog, opt_arg_list=None, bin_path=None):
+
+    """Function:  mysqlbinlog_first_ts
+
+    Description:  Has mysqlbinlog read only the first few hundred bytes of
+        a binary log and returns the timestamp of its start event.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to Mysql binary directory
+        (output) -> Unix timestamp of first event or None
+
+    """
+
+    regex = re.compile(
+        r"#(?P<date>\d{6})\s+(?P<time>\d?\d:\d\d:\d\d)\s+server id\s+\d+\s+"
+        r"end_log_pos\s+\d+\s+(CRC32\s+\w+\s+)?Start")
+    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
+    cmd = mysql_libs.crt_cmd(
+        server, ("" if bin_path is None else bin_path) + "mysqlbinlog")
+
+    for arg in opt_arg_list + ["--stop-position=512"]:
+        cmd = gen_libs.add_cmd(cmd, arg=arg)
+
+    proc = subprocess.Popen(                            # pylint:disable=R1732
+        cmd + [binlog], stdout=subprocess.PIPE)
+    tstamp = None
+
+    for item in proc.stdout:
+        if not isinstance(item, str):
+            item = item.decode("utf-8", "replace")
+
+        match = regex.match(item)
+
+        if match:
+            tstamp = int(time.mktime(time.strptime(
+                match.group("date") + " " + match.group("time"),
+                "%y%m%d %H:%M:%S")))
+            break
+
+    proc.stdout.close()
+    proc.terminate()
+    proc.wait()
+
+    return tstamp
+
+
+def prune_binlogs(                                      # pylint:disable=R0913
+        server, log_files, start_dt=None, stop_dt=None, opt_arg_list=None,
+        bin_path=None, binlog_dir=None, remote=False):
+
+    """Function:  prune_binlogs
+
+    Description:  Drops the binary logs that cannot have events between the
+        start and stop datetimes.  Binary logs are in time order, so a
+        binary log covers from its first event up to the first event of the
+        next binary log.  Binary search is used on the first event
+        timestamps so only a few binary logs are probed.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) log_files -> List of binary log names in order
+        (input) start_dt -> Start datetime
+        (input) stop_dt -> Stop datetime
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to Mysql binary directory
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) remote -> True|False - Use the replication stream client
+        (output) -> List of binary log names that overlap the datetimes
+
+    """
+
+    log_files = list(log_files)
+    start_ts = dt_to_ts(start_dt)
+    stop_ts = dt_to_ts(stop_dt)
+    first_ts = {}
+
+    if not log_files or (start_ts is None and stop_ts is None):
+        return log_files
+
+    def probe(idx):
+
+        """Function:  probe
+
+        Description:  Returns the first event timestamp of a binary log,
+            fetching it only once.
+
+        Arguments:
+            (input) idx -> Index of the binary log in log_files
+            (output) -> Unix timestamp of first event or None
+
+        """
+
+        if idx not in first_ts:
+            first_ts[idx] = fetch_first_ts(
+                server, log_files[idx], opt_arg_list, bin_path, binlog_dir,
+                remote)
+
+        return first_ts[idx]
+
+    first = first_binlog(probe, len(log_files), start_ts)
+    last = last_binlog(probe, first, len(log_files), stop_ts)
+
+    if last is None:
+        return []
+
+    return log_files[first:last + 1]
+
+
+def first_binlog(probe, count, start_ts):
+
+    """Function:  first_binlog
+
+    Description:  Binary searches for the first binary log whose successor
+        starts at or after the start time.
+
+    Arguments:
+        (input) probe -> Function returning the first event timestamp of
+            the binary log at an index
+        (input) count -> Number of binary logs
+        (input) start_ts -> Start Unix timestamp or None
+        (output) -> Index of the first binary log
+
+    """
+
+    low, high = 0, count - 1
+
+    while start_ts is not None and low < high:
+        mid = (low + high) // 2
+        tstamp = probe(mid + 1)
+
+        if tstamp is None or tstamp >= start_ts:
+            high = mid
+
+        else:
+            low = mid + 1
+
+    return low
+
+
+def last_binlog(probe, first, count, stop_ts):
+
+    """Function:  last_binlog
+
+    Description:  Binary searches for the last binary log that starts
+        before the stop time.
+
+    Arguments:
+        (input) probe -> Function returning the first event timestamp of
+            the binary log at an index
+        (input) first -> Index of the first binary log to search from
+        (input) count -> Number of binary logs
+        (input) stop_ts -> Stop Unix timestamp or None
+        (output) -> Index of the last binary log or None if none start
+            before the stop time
+
+    """
+
+    low, high = first, count - 1
+
+    if stop_ts is None:
+        return high
+
+    while low < high:
+        mid = (low + high + 1) // 2
+        tstamp = probe(mid)
+
+        if tstamp is None or tstamp < stop_ts:
+            low = mid
+
+        else:
+            high = mid - 1
+
+    tstamp = probe(low)
+
+    return None if tstamp is not None and tstamp >= stop_ts else low
+
+
+def schedule_tasks(                                     # pylint:disable=R0913
+        func, arg_list, workers=1, process=False, sizes=None,
+        mem_bytes=None, max_held=None):
+
+    """Function:  schedule_tasks
+
+    Description:  Runs a function once for each set of arguments in a pool of
+        workers and yields the results in the same order as the arguments.
+        The largest tasks are started first (longest processing time first)
+        so the workers finish at about the same time.  A task is only
+        started while the sizes of the tasks started and not yet yielded
+        fit in the memory budget and their number is within the maximum,
+        except for the next task to be yielded, which is always started so
+        the results keep flowing.
+        Thread workers are used for functions that wait on a mysqlbinlog
+        process and process workers for functions that parse binary logs.
+        With one worker or one set of arguments, the function is run inline.
+        The worker time is added to WORKER_STATS.
+
+    Arguments:
+        (input) func -> Function to run
+        (input) arg_list -> List of argument tuples, one per run
+        (input) workers -> Maximum number of workers
+        (input) process -> True|False - Use process workers
+        (input) sizes -> List of task sizes in bytes in argument order
+        (input) mem_bytes -> Memory budget in bytes of the tasks held
+        (input) max_held -> Maximum number of tasks held
+        (output) -> Generator of results in argument order
+
+    """
+
+    arg_list = list(arg_list)
+    sizes = [size or 0 for size in sizes] if sizes else [0] * len(arg_list)
+    workers = max(min(workers or 1, len(arg_list)), 1)
+    sched = {"pending": sorted(range(len(arg_list)),
+                               key=lambda idx: -sizes[idx]),
+             "futures": {}, "running": set(), "held": 0, "began": {},
+             "ended": {}, "sizes": sizes, "workers": workers,
+             "mem_bytes": mem_bytes, "max_held": max_held}
+    started = time.monotonic()
+
+    try:
+        if workers == 1:
+            for idx, args in enumerate(arg_list):
+                sched["began"][idx] = time.monotonic()
+                result = func(*args)
+                sched["ended"][idx] = time.monotonic()
+                yield result
+
+        else:
+            yield from run_tasks(func, arg_list, process, sched)
+
+    finally:
+        # The workers are held for the wall time of the schedule.
+        now = time.monotonic()
+        WORKER_STATS["tasks"] += len(sched["began"])
+        WORKER_STATS["busy"] += sum(
+            sched["ended"].get(idx, now) - begin
+            for idx, begin in sched["began"].items())
+        WORKER_STATS["slots"] += workers * (now - started)
+
+
+def run_tasks(func, arg_list, process, sched):
+
+    """Function:  run_tasks
+
+    Description:  Runs the tasks of schedule_tasks in a pool of workers and
+        yields the results in argument order.  The tasks not yet yielded
+        are cancelled when the generator is closed.
+
+    Arguments:
+        (input) func -> Function to run
+        (input) arg_list -> List of argument tuples, one per run
+        (input) process -> True|False - Use process workers
+        (input) sched -> Schedule state dictionary
+        (output) -> Generator of results in argument order
+
+    """
+
+    pool = concurrent.futures.ProcessPoolExecutor if process \
+        else concurrent.futures.ThreadPoolExecutor
+    futures = sched["futures"]
+
+    with pool(max_workers=sched["workers"]) as executor:
+        try:
+            for nxt in range(len(arg_list)):
+                while nxt not in futures or not futures[nxt].done():
+                    submit_tasks(executor, func, arg_list, sched, nxt)
+                    concurrent.futures.wait(
+                        sched["running"],
+                        return_when=concurrent.futures.FIRST_COMPLETED)
+
+                sched["held"] -= sched["sizes"][nxt]
+                yield futures.pop(nxt).result()
+
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+
+def submit_tasks(executor, func, arg_list, sched, nxt):
+
+    """Function:  submit_tasks
+
+    Description:  Submits the pending tasks of schedule_tasks, largest first,
+        while a worker is free and the tasks held fit in the memory budget
+        and maximum.  The next task to be yielded is submitted even if they
+        do not.
+
+    Arguments:
+        (input) executor -> Executor of the workers
+        (input) func -> Function to run
+        (input) arg_list -> List of argument tuples, one per run
+        (input) sched -> Schedule state dictionary
+        (input) nxt -> Index of the next task to be yielded
+
+    """
+
+    futures, sizes = sched["futures"], sched["sizes"]
+    sched["running"] = {future for future in sched["running"]
+                        if not future.done()}
+
+    while sched["pending"] and len(sched["running"]) < sched["workers"]:
+        idx = sched["pending"][0]
+
+        if (sched["mem_bytes"] and sched["held"]
+                and sched["held"] + sizes[idx] > sched["mem_bytes"]) \
+           or (sched["max_held"] and len(futures) >= sched["max_held"]):
+            if nxt in futures:
+                break
+
+            idx = nxt
+
+        sched["pending"].remove(idx)
+        sched["began"][idx] = time.monotonic()
+        futures[idx] = executor.submit(func, *arg_list[idx])
+        futures[idx].add_done_callback(
+            lambda _, idx=idx: sched["ended"].setdefault(
+                idx, time.monotonic()))
+        sched["running"].add(futures[idx])
+        sched["held"] += sizes[idx]
+
+
+def worker_stats():
+
+    """Function:  worker_stats
+
+    Description:  Summarizes the worker time of the tasks scheduled since the
+        last summary and resets WORKER_STATS.  Utilisation is the busy time
+        of the workers over the time the workers were held.
+
+    Arguments:
+        (output) -> Worker summary string
+
+    """
+
+    tasks, busy, slots = (WORKER_STATS[key]
+                          for key in ("tasks", "busy", "slots"))
+    WORKER_STATS.update(tasks=0, busy=0.0, slots=0.0)
+
+    return (f"Tasks: {tasks}, Worker busy: {busy:.1f} s, Utilisation:"
+            f" {busy / slots * 100 if slots else 0:.0f}%")
+
+
+def map_binlogs(func, arg_list, workers=1, process=False, sizes=None):
+
+    """Function:  map_binlogs
+
+    Description:  Runs a function once for each set of arguments with
+        schedule_tasks and returns the results in the same order as the
+        arguments.
+
+    Arguments:
+        (input) func -> Function to run
+        (input) arg_list -> List of argument tuples, one per run
+        (input) workers -> Maximum number of workers
+        (input) process -> True|False - Use process workers
+        (input) sizes -> List of task sizes in bytes in argument order
+        (output) -> List of results in argument order
+
+    """
+
+    return list(schedule_tasks(func, arg_list, workers, process, sizes))
+
+
+def mirror_binlog(server, binlog, mirror_dir, size, bin_path=None):
+
+    """Function:  mirror_binlog
+
+    Description:  Fetches a closed binary log from the server with
+        mysqlbinlog --raw into a work directory in the mirror directory and
+        moves it into the mirror directory once its size matches the size
+        on the server, so a partial binary log is never mirrored.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) mirror_dir -> Directory path to the mirrored binary logs
+        (input) size -> Size of the binary log on the server
+        (input) bin_path -> Path to MySQL binary directory
+        (output) -> True|False - Binary log mirrored
+
+    """
+
+    work_dir = tempfile.mkdtemp(prefix=".fetch-", dir=mirror_dir)
+
+    try:
+        cmd = crt_binlog_cmd(
+            server, binlog_files=[binlog],
+            opt_arg_list=["--read-from-remote-server", "--raw",
+                          f"--result-file={work_dir}{os.sep}"],
+            bin_path=bin_path)
+
+        with subprocess.Popen(cmd) as proc:
+            proc.wait()
+
+        path = os.path.join(work_dir, binlog)
+
+        if proc.returncode or not os.path.isfile(path) \
+           or os.path.getsize(path) != size:
+            return False
+
+        os.replace(path, os.path.join(mirror_dir, binlog))
+
+        return True
+
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def evict_mirror(mirror_dir, max_bytes, keep=None):
+
+    """Function:  evict_mirror
+
+    Description:  Removes the least recently used binary logs from the mirror
+        directory until the mirrored binary logs fit in the disk budget.
+        The modification time of a mirrored binary log is its last use.
+
+    Arguments:
+        (input) mirror_dir -> Directory path to the mirrored binary logs
+        (input) max_bytes -> Disk budget in bytes
+        (input) keep -> List of binary log names not to remove
+        (output) total -> Bytes of mirrored binary logs left
+
+    """
+
+    keep = set() if keep is None else set(keep)
+    files = []
+
+    for entry in os.scandir(mirror_dir):
+        if entry.is_file() and not entry.name.startswith("."):
+            info = entry.stat()
+            files.append((info.st_mtime, entry.name, info.st_size))
+
+    total = sum(size for _, _, size in files)
+
+    for _, binlog, size in sorted(files):
+        if total <= max_bytes:
+            break
+
+        if binlog not in keep:
+            os.remove(os.path.join(mirror_dir, binlog))
+            total -= size
+
+    return total
+
+
+def plan_mirror(binlog_list, mirror_dir, sizes, max_bytes):
+
+    """Function:  plan_mirror
+
+    Description:  Picks the closed binary logs in the list that fit in the
+        disk budget, in list order, and marks the ones already mirrored as
+        recently used.
+
+    Arguments:
+        (input) binlog_list -> List of closed binary log names
+        (input) mirror_dir -> Directory path to the mirrored binary logs
+        (input) sizes -> Dictionary of binary log name to size on the server
+        (input) max_bytes -> Disk budget in bytes
+        (output) keep -> List of binary log names to mirror
+        (output) fetch -> List of binary log names to fetch
+
+    """
+
+    keep, fetch = [], []
+    used = 0
+
+    for binlog in binlog_list:
+        if binlog not in sizes or used + sizes[binlog] > max_bytes:
+            continue
+
+        used += sizes[binlog]
+        keep.append(binlog)
+        path = os.path.join(mirror_dir, binlog)
+
+        if os.path.isfile(path):
+            # Mark as recently used.
+            os.utime(path)
+
+        else:
+            fetch.append(binlog)
+
+    return keep, fetch
+
+
+def mirror_binlogs(                                     # pylint:disable=R0913
+        server, binlog_list, mirror_dir, max_bytes, bin_path=None,
+        workers=1):
+
+    """Function:  mirror_binlogs
+
+    Description:  Keeps a local mirror of the closed binary logs in the list.
+        Mirrored binary logs that were purged from the server or whose size
+        does not match the server are removed, the closed binary logs that
+        fit in the disk budget are kept or fetched, in list order, and the
+        least recently used binary logs are evicted to make room.  The
+        active binary log is never mirrored.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog_list -> List of binary log names
+        (input) mirror_dir -> Directory path to the mirrored binary logs
+        (input) max_bytes -> Disk budget in bytes
+        (input) bin_path -> Path to MySQL binary directory
+        (input) workers -> Number of binary logs to fetch at the same time
+        (output) -> List of binary log names in the mirror directory
+
+    """
+
+    logs = mysql_libs.fetch_logs(server)
+    sizes = {row["Log_name"]: row["File_size"] for row in logs}
+    active = logs[-1]["Log_name"] if logs else None
+
+    for entry in os.scandir(mirror_dir):
+        if entry.is_file() and not entry.name.startswith(".") \
+           and (entry.name == active
+                or entry.stat().st_size != sizes.get(entry.name)):
+            os.remove(entry.path)
+
+    keep, fetch = plan_mirror(
+        [binlog for binlog in binlog_list if binlog != active], mirror_dir,
+        sizes, max_bytes)
+    evict_mirror(mirror_dir, max_bytes - sum(sizes[binlog]
+                                             for binlog in fetch), keep)
+    fetched = map_binlogs(
+        mirror_binlog,
+        [(server, binlog, mirror_dir, sizes[binlog], bin_path)
+         for binlog in fetch], workers,
+        sizes=[sizes[binlog] for binlog in fetch])
+    failed = {binlog for binlog, done in zip(fetch, fetched) if not done}
+
+    return [binlog for binlog in keep if binlog not in failed]
+
+
+def group_binlogs(binlog_list, binlog_dir=None):
+
+    """Function:  group_binlogs
+
+    Description:  Splits the binary log list, in order, into runs of binary
+        logs that are in the local binary log directory and runs of binary
+        logs that have to be read from the server.
+
+    Arguments:
+        (input) binlog_list -> List of binary log names
+        (input) binlog_dir -> Directory path to local binary log files
+        (output) -> List of (binary log directory or None, binary log names)
+
+    """
+
+    return [
+        (binlog_dir if local else None, list(binlogs))
+        for local, binlogs in itertools.groupby(
+            binlog_list, lambda binlog: bool(binlog_dir) and os.path.isfile(
+                os.path.join(binlog_dir, binlog)))]
+
+
+def sync_mirror(server, args, binlog_list):
+
+    """Function:  sync_mirror
+
+    Description:  Mirrors the closed binary logs in the list if the -m option
+        is passed.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (output) -> Directory path to the mirrored binary logs or None
+
+    """
+
+    if not args.get_val("-m"):
+        return None
+
+    mirror_binlogs(
+        server, binlog_list, args.get_val("-m"),
+        int(args.get_val("-z", def_val=MIRROR_MBYTES)) * 1048576,
+        args.get_val("-p"), int(args.get_val("-n", def_val=1)))
+
+    return args.get_val("-m")
+
+
+def process_logs_list(server, args):
+
+    """Function:  process_logs_list
+
+    Description:  Get a list of binary log file names from the source database.
+        Clean up the list if the -f and/or -g options are used.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (output) status -> Tuple on process status
+            status[0] - True|False - Process successful
+            status[1] - Error message if process failed
+        (output) binlog_list -> List of binary log file names
+
+    """
+
+    status = (True, None)
+    binlog_list = []
+
+    # Is -f and -g in the argument list and in the correct order.
+    if (args.arg_exist("-f") and args.arg_exist("-g")) \
+       and args.get_val("-g") < args.get_val("-f"):
+
+        status = (False, f'Error:  Option -g: {args.get_val("-g")} is before'
+                  f' -f {args.get_val("-f")}')
+
+        return status, binlog_list
+
+    binlog_list = gen_libs.dict_2_list(
+        mysql_libs.fetch_logs(server), "Log_name")
+
+    if args.arg_exist("-f") and args.get_val("-f") in binlog_list:
+
+        # Remove any logs before log file name.
+        while binlog_list[0] < args.get_val("-f"):
+            binlog_list.pop(0)
+
+    elif args.arg_exist("-f"):
+
+        status = (
+            False, f'Error:  Option -f: {args.get_val("-f")} not found in'
+            f' binary log list.')
+
+        return status, binlog_list
+
+    if args.arg_exist("-g") and args.get_val("-g") in binlog_list:
+        # Remove any logs after log file name.
+        while binlog_list[-1] > args.get_val("-g"):
+            binlog_list.pop(-1)
+
+    elif args.arg_exist("-g"):
+
+        status = (
+            False, f'Error:  Option -g: {args.get_val("-g")} not found in'
+            f' binary log list.')
+
+    return status, binlog_list
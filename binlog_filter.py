@@ -0,0 +1,670 @@
+# Classification (U)
+
+"""Program:  binlog_filter.py
+
+    Description:  Binary log filter of mysql_log_admin.py (-B, -X, -K, -N,
+        -G, -Y).  Groups the mysqlbinlog output into events and transactions
+        and passes on the transactions the filter keeps, and keeps the Bloom
+        filter of the tables each binary log changes (-Q).
+
+    Usage:
+        import binlog_filter
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import re
+import struct
+import hashlib
+import fnmatch
+import math
+
+# Local
+try:
+    from .mysql_lib import mysql_libs
+    from . import binlog_reader
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_reader
+    import version
+
+__version__ = version.__version__
+
+# Bloom filter of the tables changed by a binary log (-i, -Q): file header
+#   (magic, binary log size, number of bits, number of hashes, flags), the
+#   flag of a binary log that changes tables that are not known and the
+#   default false positive rate as one in this many look ups.
+BLOOM_MAGIC = b"MLABLM01"
+BLOOM_HEADER = struct.Struct("<8sQIIB")
+BLOOM_ANY = 0x01
+BLOOM_RATE = 100
+
+# Lines that start the mysqlbinlog trailer, written once after the last event.
+GTID_AUTOMATIC = b"SET @@SESSION.GTID_NEXT= 'AUTOMATIC'"
+DELIMITER_END = b"DELIMITER ;\n"
+
+# mysqlbinlog event header line with the event timestamp and type.
+FOLLOW_HEADER = re.compile(
+    rb"^#(\d{6}\s+\d?\d:\d\d:\d\d)\s+server id\s+\d+\s+end_log_pos\s+\d+\s+"
+    rb"(?:CRC32\s+\w+\s+)?(\w+)", re.M)
+
+# Transaction grouping of the filter and of the parallel applier (-a): events
+#   that start a transaction, events applied on every mysql client session
+#   after the sessions are idle and the session state lines mysqlbinlog only
+#   writes when they change.
+APPLY_TXN = (b"GTID", b"Anonymous_GTID")
+APPLY_BARRIER = (b"header", b"Start", b"trailer")
+APPLY_SESSION = re.compile(
+    rb"^(?:/\*!\d*\s*)?(SET @@session\.\w+|\\C|use)\b")
+
+# Binary log filter (-B, -X, -K, -N, -G, -Y): the include and exclude list
+#   of each option, the table of a Table_map event and of a rows event, the
+#   default database set in a Query event, the Query statements that start
+#   and end a transaction and the DDL statements that change a single table.
+FILTER_OPTS = {"-B": "dbs", "-X": "skip_dbs", "-K": "tables",
+               "-N": "skip_tables", "-G": "types", "-Y": "skip_types"}
+FILTER_TABLE = re.compile(
+    rb"Table_map: `((?:[^`]|``)*)`\.`((?:[^`]|``)*)` mapped to number (\d+)")
+FILTER_ROWS = re.compile(rb"_rows\w*: table id (\d+)")
+FILTER_USE = re.compile(rb"^use `((?:[^`]|``)*)`")
+FILTER_TXN = (b"BEGIN", b"COMMIT", b"ROLLBACK")
+FILTER_DDL = re.compile(
+    rb"\s*(?:CREATE|ALTER|DROP|TRUNCATE)\s+"
+    rb"(?:(?:TEMPORARY|ONLINE|OFFLINE|IGNORE)\s+)*TABLE\s+"
+    rb"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    rb"(`(?:[^`]|``)+`|[^\s`.,;(]+)(?:\s*\.\s*(`(?:[^`]|``)+`|[^\s`.,;(]+))?"
+    rb"(\s*,|.*\bRENAME\b)?", re.I | re.S)
+
+# Query statements that start an XA transaction.
+CATALOG_XA_START = (b"XA START", b"XA BEGIN")
+
+
+def ddl_table(stmt, dbase=None):
+
+    """Function:  ddl_table
+
+    Description:  Returns the table of a CREATE, ALTER, DROP or TRUNCATE
+        TABLE statement that changes a single table.  A statement on more
+        than one table or that renames a table returns None, as do all other
+        statements.
+
+    Arguments:
+        (input) stmt -> Statement
+        (input) dbase -> Default database or None
+        (output) -> Tuple of the database and table names or None
+
+    """
+
+    match = FILTER_DDL.match(stmt)
+
+    if not match or match.group(3) is not None:
+        return None
+
+    names = tuple(
+        (name[1:-1].replace(b"``", b"`") if name.startswith(b"`")
+         else name).decode("utf-8", "replace")
+        for name in match.group(1, 2) if name is not None)
+
+    if len(names) == 1:
+        return (dbase, names[0]) if dbase else None
+
+    return names
+
+
+def binlog_tables(binlog):
+
+    """Function:  binlog_tables
+
+    Description:  Reads a binary log file with the native binary log reader
+        and collects the tables of its Table_map events and of the DDL
+        statements of its Query events that change a single table.  Other
+        statements, other than the start and end of a transaction, and
+        compressed transactions change tables that are not known.
+
+    Arguments:
+        (input) binlog -> Path to a binary log file
+        (output) tables -> Set of the database.table names
+        (output) any_table -> True|False - Changes tables that are not known
+
+    """
+
+    tables, any_table, crc = set(), False, 0
+
+    for event in binlog_reader.read_binlog_events(binlog, body=True):
+        body = event.body
+
+        if event.type_code == binlog_reader.FORMAT_DESCRIPTION_EVENT:
+            crc = binlog_reader.fde_checksum(body)
+
+        elif event.type_code == binlog_reader.TABLE_MAP_EVENT:
+            tables.add(".".join(binlog_reader.table_map_name(body)))
+
+        elif event.type_code == binlog_reader.QUERY_EVENT:
+            dbase, stmt = binlog_reader.query_event(body, crc)
+
+            if stmt.upper() in FILTER_TXN:
+                continue
+
+            table = ddl_table(stmt, dbase)
+
+            if table:
+                tables.add(".".join(table))
+
+            else:
+                any_table = True
+
+        elif event.type_code == binlog_reader.TRANSACTION_PAYLOAD_EVENT:
+            any_table = True
+
+    return tables, any_table
+
+
+def bloom_bits(name, nbits, nhashes):
+
+    """Function:  bloom_bits
+
+    Description:  Returns the bits of a name in a Bloom filter, by double
+        hashing of a BLAKE2 digest of the name.
+
+    Arguments:
+        (input) name -> Name to hash
+        (input) nbits -> Number of bits of the Bloom filter
+        (input) nhashes -> Number of hashes of the Bloom filter
+        (output) -> List of the bit numbers
+
+    """
+
+    hash1, hash2 = struct.unpack("<QQ", hashlib.blake2b(
+        name.encode("utf-8"), digest_size=16).digest())
+
+    return [(hash1 + cnt * hash2) % nbits for cnt in range(nhashes)]
+
+
+def build_binlog_bloom(binlog, bloom_file, rate=BLOOM_RATE):
+
+    """Function:  build_binlog_bloom
+
+    Description:  Reads a closed binary log file and writes the Bloom filter
+        of the tables it changes, sized for a false positive rate of one in
+        rate look ups.
+
+    Arguments:
+        (input) binlog -> Path to a binary log file
+        (input) bloom_file -> Path to the Bloom filter file
+        (input) rate -> False positive rate as one in this many look ups
+
+    """
+
+    tables, any_table = binlog_tables(binlog)
+    count = max(len(tables), 1)
+    nbits = max(
+        int(math.ceil(count * math.log(max(rate, 1)) / math.log(2) ** 2)), 8)
+    nhashes = max(int(round(nbits / count * math.log(2))), 1)
+    bits = bytearray((nbits + 7) // 8)
+
+    for name in tables:
+        for bit in bloom_bits(name, nbits, nhashes):
+            bits[bit >> 3] |= 1 << (bit & 7)
+
+    tmp_file = bloom_file + ".tmp"
+
+    with open(tmp_file, "wb") as f_hdlr:
+        f_hdlr.write(BLOOM_HEADER.pack(
+            BLOOM_MAGIC, os.path.getsize(binlog), nbits, nhashes,
+            BLOOM_ANY if any_table else 0))
+        f_hdlr.write(bits)
+
+    os.replace(tmp_file, bloom_file)
+
+
+def open_binlog_bloom(index_dir, binlog, size):
+
+    """Function:  open_binlog_bloom
+
+    Description:  Reads the Bloom filter of a binary log.  The Bloom filter
+        is only returned if it was built from a binary log of the same size.
+
+    Arguments:
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) binlog -> Binary log name
+        (input) size -> Size of the binary log
+        (output) data -> Bloom filter file contents or None
+
+    """
+
+    try:
+        with open(os.path.join(index_dir, binlog + ".blm"), "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+    except OSError:
+        return None
+
+    if len(data) < BLOOM_HEADER.size:
+        return None
+
+    magic, bsize, nbits, nhashes, _ = BLOOM_HEADER.unpack_from(data)
+
+    if magic != BLOOM_MAGIC or bsize != size or not nhashes \
+       or not nbits or len(data) != BLOOM_HEADER.size + (nbits + 7) // 8:
+        return None
+
+    return data
+
+
+def search_binlog_bloom(data, name):
+
+    """Function:  search_binlog_bloom
+
+    Description:  Checks if a name may be in a Bloom filter.
+
+    Arguments:
+        (input) data -> Bloom filter file contents
+        (input) name -> database.table name
+        (output) -> True|False - Name may be in the Bloom filter
+
+    """
+
+    _, _, nbits, nhashes, _ = BLOOM_HEADER.unpack_from(data)
+
+    return all(data[BLOOM_HEADER.size + (bit >> 3)] & (1 << (bit & 7))
+               for bit in bloom_bits(name, nbits, nhashes))
+
+
+def bloom_rules_out(filt, data):
+
+    """Function:  bloom_rules_out
+
+    Description:  Checks with the Bloom filter of a binary log if the binary
+        log filter drops all of its transactions.  Only a filter with a list
+        of tables to keep without wildcards is checked.  A binary log that
+        changes tables that are not known is only ruled out if the filter
+        drops Query events by type.
+
+    Arguments:
+        (input) filt -> Dictionary of the binary log filter
+        (input) data -> Bloom filter file contents
+        (output) -> True|False - No transaction of the binary log is kept
+
+    """
+
+    tables = filt.get("tables", [])
+
+    if not tables or any(set(name) & set("*?[") for name in tables):
+        return False
+
+    if BLOOM_HEADER.unpack_from(data)[4] & BLOOM_ANY and match_filter(
+            {key: filt[key] for key in ("types", "skip_types")
+             if key in filt}, None, None, "query"):
+        return False
+
+    return not any(search_binlog_bloom(data, name) for name in tables)
+
+
+def prune_bloom_binlogs(                                # pylint:disable=R0913
+        server, args, binlog_list, pos_args, stop_args, binlog_dir=None):
+
+    """Function:  prune_bloom_binlogs
+
+    Description:  Drops the closed binary logs that the Bloom filters in the
+        -i directory rule out for the binary log filter.  The missing Bloom
+        filters are built from the local binary log files, so each binary
+        log is read for its Bloom filter once after it is closed.  The
+        start position is dropped with the first binary log and the stop
+        position with the last one.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) pos_args -> Arguments only for the first binary log
+        (input) stop_args -> Arguments only for the last binary log
+        (input) binlog_dir -> Directory path to local binary log files
+        (output) binlog_list -> List of binary log names to read
+        (output) pos_args -> Arguments only for the first binary log
+        (output) stop_args -> Arguments only for the last binary log
+
+    """
+
+    filt = crt_filter(args)
+    index_dir = args.get_val("-i")
+
+    if not filt or not index_dir or not binlog_list:
+        return binlog_list, pos_args, stop_args
+
+    rate = int(args.get_val("-Q", def_val=BLOOM_RATE))
+    logs = mysql_libs.fetch_logs(server)
+    sizes = {row["Log_name"]: row["File_size"] for row in logs}
+    active = logs[-1]["Log_name"] if logs else None
+    binlog_reader.purge_binlog_index(index_dir, list(sizes))
+    keep = []
+
+    for binlog in binlog_list:
+        if binlog == active or binlog not in sizes:
+            keep.append(binlog)
+            continue
+
+        data = load_binlog_bloom(
+            index_dir, binlog, sizes[binlog], binlog_dir, rate)
+
+        if data is None or not bloom_rules_out(filt, data):
+            keep.append(binlog)
+
+    return (keep,
+            pos_args if keep and keep[0] == binlog_list[0] else [],
+            stop_args if keep and keep[-1] == binlog_list[-1] else [])
+
+
+def load_binlog_bloom(index_dir, binlog, size, binlog_dir=None, rate=None):
+
+    """Function:  load_binlog_bloom
+
+    Description:  Opens the Bloom filter of a closed binary log and builds it
+        first if it is missing and the binary log file in the binary log
+        directory is complete.
+
+    Arguments:
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) binlog -> Binary log name
+        (input) size -> Size of the binary log on the server
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) rate -> False positive rate of a new Bloom filter
+        (output) data -> Bloom filter contents or None if not available
+
+    """
+
+    data = open_binlog_bloom(index_dir, binlog, size)
+    path = os.path.join(binlog_dir, binlog) if binlog_dir else None
+
+    if data is None and path and os.path.isfile(path) \
+       and os.path.getsize(path) == size:
+        build_binlog_bloom(
+            path, os.path.join(index_dir, binlog + ".blm"),
+            rate or BLOOM_RATE)
+        data = open_binlog_bloom(index_dir, binlog, size)
+
+    return data
+
+
+def split_binlog_events(lines):
+
+    """Function:  split_binlog_events
+
+    Description:  Groups the mysqlbinlog output lines into events.  The lines
+        before the first event are returned as a header event and the lines
+        from the start of the trailer as a trailer event.
+
+    Arguments:
+        (input) lines -> mysqlbinlog output lines
+        (output) -> Generator of the event type and the list of event lines
+
+    """
+
+    kind, block, held = b"header", [], None
+
+    for line in lines:
+        if not isinstance(line, bytes):
+            line = line.encode("utf-8")
+
+        # The "# at" line belongs to the event of the header line after it.
+        if held is not None:
+            match = FOLLOW_HEADER.match(line)
+
+            if match:
+                if block:
+                    yield kind, block
+
+                kind, block = match.group(2), []
+
+            block.append(held)
+            held = None
+
+        if kind != b"trailer" and line.startswith(b"# at "):
+            held = line
+            continue
+
+        if kind != b"trailer" and (
+                line.startswith(GTID_AUTOMATIC) or line == DELIMITER_END):
+            if block:
+                yield kind, block
+
+            kind, block = b"trailer", []
+
+        block.append(line)
+
+    if held is not None:
+        block.append(held)
+
+    if block:
+        yield kind, block
+
+
+def crt_filter(args):
+
+    """Function:  crt_filter
+
+    Description:  Creates the binary log filter from the include and exclude
+        lists of databases, tables and event types.  The event types are
+        matched without case.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) -> Dictionary of the binary log filter or None
+
+    """
+
+    filt = {key: list(args.get_val(opt)) for opt, key in FILTER_OPTS.items()
+            if args.get_val(opt)}
+
+    for key in ("types", "skip_types"):
+        if key in filt:
+            filt[key] = [item.lower() for item in filt[key]]
+
+    return filt or None
+
+
+def match_filter(filt, dbase, table, kind):
+
+    """Function:  match_filter
+
+    Description:  Checks an event against the include and exclude lists of
+        the binary log filter.  The names are matched with shell wildcards
+        and the tables as database.table.  The table lists are not checked
+        for events without a table.
+
+    Arguments:
+        (input) filt -> Dictionary of the binary log filter
+        (input) dbase -> Database name or None
+        (input) table -> Table name or None
+        (input) kind -> Event type in lower case
+        (output) -> True|False - Event passes the filter
+
+    """
+
+    checks = [("dbs", "skip_dbs", dbase), ("types", "skip_types", kind)]
+
+    if table is not None:
+        checks.append(("tables", "skip_tables", f"{dbase}.{table}"))
+
+    for include, exclude, name in checks:
+        if name is None:
+            if include in filt:
+                return False
+
+            continue
+
+        if include in filt and not any(
+                fnmatch.fnmatchcase(name, pat) for pat in filt[include]):
+            return False
+
+        if any(fnmatch.fnmatchcase(name, pat)
+               for pat in filt.get(exclude, [])):
+            return False
+
+    return True
+
+
+def filter_group(filt, group, tags):
+
+    """Function:  filter_group
+
+    Description:  Passes on the events of a transaction if any of its Query
+        and rows events passes the filter, or if it has none.  Otherwise only
+        the session state lines of the transaction are passed on, as the
+        events after it expect them to be set.
+
+    Arguments:
+        (input) filt -> Dictionary of the binary log filter
+        (input) group -> List of the event type and event lines
+        (input) tags -> List of the database, table and event type of the
+            Query and rows events
+        (output) -> Generator of the event type and the list of event lines
+
+    """
+
+    if not tags or any(match_filter(filt, *tag) for tag in tags):
+        yield from group
+        return
+
+    session = [line for _, lines in group for line in lines
+               if APPLY_SESSION.match(line)]
+
+    if session:
+        yield b"Query", session
+
+
+def filter_binlog_events(events, filt):
+
+    """Function:  filter_binlog_events
+
+    Description:  Groups the mysqlbinlog events into transactions and passes
+        on the transactions that the filter keeps.  A transaction starts at
+        a GTID event or, without GTIDs, at the first event after the end of
+        the last one, and the header, format description and trailer are
+        transactions of their own.  A Query event is matched by the default
+        database of the session, or by its table if it is DDL on a single
+        table, and a rows event by the table of its Table_map event.
+
+    Arguments:
+        (input) events -> Generator of the event type and event lines
+        (input) filt -> Dictionary of the binary log filter
+        (output) -> Generator of the event type and the list of event lines
+
+    """
+
+    group = []
+    state = {"dbase": None, "tables": {}, "tags": [], "in_txn": False,
+             "closed": False}
+
+    for kind, lines in events:
+        if kind in APPLY_TXN or kind in APPLY_BARRIER or state["closed"]:
+            yield from filter_group(filt, group, state["tags"])
+            group = []
+            state.update(tags=[], in_txn=False, closed=kind in APPLY_BARRIER)
+
+        group.append((kind, lines))
+        header = b"".join(lines[:2])
+
+        if kind == b"Table_map":
+            match = FILTER_TABLE.search(header)
+
+            if match:
+                state["tables"][match.group(3)] = tuple(
+                    name.decode("utf-8", "replace").replace("``", "`")
+                    for name in match.group(1, 2))
+
+        elif kind == b"Query":
+            tag_query(lines, state)
+
+        elif kind == b"Xid":
+            state["closed"] = True
+
+        else:
+            match = FILTER_ROWS.search(header)
+
+            if match:
+                state["tags"].append(
+                    state["tables"].get(match.group(1), (None, None))
+                    + (kind.decode("utf-8").lower(),))
+
+    yield from filter_group(filt, group, state["tags"])
+
+
+def tag_query(lines, state):
+
+    """Function:  tag_query
+
+    Description:  Tracks the default database of the session from a Query
+        event and tags the transaction with the database, and the table of
+        DDL on a single table, of its statement.  BEGIN opens a transaction,
+        COMMIT and ROLLBACK close it, and any other statement outside a
+        transaction is a transaction of its own.
+
+    Arguments:
+        (input) lines -> List of the event lines
+        (input) state -> Dictionary of the filter state
+
+    """
+
+    for line in lines:
+        match = FILTER_USE.match(line)
+
+        if match:
+            state["dbase"] = match.group(1).decode(
+                "utf-8", "replace").replace("``", "`")
+
+    stmt = query_stmt(lines)
+
+    if stmt.upper() == b"BEGIN":
+        state["in_txn"] = True
+
+    elif stmt.upper() in FILTER_TXN:
+        state["closed"] = True
+
+    else:
+        state["tags"].append(
+            (ddl_table(stmt, state["dbase"]) or (state["dbase"], None))
+            + ("query",))
+        state["closed"] = not state["in_txn"]
+
+
+def query_stmt(lines):
+
+    """Function:  query_stmt
+
+    Description:  Returns the statement of a Query event without the
+        comments and session state lines mysqlbinlog writes around it.
+
+    Arguments:
+        (input) lines -> List of the event lines
+        (output) -> Statement
+
+    """
+
+    return b"".join(
+        line for line in lines
+        if not line.startswith((b"#", b"SET ", b"use ", b"/*!"))).strip()
+
+
+def filter_binlog(lines, filt):
+
+    """Function:  filter_binlog
+
+    Description:  Filters the mysqlbinlog output lines.  The lines of a
+        transaction are held until the end of the transaction is read.
+
+    Arguments:
+        (input) lines -> mysqlbinlog output lines
+        (input) filt -> Dictionary of the binary log filter
+        (output) -> Generator of the mysqlbinlog output lines kept
+
+    """
+
+    for _, event in filter_binlog_events(split_binlog_events(lines), filt):
+        yield from event
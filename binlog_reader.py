@@ -0,0 +1,715 @@
+# Classification (U)
+
+"""Program:  binlog_reader.py
+
+    Description:  Native binary log v4 reader of mysql_log_admin.py.  Walks
+        the event headers of the local binary log files, builds and searches
+        the index of each binary log (-i) and finds the last Query before a
+        timestamp in a binary log or in a range of it.
+
+    Usage:
+        import binlog_reader
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import re
+import bisect
+import struct
+import mmap
+import time
+import collections
+
+# Local
+try:
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import version
+
+__version__ = version.__version__
+
+# Binary log v4 file header and common event header (timestamp, type_code,
+#   server_id, event_size, log_pos, flags).
+BINLOG_MAGIC = b"\xfebin"
+EVENT_HEADER = struct.Struct("<IBIIIH")
+
+# Event type codes used by the native binary log reader.
+QUERY_EVENT = 2
+ROTATE_EVENT = 4
+FORMAT_DESCRIPTION_EVENT = 15
+XID_EVENT = 16
+TABLE_MAP_EVENT = 19
+GTID_LOG_EVENT = 33
+ANONYMOUS_GTID_LOG_EVENT = 34
+XA_PREPARE_LOG_EVENT = 38
+TRANSACTION_PAYLOAD_EVENT = 40
+
+BinlogEvent = collections.namedtuple(
+    "BinlogEvent",
+    "timestamp type_code server_id event_size log_pos flags offset body")
+
+# Binary log index file header (magic, binary log size) and checkpoint record
+#   (max timestamp before offset, offset, last Query timestamp and end log
+#   position before offset).  A checkpoint is taken at the next transaction
+#   start after INDEX_EVENTS events or INDEX_BYTES bytes.  A partial index
+#   or Bloom filter not written to for INDEX_TMP_AGE seconds is left over
+#   from an interrupted build.
+INDEX_MAGIC = b"MLAIDX01"
+INDEX_HEADER = struct.Struct("<8sQ")
+INDEX_RECORD = struct.Struct("<IQIQ")
+INDEX_EVENTS = 1000
+INDEX_BYTES = 1048576
+INDEX_TMP_AGE = 3600
+
+
+def read_binlog_events(binlog, start_pos=None, stop_pos=None, body=False):
+
+    """Function:  read_binlog_events
+
+    Description:  Native binary log v4 reader.  Memory maps a binary log file
+        and walks the common event headers, yielding one BinlogEvent record
+        per event without decoding the event bodies.  A partial event at the
+        end of the file (i.e. active binary log) is not returned.
+
+    Arguments:
+        (input) binlog -> Path to a binary log file
+        (input) start_pos -> Offset of the first event to return
+        (input) stop_pos -> Stop at the first event at or past this offset
+        (input) body -> True|False - Include the event body bytes
+        (output) -> Generator of BinlogEvent records
+
+    """
+
+    hdr_len = EVENT_HEADER.size
+
+    with open(binlog, "rb") as f_hdlr:
+        size = os.fstat(f_hdlr.fileno()).st_size
+
+        if size < len(BINLOG_MAGIC):
+            return
+
+        data = mmap.mmap(f_hdlr.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if data[:len(BINLOG_MAGIC)] != BINLOG_MAGIC:
+            raise ValueError(f"{binlog} is not a binary log file")
+
+        offset = start_pos if start_pos else len(BINLOG_MAGIC)
+        end = size if stop_pos is None else min(size, stop_pos)
+        unpack = EVENT_HEADER.unpack_from
+        new_event = BinlogEvent._make
+
+        while offset + hdr_len <= size and offset < end:
+            header = unpack(data, offset)
+            esize = header[3]
+
+            if esize < hdr_len or offset + esize > size:
+                break
+
+            yield new_event(header + (
+                offset,
+                data[offset + hdr_len:offset + esize] if body else None))
+            offset += esize
+
+    finally:
+        data.close()
+
+
+def index_events(events, index_file, size):
+
+    """Function:  index_events
+
+    Description:  Passes binary log events through while recording the
+        checkpoints of a binary log index.  The index file is only written
+        once all the events of the binary log have been read.
+
+    Arguments:
+        (input) events -> Iterable of BinlogEvent records
+        (input) index_file -> Path to the binary log index file
+        (input) size -> Size of the binary log file
+        (output) -> Generator of BinlogEvent records
+
+    """
+
+    records = [INDEX_RECORD.pack(0, len(BINLOG_MAGIC), 0, 0)]
+    max_ts = query_ts = query_pos = count = 0
+    last_offset = end = len(BINLOG_MAGIC)
+
+    for event in events:
+        if event.type_code in (GTID_LOG_EVENT, ANONYMOUS_GTID_LOG_EVENT) \
+           and (count >= INDEX_EVENTS
+                or event.offset - last_offset >= INDEX_BYTES):
+            records.append(INDEX_RECORD.pack(
+                max_ts, event.offset, query_ts, query_pos))
+            last_offset = event.offset
+            count = 0
+
+        yield event
+
+        count += 1
+        end = event.offset + event.event_size
+
+        max_ts = max(max_ts, event.timestamp)
+
+        if event.type_code == QUERY_EVENT:
+            query_ts, query_pos = event.timestamp, event.log_pos
+
+    records.append(INDEX_RECORD.pack(max_ts, end, query_ts, query_pos))
+    tmp_file = index_file + ".tmp"
+
+    with open(tmp_file, "wb") as f_hdlr:
+        f_hdlr.write(INDEX_HEADER.pack(INDEX_MAGIC, size))
+        f_hdlr.write(b"".join(records))
+
+    os.replace(tmp_file, index_file)
+
+
+def build_binlog_index(binlog, index_file):
+
+    """Function:  build_binlog_index
+
+    Description:  Reads a closed binary log file with the native binary log
+        reader and writes its binary log index.
+
+    Arguments:
+        (input) binlog -> Path to a binary log file
+        (input) index_file -> Path to the binary log index file
+
+    """
+
+    collections.deque(index_events(
+        read_binlog_events(binlog), index_file, os.path.getsize(binlog)),
+        maxlen=0)
+
+
+def open_binlog_index(index_dir, binlog, size):
+
+    """Function:  open_binlog_index
+
+    Description:  Memory maps the index of a binary log.  The index is only
+        returned if it was built from a binary log of the same size.
+
+    Arguments:
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) binlog -> Binary log name
+        (input) size -> Size of the binary log
+        (output) data -> Memory map of the index or None
+
+    """
+
+    try:
+        with open(os.path.join(index_dir, binlog + ".idx"), "rb") as f_hdlr:
+            data = mmap.mmap(f_hdlr.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (OSError, ValueError):
+        return None
+
+    length = len(data) - INDEX_HEADER.size
+
+    if length < INDEX_RECORD.size or length % INDEX_RECORD.size \
+       or INDEX_HEADER.unpack_from(data) != (INDEX_MAGIC, size):
+        data.close()
+        data = None
+
+    return data
+
+
+def search_binlog_index(data, tstamp=None):
+
+    """Function:  search_binlog_index
+
+    Description:  Binary search of a binary log index for the last checkpoint
+        where all the events before it are earlier than the timestamp.
+
+    Arguments:
+        (input) data -> Memory map of the index
+        (input) tstamp -> Unix timestamp or None for the end of the binary log
+        (output) -> Checkpoint record (max_ts, offset, query_ts, query_pos)
+
+    """
+
+    low, high = 0, (len(data) - INDEX_HEADER.size) // INDEX_RECORD.size - 1
+
+    if tstamp is None:
+        low = high
+
+    while low < high:
+        mid = (low + high + 1) // 2
+
+        if INDEX_RECORD.unpack_from(
+                data, INDEX_HEADER.size + mid * INDEX_RECORD.size)[0] < tstamp:
+            low = mid
+
+        else:
+            high = mid - 1
+
+    return INDEX_RECORD.unpack_from(
+        data, INDEX_HEADER.size + low * INDEX_RECORD.size)
+
+
+def index_last_query(binlog, data, start_ts=None, stop_ts=None):
+
+    """Function:  index_last_query
+
+    Description:  Uses a binary log index to find the last Query event that
+        is between the start and stop timestamps.  Only the events after
+        the checkpoint found for the stop timestamp are read.
+
+    Arguments:
+        (input) binlog -> Path to a binary log file
+        (input) data -> Memory map of the binary log index
+        (input) start_ts -> Start Unix timestamp or None
+        (input) stop_ts -> Stop Unix timestamp or None
+        (output) last_log_pos -> End log position of Query or None
+
+    """
+
+    _, offset, query_ts, query_pos = search_binlog_index(data, stop_ts)
+    last_log_pos = None
+
+    if offset < INDEX_HEADER.unpack_from(data)[1]:
+        for event in read_binlog_events(binlog, start_pos=offset):
+            if stop_ts is not None and event.timestamp >= stop_ts:
+                break
+
+            if event.type_code == QUERY_EVENT \
+               and (start_ts is None or event.timestamp >= start_ts):
+                last_log_pos = event.log_pos
+
+    if last_log_pos is None and query_pos \
+       and (start_ts is None or query_ts >= start_ts):
+        last_log_pos = query_pos
+
+    return last_log_pos
+
+
+def purge_binlog_index(index_dir, log_files):
+
+    """Function:  purge_binlog_index
+
+    Description:  Removes the indexes and Bloom filters of binary logs that
+        have been purged from the database, and the partial ones left over
+        from an interrupted build.  Only the files of the binary logs with
+        the base name of the current binary logs are removed, so the
+        directory can hold the indexes of other servers and other files.
+
+    Arguments:
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) log_files -> List of current binary log names
+
+    """
+
+    log_files = set(log_files)
+
+    if not log_files:
+        return
+
+    pattern = re.compile(
+        "(?:" + "|".join(sorted({re.escape(name.rsplit(".", 1)[0])
+                                 for name in log_files}))
+        + r")\.\d+\.(?:idx|blm)(\.tmp)?")
+    stale = time.time() - INDEX_TMP_AGE
+
+    for name in os.listdir(index_dir):
+        match = pattern.fullmatch(name)
+        path = os.path.join(index_dir, name)
+
+        try:
+            if match and match.group(1) and os.path.getmtime(path) < stale:
+                os.remove(path)
+
+            elif match and not match.group(1) and name[:-4] not in log_files:
+                os.remove(path)
+
+        except FileNotFoundError:
+            # Renamed or removed by a build running at the same time.
+            pass
+
+
+def fde_checksum(body):
+
+    """Function:  fde_checksum
+
+    Description:  Returns the length of the checksum at the end of each
+        event of a binary log from its Format_description event.  Binary logs
+        from 5.6.1 end each event with the checksum if it is turned on.
+
+    Arguments:
+        (input) body -> Format_description event body
+        (output) -> Checksum length in bytes
+
+    """
+
+    server_version = tuple(int(num) for num in re.findall(
+        rb"\d+", body[2:52].split(b"\0")[0])[:3])
+
+    return 4 if server_version >= (5, 6, 1) and body[-5] == 1 else 0
+
+
+def table_map_name(body):
+
+    """Function:  table_map_name
+
+    Description:  Returns the database and table names of a Table_map event.
+
+    Arguments:
+        (input) body -> Table_map event body
+        (output) -> Tuple of the database and table names
+
+    """
+
+    db_len = body[8]
+    tbl_len = body[10 + db_len]
+
+    return (body[9:9 + db_len].decode("utf-8", "replace"),
+            body[11 + db_len:11 + db_len + tbl_len].decode(
+                "utf-8", "replace"))
+
+
+def query_event(body, crc=0):
+
+    """Function:  query_event
+
+    Description:  Returns the default database and statement of a Query
+        event.
+
+    Arguments:
+        (input) body -> Query event body
+        (input) crc -> Checksum length of the events
+        (output) -> Tuple of the default database, empty if none, and the
+            statement without surrounding white space
+
+    """
+
+    db_len = body[8]
+    start = 13 + struct.unpack_from("<H", body, 11)[0]
+
+    return (body[start:start + db_len].decode("utf-8", "replace"),
+            body[start + db_len + 1:len(body) - crc].strip())
+
+
+def scan_last_query(binlog, start_ts=None, stop_ts=None, index_file=None):
+
+    """Function:  scan_last_query
+
+    Description:  Uses the native binary log reader to find the last Query
+        event in a binary log file that is between the start and stop
+        timestamps.  If an index file is passed, the binary log index is
+        built during the scan and the rest of the binary log is read after
+        the stop timestamp.
+
+    Arguments:
+        (input) binlog -> Path to a binary log file
+        (input) start_ts -> Start Unix timestamp or None
+        (input) stop_ts -> Stop Unix timestamp or None
+        (input) index_file -> Path to the binary log index file to build
+        (output) last_log_pos -> End log position of Query or None
+
+    """
+
+    events = read_binlog_events(binlog)
+
+    if not index_file:
+        return last_query_pos(events, start_ts, stop_ts)
+
+    events = index_events(events, index_file, os.path.getsize(binlog))
+    last_log_pos = last_query_pos(events, start_ts, stop_ts)
+
+    # The index is only written once all the events have been read.
+    collections.deque(events, maxlen=0)
+
+    return last_log_pos
+
+
+def last_query_pos(events, start_ts=None, stop_ts=None):
+
+    """Function:  last_query_pos
+
+    Description:  Finds the last Query event in a sequence of binary log
+        events that is between the start and stop timestamps.  The events
+        are read until the first event at or after the stop timestamp, the
+        same as mysqlbinlog --stop-datetime does.
+
+    Arguments:
+        (input) events -> Iterable of BinlogEvent
+        (input) start_ts -> Start Unix timestamp or None
+        (input) stop_ts -> Stop Unix timestamp or None
+        (output) last_log_pos -> End log position of Query or None
+
+    """
+
+    return range_query_pos(events, start_ts, stop_ts)[0]
+
+
+def range_query_pos(events, start_ts=None, stop_ts=None):
+
+    """Function:  range_query_pos
+
+    Description:  Finds the last Query event in a sequence of binary log
+        events that is between the start and stop timestamps, reading until
+        the first event at or after the stop timestamp, and reports if that
+        event was reached.  Used to reduce the ranges of a binary log in
+        order, as the ranges after the one that reached the stop timestamp
+        are not used.
+
+    Arguments:
+        (input) events -> Iterable of BinlogEvent
+        (input) start_ts -> Start Unix timestamp or None
+        (input) stop_ts -> Stop Unix timestamp or None
+        (output) last_log_pos -> End log position of Query or None
+        (output) -> True|False - An event at or after the stop timestamp
+            was read
+
+    """
+
+    last_log_pos = None
+
+    for event in events:
+        if stop_ts is not None and event.timestamp >= stop_ts:
+            return last_log_pos, True
+
+        if event.type_code == QUERY_EVENT \
+           and (start_ts is None or event.timestamp >= start_ts):
+            last_log_pos = event.log_pos
+
+    return last_log_pos, False
+
+
+def find_file_pos(                                      # pylint:disable=R0913
+        binlog_dir, binlog, start_ts=None, stop_ts=None, index_dir=None,
+        closed=False):
+
+    """Function:  find_file_pos
+
+    Description:  Finds the last Query event in a local binary log file that
+        is between the start and stop timestamps.  For a closed binary log,
+        the binary log index is used if there is one, otherwise it is built
+        while the binary log is scanned.
+
+    Arguments:
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) binlog -> Binary log name
+        (input) start_ts -> Start Unix timestamp or None
+        (input) stop_ts -> Stop Unix timestamp or None
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) closed -> True|False - Binary log is no longer written to
+        (output) -> End log position of Query or None
+
+    """
+
+    path = os.path.join(binlog_dir, binlog)
+
+    if not index_dir or not closed:
+        return scan_last_query(path, start_ts, stop_ts)
+
+    data = open_binlog_index(index_dir, binlog, os.path.getsize(path))
+
+    if data is None:
+        return scan_last_query(
+            path, start_ts, stop_ts, os.path.join(index_dir, binlog + ".idx"))
+
+    try:
+        return index_last_query(path, data, start_ts, stop_ts)
+
+    finally:
+        data.close()
+
+
+def text_binlog_events(lines):
+
+    """Function:  text_binlog_events
+
+    Description:  Parses the event header lines of the mysqlbinlog output
+        into BinlogEvent records with the timestamp, end log position and,
+        for Query events, the type code.  The other fields are not set.
+
+    Arguments:
+        (input) lines -> Iterable of mysqlbinlog output lines
+        (output) -> Generator of BinlogEvent
+
+    """
+
+    regex = re.compile(
+        r"#(?P<dtime>\d{6}\s+\d?\d:\d\d:\d\d)\s+server id\s+\d+\s+"
+        r"end_log_pos\s+(?P<epos>\d+)\s+(CRC32\s+\w+\s+)?(?P<type>\w+)")
+    dtime = tstamp = None
+
+    for item in lines:
+        if not isinstance(item, str):
+            item = item.decode("utf-8", "replace")
+
+        match = regex.match(item)
+
+        if match:
+            # Consecutive events mostly share the same second.
+            if match.group("dtime") != dtime:
+                dtime = match.group("dtime")
+                tstamp = int(time.mktime(time.strptime(
+                    " ".join(dtime.split()), "%y%m%d %H:%M:%S")))
+
+            yield BinlogEvent(
+                tstamp, QUERY_EVENT if match.group("type") == "Query" else 0,
+                0, 0, int(match.group("epos")), 0, 0, None)
+
+
+def chunk_binlog(                                       # pylint:disable=R0913
+        binlog, size, chunk_bytes, start_pos=None, stop_pos=None,
+        index_dir=None, binlog_dir=None):
+
+    """Function:  chunk_binlog
+
+    Description:  Splits a binary log into byte ranges of about the chunk
+        size, so each range can be read by its own mysqlbinlog worker.  The
+        ranges start at transaction (GTID event) boundaries, taken from the
+        binary log index checkpoints if there is an index, otherwise from
+        the event headers of the local binary log file if it is the same
+        size.  A single range is returned if the binary log is not split.
+
+    Arguments:
+        (input) binlog -> Binary log name
+        (input) size -> Size of the binary log from SHOW BINARY LOGS
+        (input) chunk_bytes -> Size in bytes of a range
+        (input) start_pos -> Start position in the binary log or None
+        (input) stop_pos -> Stop position in the binary log or None
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) binlog_dir -> Directory path to local binary log files
+        (output) -> List of (start position, stop position) ranges, None
+            for the start or the end of the binary log
+
+    """
+
+    first = start_pos or len(BINLOG_MAGIC)
+    last = size if stop_pos is None else stop_pos
+    path = os.path.join(binlog_dir, binlog) if binlog_dir else None
+
+    if not chunk_bytes or not size or last - first <= chunk_bytes:
+        return [(start_pos, stop_pos)]
+
+    data = open_binlog_index(index_dir, binlog, size) if index_dir else None
+
+    if data is not None:
+        try:
+            offsets = [
+                INDEX_RECORD.unpack_from(
+                    data, INDEX_HEADER.size + idx * INDEX_RECORD.size)[1]
+                for idx in range(1, (len(data) - INDEX_HEADER.size)
+                                 // INDEX_RECORD.size - 1)]
+
+        finally:
+            data.close()
+
+    elif path and os.path.isfile(path) and os.path.getsize(path) == size:
+        offsets = [
+            event.offset for event in read_binlog_events(path, first, last)
+            if event.type_code in (GTID_LOG_EVENT, ANONYMOUS_GTID_LOG_EVENT)]
+
+    else:
+        return [(start_pos, stop_pos)]
+
+    bounds = [start_pos]
+    target = first + chunk_bytes
+
+    for offset in offsets:
+        if target <= offset < last:
+            bounds.append(offset)
+            target = offset + chunk_bytes
+
+    bounds.append(stop_pos)
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def chunk_binlogs(args, binlog_list, sizes, pos_args=None, stop_args=None):
+
+    """Function:  chunk_binlogs
+
+    Description:  Splits the binary logs larger than the -j chunk size into
+        ranges, using the sizes from SHOW BINARY LOGS and the transaction
+        boundaries from the -i indexes or the -b/-m local binary logs.  The
+        first range starts at the start position and the last range stops
+        at the stop position.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) sizes -> Dictionary of binary log name to size
+        (input) pos_args -> Arguments only for the first binary log
+        (input) stop_args -> Arguments only for the last binary log
+        (output) chunks -> Dictionary of binary log name to list of (start
+            position, stop position) ranges, for the split binary logs
+
+    """
+
+    chunks = {}
+    chunk_bytes = int(args.get_val("-j", def_val=0)) * 1048576
+
+    if not chunk_bytes or not binlog_list:
+        return chunks
+
+    start_pos = int(pos_args[0].split("=", 1)[1]) if pos_args else None
+    stop_pos = int(stop_args[0].split("=", 1)[1]) if stop_args else None
+    last = len(binlog_list) - 1
+
+    for cnt, binlog in enumerate(binlog_list):
+        ranges = chunk_binlog(
+            binlog, sizes.get(binlog), chunk_bytes,
+            start_pos if cnt == 0 else None,
+            stop_pos if cnt == last else None, args.get_val("-i"),
+            args.get_val("-b") or args.get_val("-m"))
+
+        if len(ranges) > 1:
+            chunks[binlog] = ranges
+
+    return chunks
+
+
+def sweep_query_pos(events, bounds):
+
+    """Function:  sweep_query_pos
+
+    Description:  Finds the last Query event in each of the time segments
+        between the window boundary timestamps, in one pass over a sequence
+        of binary log events.  Segment k holds the timestamps from
+        bounds[k - 1] up to, but not including, bounds[k].
+
+    Arguments:
+        (input) events -> Iterable of BinlogEvent
+        (input) bounds -> Sorted list of unique Unix timestamps
+        (output) last_pos -> Dictionary of segment to end log position of
+            the last Query in the segment
+
+    """
+
+    last_pos = {}
+
+    for event in events:
+        if event.type_code == QUERY_EVENT:
+            last_pos[bisect.bisect_right(bounds, event.timestamp)] = \
+                event.log_pos
+
+    return last_pos
+
+
+def sweep_file_pos(binlog_dir, binlog, bounds):
+
+    """Function:  sweep_file_pos
+
+    Description:  Finds the last Query event in each time segment of a local
+        binary log file with the native binary log reader.
+
+    Arguments:
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) binlog -> Binary log name
+        (input) bounds -> Sorted list of unique Unix timestamps
+        (output) -> Dictionary of segment to end log position of Query
+
+    """
+
+    return sweep_query_pos(
+        read_binlog_events(os.path.join(binlog_dir, binlog)), bounds)
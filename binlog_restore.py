@@ -0,0 +1,340 @@
+# Classification (U)
+
+"""Program:  binlog_restore.py
+
+    Description:  Restore of mysql_log_admin.py (-R).  Plans the binary
+        logs and positions to restore and restores them to the target
+        databases.
+
+    Usage:
+        import binlog_restore
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import subprocess
+import time
+import threading
+
+# Local
+try:
+    from .mysql_lib import mysql_class
+    from .mysql_lib import mysql_libs
+    from . import binlog_filter
+    from . import binlog_fetch
+    from . import binlog_search
+    from . import binlog_tee
+    from . import binlog_apply
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_filter
+    import binlog_fetch
+    import binlog_search
+    import binlog_tee
+    import binlog_apply
+    import version
+
+__version__ = version.__version__
+
+
+def restore_binlog(binlog_cmds, cmd, count=False, throttle=None, filt=None):
+
+    """Function:  restore_binlog
+
+    Description:  Runs mysqlbinlog into the mysql client through an OS pipe,
+        so the binary log entries are passed between the processes by the
+        kernel.  If there is more than one mysqlbinlog command, they are run
+        one after the other into the same mysql client.  If the counters
+        are requested or the restore is throttled or filtered, the entries
+        are copied between two pipes in blocks to count the bytes and
+        events.  A failed mysql client or mysqlbinlog command raises
+        ValueError.
+
+    Arguments:
+        (input) binlog_cmds -> List of mysqlbinlog command line lists
+        (input) cmd -> mysql client command line list
+        (input) count -> True|False - Count the bytes and events
+        (input) throttle -> Dictionary of the restore throttle or None
+        (input) filt -> Dictionary of the binary log filter or None
+        (output) -> Tuple of bytes and events restored or None
+
+    """
+
+    stats = None
+    codes = []
+    read_fd, write_fd = binlog_tee.crt_pipe()
+    thread = threading.Thread(
+        target=binlog_tee.run_binlog_cmds, args=(binlog_cmds, write_fd, codes))
+    thread.start()
+
+    if count or throttle or filt:
+        read_fd2, write_fd2 = binlog_tee.crt_pipe()
+        proc2 = subprocess.Popen(                       # pylint:disable=R1732
+            cmd, stdin=read_fd2)
+        os.close(read_fd2)
+
+        try:
+            stats = binlog_tee.count_pipe(read_fd, write_fd2, throttle, filt)
+
+        except BrokenPipeError:
+            # mysql client exited, its return code is checked below.
+            pass
+
+        finally:
+            os.close(write_fd2)
+            os.close(read_fd)
+
+    else:
+        proc2 = subprocess.Popen(                       # pylint:disable=R1732
+            cmd, stdin=read_fd)
+        os.close(read_fd)
+
+    thread.join()
+
+    if proc2.wait():
+        raise ValueError(f"mysql client exited with {proc2.returncode}")
+
+    binlog_tee.check_binlog_cmds(codes)
+
+    return stats if count else None
+
+
+def restore_stats(stats, unit, start):
+
+    """Function:  restore_stats
+
+    Description:  Formats the bytes and events or transactions restored and
+        the throughput of the restore.
+
+    Arguments:
+        (input) stats -> Tuple of bytes and events or transactions restored
+        (input) unit -> Name of the restored count
+        (input) start -> Start time of the restore
+        (output) -> Restore summary line
+
+    """
+
+    secs = max(time.time() - start, 0.001)
+
+    return (f"Restored: {stats[0]} bytes, {stats[1]} {unit} in {secs:.3f}"
+            f" seconds ({stats[0] / 1048576 / secs:.1f} MB/s,"
+            f" {stats[1] / secs:.1f} {unit}/s)")
+
+
+def connect_targets(args, single=False):
+
+    """Function:  connect_targets
+
+    Description:  Connects to each of the -e target databases and prints the
+        targets that cannot be connected to.  If the restore is to a single
+        target and more than one is passed, the targets are disconnected and
+        none are returned.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) single -> True|False - Restore to only one target
+        (output) targets -> List of connected Server instances
+
+    """
+
+    targets = []
+
+    for cfg_file in args.get_val("-e"):
+        target = mysql_libs.create_instance(
+            cfg_file, args.get_val("-d"), mysql_class.Server)
+        target.connect(silent=True)
+
+        if target.conn_msg:
+            print(f"load_log:  Error encountered on slave {target.name}:"
+                  f" {target.conn_msg}")
+
+        else:
+            targets.append(target)
+
+    if single and len(targets) > 1:
+        print("load_log:  Error encountered: -a, -k and -q restore to"
+              " one -e target")
+
+        for target in targets:
+            mysql_libs.disconnect(target)
+
+        targets = []
+
+    return targets
+
+
+def plan_restore(server, args, binlog_list, opt_arg_list):
+
+    """Function:  plan_restore
+
+    Description:  Plans the mysqlbinlog commands of a restore from the start
+        and stop positions, the -r checkpoint, the -m mirror and the Bloom
+        filters.  The runs of binary logs in the local binary log directory
+        and of binary logs read from the server each get a command.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (output) -> Dictionary of the mysqlbinlog command line lists, the
+            binary log names of each command and the checkpoint resumed
+            from, or None if the checkpoint binary log is not restored
+
+    """
+
+    binlog_list, pos_args, stop_args = binlog_search.plan_binlog_pos(
+        server, args, binlog_list, opt_arg_list)
+    resume = binlog_apply.read_checkpoint(args.get_val("-k")) \
+        if args.get_val("-r") else None
+
+    if resume and resume["binlog"] not in binlog_list:
+        print(f"load_log:  Error encountered: Checkpoint binary log"
+              f" {resume['binlog']} is not in the binary logs to restore")
+
+        return None
+
+    if resume:
+        # Continue from the checkpoint instead of the start.
+        binlog_list = binlog_list[binlog_list.index(resume["binlog"]):]
+        pos_args = [f"--start-position={resume['pos']}"]
+
+    binlog_dir = binlog_fetch.sync_mirror(server, args, binlog_list)
+    binlog_list, pos_args, stop_args = binlog_filter.prune_bloom_binlogs(
+        server, args, binlog_list, pos_args, stop_args,
+        args.get_val("-b") or binlog_dir)
+    groups = list(binlog_fetch.group_binlogs(binlog_list, binlog_dir))
+
+    return {"cmds": [
+        binlog_fetch.crt_binlog_cmd(
+            server, args.get_val("-s"), args.get_val("-t"), group,
+            opt_arg_list + (pos_args if cnt == 0 else [])
+            + (stop_args if cnt == len(groups) - 1 else []),
+            args.get_val("-p"), group_dir)
+        for cnt, (group_dir, group) in enumerate(groups)],
+        "binlogs": [group for _, group in groups], "resume": resume}
+
+
+def run_restore(args, targets, cmds, plan):
+
+    """Function:  run_restore
+
+    Description:  Restores the planned mysqlbinlog commands to the targets
+        and prints the restore stats.  With -a more than one, -k or -q the
+        transactions are applied by the parallel applier, with more than
+        one target the output is copied to each of them, and otherwise it
+        is passed to the mysql client through an OS pipe.  An error of the
+        restore is printed.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) targets -> List of target Server instances
+        (input) cmds -> List of mysql client command line lists
+        (input) plan -> Dictionary of the restore plan from plan_restore
+
+    """
+
+    workers = int(args.get_val("-a", def_val=1))
+    start = time.time()
+    filt = binlog_filter.crt_filter(args)
+    throttle = binlog_tee.start_throttle(args)
+
+    try:
+        if workers > 1 or args.get_val("-k") or args.get_val("-q"):
+            stats = binlog_apply.apply_binlog(
+                plan["cmds"], cmds[0], workers, plan["binlogs"],
+                args.get_val("-k"), plan["resume"], args.get_val("-q"),
+                throttle, filt)
+
+            if args.get_val("-x") or args.get_val("-q"):
+                print(restore_stats(stats, "transactions", start))
+
+        elif len(cmds) > 1:
+            stats, codes = binlog_tee.tee_binlog(
+                plan["cmds"], cmds, args.get_val("-x"),
+                int(args.get_val("-F", def_val=binlog_tee.TEE_MBYTES))
+                * 1048576,
+                throttle, filt)
+
+            for target, code in zip(targets, codes):
+                if code:
+                    print(f"load_log:  Error encountered on slave"
+                          f" {target.name}: mysql exited with {code}")
+
+            if stats:
+                print(restore_stats(stats, "events", start))
+
+        else:
+            stats = restore_binlog(
+                plan["cmds"], cmds[0], args.get_val("-x"), throttle=throttle,
+                filt=filt)
+
+            if stats:
+                print(restore_stats(stats, "events", start))
+
+    except ValueError as msg:
+        print(f"load_log:  Error encountered: {msg}")
+
+    rate = binlog_tee.stop_throttle(throttle)
+
+    if rate and args.get_val("-x"):
+        print(f"Throttle: {rate / 1048576:.1f} MB/s")
+
+
+def load_log(server, args, opt_arg_list):
+
+    """Function:  load_log
+
+    Description:  Get the binary logs from the source database, then fetch the
+        revelant binary log entries and load them into the target
+        database before closing all connections.  The mysqlbinlog output is
+        passed to the mysql client through an OS pipe.  If -m is passed,
+        the mirrored binary logs are read from the mirror directory.  If -a
+        is more than one, the transactions are applied by that many mysql
+        client sessions.  If -k is passed, the restore checkpoint is kept
+        in the file and with -r the restore continues from it.  If -q is
+        passed, the fast restore profile is used.  If -e has more than one
+        target, the binary logs are read once and restored to all of them.
+        If -T or -E is passed, the restore is throttled by the target
+        metrics.  If the filter options are passed, only the transactions
+        they keep are restored and the binary logs the Bloom filters rule
+        out are not read.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list ->  Arguments to be added to command line
+
+    """
+
+    opt_arg_list = list(opt_arg_list)
+    status, binlog_list = binlog_fetch.process_logs_list(server, args)
+
+    if status[0]:
+        targets = connect_targets(
+            args, int(args.get_val("-a", def_val=1)) > 1
+            or args.get_val("-k") or args.get_val("-q"))
+        cmds = [mysql_libs.crt_cmd(
+            target, args.arg_set_path("-p", cmd="mysql"))
+            for target in targets]
+        plan = plan_restore(server, args, binlog_list, opt_arg_list) \
+            if targets else None
+
+        if plan:
+            # Fetch binary logs and restore to target database
+            run_restore(args, targets, cmds, plan)
+
+        for target in targets:
+            mysql_libs.disconnect(target)
+
+    else:
+        print(f"load_log:  Error encountered in process_logs_list:"
+              f" {status[1]}")
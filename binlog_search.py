@@ -0,0 +1,768 @@
+# Classification (U)
+
+"""Program:  binlog_search.py
+
+    Description:  Position search of mysql_log_admin.py (-L).  Finds the
+        file name and position of the last transaction before a datetime,
+        or of each of a list of datetime windows, from the index, the binary
+        log files, the replication stream or mysqlbinlog.
+
+    Usage:
+        import binlog_search
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import subprocess
+import re
+import itertools
+import bisect
+
+# Local
+try:
+    from .mysql_lib import mysql_class
+    from .mysql_lib import mysql_libs
+    from . import binlog_reader
+    from . import binlog_stream
+    from . import binlog_fetch
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_reader
+    import binlog_stream
+    import binlog_fetch
+    import version
+
+__version__ = version.__version__
+
+
+def plan_index_start(                                   # pylint:disable=R0913
+        server, binlog_list, start_dt, index_dir, binlog_dir=None):
+
+    """Function:  plan_index_start
+
+    Description:  Uses the binary log indexes to skip the closed binary logs
+        that end before the start datetime and to find a start position in
+        the first binary log, so mysqlbinlog does not have to read them.
+        Missing indexes are built if a binary log directory is passed and
+        the indexes of purged binary logs are removed.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog_list -> List of binary log names
+        (input) start_dt -> Start datetime
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) binlog_dir -> Directory path to local binary log files
+        (output) binlog_list -> List of binary log names to read
+        (output) -> List of mysqlbinlog arguments for the start position
+
+    """
+
+    binlog_list = list(binlog_list)
+
+    if not index_dir or not start_dt or not binlog_list:
+        return binlog_list, []
+
+    start_ts = binlog_fetch.dt_to_ts(start_dt)
+    logs = mysql_libs.fetch_logs(server)
+    sizes = {row["Log_name"]: row["File_size"] for row in logs}
+    active = logs[-1]["Log_name"] if logs else None
+
+    if logs:
+        binlog_reader.purge_binlog_index(index_dir, sizes)
+
+    while binlog_list and binlog_list[0] in sizes \
+            and binlog_list[0] != active:
+        binlog = binlog_list[0]
+        data = binlog_reader.open_binlog_index(
+            index_dir, binlog, sizes[binlog])
+
+        if data is None and binlog_dir \
+           and os.path.isfile(os.path.join(binlog_dir, binlog)):
+            binlog_reader.build_binlog_index(
+                os.path.join(binlog_dir, binlog),
+                os.path.join(index_dir, binlog + ".idx"))
+            data = binlog_reader.open_binlog_index(
+                index_dir, binlog, sizes[binlog])
+
+        if data is None:
+            break
+
+        try:
+            _, offset, _, _ = binlog_reader.search_binlog_index(data, start_ts)
+            at_end = offset >= binlog_reader.INDEX_HEADER.unpack_from(data)[1]
+
+        finally:
+            data.close()
+
+        if at_end and len(binlog_list) > 1:
+            # All events in the binary log are before the start datetime.
+            binlog_list.pop(0)
+
+        else:
+            return binlog_list, (
+                [f"--start-position={offset}"]
+                if offset > len(binlog_reader.BINLOG_MAGIC) else [])
+
+    return binlog_list, []
+
+
+def binlog_ts_offset(                                   # pylint:disable=R0913
+        server, binlog, tstamp, start_pos=None, binlog_dir=None,
+        remote=False):
+
+    """Function:  binlog_ts_offset
+
+    Description:  Walks the event headers of a binary log, from the start
+        position, for the offset of the first event at or after the
+        timestamp.  This is the event mysqlbinlog --stop-datetime stops at
+        and all the events before it are earlier than the timestamp.  Reads
+        the local binary log file if it is in the binary log directory,
+        otherwise streams the binary log from the server if remote is set.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) tstamp -> Unix timestamp
+        (input) start_pos -> Offset of an event to start from
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) remote -> True|False - Use the replication stream client
+        (output) -> Offset of the event or None if there is no such event
+            or the binary log cannot be read
+
+    """
+
+    if binlog_dir and os.path.isfile(os.path.join(binlog_dir, binlog)):
+        events = binlog_reader.read_binlog_events(
+            os.path.join(binlog_dir, binlog), start_pos=start_pos)
+
+    elif remote:
+        events = binlog_stream.stream_binlog_events(server, binlog, start_pos)
+
+    else:
+        return None
+
+    try:
+        for event in events:
+            if event.timestamp >= tstamp:
+                return event.offset
+
+    finally:
+        events.close()
+
+    return None
+
+
+def plan_binlog_pos(                                    # pylint:disable=R0914
+        server, args, binlog_list, opt_arg_list=None):
+
+    """Function:  plan_binlog_pos
+
+    Description:  Converts the -s and -t datetimes into binary log positions
+        so mysqlbinlog seeks to them instead of decoding every event to
+        check its datetime.  The binary logs that are entirely before the
+        start datetime or after the stop datetime are dropped.  The start
+        position of the first binary log and the stop position of the last
+        binary log are the offsets of the first events at or after the
+        datetimes, found by walking the event headers of the local binary
+        log (-b, -m) or of the replication stream (-P), from the binary log
+        index checkpoint (-i) if there is one.  Otherwise the index
+        checkpoint is used for the start position.  The datetimes are still
+        passed to mysqlbinlog, so the entries are the same.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (output) binlog_list -> List of binary log names to read
+        (output) pos_args -> List of mysqlbinlog arguments for the first
+            binary log
+        (output) stop_args -> List of mysqlbinlog arguments for the last
+            binary log
+
+    """
+
+    start_dt, stop_dt = args.get_val("-s"), args.get_val("-t")
+    binlog_dir = args.get_val("-b") or args.get_val("-m")
+    index_dir, remote = args.get_val("-i"), args.get_val("-P")
+    binlog_list = list(binlog_list)
+    stop_args = []
+
+    if binlog_list and (start_dt or stop_dt):
+        binlog_list = binlog_fetch.prune_binlogs(
+            server, binlog_list, start_dt, stop_dt, opt_arg_list,
+            args.get_val("-p"), binlog_dir, remote) or binlog_list[-1:]
+
+    binlog_list, pos_args = plan_index_start(
+        server, binlog_list, start_dt, index_dir, binlog_dir)
+    start_pos = int(pos_args[0].split("=", 1)[1]) if pos_args else None
+
+    if binlog_list and start_dt:
+        offset = binlog_ts_offset(
+            server, binlog_list[0], binlog_fetch.dt_to_ts(start_dt),
+            start_pos, binlog_dir, remote)
+
+        if offset is not None:
+            start_pos = offset
+            pos_args = [f"--start-position={offset}"] \
+                if offset > len(binlog_reader.BINLOG_MAGIC) else []
+
+    if binlog_list and stop_dt:
+        stop_ts = binlog_fetch.dt_to_ts(stop_dt)
+        binlog = binlog_list[-1]
+        from_pos = start_pos if len(binlog_list) == 1 else None
+        path = os.path.join(binlog_dir, binlog) if binlog_dir else None
+        data = binlog_reader.open_binlog_index(
+            index_dir, binlog, os.path.getsize(path)) \
+            if index_dir and path and os.path.isfile(path) else None
+
+        if data is not None:
+            try:
+                from_pos = max(
+                    from_pos or 0,
+                    binlog_reader.search_binlog_index(data, stop_ts)[1])
+
+            finally:
+                data.close()
+
+        offset = binlog_ts_offset(
+            server, binlog, stop_ts, from_pos, binlog_dir, remote)
+
+        if offset is not None:
+            stop_args = [f"--stop-position={offset}"]
+
+    return binlog_list, pos_args, stop_args
+
+
+def fetch_file_pos(                                     # pylint:disable=R0913
+        server, binlog, start_dt, stop_dt, opt_arg_list=None, bin_path=None):
+
+    """Function:  fetch_file_pos
+
+    Description:  Runs mysqlbinlog against a single binary log and returns
+        the end log position of the last Query that is between the start and
+        stop datetimes.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) start_dt -> Start datetime
+        (input) stop_dt -> Stop datetime
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to MySQL binary directory
+        (output) last_log_pos -> End log position of Query or None
+
+    """
+
+    sub1 = r"#\d{6}\s+\d?\d:\d\d:\d\d\s+"
+    sub2 = r"server id\s+(?P<sid>\d+)\s+"
+    sub3 = r"end_log_pos\s+(?P<epos>\d+)\s+"
+    sub4 = r"CRC32\s+(?P<crc>\w+)\s+"
+    sub5 = r"(?P<type>\w+)"
+
+    # Supports checksum and match for approriate format.
+    regex = sub1 + sub2 + sub3 + sub4 + sub5 if server.crc == "CRC32" \
+        else sub1 + sub2 + sub3 + sub5
+    last_log_pos = None
+
+    for item in binlog_fetch.fetch_binlog(
+            server, start_dt, stop_dt, [binlog], opt_arg_list, bin_path):
+
+        if not isinstance(item, str):
+            item = item.decode("utf-8")
+
+        match = re.match(regex, item)
+
+        # Matched line is a Query, capture position of the log.
+        if match and match.group("type") == "Query":
+            last_log_pos = match.group("epos")
+
+    return last_log_pos
+
+
+def fetch_range_pos(                                    # pylint:disable=R0913
+        server, binlog, start_pos=None, stop_pos=None, start_ts=None,
+        stop_ts=None, opt_arg_list=None, bin_path=None):
+
+    """Function:  fetch_range_pos
+
+    Description:  Runs mysqlbinlog against a byte range of a binary log and
+        finds the last Query that is between the start and stop timestamps,
+        reading until the first event at or after the stop timestamp.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) start_pos -> Start position of the range or None
+        (input) stop_pos -> Stop position of the range or None
+        (input) start_ts -> Start Unix timestamp or None
+        (input) stop_ts -> Stop Unix timestamp or None
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to MySQL binary directory
+        (output) -> End log position of Query or None
+        (output) -> True|False - The stop timestamp was reached
+
+    """
+
+    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
+
+    if start_pos:
+        opt_arg_list.append(f"--start-position={start_pos}")
+
+    if stop_pos:
+        opt_arg_list.append(f"--stop-position={stop_pos}")
+
+    cmd = binlog_fetch.crt_binlog_cmd(
+        server, binlog_files=[binlog], opt_arg_list=opt_arg_list,
+        bin_path=bin_path)
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE) as proc:
+        last_log_pos, reached = binlog_reader.range_query_pos(
+            binlog_reader.text_binlog_events(proc.stdout), start_ts, stop_ts)
+
+        # The rest of the range is not needed once the stop timestamp is
+        #   reached, so mysqlbinlog is stopped rather than read to the end.
+        if reached:
+            proc.terminate()
+
+        proc.stdout.close()
+        proc.wait()
+
+    if not reached and proc.returncode:
+        raise ValueError(
+            f"mysqlbinlog exited with {proc.returncode} on {binlog}")
+
+    return last_log_pos, reached
+
+
+def reduce_ranges(tasks, results):
+
+    """Function:  reduce_ranges
+
+    Description:  Reduces the results of the ranges of each binary log, in
+        order, to the last end log position found up to the range that
+        reached the stop timestamp.
+
+    Arguments:
+        (input) tasks -> List of (binary log name, start, stop) ranges in
+            binary log order
+        (input) results -> List of (position, stop reached) per range
+        (output) positions -> Dictionary of binary log name to end log
+            position of Query or None
+
+    """
+
+    positions = {}
+    reached = set()
+
+    for (binlog, _, _), (log_pos, stop) in zip(tasks, results):
+        if binlog not in reached:
+            if log_pos is not None or binlog not in positions:
+                positions[binlog] = log_pos
+
+            if stop:
+                reached.add(binlog)
+
+    return positions
+
+
+def sweep_fetch_pos(                                    # pylint:disable=R0913
+        server, binlog, bounds, opt_arg_list=None, bin_path=None):
+
+    """Function:  sweep_fetch_pos
+
+    Description:  Runs mysqlbinlog once against a whole binary log and finds
+        the last Query event in each time segment.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) bounds -> Sorted list of unique Unix timestamps
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to MySQL binary directory
+        (output) last_pos -> Dictionary of segment to end log position of
+            the last Query in the segment
+
+    """
+
+    last_pos = {}
+
+    for event in binlog_reader.text_binlog_events(binlog_fetch.fetch_binlog(
+            server, binlog_files=[binlog], opt_arg_list=opt_arg_list,
+            bin_path=bin_path)):
+
+        if event.type_code == binlog_reader.QUERY_EVENT:
+            last_pos[bisect.bisect_right(bounds, event.timestamp)] = \
+                event.log_pos
+
+    return last_pos
+
+
+def find_dt_pos(                                # pylint:disable=R0913,R0914
+        master, start_dt, stop_dt, opt_arg_list=None, bin_path=None,
+        slave=None, binlog_dir=None, index_dir=None, workers=1,
+        remote=False, mirror_bytes=None, chunk_bytes=None):
+
+    """Function:  find_dt_pos
+
+    Description:  Gets all binary logs, unless a Slave is present.  The
+        binary logs are checked for the last end log position of a Query
+        between the start and stop datatimes from the newest back, a pool
+        of workers at a time, and the first end log position found is
+        returned along with the binary log name that it was found in.  The
+        older binary logs are not read.
+        Binary logs outside the start and stop datetimes are skipped.
+        If a binary log directory is passed, the binary logs are read with
+        the native binary log reader instead of mysqlbinlog and the closed
+        binary logs are looked up in, or added to, the binary log indexes
+        if an index directory is passed.  If remote is set, the binary logs
+        are streamed from the server over the replication protocol instead
+        of being read with mysqlbinlog.  If a mirror disk budget is passed,
+        the binary log directory is a mirror of the closed binary logs and
+        the binary logs that are not mirrored are read from the server.
+        If a chunk size is passed, the binary logs read with mysqlbinlog
+        that have an index are split into ranges of about the chunk size,
+        each range is read by its own worker and the ranges are reduced in
+        order.
+
+    Arguments:
+        (input) master -> Server instance or Master, if Slave present
+        (input) start_dt -> Start datetime
+        (input) stop_dt -> Stop datetime
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) slave -> Slave server instance
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) workers -> Number of binary logs to check at the same time
+        (input) remote -> True|False - Use the replication stream client
+        (input) mirror_bytes -> Disk budget in bytes of the mirror directory
+        (input) chunk_bytes -> Size in bytes of a mysqlbinlog range
+        (output) -> Position class (file, pos)
+
+    """
+
+    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
+
+    if bin_path is None:
+        bin_path = ""
+
+    # List of current binary log names.
+    logs = mysql_libs.fetch_logs(master)
+    log_files = [row["Log_name"] for row in logs]
+    sizes = {row["Log_name"]: row.get("File_size") for row in logs}
+    active = log_files[-1] if log_files else None
+
+    if binlog_dir and index_dir:
+        binlog_reader.purge_binlog_index(index_dir, log_files)
+
+    if slave:
+        # Get only those binary log files up to the relay log file.
+        efile = slave.relay_mst_log
+        files = list(
+            itertools.dropwhile(lambda file: file != efile, log_files))
+        log_files = files
+
+    # Skip binary logs that cannot overlap the start and stop datetimes.
+    scan_files = binlog_fetch.prune_binlogs(
+        master, log_files, start_dt, stop_dt, opt_arg_list, bin_path,
+        binlog_dir, remote)
+
+    if not scan_files:
+        return mysql_class.Position(
+            log_files[-1] if log_files else None, None)
+
+    local_files = scan_files if binlog_dir else []
+    chunk_bytes = chunk_bytes if not remote else None
+    start_ts = binlog_fetch.dt_to_ts(start_dt) \
+        if binlog_dir or remote or chunk_bytes else None
+    stop_ts = binlog_fetch.dt_to_ts(stop_dt) \
+        if binlog_dir or remote or chunk_bytes else None
+    batch = max(workers or 1, 1)
+
+    # The last binary log with a Query holds the last position, so the
+    #   newest binary logs are checked first, a batch of workers at a time,
+    #   until a batch has a Query.  Binary logs are only mirrored when
+    #   their batch is checked.
+    for end in range(len(scan_files), 0, -batch):
+        binlogs = scan_files[max(end - batch, 0):end]
+
+        if binlog_dir and mirror_bytes:
+            local_files = binlog_fetch.mirror_binlogs(
+                master, binlogs, binlog_dir, mirror_bytes, bin_path, workers)
+
+        batch_local = [binlog for binlog in binlogs if binlog in local_files]
+        batch_remote = [
+            binlog for binlog in binlogs if binlog not in local_files]
+        positions = dict(zip(batch_local, binlog_fetch.map_binlogs(
+            binlog_reader.find_file_pos,
+            [(binlog_dir, binlog, start_ts, stop_ts, index_dir,
+              binlog != active) for binlog in batch_local],
+            workers, process=True,
+            sizes=[sizes.get(binlog) for binlog in batch_local])))
+
+        if remote:
+            positions.update(zip(batch_remote, binlog_fetch.map_binlogs(
+                binlog_stream.stream_file_pos,
+                [(master, binlog, start_ts, stop_ts)
+                 for binlog in batch_remote], workers,
+                sizes=[sizes.get(binlog) for binlog in batch_remote])))
+
+        elif chunk_bytes:
+            tasks = [
+                (binlog, start_pos, stop_pos) for binlog in batch_remote
+                for start_pos, stop_pos in binlog_reader.chunk_binlog(
+                    binlog, sizes.get(binlog) if binlog != active else None,
+                    chunk_bytes, index_dir=index_dir)]
+            positions.update(reduce_ranges(tasks, binlog_fetch.map_binlogs(
+                fetch_range_pos,
+                [(master, binlog, start_pos, stop_pos, start_ts, stop_ts,
+                  opt_arg_list, bin_path)
+                 for binlog, start_pos, stop_pos in tasks], workers,
+                sizes=[max((stop_pos or sizes.get(binlog) or 0)
+                           - (start_pos or len(binlog_reader.BINLOG_MAGIC)), 0)
+                       for binlog, start_pos, stop_pos in tasks])))
+
+        else:
+            positions.update(zip(batch_remote, binlog_fetch.map_binlogs(
+                fetch_file_pos,
+                [(master, binlog, start_dt, stop_dt, opt_arg_list, bin_path)
+                 for binlog in batch_remote], workers,
+                sizes=[sizes.get(binlog) for binlog in batch_remote])))
+
+        for binlog in reversed(binlogs):
+            if positions[binlog] is not None:
+                return mysql_class.Position(binlog, positions[binlog])
+
+    return mysql_class.Position(scan_files[-1], None)
+
+
+def read_windows(windows_file):
+
+    """Function:  read_windows
+
+    Description:  Reads the windows file, one "start,stop" pair of datetimes
+        per line.  Either datetime may be left empty.  Blank lines and lines
+        starting with # are skipped.
+
+    Arguments:
+        (input) windows_file -> Path to the windows file
+        (output) windows -> List of (start datetime, stop datetime) tuples
+
+    """
+
+    windows = []
+
+    with open(windows_file, mode="r", encoding="UTF-8") as f_hdlr:
+        for line in f_hdlr:
+            line = line.strip()
+
+            if line and not line.startswith("#"):
+                start_dt, _, stop_dt = line.partition(",")
+                windows.append((start_dt.strip() or None,
+                                stop_dt.strip() or None))
+
+    return windows
+
+
+def latest_in_ranges(values, ranges):
+
+    """Function:  latest_in_ranges
+
+    Description:  Returns the largest value in each range of a list, using a
+        sparse table so each range is answered with two look ups.  An empty
+        range returns None.
+
+    Arguments:
+        (input) values -> List of comparable values
+        (input) ranges -> List of (first, last) inclusive indexes
+        (output) -> List of largest values, one per range
+
+    """
+
+    table = [list(values)]
+    span = 1
+
+    while span * 2 <= len(values):
+        prev = table[-1]
+        table.append([max(prev[idx], prev[idx + span])
+                      for idx in range(len(prev) - span)])
+        span *= 2
+
+    latest = []
+
+    for first, last in ranges:
+        if first > last:
+            latest.append(None)
+            continue
+
+        level = (last - first + 1).bit_length() - 1
+        latest.append(max(table[level][first],
+                          table[level][last - (1 << level) + 1]))
+
+    return latest
+
+
+def find_window_pos(                            # pylint:disable=R0913,R0914
+        master, windows, opt_arg_list=None, bin_path=None, binlog_dir=None,
+        workers=1, remote=False, mirror_bytes=None):
+
+    """Function:  find_window_pos
+
+    Description:  Finds the last end log position of a Query for each of a
+        list of start and stop datetime windows in a single pass over the
+        binary logs.  The window boundaries are sorted into time segments,
+        each binary log is read once to find the last Query in each segment
+        and each window then takes the latest Query of the segments it
+        covers.  Binary logs outside all the windows are skipped.  The
+        binary log directory, remote and mirror options are the same as for
+        find_dt_pos.
+
+    Arguments:
+        (input) master -> Server instance
+        (input) windows -> List of (start datetime, stop datetime) tuples
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) bin_path -> Path to MySQL binary directory
+        (input) binlog_dir -> Directory path to local binary log files
+        (input) workers -> Number of binary logs to read at the same time
+        (input) remote -> True|False - Use the replication stream client
+        (input) mirror_bytes -> Disk budget in bytes of the mirror directory
+        (output) -> List of Position class (file, pos), one per window
+
+    """
+
+    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
+
+    if bin_path is None:
+        bin_path = ""
+
+    if not windows:
+        return []
+
+    stamps = [(binlog_fetch.dt_to_ts(start_dt), binlog_fetch.dt_to_ts(stop_dt))
+              for start_dt, stop_dt in windows]
+    starts = [start_ts for start_ts, _ in stamps]
+    stops = [stop_ts for _, stop_ts in stamps]
+    logs = mysql_libs.fetch_logs(master)
+    log_files = [row["Log_name"] for row in logs]
+    sizes = {row["Log_name"]: row.get("File_size") for row in logs}
+    scan_files = binlog_fetch.prune_binlogs(
+        master, log_files,
+        None if None in starts else windows[starts.index(min(starts))][0],
+        None if None in stops else windows[stops.index(max(stops))][1],
+        opt_arg_list, bin_path, binlog_dir, remote)
+
+    if not scan_files:
+        return [mysql_class.Position(log_files[-1] if log_files else None,
+                                     None) for _ in windows]
+
+    bounds = sorted({tstamp for pair in stamps for tstamp in pair
+                     if tstamp is not None})
+    local_files = scan_files if binlog_dir else []
+
+    if binlog_dir and mirror_bytes:
+        local_files = binlog_fetch.mirror_binlogs(
+            master, scan_files, binlog_dir, mirror_bytes, bin_path, workers)
+
+    remote_files = [
+        binlog for binlog in scan_files if binlog not in local_files]
+    segments = dict(zip(local_files, binlog_fetch.map_binlogs(
+        binlog_reader.sweep_file_pos,
+        [(binlog_dir, binlog, bounds) for binlog in local_files],
+        workers, process=True,
+        sizes=[sizes.get(binlog) for binlog in local_files])))
+
+    if remote:
+        segments.update(zip(remote_files, binlog_fetch.map_binlogs(
+            binlog_stream.sweep_stream_pos,
+            [(master, binlog, bounds) for binlog in remote_files], workers,
+            sizes=[sizes.get(binlog) for binlog in remote_files])))
+
+    else:
+        segments.update(zip(remote_files, binlog_fetch.map_binlogs(
+            sweep_fetch_pos,
+            [(master, binlog, bounds, opt_arg_list, bin_path)
+             for binlog in remote_files], workers,
+            sizes=[sizes.get(binlog) for binlog in remote_files])))
+
+    # Latest Query of each segment as (binary log order, position).
+    latest = [(-1, -1)] * (len(bounds) + 1)
+
+    for idx, binlog in enumerate(scan_files):
+        for segment, log_pos in segments[binlog].items():
+            latest[segment] = (idx, log_pos)
+
+    latest = latest_in_ranges(latest, [
+        (0 if start_ts is None else bisect.bisect_right(bounds, start_ts),
+         len(bounds) if stop_ts is None
+         else bisect.bisect_left(bounds, stop_ts))
+        for start_ts, stop_ts in stamps])
+
+    return [mysql_class.Position(scan_files[item[0]], item[1])
+            if item and item[0] >= 0
+            else mysql_class.Position(scan_files[-1], None)
+            for item in latest]
+
+
+def fetch_log_pos(server, args, opt_arg_list=None):
+
+    """Function:  fetch_log_pos
+
+    Description:  Gets the server's file name and position that are between the
+        start and stop datetimes.  The worker utilisation is printed to
+        standard error if -x is passed.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list ->  Arguments to be added to command line
+
+    """
+
+    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
+    mirror_bytes = int(
+        args.get_val("-z", def_val=binlog_fetch.MIRROR_MBYTES)) * 1048576 \
+        if args.get_val("-m") else None
+
+    # Get Position class from file and log position.
+    try:
+        if args.get_val("-l"):
+            windows = read_windows(args.get_val("-l"))
+            pos_list = find_window_pos(
+                server, windows, opt_arg_list, args.get_val("-p"),
+                binlog_dir=args.get_val("-b") or args.get_val("-m"),
+                workers=int(args.get_val("-n", def_val=1)),
+                remote=args.get_val("-P"), mirror_bytes=mirror_bytes)
+
+        else:
+            pos = find_dt_pos(
+                server, args.get_val("-s"), args.get_val("-t"), opt_arg_list,
+                args.get_val("-p"),
+                binlog_dir=args.get_val("-b") or args.get_val("-m"),
+                index_dir=args.get_val("-i"),
+                workers=int(args.get_val("-n", def_val=1)),
+                remote=args.get_val("-P"), mirror_bytes=mirror_bytes,
+                chunk_bytes=int(args.get_val("-j", def_val=0)) * 1048576)
+
+    except (OSError, ValueError) as msg:
+        print(f"fetch_log_pos:  Error encountered: {msg}")
+        return
+
+    if args.get_val("-l"):
+        for (start_dt, stop_dt), pos in zip(windows, pos_list):
+            print(f"Start: {start_dt}, Stop: {stop_dt}, Filename: {pos.file},"
+                  f" Position: {pos.pos}")
+
+    else:
+        print(f"Filename: {pos.file}, Position: {pos.pos}")
+
+    if args.get_val("-x"):
+        print(binlog_fetch.worker_stats(), file=sys.stderr)
@@ -0,0 +1,335 @@
+# Classification (U)
+
+"""Program:  binlog_service.py
+
+    Description:  Service of mysql_log_admin.py (-S).  Answers requests
+        over a unix socket on one open database connection, and sends the
+        requests of a client (-u).
+
+    Usage:
+        import binlog_service
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import struct
+import socket
+import io
+import json
+import signal
+import stat
+
+# Local
+try:
+    from .lib import gen_class
+    from . import binlog_fetch
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import lib.gen_class as gen_class                   # pylint:disable=R0402
+    import binlog_fetch
+    import version
+
+__version__ = version.__version__
+
+# Options of the service (-S) that are passed on to each request, the
+#   options of a request that have to be absolute paths and the frame header
+#   (channel and length) of the standard out and error sent to the client.
+SERVICE_OPTS = ["-b", "-d", "-i", "-m", "-n", "-p", "-z", "-M", "-P",
+                "-Q", "-x"]
+SERVICE_PATHS = ["-b", "-d", "-i", "-k", "-l", "-m", "-o", "-p", "-C"]
+SERVICE_FRAME = struct.Struct("!BI")
+SERVICE_STDOUT = 1
+SERVICE_STDERR = 2
+
+
+def send_request(sock_path, argv):
+
+    """Function:  send_request
+
+    Description:  Sends the command line arguments to the service listening
+        on the unix socket and copies the standard out and standard error
+        frames of the response to standard out and standard error.
+
+    Arguments:
+        (input) sock_path -> Path to the service unix socket
+        (input) argv -> List of command line arguments
+
+    """
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(sock_path)
+        sock.sendall(json.dumps(list(argv)).encode("utf-8") + b"\n")
+
+        with sock.makefile("rb") as rfile:
+            while True:
+                header = rfile.read(SERVICE_FRAME.size)
+
+                if len(header) < SERVICE_FRAME.size:
+                    break
+
+                channel, size = SERVICE_FRAME.unpack(header)
+                out = sys.stderr if channel == SERVICE_STDERR else sys.stdout
+                out.buffer.write(rfile.read(size))
+                out.flush()
+
+
+def crt_request_args(args, argv, req_opts):
+
+    """Function:  crt_request_args
+
+    Description:  Parses the command line arguments of a request, adds the
+        SERVICE_OPTS options of the service that are not in the request and
+        runs the same directory and conditional option checks as main.  The
+        SERVICE_PATHS options of the request have to be absolute paths, as
+        the request is not run in the working directory of the client.
+
+    Arguments:
+        (input) args -> ArgParser class instance of the service
+        (input) argv -> List of command line arguments of the request
+        (input) req_opts -> Dictionary of opt_val, multi_val, valid_func,
+            opt_xor_val, dir_perms_chk and opt_con_req for the request
+            arguments
+        (output) -> ArgParser class instance or None if not valid
+
+    """
+
+    req = gen_class.ArgParser(
+        ["mysql_log_admin.py"] + list(argv), opt_val=req_opts["opt_val"],
+        multi_val=req_opts["multi_val"])
+
+    if not req.arg_parse2() \
+       or not req.arg_xor_dict(opt_xor_val=req_opts["opt_xor_val"]) \
+       or not req.arg_validate(valid_func=req_opts["valid_func"]):
+        return None
+
+    relative = [opt for opt in SERVICE_PATHS
+                if req.arg_exist(opt) and not os.path.isabs(req.get_val(opt))]
+
+    if relative:
+        print(f"crt_request_args:  Error:  {', '.join(relative)} must be"
+              f" absolute paths with -u.")
+        return None
+
+    for opt in SERVICE_OPTS:
+        if args.arg_exist(opt) and not req.arg_exist(opt):
+            req.insert_arg(opt, args.get_val(opt))
+
+    if not req.arg_dir_chk(dir_perms_chk=req_opts["dir_perms_chk"]) \
+       or not req.arg_cond_req(opt_con_req=req_opts["opt_con_req"]):
+        return None
+
+    return req
+
+
+def serve_request(                                      # pylint:disable=R0913
+        server, args, conn, func_dict, opt_arg_list, req_opts):
+
+    """Function:  serve_request
+
+    Description:  Reads a request from a client connection and runs it on
+        the open server connection, with standard out and standard error
+        going to the client on their own channels.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance of the service
+        (input) conn -> Client socket
+        (input) func_dict -> Dictionary list of functions and options
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) req_opts -> Dictionary of opt_val, multi_val, valid_func,
+            opt_xor_val, dir_perms_chk and opt_con_req for the request
+            arguments
+
+    """
+
+    with conn, conn.makefile("rb") as rfile:
+        old_stdout, old_stderr = sys.stdout, sys.stderr
+        sys.stdout = io.TextIOWrapper(
+            io.BufferedWriter(ServiceChannel(conn, SERVICE_STDOUT),
+                              binlog_fetch.COPY_BYTES), write_through=True)
+        sys.stderr = io.TextIOWrapper(
+            io.BufferedWriter(ServiceChannel(conn, SERVICE_STDERR)),
+            line_buffering=True)
+
+        try:
+            req = crt_request_args(
+                args, json.loads(rfile.readline()), req_opts)
+
+            if req and req.arg_exist("-w"):
+                print("serve_request:  Error:  -w is not used with -u.")
+
+            elif req:
+                if not server.is_connected():
+                    server.reconnect()
+
+                # Only the workers of this request are reported.
+                binlog_fetch.WORKER_STATS.update(tasks=0, busy=0.0, slots=0.0)
+
+                for item in set(req.get_args_keys()) & set(func_dict.keys()):
+                    func_dict[item](server, req, opt_arg_list)
+
+        except Exception as msg:                        # pylint:disable=W0718
+            # A failed request does not stop the service.
+            print(f"serve_request:  Error encountered: {msg}")
+
+        finally:
+            sys.stdout.close()
+            sys.stderr.close()
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+
+
+def stale_socket(sock_path):
+
+    """Function:  stale_socket
+
+    Description:  Checks if a path is a unix socket that no service is
+        listening on.
+
+    Arguments:
+        (input) sock_path -> Path to the unix socket
+        (output) -> True|False - Path is a unix socket that refuses
+            connections
+
+    """
+
+    if not stat.S_ISSOCK(os.lstat(sock_path).st_mode):
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(sock_path)
+
+        except ConnectionRefusedError:
+            return True
+
+    return False
+
+
+class ServiceChannel(io.RawIOBase):
+
+    """Class:  ServiceChannel
+
+    Description:  Writes to a channel of a service client connection.  Each
+        write is sent as a SERVICE_FRAME header and the data, so the client
+        can tell standard out and standard error apart.
+
+    Methods:
+        __init__
+        writable
+        write
+
+    """
+
+    def __init__(self, conn, channel):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) conn -> Client socket
+            (input) channel -> SERVICE_STDOUT or SERVICE_STDERR
+
+        """
+
+        super().__init__()
+        self.conn = conn
+        self.channel = channel
+
+    def writable(self):
+
+        """Method:  writable
+
+        Description:  The channel is written to.
+
+        Arguments:
+
+        """
+
+        return True
+
+    def write(self, data):                              # pylint:disable=W0221
+
+        """Method:  write
+
+        Description:  Sends the data in one frame.
+
+        Arguments:
+            (input) data -> Bytes like object
+            (output) -> Number of bytes written
+
+        """
+
+        data = bytes(data)
+        self.conn.sendall(SERVICE_FRAME.pack(self.channel, len(data)) + data)
+
+        return len(data)
+
+
+def serve_requests(server, args, func_dict, opt_arg_list, req_opts):
+
+    """Function:  serve_requests
+
+    Description:  Listens on the unix socket and runs the requests one at a
+        time on the open server connection until interrupted or terminated.
+        A socket left over from a service that did not shut down is
+        replaced, anything else at the path is not.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (input) req_opts -> Dictionary of opt_val, multi_val, valid_func,
+            opt_xor_val, dir_perms_chk and opt_con_req for the request
+            arguments
+
+    """
+
+    sock_path = args.get_val("-S")
+
+    if os.path.lexists(sock_path):
+        if not stale_socket(sock_path):
+            print(f"serve_requests:  Error:  {sock_path} is not a socket or"
+                  f" a service is listening on it.")
+            return
+
+        # Left over from a service that did not shut down.
+        os.remove(sock_path)
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        # No other user can connect between bind and chmod.
+        umask = os.umask(0o077)
+
+        try:
+            sock.bind(sock_path)
+
+        finally:
+            os.umask(umask)
+
+        os.chmod(sock_path, 0o600)
+        sock.listen()
+
+        try:
+            while True:
+                conn, _ = sock.accept()
+                serve_request(
+                    server, args, conn, func_dict, opt_arg_list, req_opts)
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            os.remove(sock_path)
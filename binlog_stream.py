@@ -0,0 +1,329 @@
+# Classification (U)
+
+"""Program:  binlog_stream.py
+
+    Description:  Replication protocol client of mysql_log_admin.py.
+        Connects to the server as a replica and streams the binary log
+        events (-P).
+
+    Usage:
+        import binlog_stream
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import struct
+import socket
+import hashlib
+
+# Local
+try:
+    from . import binlog_reader
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import binlog_reader
+    import version
+
+__version__ = version.__version__
+
+# MySQL client/server protocol values used by the replication stream client.
+MAX_PACKET = 0xffffff
+COM_QUIT = 0x01
+COM_QUERY = 0x03
+COM_BINLOG_DUMP = 0x12
+BINLOG_DUMP_NON_BLOCK = 0x01
+CLIENT_FLAGS = 0x0001 | 0x0004 | 0x0200 | 0x8000 | 0x80000
+HEARTBEAT_EVENT = 27
+LOG_EVENT_ARTIFICIAL_F = 0x20
+
+
+def read_packet(conn):
+
+    """Function:  read_packet
+
+    Description:  Reads a MySQL protocol packet from a connection and joins
+        the packets of a payload that was split at 16 MB.
+
+    Arguments:
+        (input) conn -> Connection file
+        (output) payload -> Packet payload
+
+    """
+
+    payload = b""
+
+    while True:
+        header = conn.read(4)
+
+        if len(header) < 4:
+            raise ConnectionError("Connection closed by the MySQL server")
+
+        size = int.from_bytes(header[:3], "little")
+        data = conn.read(size)
+
+        if len(data) < size:
+            raise ConnectionError("Connection closed by the MySQL server")
+
+        payload += data
+
+        if size < MAX_PACKET:
+            return payload
+
+
+def write_packet(conn, payload, seq=0):
+
+    """Function:  write_packet
+
+    Description:  Writes a MySQL protocol packet to a connection.
+
+    Arguments:
+        (input) conn -> Connection file
+        (input) payload -> Packet payload, less than 16 MB
+        (input) seq -> Packet sequence number
+
+    """
+
+    conn.write(len(payload).to_bytes(3, "little") + bytes([seq & 0xff])
+               + payload)
+    conn.flush()
+
+
+def check_packet(packet):
+
+    """Function:  check_packet
+
+    Description:  Raises the MySQL error in an error packet.
+
+    Arguments:
+        (input) packet -> Packet payload
+        (output) packet -> Packet payload, if not an error packet
+
+    """
+
+    if packet[:1] == b"\xff":
+        code = struct.unpack_from("<H", packet, 1)[0]
+        msg = packet[9:] if packet[3:4] == b"#" else packet[3:]
+
+        raise ValueError(
+            f"MySQL error {code}: {msg.decode('utf-8', 'replace')}")
+
+    return packet
+
+
+def scramble_password(plugin, password, nonce):
+
+    """Function:  scramble_password
+
+    Description:  Scrambles a password with the server nonce for the
+        mysql_native_password and caching_sha2_password (fast
+        authentication) plugins.
+
+    Arguments:
+        (input) plugin -> Authentication plugin name
+        (input) password -> Password
+        (input) nonce -> Server nonce
+        (output) -> Scrambled password
+
+    """
+
+    if not password:
+        return b""
+
+    password = password.encode("utf-8")
+
+    if plugin == "mysql_native_password":
+        stage1 = hashlib.sha1(password).digest()
+        stage2 = hashlib.sha1(
+            nonce + hashlib.sha1(stage1).digest()).digest()
+
+    elif plugin == "caching_sha2_password":
+        stage1 = hashlib.sha256(password).digest()
+        stage2 = hashlib.sha256(
+            hashlib.sha256(stage1).digest() + nonce).digest()
+
+    else:
+        raise ValueError(f"Authentication plugin {plugin} is not supported")
+
+    return bytes(x ^ y for x, y in zip(stage1, stage2))
+
+
+def connect_binlog(server):
+
+    """Function:  connect_binlog
+
+    Description:  Opens a MySQL protocol connection with the host, port,
+        user and password of the Server instance and authenticates it.
+        The caching_sha2_password full authentication, which needs a secure
+        connection, is not supported.
+
+    Arguments:
+        (input) server -> Server instance
+        (output) conn -> Connection file
+
+    """
+
+    sock = socket.create_connection((server.host, int(server.port)))
+    conn = sock.makefile("rwb")
+    sock.close()
+
+    try:
+        handshake = check_packet(read_packet(conn))
+        ver_end = handshake.index(b"\0", 1)
+        nonce = handshake[ver_end + 5:ver_end + 13]
+        plugin = "mysql_native_password"
+
+        # Capabilities, character set, status and reserved bytes come before
+        #   the second part of the nonce and the authentication plugin name.
+        rest = handshake[ver_end + 14:]
+
+        if len(rest) > 18:
+            part2_len = max(13, rest[7] - 8)
+            nonce += rest[18:18 + part2_len - 1]
+            plugin = rest[18 + part2_len:].split(b"\0", 1)[0].decode(
+                "utf-8") or plugin
+
+        auth = scramble_password(plugin, server.sql_pass, nonce)
+        write_packet(
+            conn, struct.pack("<IIB23x", CLIENT_FLAGS, MAX_PACKET, 33)
+            + server.sql_user.encode("utf-8") + b"\0" + bytes([len(auth)])
+            + auth + plugin.encode("utf-8") + b"\0", 1)
+        seq = 2
+
+        while True:
+            packet = check_packet(read_packet(conn))
+            seq += 1
+
+            if packet[:1] == b"\x00":
+                break
+
+            if packet[:1] == b"\xfe":
+                # Authentication switch to another plugin.
+                plugin, nonce = packet[1:].split(b"\0", 1)
+                plugin = plugin.decode("utf-8")
+                write_packet(conn, scramble_password(
+                    plugin, server.sql_pass, nonce.rstrip(b"\0")), seq)
+                seq += 1
+
+            elif packet[:2] == b"\x01\x04":
+                raise ValueError(
+                    "caching_sha2_password full authentication is not"
+                    " supported, connect with mysqlbinlog once to cache the"
+                    " password on the server")
+
+    except BaseException:
+        conn.close()
+        raise
+
+    return conn
+
+
+def stream_binlog_events(server, binlog, start_pos=None, body=False):
+
+    """Function:  stream_binlog_events
+
+    Description:  Streams the events of a binary log from the MySQL server
+        over the replication protocol (COM_BINLOG_DUMP), without mysqlbinlog.
+        Artificial and heartbeat events are skipped and the stream stops at
+        the end of the binary log.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) start_pos -> Position of the first event to stream
+        (input) body -> True|False - Include event body bytes
+        (output) -> Generator of BinlogEvent
+
+    """
+
+    conn = connect_binlog(server)
+    hdr_len = binlog_reader.EVENT_HEADER.size
+    rotates = 0
+
+    try:
+        write_packet(conn, bytes([COM_QUERY]) + b"SET @master_binlog_checksum"
+                     b" = @@global.binlog_checksum")
+        check_packet(read_packet(conn))
+        write_packet(conn, struct.pack(
+            "<BIHI", COM_BINLOG_DUMP,
+            start_pos or len(binlog_reader.BINLOG_MAGIC),
+            BINLOG_DUMP_NON_BLOCK, 0) + binlog.encode("utf-8"))
+
+        while True:
+            packet = check_packet(read_packet(conn))
+
+            if packet[:1] == b"\xfe" and len(packet) < 9:
+                break
+
+            header = binlog_reader.EVENT_HEADER.unpack_from(packet, 1)
+
+            if header[5] & LOG_EVENT_ARTIFICIAL_F or not header[4] \
+               or header[1] == HEARTBEAT_EVENT:
+
+                # A second artificial Rotate is the start of the next log.
+                rotates += header[1] == binlog_reader.ROTATE_EVENT
+
+                if rotates > 1:
+                    break
+
+                continue
+
+            yield binlog_reader.BinlogEvent._make(header + (
+                header[4] - header[3], packet[hdr_len + 1:] if body else None))
+
+            if header[1] == binlog_reader.ROTATE_EVENT:
+                break
+
+    finally:
+        try:
+            write_packet(conn, bytes([COM_QUIT]))
+
+        except OSError:
+            pass
+
+        conn.close()
+
+
+def stream_file_pos(server, binlog, start_ts=None, stop_ts=None):
+
+    """Function:  stream_file_pos
+
+    Description:  Finds the last Query event in a binary log that is between
+        the start and stop timestamps, streaming the binary log from the
+        MySQL server over the replication protocol.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) start_ts -> Start Unix timestamp or None
+        (input) stop_ts -> Stop Unix timestamp or None
+        (output) -> End log position of Query or None
+
+    """
+
+    return binlog_reader.last_query_pos(
+        stream_binlog_events(server, binlog), start_ts, stop_ts)
+
+
+def sweep_stream_pos(server, binlog, bounds):
+
+    """Function:  sweep_stream_pos
+
+    Description:  Finds the last Query event in each time segment of a
+        binary log streamed from the MySQL server over the replication
+        protocol.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) bounds -> Sorted list of unique Unix timestamps
+        (output) -> Dictionary of segment to end log position of Query
+
+    """
+
+    return binlog_reader.sweep_query_pos(
+        stream_binlog_events(server, binlog), bounds)
@@ -0,0 +1,634 @@
+# Classification (U)
+
+"""Program:  binlog_tee.py
+
+    Description:  Restore pipes of mysql_log_admin.py.  Runs mysqlbinlog
+        into the mysql clients through OS pipes, tees one read of the binary
+        logs to each target (-e) and throttles the feed rate to the metrics
+        of the targets (-T, -E).
+
+    Usage:
+        import binlog_tee
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import subprocess
+import time
+import threading
+import fcntl
+import queue
+
+# Local
+try:
+    from .mysql_lib import mysql_class
+    from .mysql_lib import mysql_libs
+    from . import binlog_filter
+    from . import binlog_fetch
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_filter
+    import binlog_fetch
+    import version
+
+__version__ = version.__version__
+
+# Pipe buffer between mysqlbinlog and the mysql client and the fcntl command
+#   to set it, which is only in the fcntl module from Python 3.10.
+PIPE_BYTES = 1048576
+F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+
+# Default buffer in megabytes each restore target (-F) can fall behind the
+#   fastest target before the binary logs are read more slowly.
+TEE_MBYTES = 64
+
+# Restore throttle (-T, -E): seconds between checks of the target metrics,
+#   the starting and least feed rates in bytes a second and the gain of the
+#   feed rate controller.
+THROTTLE_SECS = 1.0
+THROTTLE_START = 4194304
+THROTTLE_MIN = 65536
+THROTTLE_GAIN = 0.5
+
+# Start of each event in the mysqlbinlog output.
+EVENT_MARK = b"\n# at "
+
+
+def crt_pipe():
+
+    """Function:  crt_pipe
+
+    Description:  Creates an OS pipe and raises its buffer to PIPE_BYTES,
+        where the system allows it, so the processes at each end are woken
+        up less often.
+
+    Arguments:
+        (output) read_fd -> Read end of the pipe
+        (output) write_fd -> Write end of the pipe
+
+    """
+
+    read_fd, write_fd = os.pipe()
+
+    try:
+        fcntl.fcntl(write_fd, F_SETPIPE_SZ, PIPE_BYTES)
+
+    except OSError:
+        # Not Linux or above fs.pipe-max-size, keep the default buffer.
+        pass
+
+    return read_fd, write_fd
+
+
+def count_events(data, tail):
+
+    """Function:  count_events
+
+    Description:  Counts the mysqlbinlog event markers in a block of data,
+        including a marker across the edge with the previous block.
+
+    Arguments:
+        (input) data -> Block of mysqlbinlog output
+        (input) tail -> End of the previous block
+        (output) events -> Number of event markers
+        (output) tail -> End of the block for the next block
+
+    """
+
+    keep = len(EVENT_MARK) - 1
+    events = data.count(EVENT_MARK) + (tail + data[:keep]).count(EVENT_MARK)
+
+    return events, (tail + data)[-keep:] if len(data) < keep else data[-keep:]
+
+
+def read_blocks(read_fd, filt=None):
+
+    """Function:  read_blocks
+
+    Description:  Reads a pipe of mysqlbinlog output in blocks of up to
+        COPY_BYTES.  If a filter is passed, the output is split into lines
+        and the blocks are made of the transactions the filter keeps.
+
+    Arguments:
+        (input) read_fd -> Pipe to read from
+        (input) filt -> Dictionary of the binary log filter or None
+        (output) -> Generator of the blocks of mysqlbinlog output
+
+    """
+
+    if not filt:
+        while True:
+            data = os.read(read_fd, binlog_fetch.COPY_BYTES)
+
+            if not data:
+                break
+
+            yield data
+
+        return
+
+    block, size = [], 0
+
+    with open(read_fd, "rb", closefd=False) as rfile:
+        for line in binlog_filter.filter_binlog(rfile, filt):
+            block.append(line)
+            size += len(line)
+
+            if size >= binlog_fetch.COPY_BYTES:
+                yield b"".join(block)
+                block, size = [], 0
+
+    if block:
+        yield b"".join(block)
+
+
+def count_pipe(read_fd, write_fd, throttle=None, filt=None):
+
+    """Function:  count_pipe
+
+    Description:  Copies one pipe to another in blocks and counts the bytes
+        and the mysqlbinlog events, without splitting the data into lines.
+        If a throttle is passed, the blocks are copied at its feed rate.  If
+        a filter is passed, only the transactions it keeps are copied.
+
+    Arguments:
+        (input) read_fd -> Pipe to read from
+        (input) write_fd -> Pipe to write to
+        (input) throttle -> Dictionary of the restore throttle or None
+        (input) filt -> Dictionary of the binary log filter or None
+        (output) total -> Number of bytes copied
+        (output) events -> Number of events copied
+
+    """
+
+    total = events = 0
+    tail = b""
+
+    for data in read_blocks(read_fd, filt):
+        cnt, tail = count_events(data, tail)
+        events += cnt
+        total += len(data)
+        view = memoryview(data)
+
+        if throttle:
+            throttle_wait(throttle, len(data))
+
+        while view:
+            view = view[os.write(write_fd, view):]
+
+    return total, events
+
+
+def run_binlog_cmds(binlog_cmds, write_fd, codes):
+
+    """Function:  run_binlog_cmds
+
+    Description:  Runs the mysqlbinlog commands one after the other with
+        their output going to the pipe, then closes the pipe.  The commands
+        after a failed one are not run, so no binary log is restored past a
+        gap.
+
+    Arguments:
+        (input) binlog_cmds -> List of mysqlbinlog command line lists
+        (input) write_fd -> Pipe to write to
+        (input) codes -> List the return codes of the commands are added to
+
+    """
+
+    try:
+        for binlog_cmd in binlog_cmds:
+            with subprocess.Popen(binlog_cmd, stdout=write_fd) as proc:
+                codes.append(proc.wait())
+
+            if proc.returncode:
+                break
+
+    finally:
+        os.close(write_fd)
+
+
+def check_binlog_cmds(codes):
+
+    """Function:  check_binlog_cmds
+
+    Description:  Raises an error if a mysqlbinlog command failed, as the
+        restore then stopped part way through the binary logs.
+
+    Arguments:
+        (input) codes -> List of the mysqlbinlog return codes
+
+    """
+
+    failed = [code for code in codes if code]
+
+    if failed:
+        raise ValueError(
+            f"mysqlbinlog exited with {failed[0]}, the binary logs were only"
+            f" partly restored")
+
+
+def put_block(tee, block):
+
+    """Function:  put_block
+
+    Description:  Queues a block of mysqlbinlog output for a restore target
+        once the bytes held for the target leave room for it.  A block is
+        queued at once if nothing is held, so a block larger than the
+        buffer is not held up, and so is None.
+
+    Arguments:
+        (input) tee -> Dictionary of the target queue
+        (input) block -> Block of mysqlbinlog output or None
+
+    """
+
+    with tee["cond"]:
+        if block is not None:
+            tee["cond"].wait_for(
+                lambda: not tee["held"]
+                or tee["held"] + len(block) <= tee["max"])
+            tee["held"] += len(block)
+
+        tee["blocks"].put(block)
+
+
+def write_target(proc, tee):
+
+    """Function:  write_target
+
+    Description:  Writes the queued blocks to the mysql client of a restore
+        target until None is queued, releasing the bytes held for each block
+        once it is written.  If the mysql client exits, the rest of the
+        blocks are dropped so the other targets are not held up.
+
+    Arguments:
+        (input) proc -> mysql client process
+        (input) tee -> Dictionary of the target queue
+
+    """
+
+    alive = True
+
+    while True:
+        block = tee["blocks"].get()
+
+        if block is None:
+            break
+
+        if alive:
+            try:
+                proc.stdin.write(block)
+                proc.stdin.flush()
+
+            except BrokenPipeError:
+                alive = False
+
+        with tee["cond"]:
+            tee["held"] -= len(block)
+            tee["cond"].notify()
+
+    try:
+        proc.stdin.close()
+
+    except BrokenPipeError:
+        pass
+
+
+def tee_binlog(                                         # pylint:disable=R0913
+        binlog_cmds, cmds, count=False, buf_bytes=None, throttle=None,
+        filt=None):
+
+    """Function:  tee_binlog
+
+    Description:  Runs mysqlbinlog once and copies its output to the mysql
+        client of each restore target.  Each target holds at most buf_bytes
+        of blocks not yet written, so a slow target only holds up the
+        reading of the binary logs, and so the other targets, once it is
+        that far behind.  If a throttle is passed, the blocks are copied at
+        its feed rate.  If a filter is passed, only the transactions it
+        keeps are copied.  A failed mysqlbinlog command raises ValueError.
+
+    Arguments:
+        (input) binlog_cmds -> List of mysqlbinlog command line lists
+        (input) cmds -> List of mysql client command line lists
+        (input) count -> True|False - Count the bytes and events
+        (input) buf_bytes -> Bytes queued for each target
+        (input) throttle -> Dictionary of the restore throttle or None
+        (input) filt -> Dictionary of the binary log filter or None
+        (output) stats -> Tuple of bytes and events restored or None
+        (output) -> List of the mysql client return codes
+
+    """
+
+    tees = start_tees(cmds, buf_bytes or TEE_MBYTES * 1048576)
+    stats = {"bytes": 0, "events": 0, "tail": b""}
+    codes = []
+    read_fd, write_fd = crt_pipe()
+    thread = threading.Thread(
+        target=run_binlog_cmds, args=(binlog_cmds, write_fd, codes))
+    thread.start()
+
+    try:
+        for data in read_blocks(read_fd, filt):
+            if count:
+                cnt, stats["tail"] = count_events(data, stats["tail"])
+                stats["events"] += cnt
+                stats["bytes"] += len(data)
+
+            for tee in tees:
+                put_block(tee, data)
+
+            if throttle:
+                throttle_wait(throttle, len(data))
+
+    finally:
+        for tee in tees:
+            put_block(tee, None)
+
+        for tee in tees:
+            tee["writer"].join()
+            tee["proc"].wait()
+
+        os.close(read_fd)
+        thread.join()
+
+    check_binlog_cmds(codes)
+
+    return (stats["bytes"], stats["events"]) if count else None, \
+        [tee["proc"].returncode for tee in tees]
+
+
+def start_tees(cmds, buf_bytes):
+
+    """Function:  start_tees
+
+    Description:  Starts the mysql client of each restore target of
+        tee_binlog and a thread writing the blocks queued for it.
+
+    Arguments:
+        (input) cmds -> List of mysql client command line lists
+        (input) buf_bytes -> Bytes queued for each target
+        (output) tees -> List of dictionaries of the target queues
+
+    """
+
+    tees = []
+
+    for cmd in cmds:
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            cmd, stdin=subprocess.PIPE)
+        tee = {"proc": proc, "blocks": queue.Queue(), "held": 0,
+               "max": buf_bytes, "cond": threading.Condition()}
+        tee["writer"] = threading.Thread(
+            target=write_target, args=(proc, tee))
+        tee["writer"].start()
+        tees.append(tee)
+
+    return tees
+
+
+def throttle_wait(throttle, nbytes):
+
+    """Function:  throttle_wait
+
+    Description:  Waits until the bytes can be fed to the target at the feed
+        rate of the throttle.  Up to a second of unused feed rate is kept
+        for bursts.
+
+    Arguments:
+        (input) throttle -> Dictionary of the restore throttle
+        (input) nbytes -> Number of bytes fed
+
+    """
+
+    now = time.time()
+    rate = throttle["rate"]
+    throttle["avail"] = min(
+        throttle["avail"] + (now - throttle["last"]) * rate, rate) - nbytes
+    throttle["last"] = now
+
+    with throttle["lock"]:
+        throttle["fed"] += nbytes
+
+    if throttle["avail"] < 0:
+        time.sleep(-throttle["avail"] / rate)
+
+
+def throttle_pressure(targets, replicas, lag=None, threads=None):
+
+    """Function:  throttle_pressure
+
+    Description:  Measures how loaded the targets are against the limits, as
+        the highest of the replica lag over the target lag and the threads
+        running on a target over the threads limit.  One is at the limit.
+        Replicas that are not replicating are not counted.
+
+    Arguments:
+        (input) targets -> List of target Server instances
+        (input) replicas -> List of replica Server instances of the targets
+        (input) lag -> Seconds of replica lag to hold
+        (input) threads -> Limit of Threads_running on the targets
+        (output) pressure -> Load against the limits or None if not known
+
+    """
+
+    pressure = None
+
+    for target in targets if threads else []:
+        # Threads_running is a status variable, not a system variable.
+        for row in target.col_sql(
+                "SHOW GLOBAL STATUS LIKE 'Threads_running'"):
+            pressure = max(pressure or 0, int(row["Value"]) / threads)
+
+    for replica in replicas if lag else []:
+        for row in mysql_class.show_slave_stat(replica):
+            behind = row.get(
+                "Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+
+            if behind is not None:
+                pressure = max(pressure or 0, int(behind) / lag)
+
+    return pressure
+
+
+def adjust_rate(rate, pressure, fed_rate):
+
+    """Function:  adjust_rate
+
+    Description:  Feedback controller of the feed rate.  The rate is raised
+        while the pressure is below one and cut while it is above, in
+        proportion to the distance from one and by at most double or half
+        at a time.  The rate is not raised while less than half of it is
+        fed, as the restore is then not held back by the throttle.
+
+    Arguments:
+        (input) rate -> Feed rate in bytes a second
+        (input) pressure -> Load against the limits or None if not known
+        (input) fed_rate -> Bytes a second fed since the last check
+        (output) -> New feed rate in bytes a second
+
+    """
+
+    if pressure is None:
+        return rate
+
+    factor = min(max(1 + THROTTLE_GAIN * (1 - pressure), 0.5), 2.0)
+
+    if factor > 1 and fed_rate < rate / 2:
+        return rate
+
+    return max(rate * factor, THROTTLE_MIN)
+
+
+def check_throttle(throttle, lag=None, threads=None):
+
+    """Function:  check_throttle
+
+    Description:  Reconnects the throttle connections that are closed and
+        measures the pressure of the targets.  If the metrics cannot be
+        read, the error is kept in the throttle and printed once until they
+        are read again.
+
+    Arguments:
+        (input) throttle -> Dictionary of the restore throttle
+        (input) lag -> Seconds of replica lag to hold
+        (input) threads -> Limit of Threads_running on the targets
+        (output) -> Load against the limits or None if not known
+
+    """
+
+    try:
+        for server in throttle["targets"] + throttle["replicas"]:
+            if not server.is_connected():
+                server.reconnect()
+
+        pressure = throttle_pressure(
+            throttle["targets"], throttle["replicas"], lag, threads)
+
+    except Exception as msg:                            # pylint:disable=W0718
+        if not throttle["error"]:
+            print(f"load_log:  Error encountered on throttle: {msg}")
+
+        throttle["error"] = str(msg)
+
+        return None
+
+    throttle["error"] = None
+
+    return pressure
+
+
+def monitor_throttle(throttle, lag=None, threads=None):
+
+    """Function:  monitor_throttle
+
+    Description:  Checks the target metrics every THROTTLE_SECS seconds and
+        adjusts the feed rate of the throttle until it is stopped.  While
+        the metrics cannot be read, the feed rate is halved at each check.
+
+    Arguments:
+        (input) throttle -> Dictionary of the restore throttle
+        (input) lag -> Seconds of replica lag to hold
+        (input) threads -> Limit of Threads_running on the targets
+
+    """
+
+    last = time.time()
+
+    while not throttle["stop"].wait(THROTTLE_SECS):
+        now = time.time()
+
+        with throttle["lock"]:
+            fed, throttle["fed"] = throttle["fed"], 0
+
+        pressure = check_throttle(throttle, lag, threads)
+
+        if throttle["error"]:
+            # The load of the targets is not known, so it is not added to.
+            throttle["rate"] = max(throttle["rate"] / 2, THROTTLE_MIN)
+
+        else:
+            throttle["rate"] = adjust_rate(
+                throttle["rate"], pressure, fed / max(now - last, 0.001))
+
+        last = now
+
+
+def start_throttle(args):
+
+    """Function:  start_throttle
+
+    Description:  Opens connections of its own to the -e targets and the -W
+        replicas and starts checking their metrics, if the restore is
+        throttled with -T or -E.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) throttle -> Dictionary of the restore throttle or None
+
+    """
+
+    lag = int(args.get_val("-T", def_val=0))
+    threads = int(args.get_val("-E", def_val=0))
+
+    if not lag and not threads:
+        return None
+
+    servers = {"targets": [], "replicas": []}
+
+    for key, opt in [("targets", "-e"), ("replicas", "-W")]:
+        for cfg_file in args.get_val(opt, def_val=[]):
+            server = mysql_libs.create_instance(
+                cfg_file, args.get_val("-d"), mysql_class.Server)
+            server.connect(silent=True)
+
+            if server.conn_msg:
+                print(f"load_log:  Error encountered on throttle"
+                      f" {server.name}: {server.conn_msg}")
+
+            else:
+                servers[key].append(server)
+
+    throttle = {"rate": float(THROTTLE_START), "avail": 0.0,
+                "last": time.time(), "fed": 0, "lock": threading.Lock(),
+                "stop": threading.Event(), "error": None,
+                "targets": servers["targets"],
+                "replicas": servers["replicas"]}
+    throttle["thread"] = threading.Thread(
+        target=monitor_throttle, args=(throttle, lag, threads), daemon=True)
+    throttle["thread"].start()
+
+    return throttle
+
+
+def stop_throttle(throttle):
+
+    """Function:  stop_throttle
+
+    Description:  Stops checking the target metrics and closes the throttle
+        connections.
+
+    Arguments:
+        (input) throttle -> Dictionary of the restore throttle or None
+        (output) -> Last feed rate in bytes a second or None
+
+    """
+
+    if not throttle:
+        return None
+
+    throttle["stop"].set()
+    throttle["thread"].join()
+
+    for server in throttle["targets"] + throttle["replicas"]:
+        mysql_libs.disconnect(server)
+
+    return throttle["rate"]
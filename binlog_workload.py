@@ -0,0 +1,367 @@
+# Classification (U)
+
+"""Program:  binlog_workload.py
+
+    Description:  Workload analytics of mysql_log_admin.py (-A).  Reports
+        per minute write rates, event type mixes, per table row counts and
+        transaction sizes as JSON or CSV.
+
+    Usage:
+        import binlog_workload
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import itertools
+import time
+import json
+import array
+import csv
+
+# Local
+try:
+    from . import binlog_reader
+    from . import binlog_stream
+    from . import binlog_fetch
+    from . import binlog_search
+    from . import binlog_catalog
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import binlog_reader
+    import binlog_stream
+    import binlog_fetch
+    import binlog_search
+    import binlog_catalog
+    import version
+
+__version__ = version.__version__
+
+# Workload analytics (-A) per minute counters, the event types that start a
+#   transaction and the CSV columns.
+WORKLOAD_MINUTES = ("events", "txns", "rows", "bytes")
+WORKLOAD_TXN = ("GTID", "Anonymous_GTID", "Query")
+WORKLOAD_CSV = ["section", "key", "events", "transactions", "rows", "bytes"]
+
+
+def crt_workload(count=False):
+
+    """Function:  crt_workload
+
+    Description:  Creates the workload counters.  The per minute counters are
+        arrays indexed by the minute from the first minute, the event types
+        and tables have an array of counters each and the transaction sizes
+        are counted in power of two buckets, so the memory used does not
+        grow with the number of events.
+
+    Arguments:
+        (input) count -> True|False - The rows of rows events are counted
+        (output) -> Dictionary of workload counters
+
+    """
+
+    stats = {key: array.array("Q") for key in WORKLOAD_MINUTES}
+    stats.update({
+        "minute": None, "types": {}, "tables": {}, "undecoded": 0,
+        "count": count,
+        "sizes": array.array("Q", [0]) * 65,
+        "size_bytes": array.array("Q", [0]) * 65})
+
+    return stats
+
+
+def workload_minute(stats, tstamp):
+
+    """Function:  workload_minute
+
+    Description:  Returns the index of the per minute counters of a
+        timestamp, adding the minutes that are not counted yet.
+
+    Arguments:
+        (input) stats -> Dictionary of workload counters
+        (input) tstamp -> Unix timestamp
+        (output) idx -> Index of the minute
+
+    """
+
+    minute = tstamp // 60
+
+    if stats["minute"] is None:
+        stats["minute"] = minute
+
+    idx = minute - stats["minute"]
+
+    if idx < 0:
+        # Events of another server may be a little out of order.
+        for key in WORKLOAD_MINUTES:
+            stats[key][0:0] = array.array("Q", [0]) * -idx
+
+        stats["minute"], idx = minute, 0
+
+    elif idx >= len(stats["events"]):
+        for key in WORKLOAD_MINUTES:
+            stats[key].extend([0] * (idx + 1 - len(stats[key])))
+
+    return idx
+
+
+def add_workload(stats, rows, start_ts=None, stop_ts=None):
+
+    """Function:  add_workload
+
+    Description:  Adds the events of a transaction, or of an event outside a
+        transaction, from catalog_events to the workload counters.  The
+        transactions are counted in the minute of their last event.  The
+        rows events without a row count are only counted as undecoded if
+        the rows are counted.
+
+    Arguments:
+        (input) stats -> Dictionary of workload counters
+        (input) rows -> List of catalogue rows of the events
+        (input) start_ts -> Skip if the first event is before this timestamp
+        (input) stop_ts -> Skip if the first event is at or after this
+            timestamp
+
+    """
+
+    if start_ts and rows[0][2] < start_ts or stop_ts and rows[0][2] >= stop_ts:
+        return
+
+    size = idx = 0
+
+    for _, _, tstamp, kind, _, _, dbase, table, esize, nrows in rows:
+        idx = workload_minute(stats, tstamp)
+        stats["events"][idx] += 1
+        stats["bytes"][idx] += esize
+        size += esize
+        counts = stats["types"].setdefault(kind, array.array("Q", [0, 0]))
+        counts[0] += 1
+        counts[1] += esize
+
+        if "_rows" in kind:
+            counts = stats["tables"].setdefault(
+                f"{dbase}.{table}", array.array("Q", [0, 0, 0]))
+            counts[0] += 1
+            counts[2] += esize
+
+            if nrows is not None:
+                counts[1] += nrows
+                stats["rows"][idx] += nrows
+
+            elif stats["count"]:
+                stats["undecoded"] += 1
+
+    if rows[0][3] in WORKLOAD_TXN:
+        stats["txns"][idx] += 1
+        stats["sizes"][size.bit_length()] += 1
+        stats["size_bytes"][size.bit_length()] += size
+
+
+def workload_report(stats):
+
+    """Function:  workload_report
+
+    Description:  Converts the workload counters into the report.
+
+    Arguments:
+        (input) stats -> Dictionary of workload counters
+        (output) -> Dictionary of the report: minutes, types, tables,
+            transaction_sizes and undecoded_rows_events
+
+    """
+
+    first = stats["minute"] or 0
+
+    return {
+        "minutes": [
+            {"minute": time.strftime(
+                "%Y-%m-%d %H:%M", time.localtime((first + idx) * 60)),
+             "events": stats["events"][idx],
+             "transactions": stats["txns"][idx], "rows": stats["rows"][idx],
+             "bytes": stats["bytes"][idx]}
+            for idx in range(len(stats["events"]))],
+        "types": [
+            {"type": kind, "events": counts[0], "bytes": counts[1]}
+            for kind, counts in sorted(
+                stats["types"].items(), key=lambda item: -item[1][0])],
+        "tables": [
+            {"table": name, "events": counts[0], "rows": counts[1],
+             "bytes": counts[2]}
+            for name, counts in sorted(
+                stats["tables"].items(), key=lambda item: -item[1][1])],
+        "transaction_sizes": [
+            {"max_bytes": (1 << bucket) - 1, "transactions": count,
+             "bytes": stats["size_bytes"][bucket]}
+            for bucket, count in enumerate(stats["sizes"]) if count],
+        "undecoded_rows_events": stats["undecoded"]}
+
+
+def write_workload(report, out, fmt="json"):
+
+    """Function:  write_workload
+
+    Description:  Writes the workload report as JSON or as CSV with a row per
+        minute, event type, table and transaction size bucket.
+
+    Arguments:
+        (input) report -> Dictionary of the report from workload_report
+        (input) out -> Text output file
+        (input) fmt -> json|csv
+
+    """
+
+    if fmt == "json":
+        json.dump(report, out, indent=4)
+        out.write("\n")
+        return
+
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(WORKLOAD_CSV)
+    writer.writerows(
+        ["minute", item["minute"], item["events"], item["transactions"],
+         item["rows"], item["bytes"]] for item in report["minutes"])
+    writer.writerows(
+        ["type", item["type"], item["events"], "", "", item["bytes"]]
+        for item in report["types"])
+    writer.writerows(
+        ["table", item["table"], item["events"], "", item["rows"],
+         item["bytes"]] for item in report["tables"])
+    writer.writerows(
+        ["size", item["max_bytes"], "", item["transactions"], "",
+         item["bytes"]] for item in report["transaction_sizes"])
+    writer.writerow(
+        ["undecoded", "", report["undecoded_rows_events"], "", "", ""])
+
+
+def workload_events(server, args, binlog, start_pos=None, stop_pos=None):
+
+    """Function:  workload_events
+
+    Description:  Returns the events of a binary log with their bodies, read
+        with the native binary log reader from the local copy or streamed
+        from the server with -P.  The Format_description event is read
+        first, for the checksum length, if the binary log is read from a
+        start position.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog -> Binary log name
+        (input) start_pos -> Start position in the binary log or None
+        (input) stop_pos -> Stop position in the binary log or None
+        (output) -> Iterable of BinlogEvent records and checksum length
+
+    """
+
+    binlog_dir = args.get_val("-b") or args.get_val("-m")
+
+    if binlog_dir and os.path.isfile(os.path.join(binlog_dir, binlog)):
+        path = os.path.join(binlog_dir, binlog)
+
+        return itertools.chain(
+            binlog_reader.read_binlog_events(
+                path, stop_pos=len(binlog_reader.BINLOG_MAGIC) + 1, body=True)
+            if start_pos else [],
+            binlog_reader.read_binlog_events(
+                path, start_pos, stop_pos, body=True)), 0
+
+    if not args.get_val("-P"):
+        raise ValueError(f"Binary log {binlog} is not local, see -P")
+
+    events = binlog_stream.stream_binlog_events(
+        server, binlog, start_pos, body=True)
+
+    if stop_pos:
+        events = itertools.takewhile(
+            lambda event: event.offset < stop_pos, events)
+
+    return events, 4 if start_pos and server.crc == "CRC32" else 0
+
+
+def read_workload(server, args, binlog_list, opt_arg_list):
+
+    """Function:  read_workload
+
+    Description:  Reads the binary log events between the start and stop
+        datetimes once into the workload counters.  The rows of rows events
+        are counted with -U.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) binlog_list -> List of binary log names
+        (input) opt_arg_list ->  Arguments to be added to command line
+        (output) stats -> Dictionary of workload counters
+
+    """
+
+    binlog_list, pos_args, stop_args = binlog_search.plan_binlog_pos(
+        server, args, binlog_list, list(opt_arg_list))
+    start_pos = int(pos_args[0].split("=", 1)[1]) if pos_args else None
+    stop_pos = int(stop_args[0].split("=", 1)[1]) if stop_args else None
+    window = binlog_fetch.dt_to_ts(args.get_val("-s")), \
+        binlog_fetch.dt_to_ts(args.get_val("-t"))
+    stats = crt_workload(args.arg_exist("-U"))
+    binlog_fetch.sync_mirror(server, args, binlog_list)
+
+    for cnt, binlog in enumerate(binlog_list):
+        events, crc = workload_events(
+            server, args, binlog, start_pos if cnt == 0 else None,
+            stop_pos if cnt == len(binlog_list) - 1 else None)
+
+        for rows, _, _ in binlog_catalog.catalog_events(
+                events, crc, stats["count"]):
+            add_workload(stats, rows, *window)
+
+    return stats
+
+
+def analyse_log(server, args, opt_arg_list):
+
+    """Function:  analyse_log
+
+    Description:  Reads the binary log events between the start and stop
+        datetimes once and writes the per minute event, transaction, row and
+        byte counts, the event type mix, the rows events, rows and bytes of
+        each table and the transaction size distribution, to standard out or
+        to the -o file.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list ->  Arguments to be added to command line
+
+    """
+
+    fmt = args.get_val("-O", def_val="json")
+
+    if fmt not in ("json", "csv"):
+        print(f"analyse_log:  Error encountered: -O {fmt} is not json or csv")
+        return
+
+    status, binlog_list = binlog_fetch.process_logs_list(server, args)
+
+    if not status[0]:
+        print(f"Error encountered: {status[1]}")
+        return
+
+    try:
+        stats = read_workload(server, args, binlog_list, opt_arg_list)
+
+    except (OSError, ValueError) as msg:
+        print(f"analyse_log:  Error encountered: {msg}")
+        return
+
+    if args.get_val("-o"):
+        with open(args.get_val("-o"), "w", encoding="utf-8",
+                  newline="") as out:
+            write_workload(workload_report(stats), out, fmt)
+
+    else:
+        write_workload(workload_report(stats), sys.stdout, fmt)
@@ -9,12 +9,34 @@
 
     Usage:
         mysql_log_admin.py -c file -d path
-            {-L [-s "date time" | -t "date time"] |
-             -D [-f file | -g file | -s "date time"] [-t "date time"] |
-             -R -e file [-f file | -g file]}
+            {-S path [-b path | -m path [-z mb]] [-i path] [-n count] [-P]
+                [-x] |
+             -L [-s "date time" | -t "date time" | -l file]
+                [-b path | -m path [-z mb]] [-i path] [-n count [-j mb]]
+                [-P] [-x] |
+             -D [-f file | -g file | -s "date time"] [-t "date time"]
+                [-b path | -m path [-z mb]] [-i path]
+                [-n count [-j mb] [-M mb]] [-o file] [-P] [-w] [-x]
+                [-B db [db ...]] [-X db [db ...]] [-K table [table ...]]
+                [-N table [table ...]] [-G type [type ...]]
+                [-Y type [type ...]] [-Q count] |
+             -R -e file [file ...] [-f file | -g file | -s "date time"]
+                [-t "date time"] [-b path | -m path [-z mb]] [-i path]
+                [-a count] [-k file [-r]] [-q] [-F mb]
+                [-T seconds -W file [file ...]] [-E count] [-P] [-x]
+                [-B db [db ...]] [-X db [db ...]] [-K table [table ...]]
+                [-N table [table ...]] [-G type [type ...]]
+                [-Y type [type ...]] [-Q count] |
+             -C file [-b path | -m path [-z mb]] [-P] [-U] [-x] |
+             -A [-f file | -g file | -s "date time"] [-t "date time"]
+                [-b path | -m path [-z mb]] [-i path] [-P] [-U] [-o file]
+                [-O json | csv]}
             [-y flavor_id] [-p path]
             [-v | -h]
 
+        mysql_log_admin.py -u path
+            {-L ... | -D ... | -R -e file ... | -C file ... | -A ...}
+
     Arguments:
         -c file => Database configuration file.  Required arg.
         -d dir path => Directory path to config files.  Required arg.
@@ -23,19 +45,338 @@
             datetimes are NULL, then get current position.
             -s "date time" => Start datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
             -t "date time" => Stop datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
+            -l file => File of start and stop datetime windows, one
+                "start,stop" pair per line, either of which may be empty.
+                The position for every window is found in a single pass over
+                the binary logs and one position is printed per window, in
+                file order.  Not used with -s or -t.  -i is not used with -l.
+            -b dir path => Directory path to a local copy of the binary log
+                files.  If used, the binary logs are read directly from this
+                directory with the native binary log reader instead of being
+                decoded by the mysqlbinlog program.
+            -i dir path => Directory path to the binary log indexes.  If
+                used with -b, an index is built for each closed binary log
+                the first time it is read and later look ups use a binary
+                search of the index instead of reading the binary log.  The
+                indexes of the purged binary logs are removed.  Servers
+                whose binary logs have the same base name need a directory
+                each.
+            -n count => Number of binary logs to check at the same time.
+                The binary logs are checked from the newest back, a batch of
+                this many at a time, until one has a position.  Default is 1.
+            -j megabytes => Split the closed binary logs larger than this
+                into ranges of about this size at transaction boundaries
+                from the -i index, and check each range with its own
+                mysqlbinlog --start-position/--stop-position, -n at a time.
+                Only used for the binary logs read with mysqlbinlog.
+                The binary logs and ranges of a batch are started on the
+                workers largest first, so the workers finish at about the
+                same time.
+            -x => Print the number of binary logs and ranges read by the
+                workers, their busy time and the utilisation of the -n
+                workers to standard error at the end.
+            -P => Stream the binary logs from the database over the
+                replication protocol instead of running mysqlbinlog.  Uses
+                the host, port, user and password (japd) in the database
+                configuration file.  The user requires the REPLICATION SLAVE
+                privilege.  Not used with -b.
+            -m dir path => Directory path to a local mirror of the closed
+                binary logs.  Closed binary logs that are not in the mirror
+                are fetched once from the database with mysqlbinlog --raw
+                and checked against the binary log sizes on the database.
+                Mirrored binary logs are read with the native binary log
+                reader and the active binary log is read from the database.
+                The directory is only to be used for the mirror, as binary
+                logs that are purged from the database are removed from it.
+                Not used with -b.
+            -z megabytes => Disk budget of the -m mirror.  The least recently
+                used binary logs are removed to stay within it.  Default is
+                10240.
 
         -D => Display log(s).  Will use a combination of start and stop
-            datetimes and first and last binary log file names.
+            datetimes and first and last binary log file names.  The
+            binary logs outside the start and stop datetimes are skipped and
+            the datetimes are converted to start and stop positions, so
+            mysqlbinlog starts and stops at them without decoding the events
+            before them.
             -f file => First binary log file name.
             -g file => Last binary log file name.
             -s "date time" => Start datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
             -t "date time" => Stop datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
+            -i dir path => Directory path to the binary log indexes.  Used to
+                skip the binary logs and the part of the first binary log
+                that are before the start datetime.  With the filter
+                options, a Bloom filter of the tables each closed binary log
+                changes is also kept in the directory, and with -K the
+                binary logs it rules out are not read.  See -K.
+            -b dir path => Directory path to a local copy of the binary log
+                files.  Used to build any missing binary log indexes and to
+                find the start and stop positions.
+            -n count => Number of binary logs to decode at the same time.
+                The output is written in binary log order as the output of
+                a single mysqlbinlog run, with one header and trailer and
+                the session settings only written when they change.  Each
+                worker holds at most 2 decoded binary logs ahead of the
+                output.  Default is 1.
+            -j megabytes => Split the binary logs larger than this into
+                ranges of about this size at transaction boundaries, from
+                the -i index or the -b/-m local copy, and decode each range
+                with its own mysqlbinlog --start-position/--stop-position,
+                -n at a time.  The ranges are written in order like binary
+                logs.
+            -M megabytes => Memory budget of the -n workers.  The binary
+                logs and ranges are started largest first while the binary
+                log bytes being decoded, or held until they are written, fit
+                in the budget.  The next binary log or range to be written
+                is always started.  Default is no budget.
+            -x => Print the worker utilisation to standard error.  See -L.
+            -o file => Write the binary log entries to this file instead of
+                standard out.
+            -m dir path => Directory path to a local mirror of the closed
+                binary logs.  See -L.  Mirrored binary logs are decoded from
+                the local copy.
+            -z megabytes => Disk budget of the -m mirror.  See -L.
+            -P => Find the start and stop positions of the binary logs that
+                are not local by streaming their event headers over the
+                replication protocol.  See -L.  Without -P, -b or -m, the
+                start position is only found from the -i index.
+            -w => Follow the binary logs and write new events as they are
+                written, until interrupted.  Uses mysqlbinlog --stop-never,
+                so rotations to new binary logs are followed on the same
+                connection.  Without -f or -s, starts at the end of the
+                active binary log.  If the connection is lost, mysqlbinlog
+                is restarted at the last transaction boundary written with
+                an increasing delay, and only complete transactions are
+                written.  The number of events and their latency from commit
+                (second resolution) are printed to standard error at the
+                end.  -n and -m are not used with -w.  Not used with the
+                filter options.
+            -B database [database ...] => Only keep the transactions that
+                change these databases.  The mysqlbinlog output is grouped
+                into transactions as it is read and a transaction is
+                written if any of its Query or rows events passes all of the
+                filter options, so a transaction is never split.  Query
+                events are matched by the default database of the session
+                (use), or by their table if they are CREATE, ALTER, DROP or
+                TRUNCATE TABLE statements on a single table, and rows events
+                by the database and table of their Table_map event.  The
+                names may have shell wildcards (*, ?
+                and [seq]).  The session settings of a dropped transaction
+                are still written, so the transactions after it run with
+                them.  A transaction is held in memory until its end is
+                read.  The filter options are applied to the mysqlbinlog
+                output, so mysqlbinlog still decodes every event of the
+                binary logs it reads.  -B is not passed on as mysqlbinlog
+                --database, which drops the events of other databases from
+                a transaction instead of keeping or dropping the whole
+                transaction, and takes a single database without
+                wildcards.
+            -X database [database ...] => Drop the transactions that only
+                change these databases.  See -B.
+            -K database.table [database.table ...] => Only keep the
+                transactions that change these tables.  Query events other
+                than DDL on a single table are not matched by table.  See
+                -B.  With -i and without wildcards, the closed binary logs
+                that do not change these tables are not read.  The tables of
+                each closed binary log are kept in a Bloom filter in the -i
+                directory, which is built from the -b or -m local copy the
+                first time the binary log is read after it is closed.  A
+                binary log with statement based changes or compressed
+                transactions is always read, unless Query events are
+                dropped by -G or -Y.
+            -Q count => False positive rate of the Bloom filters, as one in
+                this many look ups, when they are built.  A lower rate
+                makes larger Bloom filters.  Default is 100.
+            -N database.table [database.table ...] => Drop the transactions
+                that only change these tables.  See -K.
+            -G type [type ...] => Only keep the transactions with these
+                event types, as printed by mysqlbinlog (i.e. Query,
+                Write_rows, Update_rows, Delete_rows), without case.  See
+                -B.
+            -Y type [type ...] => Drop the transactions that only have these
+                event types.  See -G.
 
         -R => Restore binary logs from a master database (-c) to a slave
             database (-e).
-            -e file => Target database configuration file.
+            -e file [file ...] => Target database configuration files.  With
+                more than one target, the binary logs are read once and
+                restored to every target at the same time.  A target that
+                fails is left out and the restore goes on to the others.
+                Not used with -a, -k or -q.
+            -f file => First binary log file name.
+            -g file => Last binary log file name.
+            -s "date time" => Start datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
+            -t "date time" => Stop datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
+                The start and stop datetimes are converted to positions the
+                same as -D, so a restore that starts deep inside a binary
+                log does not decode the events before it.
+            -i dir path => Directory path to the binary log indexes.  See -D.
+                The Bloom filters are used as with -D.
+            -b dir path => Directory path to a local copy of the binary log
+                files.  See -D.
+            -m dir path => Directory path to a local mirror of the closed
+                binary logs.  See -D.
+            -z megabytes => Disk budget of the -m mirror.  See -L.
+            -P => Find the start and stop positions over the replication
+                protocol.  See -D.
+            -a count => Apply the transactions with this many mysql client
+                sessions on the target.  The transactions are dispatched by
+                the logical clock (last_committed and sequence_number) of the
+                GTID events, so a transaction is only started once the
+                transactions it depends on are committed or are queued on
+                the same session before it.  Transactions without a logical
+                clock are applied one at a time on the first session.
+                Temporary tables from statement based binary logs are not
+                kept across sessions.  Default is one session.
+            -k file => Restore checkpoint file.  The binary log and
+                position up to which all transactions are committed on the
+                target, and the transactions committed past it, are written
+                to the file at most once a second and when the restore ends
+                or fails.  The transactions are applied as with -a.
+                -r => Resume the restore from the checkpoint file.  The
+                    binary logs before the checkpoint are not read and the
+                    transactions already committed are not applied again.
+                    Starts from -f or -s if there is no checkpoint file.
+            -q => Fast restore profile.  Each mysql client session turns off
+                sql_log_bin, unique_checks and foreign_key_checks before
+                the binary logs and sets them back after them, and the
+                checks the binary log events turn on are left off.  The
+                mysql client is run with a max_allowed_packet of 1GB.  The
+                target user needs the privilege to set sql_log_bin.  The
+                throughput is printed at the end.  The transactions are
+                applied as with -a.
+            -F megabytes => Buffer of each -e target when there is more than
+                one.  A target only slows down the reading of the binary
+                logs, and so the other targets, once it is this far behind
+                the fastest target.  Default is 64MB.
+            -T seconds => Throttle the restore to hold the replication lag
+                of the -W replicas of the targets at this many seconds.
+                The metrics are checked once a second on connections of
+                their own and a feedback controller raises the feed rate
+                while they are below the limits and cuts it while they are
+                above, so the restore runs at the highest rate the targets
+                and their replicas keep up with.  If the metrics cannot be
+                read, the error is printed, the connections are reconnected
+                and the feed rate is halved at each check until they are
+                read again.
+                -W file [file ...] => Database configuration files of the
+                    replicas of the targets to check the lag on.
+            -E count => Throttle the restore to hold the Threads_running of
+                the targets at this many threads.  See -T.
+            -B database [database ...] => Only restore the transactions that
+                change these databases.  See -D.
+            -X database [database ...] => Do not restore the transactions
+                that only change these databases.  See -D.
+            -K database.table [database.table ...] => Only restore the
+                transactions that change these tables.  See -D.
+            -N database.table [database.table ...] => Do not restore the
+                transactions that only change these tables.  See -D.
+            -G type [type ...] => Only restore the transactions with these
+                event types.  See -D.
+            -Y type [type ...] => Do not restore the transactions that only
+                have these event types.  See -D.
+            -Q count => False positive rate of the Bloom filters.  See -D.
+            -x => Print the number of bytes and events restored and the
+                throughput.  The entries are then copied through this
+                program in blocks instead of being passed straight from
+                mysqlbinlog to mysql, as they also are with the filter
+                options.  With -a, -k or -q, the number of transactions is
+                printed.  With -T or -E, the last feed rate of the throttle
+                is printed.
+
+        -C file => Event catalogue.  Adds the events of the binary logs to
+            this SQLite database file, which is created if it does not
+            exist, and prints nothing.  Each run only adds the events after
+            the last complete transaction of the previous run, and a closed
+            binary log read to its end is not read again.  The events are
+            added in database transactions of up to 10000 events, each
+            ending at the end of a binary log transaction, and the database
+            can be queried while events are added.  Tables:
+                events => One row per event: binlog, pos (event position),
+                    txn_pos (position of the first event of its
+                    transaction), ts (Unix timestamp), type (as printed by
+                    mysqlbinlog), server_id, gtid, db, tbl (the table of
+                    Table_map and rows events and of DDL on a single table),
+                    size (bytes) and nrows (rows of a rows event with -U,
+                    if the column types are known).  Indexed by binlog and
+                    pos, ts, tbl and ts, gtid and binlog and txn_pos.
+                binlogs => The position each binary log is read up to.
+            The binary logs are read with the native binary log reader.  The
+            nrows column is added to a catalogue created without it.
+            -b dir path => Directory path to a local copy of the binary log
+                files.  See -L.
+            -m dir path => Directory path to a local mirror of the closed
+                binary logs.  See -L.
+            -z megabytes => Disk budget of the -m mirror.  See -L.
+            -P => Stream the binary logs that are not local from the
+                database over the replication protocol.  See -L.  Without
+                -P, the binary logs that are not local are not read.
+            -U => Count the rows of each rows event into nrows.  Counting
+                walks the row images of every rows event, so the binary logs
+                are read about two to three times slower.
+            -x => Print the number of binary logs read and events added to
+                standard error.
+
+        -A => Workload analytics.  Reads the binary log events between the
+            start and stop datetimes once and writes, for capacity planning:
+                minutes => Events, transactions, rows and bytes of each
+                    minute, with the transactions in the minute they end.
+                types => Events and bytes of each event type.
+                tables => Rows events, rows and bytes of each table.
+                transaction_sizes => Transactions and bytes in power of two
+                    size buckets, up to max_bytes each.
+                undecoded_rows_events => Rows events whose rows are not
+                    counted with -U, as their column types are not known
+                    (i.e. partial JSON updates).
+            The rows are only counted with -U and are 0 without it.
+            The counters are arrays by minute, event type, table and size
+            bucket, so the memory used does not grow with the number of
+            events.  The binary logs are read with the native binary log
+            reader.  The rows in compressed transactions are not counted.
             -f file => First binary log file name.
             -g file => Last binary log file name.
+            -s "date time" => Start datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
+            -t "date time" => Stop datetime.  Format:  "YYYY-MM-DD HH:MM:SS"
+                The transactions that start between the datetimes are
+                counted.  The binary logs outside them are skipped as with
+                -D.
+            -b dir path => Directory path to a local copy of the binary log
+                files.  See -L.
+            -m dir path => Directory path to a local mirror of the closed
+                binary logs.  See -L.
+            -z megabytes => Disk budget of the -m mirror.  See -L.
+            -i dir path => Directory path to the binary log indexes.  See -D.
+            -P => Stream the binary logs that are not local from the
+                database over the replication protocol.  See -L.  Without
+                -P, all of the binary logs have to be local.
+            -U => Count the rows of each rows event.  See -C.
+            -o file => Write the report to this file instead of standard
+                out.
+            -O json|csv => Report format.  The CSV report has the columns
+                section, key, events, transactions, rows and bytes, with a
+                row for each minute, type, table and size bucket.  Default
+                is json.
+
+        -S file path => Run as a service listening on this unix socket.  The
+            database connection is opened once and kept open, and each -L,
+            -D, -R, -C or -A request sent with -u is run on it one at a time,
+            without the program lock, start up and database connection of a
+            new run.
+            The -b, -d, -i, -m, -n, -p, -z, -M, -P, -Q and -x options of the
+            service are used by the requests that do not have them.  The
+            socket is only accessible by the user running the service.  A
+            socket left over from a service that did not shut down is
+            replaced, but not a file or the socket of a running service.
+            Runs until interrupted or terminated.
+        -u file path => Send the request to the service listening on this
+            unix socket and print its response.  -c is not used, as the
+            service database connection is used.  The -e configuration files
+            are read from the -d directory of the service, unless -d is
+            passed.  The request is run by the service in its own working
+            directory, so the -b, -d, -i, -k, -l, -m, -o, -p and -C paths
+            have to be absolute.  The standard out and standard error of
+            the request are printed to standard out and standard error.
+            Not used with -w.
 
         -p dir path => Directory path to mysql programs.  Only required if the
             mysql binary programs do not run properly.  (i.e. not in the $PATH
@@ -104,6 +445,8 @@
 
     Example:
         mysql_log_admin.py -c database -d config -L
+        mysql_log_admin.py -c database -d config -S /tmp/log_admin.sock -n 4
+        mysql_log_admin.py -u /tmp/log_admin.sock -L -s "2024-01-01 00:00:00"
 
 """
 
@@ -111,9 +454,6 @@
 
 # Standard
 import sys
-import subprocess
-import re
-import itertools
 
 # Local
 try:
@@ -121,6 +461,12 @@ try:
     from .lib import gen_class
     from .mysql_lib import mysql_class
     from .mysql_lib import mysql_libs
+    from . import binlog_search
+    from . import binlog_display
+    from . import binlog_restore
+    from . import binlog_catalog
+    from . import binlog_workload
+    from . import binlog_service
     from . import version
 
 except (ValueError, ImportError) as err:
@@ -128,6 +474,12 @@ except (ValueError, ImportError) as err:
     import lib.gen_class as gen_class                   # pylint:disable=R0402
     import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
     import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import binlog_search
+    import binlog_display
+    import binlog_restore
+    import binlog_catalog
+    import binlog_workload
+    import binlog_service
     import version
 
 __version__ = version.__version__
@@ -147,302 +499,21 @@ def help_message():
     print(__doc__)
 
 
-def fetch_binlog(                                       # pylint:disable=R0913
-        server, start_dt=None, stop_dt=None, binlog_files=None,
-        opt_arg_list=None, bin_path=None):
-
-    """Function:  fetch_binlog
-
-    Description:  Returns a list of binary log entries based on the binary log
-        file names passed and/or the start and/or stop datetimes.
-        Returns the entries as a file.
-
-    Arguments:
-        (input) server -> Server instance
-        (input) start_dt -> Start datetime
-        (input) stop_dr -> Stop datetime
-        (input) binlog_files -> List of binary log names
-        (input) opt_arg_list ->  Arguments to be added to command line
-        (input) bin_path -> Path to Mysql binary directory
-        (output) -> File handler to list of log entries
-
-    """
-
-    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
-
-    if bin_path is None:
-        bin_path = ""
-
-    if binlog_files is None:
-        # List of binary logs.
-        binlog_files = [
-            row["Log_name"] for row in mysql_libs.fetch_logs(server)]
-
-    else:
-        binlog_files = list(binlog_files)
-
-    cmd = mysql_libs.crt_cmd(server, bin_path + "mysqlbinlog")
-
-    if opt_arg_list:
-        for arg in opt_arg_list:
-            cmd = gen_libs.add_cmd(cmd, arg=arg)
-
-    if start_dt:
-        cmd = gen_libs.add_cmd(cmd, arg=f"--start-datetime={start_dt}")
-
-    if stop_dt:
-        cmd = gen_libs.add_cmd(cmd, arg=f"--stop-datetime={stop_dt}")
-
-    # Return a file handler with log entries.
-    return iter(
-        subprocess.Popen(cmd + binlog_files, stdout=subprocess.PIPE).stdout)
-
-
-def find_dt_pos(                                # pylint:disable=R0913,R0914
-        master, start_dt, stop_dt, opt_arg_list=None, bin_path=None,
-        slave=None):
-
-    """Function:  find_dt_pos
-
-    Description:  Gets all binary logs, unless a Slave is present.  Fetches all
-        lines that match the start and stop datatimes and checks these
-        entries for end log positions and returns the last end log
-        position found along with the binary log name that it was found in.
-
-    Arguments:
-        (input) master -> Server instance or Master, if Slave present
-        (input) start_dt -> Start datetime
-        (input) stop_dt -> Stop datetime
-        (input) opt_arg_list ->  Arguments to be added to command line
-        (input) slave -> Slave server instance
-        (output) -> Position class (file, pos)
-
-    """
-
-    sub1 = r"#\d{6}\s+\d?\d:\d\d:\d\d\s+"
-    sub2 = r"server id\s+(?P<sid>\d+)\s+"
-    sub3 = r"end_log_pos\s+(?P<epos>\d+)\s+"
-    sub4 = r"CRC32\s+(?P<crc>\w+)\s+"
-    sub5 = r"(?P<type>\w+)"
-
-    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
-
-    if bin_path is None:
-        bin_path = ""
-
-    # List of current binary log names.
-    log_files = [row["Log_name"] for row in mysql_libs.fetch_logs(master)]
-
-    if slave:
-        # Get only those binary log files up to the relay log file.
-        efile = slave.relay_mst_log
-        files = list(
-            itertools.dropwhile(lambda file: file != efile, log_files))
-        log_files = files
-
-    # Get entries between start and stop datetimes.
-    lines = fetch_binlog(
-        master, start_dt, stop_dt, log_files, opt_arg_list, bin_path)
-    num_files = 0
-    last_log_pos = None
-
-    for item in lines:
-        if not isinstance(item, str):
-            item = item.decode("utf-8")
-
-        match = re.match(sub1 + sub2 + sub3 + sub5, item)
-
-        # Supports checksum and match for approriate format.
-        if master.crc == "CRC32":
-            match = re.match(sub1 + sub2 + sub3 + sub4 + sub5, item)
-
-        # If a line matches then see if the end_log_pos is Start (new file) or
-        #   has found a Query within the datetime range requested.
-        # Matched line is at the start of the log.
-        if match and match.group("type") == "Start":
-            # Increase file position by 1.
-            num_files += 1
-
-        # Matched line is a Query
-        if match and match.group("type") == "Query":
-            # Capture position of the log.
-            last_log_pos = match.group("epos")
-
-    # Return file and position as a Position class.
-    return mysql_class.Position(log_files[num_files - 1], last_log_pos)
-
-
-def fetch_log_pos(server, args, opt_arg_list=None):
-
-    """Function:  fetch_log_pos
-
-    Description:  Gets the server's file name and position that are between the
-        start and stop datetimes.
-
-    Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) opt_arg_list ->  Arguments to be added to command line
-
-    """
-
-    opt_arg_list = [] if opt_arg_list is None else list(opt_arg_list)
-
-    # Get Position class from file and log position.
-    pos = find_dt_pos(server, args.get_val("-s"), args.get_val("-t"),
-                      opt_arg_list, args.get_val("-p"))
-
-    print(f"Filename: {pos.file}, Position: {pos.pos}")
-
-
-def fetch_log_entries(server, args, opt_arg_list):
-
-    """Function:  fetch_log_entries
-
-    Description:  Prints out the binary log entries that are between the start
-        and stop datetimes.
-
-    Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) opt_arg_list ->  Arguments to be added to command line
-
-    """
-
-    opt_arg_list = list(opt_arg_list)
-    status, binlog_list = process_logs_list(server, args)
-
-    if status[0]:
-
-        lines = fetch_binlog(
-            server, opt_arg_list=opt_arg_list, start_dt=args.get_val("-s"),
-            stop_dt=args.get_val("-t"), binlog_files=binlog_list,
-            bin_path=args.get_val("-p"))
-
-        for item in lines:
-            if not isinstance(item, str):
-                item = item.decode("utf-8")
-
-            print(item, end="")
-
-    else:
-        print(f"Error encountered: {status[1]}")
-
-
-def process_logs_list(server, args):
-
-    """Function:  process_logs_list
-
-    Description:  Get a list of binary log file names from the source database.
-        Clean up the list if the -f and/or -g options are used.
-
-    Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (output) status -> Tuple on process status
-            status[0] - True|False - Process successful
-            status[1] - Error message if process failed
-        (output) binlog_list -> List of binary log file names
-
-    """
-
-    status = (True, None)
-    binlog_list = []
-
-    # Is -f and -g in the argument list and in the correct order.
-    if (args.arg_exist("-f") and args.arg_exist("-g")) \
-       and args.get_val("-g") < args.get_val("-f"):
-
-        status = (False, f'Error:  Option -g: {args.get_val("-g")} is before'
-                  f' -f {args.get_val("-f")}')
-
-        return status, binlog_list
-
-    binlog_list = gen_libs.dict_2_list(
-        mysql_libs.fetch_logs(server), "Log_name")
-
-    if args.arg_exist("-f") and args.get_val("-f") in binlog_list:
-
-        # Remove any logs before log file name.
-        while binlog_list[0] < args.get_val("-f"):
-            binlog_list.pop(0)
-
-    elif args.arg_exist("-f"):
-
-        status = (
-            False, f'Error:  Option -f: {args.get_val("-f")} not found in'
-            f' binary log list.')
-
-        return status, binlog_list
-
-    if args.arg_exist("-g") and args.get_val("-g") in binlog_list:
-        # Remove any logs after log file name.
-        while binlog_list[-1] > args.get_val("-g"):
-            binlog_list.pop(-1)
-
-    elif args.arg_exist("-g"):
-
-        status = (
-            False, f'Error:  Option -g: {args.get_val("-g")} not found in'
-            f' binary log list.')
-
-    return status, binlog_list
-
-
-def load_log(server, args, opt_arg_list):
-
-    """Function:  load_log
-
-    Description:  Get the binary logs from the source database, then fetch the
-        revelant binary log entries and load them into the target
-        database before closing all connections.
-
-    Arguments:
-        (input) server -> Server instance
-        (input) args -> ArgParser class instance
-        (input) opt_arg_list ->  Arguments to be added to command line
-
-    """
-
-    opt_arg_list = list(opt_arg_list)
-    status, binlog_list = process_logs_list(server, args)
-
-    if status[0]:
-        target = mysql_libs.create_instance(
-            args.get_val("-e"), args.get_val("-d"), mysql_class.Server)
-        target.connect(silent=True)
-
-        if not target.conn_msg:
-            cmd = mysql_libs.crt_cmd(
-                target, args.arg_set_path("-p", cmd="mysql"))
-
-            # Fetch binary logs and restore to target database
-            proc1 = fetch_binlog(
-                server, args.get_val("-s"), args.get_val("-t"),
-                binlog_list, opt_arg_list, args.get_val("-p"))
-            proc2 = subprocess.Popen(cmd, stdin=proc1)  # pylint:disable=R1732
-            proc2.wait()
-            mysql_libs.disconnect(target)
-
-        else:
-            print(f"load_log:  Error encountered on slave {target.name}:"
-                  f" {target.conn_msg}")
-
-    else:
-        print(f"load_log:  Error encountered in process_logs_list:"
-              f" {status[1]}")
-
-
-def run_program(args, func_dict, opt_arg_list):
+def run_program(args, func_dict, opt_arg_list, req_opts=None):
 
     """Function:  run_program
 
     Description:  Creates class instance(s) and controls flow of the program.
+        With -S, runs as a service that answers requests on a unix socket
+        over the one server connection.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) func_dict -> Dictionary list of functions and options
         (input) opt_arg_list ->  Arguments to be added to command line
+        (input) req_opts -> Dictionary of opt_val, multi_val, valid_func,
+            opt_xor_val, dir_perms_chk and opt_con_req for the request
+            arguments
 
     """
 
@@ -455,10 +526,16 @@ def run_program(args, func_dict, opt_arg_list):
     if not server.conn_msg:
         server.set_srv_binlog_crc()
 
-        # Call function(s) - intersection of command line and function dict.
-        for item in set(args.get_args_keys()) & set(func_dict.keys()):
-            # Call the function requested.
-            func_dict[item](server, args, opt_arg_list)
+        if args.get_val("-S"):
+            binlog_service.serve_requests(
+                server, args, func_dict, opt_arg_list, req_opts)
+
+        else:
+            # Call function(s) - intersection of command line and function
+            #   dict.
+            for item in set(args.get_args_keys()) & set(func_dict.keys()):
+                # Call the function requested.
+                func_dict[item](server, args, opt_arg_list)
 
         mysql_libs.disconnect(server)
 
@@ -480,6 +557,7 @@ def main():
         func_dict -> dictionary list for the function calls or other options
         opt_arg_list -> contains arguments to add to command line by default
         opt_con_req_list -> contains the options that require other options
+        opt_multi_list -> contains the options that will have multiple values
         opt_req_list -> contains the options that are required for the program
         opt_val_list -> contains options which require values
         opt_valid_val -> contains list of types of values to be validated
@@ -490,36 +568,67 @@ def main():
 
     """
 
-    dir_perms_chk = {"-d": 5, "-p": 5}
-    func_dict = {"-L": fetch_log_pos, "-D": fetch_log_entries, "-R": load_log}
+    dir_perms_chk = {"-b": 5, "-d": 5, "-i": 7, "-m": 7, "-p": 5}
+    func_dict = {"-L": binlog_search.fetch_log_pos,
+                 "-D": binlog_display.fetch_log_entries,
+                 "-R": binlog_restore.load_log,
+                 "-C": binlog_catalog.catalog_log,
+                 "-A": binlog_workload.analyse_log}
     opt_arg_list = ["--force-read", "--read-from-remote-server"]
-    opt_con_req_list = {"-R": ["-e"]}
+    opt_con_req_list = {"-R": ["-e"], "-r": ["-k"], "-T": ["-W"],
+                        "-W": ["-T"]}
+    opt_multi_list = ["-e", "-B", "-G", "-K", "-N", "-W", "-X", "-Y"]
     opt_req_list = ["-c", "-d"]
-    opt_val_list = ["-c", "-e", "-d", "-f", "-g", "-p", "-s", "-t", "-y"]
-    valid_func = {"-s": gen_libs.validate_date, "-t": gen_libs.validate_date}
-    opt_xor_val = {"-L": ["-D", "-R"], "-D": ["-L", "-R"], "-R": ["-D", "-L"]}
+    opt_val_list = [
+        "-a", "-b", "-c", "-e", "-d", "-f", "-g", "-i", "-j", "-k", "-l",
+        "-m", "-n", "-o", "-p", "-s", "-t", "-u", "-y", "-z", "-B", "-C",
+        "-E", "-F", "-G", "-K", "-M", "-N", "-O", "-Q", "-S", "-T", "-W",
+        "-X", "-Y"]
+    valid_func = {"-s": gen_libs.validate_date, "-t": gen_libs.validate_date,
+                  "-n": gen_libs.chk_int, "-z": gen_libs.chk_int,
+                  "-j": gen_libs.chk_int, "-M": gen_libs.chk_int,
+                  "-a": gen_libs.chk_int, "-F": gen_libs.chk_int,
+                  "-E": gen_libs.chk_int, "-T": gen_libs.chk_int,
+                  "-Q": gen_libs.chk_int}
+    opt_xor_val = {"-L": ["-A", "-C", "-D", "-R"],
+                   "-D": ["-A", "-C", "-L", "-R"],
+                   "-R": ["-A", "-C", "-D", "-L"],
+                   "-C": ["-A", "-D", "-L", "-R"],
+                   "-A": ["-C", "-D", "-L", "-R"],
+                   "-b": ["-m"], "-m": ["-b"], "-l": ["-s", "-t"],
+                   "-S": ["-A", "-C", "-L", "-D", "-R", "-u"],
+                   "-w": ["-B", "-G", "-K", "-N", "-X", "-Y"]}
+    req_opts = {"opt_val": opt_val_list, "multi_val": opt_multi_list,
+                "valid_func": valid_func, "opt_xor_val": opt_xor_val,
+                "dir_perms_chk": dir_perms_chk,
+                "opt_con_req": opt_con_req_list}
 
     # Process argument list from command line.
-    args = gen_class.ArgParser(sys.argv, opt_val=opt_val_list)
+    args = gen_class.ArgParser(
+        sys.argv, opt_val=opt_val_list, multi_val=opt_multi_list)
 
     if args.arg_parse2()                                            \
-       and not gen_libs.help_func(args, __version__, help_message)  \
-       and args.arg_require(opt_req=opt_req_list)                   \
-       and args.arg_xor_dict(opt_xor_val=opt_xor_val)               \
-       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)            \
-       and args.arg_validate(valid_func=valid_func)                 \
-       and args.arg_cond_req(opt_con_req=opt_con_req_list):
-
-        try:
-            prog_lock = gen_class.ProgramLock(
-                sys.argv, args.get_val("-y", def_val=""))
-            run_program(args, func_dict, opt_arg_list)
-            del prog_lock
-
-        except gen_class.SingleInstanceException:
-            print(f'WARNING:  lock in place for mysql_log_admin with id of:'
-                  f' {args.get_val("-y", def_val="")}')
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+       and not gen_libs.help_func(args, __version__, help_message):
+
+        if args.get_val("-u"):
+            # Client of a service (-S), the service runs the request.
+            argv = sys.argv[1:]
+            idx = argv.index("-u")
+            binlog_service.send_request(
+                args.get_val("-u"), argv[:idx] + argv[idx + 2:])
+
+        elif args.arg_require(opt_req=opt_req_list)                 \
+                and args.arg_xor_dict(opt_xor_val=opt_xor_val)      \
+                and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)   \
+                and args.arg_validate(valid_func=valid_func)        \
+                and args.arg_cond_req(opt_con_req=opt_con_req_list):
+
+            try:
+                prog_lock = gen_class.ProgramLock(
+                    sys.argv, args.get_val("-y", def_val=""))
+                run_program(args, func_dict, opt_arg_list, req_opts)
+                del prog_lock
+
+            except gen_class.SingleInstanceException:
+                print(f'WARNING:  lock in place for mysql_log_admin with id'
+                      f' of: {args.get_val("-y", def_val="")}')
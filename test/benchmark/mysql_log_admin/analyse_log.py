@@ -0,0 +1,181 @@
+# Classification (U)
+
+"""Program:  analyse_log.py
+
+    Description:  Benchmark of the workload analytics read of analyse_log
+        (-A), with and without counting the rows of the rows events (-U),
+        against the native reader alone and, if passed, a full mysqlbinlog
+        display of the same binary log.
+
+    Usage:
+        test/benchmark/mysql_log_admin/analyse_log.py [events [mysqlbinlog]]
+
+    Arguments:
+        events => Number of transactions in the generated binary log, each
+            with a Write_rows event of 10 rows.  Default is 100000.
+        mysqlbinlog => Path to the mysqlbinlog program.  If passed, the full
+            display (mysqlbinlog -vv to /dev/null) is timed as the baseline
+            the analytics run time is a fraction of.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import struct
+import tempfile
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_rows(cnt):
+
+    """Function:  crt_rows
+
+    Description:  Create the body of a Write_rows event of 10 rows of an
+        INT, VARCHAR(64), DATETIME2, DECIMAL(10,2) and nullable VARCHAR(64)
+        table, with every other row NULL in the last column.
+
+    Arguments:
+        (input) cnt -> Transaction number
+
+    """
+
+    body = b"\x6c\0\0\0\0\0\x01\0\x02\0\x05\x1f"
+
+    for row in range(10):
+        name = f"customer-{cnt}-{row}".encode("utf-8")
+        body += (b"\x10" if row % 2 else b"\0") \
+            + struct.pack("<i", cnt) + bytes([len(name)]) + name \
+            + b"\x99\xb2\x42\x00\x00" + b"\x80\0\0\x01\x05"
+
+        if not row % 2:
+            body += bytes([len(name)]) + name
+
+    return body
+
+
+def crt_binlog(binlog, events):
+
+    """Function:  crt_binlog
+
+    Description:  Create a binary log file with a format description event
+        followed by GTID, Query, Table_map, Write_rows and Xid events.
+
+    Arguments:
+        (input) binlog -> Path to the binary log file
+        (input) events -> Number of transactions
+
+    """
+
+    tstamp = int(time.time()) - events
+    table_map = b"\x6c\0\0\0\0\0\x01\0\x04shop\0\x09customers\0\x05" \
+        + bytes([3, 15, 18, 246, 15]) + b"\x07" + b"\x40\0\0\x0a\x02\x40\0" \
+        + b"\x10"
+
+    with open(binlog, "wb") as f_hdlr:
+        f_hdlr.write(b"\xfebin")
+        pos = 4
+
+        for cnt, etype, body in [(0, 15, b"\0" * 100)] + [
+                (cnt, etype, body) for cnt in range(events)
+                for etype, body in [
+                    (33, b"\x01" + bytes(16) + struct.pack("<q", cnt + 1)
+                     + bytes(25)),
+                    (2, struct.pack("<IIBHH", 5, 0, 4, 0, 0) + b"shop\0BEGIN"),
+                    (19, table_map), (30, crt_rows(cnt)),
+                    (16, struct.pack("<Q", cnt))]]:
+            size = 19 + len(body)
+            f_hdlr.write(struct.pack(
+                "<IBIIIH", tstamp + cnt, etype, 1, size, pos + size, 0))
+            f_hdlr.write(body)
+            pos += size
+
+
+def read_workload(binlog, count):
+
+    """Function:  read_workload
+
+    Description:  Same reading and counting as analyse_log does on a local
+        binary log.
+
+    Arguments:
+        (input) binlog -> Path to the binary log file
+        (input) count -> True|False - Count the rows of the rows events
+        (output) stats -> Dictionary of workload counters
+
+    """
+
+    stats = binlog_workload.crt_workload(count)
+
+    for rows, _, _ in binlog_catalog.catalog_events(
+            binlog_reader.read_binlog_events(binlog, body=True), 0, count):
+        binlog_workload.add_workload(stats, rows)
+
+    return stats
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the timings.
+
+    Arguments:
+
+    """
+
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    mysqlbinlog = sys.argv[2] if len(sys.argv) > 2 else None
+    timings = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        binlog = os.path.join(tmp_dir, "binlog.000001")
+        crt_binlog(binlog, events)
+        size = os.path.getsize(binlog)
+
+        start = time.time()
+
+        for _ in binlog_reader.read_binlog_events(binlog, body=True):
+            pass
+
+        timings.append(("Native reader", time.time() - start))
+
+        for label, count in [("Workload", False), ("Workload -U", True)]:
+            start = time.time()
+            stats = read_workload(binlog, count)
+            timings.append((label, time.time() - start))
+
+        if sum(stats["rows"]) != events * 10:
+            print(f"Error: {sum(stats['rows'])} rows counted")
+
+        if mysqlbinlog:
+            start = time.time()
+
+            with open(os.devnull, "wb") as out:
+                subprocess.run([mysqlbinlog, "-vv", binlog], stdout=out,
+                               check=True)
+
+            timings.append(("mysqlbinlog -vv display", time.time() - start))
+
+    print(f"Binary log: {events} transactions, {size} bytes")
+
+    for label, secs in timings:
+        print(f"{label}: {secs:.3f} s, {size / secs / 1048576:.1f} MB/s"
+              + (f", {secs / timings[-1][1]:.0%} of the display"
+                 if mysqlbinlog else ""))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  fetch_log_entries.py
+
+    Description:  Benchmark of the bytes passthrough used by
+        fetch_log_entries (-D) against decoding and printing each line, with
+        the raw program writing straight to the output file as the baseline.
+
+    Usage:
+        test/benchmark/mysql_log_admin/fetch_log_entries.py [mbytes [cmd]]
+
+    Arguments:
+        mbytes => Size in megabytes of the generated mysqlbinlog output.
+            Default is 256.
+        cmd => Program and arguments that write the mysqlbinlog output, for
+            example "mysqlbinlog /path/binlog.000001".  If not passed, cat of
+            the generated output is used.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import tempfile
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_text(text_file, mbytes):
+
+    """Function:  crt_text
+
+    Description:  Create a file of mysqlbinlog style output.
+
+    Arguments:
+        (input) text_file -> Path to the output file
+        (input) mbytes -> Size in megabytes
+
+    """
+
+    block = "".join(
+        f"# at {cnt * 120}\n#240101 10:00:00 server id 1  end_log_pos"
+        f" {cnt * 120 + 120} CRC32 0x1a2b3c4d  Query\tthread_id=1\n"
+        f"SET TIMESTAMP=1704103200/*!*/;\nINSERT INTO t1 VALUES ({cnt})\n"
+        f"/*!*/;\n" for cnt in range(1000)).encode("utf-8")
+
+    with open(text_file, "wb") as f_hdlr:
+        for _ in range(mbytes * 1048576 // len(block) + 1):
+            f_hdlr.write(block)
+
+
+def print_lines(cmd, out_file):
+
+    """Function:  print_lines
+
+    Description:  Decode and print each line the way fetch_log_entries did
+        before the bytes passthrough.
+
+    Arguments:
+        (input) cmd -> Command to run
+        (input) out_file -> Path to the output file
+
+    """
+
+    old_stdout = sys.stdout
+
+    with open(out_file, "w", encoding="utf-8") as out:
+        sys.stdout = out
+
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+
+            for item in iter(proc.stdout):
+                print(item.decode("utf-8"), end="")
+
+            proc.wait()
+
+        finally:
+            sys.stdout = old_stdout
+
+
+def copy_lines(cmd, out_file):
+
+    """Function:  copy_lines
+
+    Description:  Copy the output with binlog_display.copy_binlog.
+
+    Arguments:
+        (input) cmd -> Command to run
+        (input) out_file -> Path to the output file
+
+    """
+
+    with open(out_file, "wb") as out:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        binlog_display.copy_binlog(iter(proc.stdout), out)
+        proc.wait()
+
+
+def raw_lines(cmd, out_file):
+
+    """Function:  raw_lines
+
+    Description:  Run the command with its output going straight to the
+        output file.
+
+    Arguments:
+        (input) cmd -> Command to run
+        (input) out_file -> Path to the output file
+
+    """
+
+    with open(out_file, "wb") as out:
+        subprocess.run(cmd, stdout=out, check=True)
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the timings.
+
+    Arguments:
+
+    """
+
+    mbytes = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_file = os.path.join(tmp_dir, "binlog.sql")
+
+        if len(sys.argv) > 2:
+            cmd = sys.argv[2].split()
+
+        else:
+            text_file = os.path.join(tmp_dir, "binlog.txt")
+            crt_text(text_file, mbytes)
+            cmd = ["cat", text_file]
+
+        timings = []
+
+        for label, func in [("Raw program", raw_lines),
+                            ("Decode and print", print_lines),
+                            ("Bytes passthrough", copy_lines)]:
+            start = time.time()
+            func(cmd, out_file)
+            timings.append((label, time.time() - start))
+
+        size = os.path.getsize(out_file)
+
+    print(f"Output: {size} bytes")
+
+    for label, secs in timings:
+        print(f"{label}: {secs:.3f} s, {size / secs / 1048576:.0f} MB/s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  find_dt_pos.py
+
+    Description:  Benchmark of the native binary log reader used by
+        find_dt_pos (-L -b) against the mysqlbinlog text pipeline.
+
+    Usage:
+        test/benchmark/mysql_log_admin/find_dt_pos.py [events [mysqlbinlog]]
+
+    Arguments:
+        events => Number of transactions in the generated binary log.
+            Default is 200000.
+        mysqlbinlog => Path to the mysqlbinlog program.  If not passed, the
+            text pipeline is timed on generated mysqlbinlog style lines,
+            which only measures the Python decode and regex cost and is a
+            lower bound of the real text pipeline.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import re
+import time
+import tempfile
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_text(events):
+
+    """Function:  crt_text
+
+    Description:  Create mysqlbinlog style event lines for the events in the
+        generated binary log.
+
+    Arguments:
+        (input) events -> Number of transactions
+        (output) -> List of encoded lines
+
+    """
+
+    lines = []
+    line = "#240101 10:00:00 server id 1  end_log_pos {0} CRC32 0x1a2b3c4d" \
+        "  {1}\tthread_id=1\n"
+
+    for cnt in range(events):
+        for etype in ["Query", "Table_map", "Write_rows", "Xid"]:
+            lines.append(line.format(cnt, etype).encode("utf-8"))
+            lines.append(b"### body of the event\n")
+
+    return lines
+
+
+def text_pipeline(lines):
+
+    """Function:  text_pipeline
+
+    Description:  Same line decoding and matching as find_dt_pos does on the
+        mysqlbinlog output.
+
+    Arguments:
+        (input) lines -> Iterable of encoded lines
+        (output) last_log_pos -> End log position of last Query
+
+    """
+
+    regex = re.compile(
+        r"#\d{6}\s+\d?\d:\d\d:\d\d\s+server id\s+(?P<sid>\d+)\s+"
+        r"end_log_pos\s+(?P<epos>\d+)\s+CRC32\s+(?P<crc>\w+)\s+"
+        r"(?P<type>\w+)")
+    last_log_pos = None
+
+    for item in lines:
+        match = regex.match(item.decode("utf-8"))
+
+        if match and match.group("type") == "Query":
+            last_log_pos = match.group("epos")
+
+    return last_log_pos
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the timings.
+
+    Arguments:
+
+    """
+
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    mysqlbinlog = sys.argv[2] if len(sys.argv) > 2 else None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        binlog = os.path.join(tmp_dir, "binlog.000001")
+        binlog_files.crt_txn_binlog(
+            binlog, int(time.time()) - events, events,
+            binlog_files.ROW_TRANSACTION)
+        size = os.path.getsize(binlog)
+
+        start = time.time()
+        binlog_reader.scan_last_query(binlog)
+        native = time.time() - start
+
+        if mysqlbinlog:
+            label = "mysqlbinlog text pipeline"
+            start = time.time()
+            proc = subprocess.Popen(
+                [mysqlbinlog, binlog], stdout=subprocess.PIPE)
+            text_pipeline(proc.stdout)
+            proc.wait()
+            text = time.time() - start
+
+        else:
+            label = "text decode/regex only"
+            lines = crt_text(events)
+            start = time.time()
+            text_pipeline(lines)
+            text = time.time() - start
+
+    print(f"Binary log: {events} transactions, {size} bytes")
+    print(f"Native reader: {native:.3f} s")
+    print(f"{label}: {text:.3f} s")
+    print(f"Speedup: {text / native:.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  find_window_pos.py
+
+    Description:  Benchmark of the single pass window look up of
+        find_window_pos (-L -l) against one binary log scan per window.
+
+    Usage:
+        test/benchmark/mysql_log_admin/find_window_pos.py [events [windows]]
+
+    Arguments:
+        events => Number of transactions in the generated binary log, one
+            per second.  Default is 200000.
+        windows => Number of equal windows across the binary log.  Default
+            is 96.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the timings.
+
+    Arguments:
+
+    """
+
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 96
+    tstamp = int(time.time()) - events
+    step = max(events // count, 1)
+    stamps = [(tstamp + idx * step, tstamp + (idx + 1) * step)
+              for idx in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        binlog = os.path.join(tmp_dir, "binlog.000001")
+        binlog_files.crt_txn_binlog(
+            binlog, tstamp, events, binlog_files.QUERY_TRANSACTION)
+
+        start = time.time()
+        scans = [binlog_reader.scan_last_query(binlog, start_ts, stop_ts)
+                 for start_ts, stop_ts in stamps]
+        per_window = time.time() - start
+
+        start = time.time()
+        bounds = sorted({ts for pair in stamps for ts in pair})
+        latest = [(-1, -1)] * (len(bounds) + 1)
+
+        for segment, log_pos in binlog_reader.sweep_file_pos(
+                tmp_dir, "binlog.000001", bounds).items():
+            latest[segment] = (0, log_pos)
+
+        sweep = [item[1] if item and item[0] >= 0 else None
+                 for item in binlog_search.latest_in_ranges(latest, [
+                     (binlog_search.bisect.bisect_right(bounds, start_ts),
+                      binlog_search.bisect.bisect_left(bounds, stop_ts))
+                     for start_ts, stop_ts in stamps])]
+        single = time.time() - start
+
+    print(f"Binary log: {events} transactions, {count} windows")
+    print(f"Scan per window: {per_window:.3f} s")
+    print(f"Single pass: {single:.3f} s")
+    print(f"Same positions: {scans == sweep}")
+    print(f"Speedup: {per_window / single:.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
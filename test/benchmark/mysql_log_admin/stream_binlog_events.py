@@ -0,0 +1,112 @@
+# Classification (U)
+
+"""Program:  stream_binlog_events.py
+
+    Description:  Benchmark of the replication stream client used by
+        find_dt_pos (-L -P) against the local stand-in server in
+        test/binlog_server.py, run as a separate process, with the native
+        reader on the same binary log as the baseline.
+
+    Usage:
+        test/benchmark/mysql_log_admin/stream_binlog_events.py [events]
+
+    Arguments:
+        events => Number of transactions in the generated binary log.
+            Default is 200000.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import tempfile
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, host, port):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.host = host
+        self.port = port
+        self.sql_user = "mysql"
+        self.sql_pass = "japd"
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the benchmark and print the timings.
+
+    Arguments:
+
+    """
+
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        binlog = os.path.join(tmp_dir, "binlog.000001")
+        binlog_files.crt_txn_binlog(
+            binlog, int(time.time()) - events, events,
+            binlog_files.ROW_TRANSACTION)
+        size = os.path.getsize(binlog)
+
+        start = time.time()
+        binlog_reader.scan_last_query(binlog)
+        native = time.time() - start
+
+        with subprocess.Popen(
+                [sys.executable, os.path.join("test", "binlog_server.py"),
+                 tmp_dir, "0", "mysql", "japd"],
+                stdout=subprocess.PIPE) as proc:
+
+            try:
+                host, port = proc.stdout.readline().decode().split()[-1] \
+                    .split(":")
+                start = time.time()
+                binlog_stream.stream_file_pos(
+                    Server(host, int(port)), "binlog.000001")
+                stream = time.time() - start
+
+            finally:
+                proc.terminate()
+
+    print(f"Binary log: {events} transactions, {size} bytes")
+    print(f"Native reader: {native:.3f} s")
+    print(f"Replication stream: {stream:.3f} s,"
+          f" {size / stream / 1048576:.0f} MB/s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  binlog_files.py
+
+    Description:  Creates binary log v4 files and events for the unit tests
+        and benchmarks of the native binary log reader, index and
+        replication stream client in mysql_log_admin.py.
+
+    Usage:
+        import binlog_files
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import struct
+
+BINLOG_MAGIC = b"\xfebin"
+EVENT_HEADER = struct.Struct("<IBIIIH")
+ROTATE_EVENT = 4
+FORMAT_DESCRIPTION_EVENT = 15
+
+# (type_code, body_length) of the events of a transaction.
+QUERY_TRANSACTION = [(2, 40), (16, 40)]
+ROW_TRANSACTION = [(2, 60), (19, 40), (30, 200), (16, 12)]
+
+
+def crt_event(                                          # pylint:disable=R0913
+        tstamp, etype, pos, body=b"", server_id=1, end_pos=None):
+
+    """Function:  crt_event
+
+    Description:  Create a binary log event with the header for the position
+        it is written at.
+
+    Arguments:
+        (input) tstamp -> Event timestamp
+        (input) etype -> Event type code
+        (input) pos -> Offset of the event in the file
+        (input) body -> Event body, with the checksum if any
+        (input) server_id -> Server id of the event
+        (input) end_pos -> End log position if not the end of the event
+        (output) -> Event bytes
+
+    """
+
+    size = EVENT_HEADER.size + len(body)
+
+    return EVENT_HEADER.pack(
+        tstamp, etype, server_id, size, pos + size if end_pos is None
+        else end_pos, 0) + body
+
+
+def crt_binlog(binlog, layout, next_binlog=None, body_len=10):
+
+    """Function:  crt_binlog
+
+    Description:  Create a binary log file from a list of event timestamps
+        and event type codes, ending with a Rotate event if a next binary
+        log is passed.
+
+    Arguments:
+        (input) binlog -> Path to the binary log file
+        (input) layout -> List of (timestamp, type_code)
+        (input) next_binlog -> Name of the next binary log
+        (input) body_len -> Length of the zero filled event bodies
+
+    """
+
+    data = [BINLOG_MAGIC]
+    pos = len(BINLOG_MAGIC)
+
+    for tstamp, etype in layout:
+        data.append(crt_event(tstamp, etype, pos, b"\0" * body_len))
+        pos += len(data[-1])
+
+    if next_binlog:
+        data.append(crt_event(
+            layout[-1][0], ROTATE_EVENT, pos,
+            struct.pack("<Q", 4) + next_binlog.encode()))
+
+    with open(binlog, "wb") as f_hdlr:
+        f_hdlr.write(b"".join(data))
+
+
+def crt_txn_binlog(binlog, tstamp, events, layout):
+
+    """Function:  crt_txn_binlog
+
+    Description:  Create a binary log file with a format description event
+        followed by one transaction per second.
+
+    Arguments:
+        (input) binlog -> Path to the binary log file
+        (input) tstamp -> Timestamp of the first transaction
+        (input) events -> Number of transactions
+        (input) layout -> List of (type_code, body_length) of a transaction
+
+    """
+
+    with open(binlog, "wb") as f_hdlr:
+        f_hdlr.write(BINLOG_MAGIC)
+        pos = len(BINLOG_MAGIC)
+        event = crt_event(tstamp, FORMAT_DESCRIPTION_EVENT, pos, b"\0" * 100)
+        f_hdlr.write(event)
+        pos += len(event)
+
+        for cnt in range(events):
+            for etype, blen in layout:
+                event = crt_event(tstamp + cnt, etype, pos, b"\0" * blen)
+                f_hdlr.write(event)
+                pos += len(event)
@@ -0,0 +1,366 @@
+# Classification (U)
+
+"""Program:  binlog_server.py
+
+    Description:  Local stand-in MySQL server which serves the binary log
+        files in a directory over the replication protocol.  Only the
+        handshake (mysql_native_password), COM_QUERY (answered with OK),
+        COM_REGISTER_SLAVE, COM_BINLOG_DUMP and COM_QUIT are supported.
+        Used by the unit tests and benchmarks of the replication stream
+        client in mysql_log_admin.py.
+
+    Usage:
+        test/binlog_server.py binlog_dir [port [user [password]]]
+
+    Arguments:
+        binlog_dir => Directory of binary log files to serve.
+        port => Port to listen on.  Default is a free port.
+        user => User name to accept.  Default is mysql.
+        password => Password to accept.  Default is no password.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import struct
+import hashlib
+import threading
+import socketserver
+
+EVENT_HEADER = struct.Struct("<IBIIIH")
+ROTATE_EVENT = 4
+FORMAT_DESCRIPTION_EVENT = 15
+
+
+def native_password(password, nonce):
+
+    """Function:  native_password
+
+    Description:  Scrambles a password for mysql_native_password.
+
+    Arguments:
+        (input) password -> Password
+        (input) nonce -> Server nonce
+        (output) -> Scrambled password
+
+    """
+
+    if not password:
+        return b""
+
+    stage1 = hashlib.sha1(password.encode("utf-8")).digest()
+    stage2 = hashlib.sha1(nonce + hashlib.sha1(stage1).digest()).digest()
+
+    return bytes(x ^ y for x, y in zip(stage1, stage2))
+
+
+class BinlogHandler(socketserver.StreamRequestHandler):
+
+    """Class:  BinlogHandler
+
+    Description:  Handles one client connection to the BinlogServer.
+
+    Methods:
+        setup
+        send
+        recv
+        send_ok
+        send_err
+        handle
+        login
+        dump
+
+    """
+
+    nonce = b"abcdefgh01234567890A"
+
+    def setup(self):
+
+        """Method:  setup
+
+        Description:  Set up the connection files and sequence number.
+
+        Arguments:
+
+        """
+
+        super().setup()
+        self.seq = 0
+
+    def send(self, payload, flush=True):
+
+        """Method:  send
+
+        Description:  Send a packet to the client.
+
+        Arguments:
+            (input) payload -> Packet payload
+            (input) flush -> True|False - Flush the packet to the client
+
+        """
+
+        self.wfile.write(len(payload).to_bytes(3, "little")
+                         + bytes([self.seq & 0xff]) + payload)
+        self.seq += 1
+
+        if flush:
+            self.wfile.flush()
+
+    def recv(self):
+
+        """Method:  recv
+
+        Description:  Read a packet from the client.
+
+        Arguments:
+            (output) -> Packet payload or None if the client closed
+
+        """
+
+        header = self.rfile.read(4)
+
+        if len(header) < 4:
+            return None
+
+        self.seq = header[3] + 1
+
+        return self.rfile.read(int.from_bytes(header[:3], "little"))
+
+    def send_ok(self):
+
+        """Method:  send_ok
+
+        Description:  Send an OK packet.
+
+        Arguments:
+
+        """
+
+        self.send(b"\x00\x00\x00\x02\x00\x00\x00")
+
+    def send_err(self, code, state, msg):
+
+        """Method:  send_err
+
+        Description:  Send an error packet.
+
+        Arguments:
+            (input) code -> MySQL error code
+            (input) state -> SQL state
+            (input) msg -> Error message
+
+        """
+
+        self.send(b"\xff" + struct.pack("<H", code) + b"#" + state.encode()
+                  + msg.encode())
+
+    def handle(self):
+
+        """Method:  handle
+
+        Description:  Log in the client and run its commands.
+
+        Arguments:
+
+        """
+
+        if not self.login():
+            return
+
+        while True:
+            packet = self.recv()
+
+            if not packet or packet[0] == 0x01:
+                return
+
+            if packet[0] in (0x03, 0x15):
+                self.send_ok()
+
+            elif packet[0] == 0x12:
+                pos, _, _ = struct.unpack_from("<IHI", packet, 1)
+                self.dump(packet[11:].decode(), pos)
+
+            else:
+                self.send_err(1047, "08S01", "Unknown command")
+
+    def login(self):
+
+        """Method:  login
+
+        Description:  Send the handshake and check the user and password.
+
+        Arguments:
+            (output) -> True|False - Client logged in
+
+        """
+
+        self.send(
+            b"\x0a8.0.36-binlog-server\x00" + struct.pack("<I", 1)
+            + self.nonce[:8] + b"\x00" + struct.pack("<H", 0xffff) + b"\x21"
+            + struct.pack("<HHB", 2, 0xdfff, 21) + b"\x00" * 10
+            + self.nonce[8:] + b"\x00mysql_native_password\x00")
+        packet = self.recv()
+
+        if not packet:
+            return False
+
+        user, rest = packet[32:].split(b"\x00", 1)
+        auth = rest[1:1 + rest[0]]
+
+        if user.decode() != self.server.user \
+           or auth != native_password(self.server.password, self.nonce):
+            self.send_err(
+                1045, "28000", f"Access denied for user '{user.decode()}'")
+            return False
+
+        self.send_ok()
+
+        return True
+
+    def dump(self, binlog, pos):
+
+        """Method:  dump
+
+        Description:  Send the events of a binary log and the binary logs
+            after it, then an EOF packet.
+
+        Arguments:
+            (input) binlog -> Binary log name
+            (input) pos -> Position of the first event
+
+        """
+
+        while binlog:
+            path = os.path.join(self.server.binlog_dir, binlog)
+
+            if not os.path.isfile(path):
+                self.send_err(
+                    1236, "HY000", f"Could not find first log file name"
+                    f" in binary log index file: {binlog}")
+                return
+
+            with open(path, "rb") as f_hdlr:
+                data = f_hdlr.read()
+
+            name = binlog.encode()
+            self.send(b"\x00" + EVENT_HEADER.pack(
+                0, ROTATE_EVENT, self.server.server_id, 19 + 8 + len(name),
+                0, 0x20) + struct.pack("<Q", pos) + name)
+            offset, binlog = 4, None
+
+            while offset + 19 <= len(data):
+                header = list(EVENT_HEADER.unpack_from(data, offset))
+                event = data[offset:offset + header[3]]
+
+                if header[1] == ROTATE_EVENT:
+                    binlog = event[19 + 8:].decode()
+
+                if offset >= pos or header[1] == FORMAT_DESCRIPTION_EVENT:
+                    if offset < pos:
+                        # Format description ahead of the start position.
+                        event = EVENT_HEADER.pack(
+                            *header[:4], 0, header[5]) + event[19:]
+
+                    self.send(b"\x00" + event, flush=False)
+
+                offset += header[3]
+
+            pos = 4
+
+        self.send(b"\xfe\x00\x00\x02\x00")
+
+
+class BinlogServer(socketserver.ThreadingTCPServer):
+
+    """Class:  BinlogServer
+
+    Description:  Local stand-in MySQL server for binary log streaming.
+
+    Methods:
+        __init__
+        start
+        stop
+
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(                                       # pylint:disable=R0913
+            self, binlog_dir, user="mysql", password="", port=0,
+            server_id=1):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) binlog_dir -> Directory of binary log files to serve
+            (input) user -> User name to accept
+            (input) password -> Password to accept
+            (input) port -> Port to listen on, 0 for a free port
+            (input) server_id -> Server id in the artificial events
+
+        """
+
+        super().__init__(("127.0.0.1", port), BinlogHandler)
+        self.binlog_dir = binlog_dir
+        self.user = user
+        self.password = password
+        self.server_id = server_id
+        self.host, self.port = self.server_address
+        self.thread = None
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Serve clients in a background thread.
+
+        Arguments:
+
+        """
+
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop serving clients and close the socket.
+
+        Arguments:
+
+        """
+
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Serve a directory of binary logs until interrupted.
+
+    Arguments:
+
+    """
+
+    binlog_dir = sys.argv[1]
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    user = sys.argv[3] if len(sys.argv) > 3 else "mysql"
+    password = sys.argv[4] if len(sys.argv) > 4 else ""
+
+    with BinlogServer(binlog_dir, user, password, port) as server:
+        print(f"Serving {binlog_dir} on {server.host}:{server.port}",
+              flush=True)
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
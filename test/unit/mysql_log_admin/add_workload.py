@@ -0,0 +1,161 @@
+# Classification (U)
+
+"""Program:  add_workload.py
+
+    Description:  Unit testing of add_workload in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/add_workload.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_before_start
+        test_at_stop
+        test_outside_txn
+        test_not_counted
+        test_add_workload
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.stats = binlog_workload.crt_workload(True)
+        self.rows = [
+            (100, 100, 6000, "GTID", 7, "uuid:1", None, None, 60, None),
+            (160, 100, 6000, "Table_map", 7, "uuid:1", "shop", "orders", 40,
+             None),
+            (200, 100, 6000, "Write_rows", 7, "uuid:1", "shop", "orders",
+             100, 3),
+            (300, 100, 6010, "Update_rows_partial", 7, "uuid:1", "shop",
+             "orders", 70, None),
+            (370, 100, 6070, "Xid", 7, "uuid:1", None, None, 30, None)]
+
+    def test_before_start(self):
+
+        """Function:  test_before_start
+
+        Description:  Test with a transaction that starts before the start
+            timestamp.
+
+        Arguments:
+
+        """
+
+        binlog_workload.add_workload(self.stats, self.rows, 6001)
+
+        self.assertIsNone(self.stats["minute"])
+
+    def test_at_stop(self):
+
+        """Function:  test_at_stop
+
+        Description:  Test with a transaction that starts at the stop
+            timestamp.
+
+        Arguments:
+
+        """
+
+        binlog_workload.add_workload(self.stats, self.rows, None, 6000)
+
+        self.assertIsNone(self.stats["minute"])
+
+    def test_outside_txn(self):
+
+        """Function:  test_outside_txn
+
+        Description:  Test that an event outside a transaction is not counted
+            as a transaction.
+
+        Arguments:
+
+        """
+
+        binlog_workload.add_workload(
+            self.stats,
+            [(4, 4, 6000, "Rotate", 7, None, None, None, 40, None)])
+
+        self.assertEqual(list(self.stats["events"]), [1])
+        self.assertEqual(list(self.stats["txns"]), [0])
+        self.assertEqual(sum(self.stats["sizes"]), 0)
+
+    def test_not_counted(self):
+
+        """Function:  test_not_counted
+
+        Description:  Test that the rows events are not undecoded if the
+            rows are not counted.
+
+        Arguments:
+
+        """
+
+        stats = binlog_workload.crt_workload()
+        binlog_workload.add_workload(
+            stats, [row[:9] + (None,) for row in self.rows])
+
+        self.assertEqual(list(stats["rows"]), [0, 0])
+        self.assertEqual(list(stats["tables"]["shop.orders"]), [2, 0, 170])
+        self.assertEqual(stats["undecoded"], 0)
+
+    def test_add_workload(self):
+
+        """Function:  test_add_workload
+
+        Description:  Test that the events are counted in their minute and
+            the transaction in the minute of its last event.
+
+        Arguments:
+
+        """
+
+        binlog_workload.add_workload(self.stats, self.rows, 6000, 6001)
+
+        self.assertEqual(self.stats["minute"], 100)
+        self.assertEqual(list(self.stats["events"]), [4, 1])
+        self.assertEqual(list(self.stats["txns"]), [0, 1])
+        self.assertEqual(list(self.stats["rows"]), [3, 0])
+        self.assertEqual(list(self.stats["bytes"]), [270, 30])
+        self.assertEqual(list(self.stats["types"]["Write_rows"]), [1, 100])
+        self.assertEqual(
+            list(self.stats["tables"]["shop.orders"]), [2, 3, 170])
+        self.assertEqual(self.stats["undecoded"], 1)
+        self.assertEqual(self.stats["sizes"][9], 1)
+        self.assertEqual(self.stats["size_bytes"][9], 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
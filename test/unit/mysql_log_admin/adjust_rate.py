@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  adjust_rate.py
+
+    Description:  Unit testing of adjust_rate in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/adjust_rate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_known
+        test_not_used
+        test_raise
+        test_cut
+        test_least_rate
+
+    """
+
+    def test_not_known(self):
+
+        """Function:  test_not_known
+
+        Description:  Test that the rate is kept with no metrics.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.adjust_rate(1000000.0, None, 1000000.0),
+            1000000.0)
+
+    def test_not_used(self):
+
+        """Function:  test_not_used
+
+        Description:  Test that the rate is not raised while it is not used.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.adjust_rate(1000000.0, 0.0, 400000.0), 1000000.0)
+
+    def test_raise(self):
+
+        """Function:  test_raise
+
+        Description:  Test that the rate is raised below the limits.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.adjust_rate(1000000.0, 0.5, 1000000.0), 1250000.0)
+        self.assertEqual(
+            binlog_tee.adjust_rate(1000000.0, -9.0, 1000000.0),
+            2000000.0)
+
+    def test_cut(self):
+
+        """Function:  test_cut
+
+        Description:  Test that the rate is cut above the limits, by at most
+            half.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.adjust_rate(1000000.0, 1.5, 100.0), 750000.0)
+        self.assertEqual(
+            binlog_tee.adjust_rate(1000000.0, 9.0, 100.0), 500000.0)
+
+    def test_least_rate(self):
+
+        """Function:  test_least_rate
+
+        Description:  Test that the rate is not cut below THROTTLE_MIN.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.adjust_rate(70000.0, 9.0, 70000.0),
+            binlog_tee.THROTTLE_MIN)
+
+
+if __name__ == "__main__":
+    unittest.main()
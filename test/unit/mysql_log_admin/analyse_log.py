@@ -0,0 +1,216 @@
+# Classification (U)
+
+"""Program:  analyse_log.py
+
+    Description:  Unit testing of analyse_log in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/analyse_log.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-A": True, "-s": "2024-01-01 10:00:00"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_format
+        test_list_fail
+        test_read_error
+        test_analyse_log
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = "Server"
+        self.args = ArgParser()
+        self.tstamp = int(time.mktime(time.strptime(
+            "2024-01-01 10:00", "%Y-%m-%d %H:%M")))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_format(self, mock_logs):
+
+        """Function:  test_format
+
+        Description:  Test with a report format that is not valid.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-O"] = "xml"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                binlog_workload.analyse_log(self.server, self.args, []))
+
+        mock_logs.assert_not_called()
+
+    @mock.patch("binlog_workload.read_workload")
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_list_fail(self, mock_logs, mock_read):
+
+        """Function:  test_list_fail
+
+        Description:  Test with the binary log list failing.
+
+        Arguments:
+
+        """
+
+        mock_logs.return_value = (False, "Error Message"), []
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                binlog_workload.analyse_log(self.server, self.args, []))
+
+        mock_read.assert_not_called()
+
+    @mock.patch("binlog_workload.write_workload")
+    @mock.patch("binlog_workload.read_workload")
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_read_error(self, mock_logs, mock_read, mock_write):
+
+        """Function:  test_read_error
+
+        Description:  Test that no report is written if a binary log cannot
+            be read.
+
+        Arguments:
+
+        """
+
+        mock_logs.return_value = (True, None), ["binlog1"]
+        mock_read.side_effect = ValueError("Binary log binlog1 is not local")
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                binlog_workload.analyse_log(self.server, self.args, []))
+
+        mock_write.assert_not_called()
+
+    @mock.patch("binlog_workload.read_workload")
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_analyse_log(self, mock_logs, mock_read):
+
+        """Function:  test_analyse_log
+
+        Description:  Test that the report is written to the -o file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = os.path.join(
+            self.tmp_dir.name, "report.csv")
+        self.args.args_array["-O"] = "csv"
+        mock_logs.return_value = (True, None), ["binlog1", "binlog2"]
+        stats = binlog_workload.crt_workload()
+
+        for tstamp in [self.tstamp, self.tstamp + 60]:
+            binlog_workload.add_workload(
+                stats, [(4, 4, tstamp, "Query", 7, None, None, None, 10,
+                         None)])
+
+        mock_read.return_value = stats
+
+        binlog_workload.analyse_log(self.server, self.args, ["--force"])
+
+        mock_read.assert_called_once_with(
+            self.server, self.args, ["binlog1", "binlog2"], ["--force"])
+
+        with open(self.args.args_array["-o"], encoding="utf-8") as f_hdlr:
+            self.assertEqual(
+                f_hdlr.read().splitlines()[:3],
+                ["section,key,events,transactions,rows,bytes",
+                 "minute,2024-01-01 10:00,1,1,0,10",
+                 "minute,2024-01-01 10:01,1,1,0,10"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,415 @@
+# Classification (U)
+
+"""Program:  apply_binlog.py
+
+    Description:  Unit testing of apply_binlog in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/apply_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import shutil
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+MYSQL = """import os
+import re
+import sys
+
+DATA = []
+
+for line in sys.stdin.buffer:
+    MATCH = re.match(rb"SELECT 'mla:(\\d+)'", line)
+
+    if MATCH:
+        print("mla:" + MATCH.group(1).decode(), flush=True)
+
+    elif line.startswith(b"FAIL"):
+        sys.exit(1)
+
+    else:
+        DATA.append(line)
+
+with open(sys.argv[1] + "." + str(os.getpid()), "wb") as OUT:
+    OUT.write(b"".join(DATA))
+"""
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        crt_binlog
+        crt_no_gtid
+        test_error
+        test_binlog_error
+        test_checkpoint
+        test_stop_event
+        test_no_gtid
+        test_resume
+        test_profile
+        test_throttle
+        test_filter
+        test_apply_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.out = os.path.join(self.tmp_dir, "session")
+        script = os.path.join(self.tmp_dir, "mysql.py")
+
+        with open(script, "w", encoding="UTF-8") as fhdr:
+            fhdr.write(MYSQL)
+
+        self.cmd = [sys.executable, script, self.out]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def crt_binlog(self, last, files=1):
+
+        """Function:  crt_binlog
+
+        Description:  Writes mysqlbinlog output with two transactions that
+            do not depend on each other in each binary log.
+
+        Arguments:
+            (input) last -> Last statement of the second transaction
+            (input) files -> Number of binary logs
+            (output) -> mysqlbinlog command line list
+
+        """
+
+        lines = ["DELIMITER /*!*/;\n"]
+
+        for seq, stmt in [(1, "INSERT 1\n"), (2, last)] * files:
+            lines.extend([
+                "# at 4\n",
+                "#240101 10:00:00 server id 1  end_log_pos 125 CRC32 0x01"
+                " \tStart: binlog v 4\n", "BINLOG 'AAAA'/*!*/;\n",
+                "# at 125\n",
+                "#240101 10:00:00 server id 1  end_log_pos 156 CRC32 0x02"
+                " \tPrevious-GTIDs\n", "# [empty]\n"] if seq == 1 else [])
+            lines.extend([
+                f"# at {seq}00\n",
+                f"#240101 10:00:01 server id 1  end_log_pos 1 CRC32 0x03"
+                f" \tAnonymous_GTID\tlast_committed=0\tsequence_number={seq}"
+                f"\n", f"# at {seq}50\n",
+                "#240101 10:00:01 server id 1  end_log_pos 2 CRC32 0x04"
+                " \tQuery\tthread_id=8\n"]
+                + (["use `db1`/*!*/;\n"] if seq == 1 else [])
+                + [stmt, "COMMIT/*!*/;\n"])
+
+        lines.extend(["SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /*!*/;\n",
+                      "DELIMITER ;\n", "# End of log file\n"])
+        binlog = os.path.join(self.tmp_dir, "binlog.txt")
+
+        with open(binlog, "w", encoding="UTF-8") as fhdr:
+            fhdr.write("".join(lines))
+
+        return ["cat", binlog]
+
+    def crt_no_gtid(self, last):
+
+        """Function:  crt_no_gtid
+
+        Description:  Writes mysqlbinlog output of a binary log without GTID
+            events with two transactions, each ending in an Xid event.
+
+        Arguments:
+            (input) last -> Statement of the second transaction
+            (output) -> mysqlbinlog command line list
+
+        """
+
+        lines = [
+            "DELIMITER /*!*/;\n", "# at 4\n",
+            "#240101 10:00:00 server id 1  end_log_pos 120 \tStart: binlog"
+            " v 4\n", "BINLOG 'AAAA'/*!*/;\n"]
+
+        for seq, stmt in [(1, "INSERT 1\n"), (2, last)]:
+            lines.extend([
+                f"# at {seq}00\n",
+                f"#240101 10:00:01 server id 1  end_log_pos {seq}10"
+                f" \tQuery\tthread_id=8\n", "BEGIN\n", "/*!*/;\n",
+                f"# at {seq}10\n",
+                f"#240101 10:00:01 server id 1  end_log_pos {seq}50"
+                f" \tQuery\tthread_id=8\n", stmt, "/*!*/;\n",
+                f"# at {seq}50\n",
+                f"#240101 10:00:01 server id 1  end_log_pos {seq}80"
+                f" \tXid = {seq}\n", "COMMIT/*!*/;\n"])
+
+        lines.extend(["DELIMITER ;\n", "# End of log file\n"])
+        binlog = os.path.join(self.tmp_dir, "binlog.txt")
+
+        with open(binlog, "w", encoding="UTF-8") as fhdr:
+            fhdr.write("".join(lines))
+
+        return ["cat", binlog]
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test with a session that exits with an error.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            binlog_apply.apply_binlog(
+                [self.crt_binlog("FAIL\n")], self.cmd, 2)
+
+    def test_binlog_error(self):
+
+        """Function:  test_binlog_error
+
+        Description:  Test that a failed mysqlbinlog command is an error and
+            the checkpoint is at the last committed transaction.
+
+        Arguments:
+
+        """
+
+        ckpt_file = os.path.join(self.tmp_dir, "restore.ckpt")
+        binlog_cmd = ["sh", "-c", " ".join(self.crt_binlog("INSERT 2\n"))
+                      + "; exit 2"]
+
+        with self.assertRaisesRegex(ValueError, "mysqlbinlog exited with 2"):
+            binlog_apply.apply_binlog(
+                [binlog_cmd], self.cmd, 1, [["binlog1"]], ckpt_file)
+
+        self.assertEqual(
+            binlog_apply.read_checkpoint(ckpt_file)["binlog"], "binlog1")
+
+    def test_checkpoint(self):
+
+        """Function:  test_checkpoint
+
+        Description:  Test that the checkpoint is at the end of the last
+            transaction.
+
+        Arguments:
+
+        """
+
+        ckpt_file = os.path.join(self.tmp_dir, "restore.ckpt")
+        binlog_apply.apply_binlog(
+            [self.crt_binlog("INSERT 2\n")], self.cmd, 1, [["binlog1"]],
+            ckpt_file)
+
+        self.assertEqual(
+            binlog_apply.read_checkpoint(ckpt_file),
+            {"binlog": "binlog1", "pos": 2, "applied": []})
+
+    def test_stop_event(self):
+
+        """Function:  test_stop_event
+
+        Description:  Test that the checkpoint moves on to the next binary
+            log of a command after a binary log that ends in a Stop event.
+
+        Arguments:
+
+        """
+
+        ckpt_file = os.path.join(self.tmp_dir, "restore.ckpt")
+        binlog_apply.apply_binlog(
+            [self.crt_binlog("INSERT 2\n", 2)], self.cmd, 1,
+            [["binlog1", "binlog2"]], ckpt_file)
+
+        self.assertEqual(
+            binlog_apply.read_checkpoint(ckpt_file),
+            {"binlog": "binlog2", "pos": 2, "applied": []})
+
+    def test_no_gtid(self):
+
+        """Function:  test_no_gtid
+
+        Description:  Test that the checkpoint of a binary log without GTID
+            events is at the end of the last committed transaction.
+
+        Arguments:
+
+        """
+
+        ckpt_file = os.path.join(self.tmp_dir, "restore.ckpt")
+
+        with self.assertRaises(ValueError):
+            binlog_apply.apply_binlog(
+                [self.crt_no_gtid("FAIL\n")], self.cmd, 1, [["binlog1"]],
+                ckpt_file)
+
+        self.assertEqual(
+            binlog_apply.read_checkpoint(ckpt_file),
+            {"binlog": "binlog1", "pos": 180, "applied": []})
+
+    def test_resume(self):
+
+        """Function:  test_resume
+
+        Description:  Test that the transactions committed past the
+            checkpoint are not applied again.
+
+        Arguments:
+
+        """
+
+        ckpt_file = os.path.join(self.tmp_dir, "restore.ckpt")
+
+        self.assertEqual(
+            binlog_apply.apply_binlog(
+                [self.crt_binlog("INSERT 2\n")], self.cmd, 2, [["binlog1"]],
+                ckpt_file, {"binlog": "binlog1", "pos": 4,
+                            "applied": [["binlog1", 200]]})[1], 2)
+
+        for name in os.listdir(self.tmp_dir):
+            if name.startswith("session."):
+                with open(os.path.join(self.tmp_dir, name), "rb") as fhdr:
+                    self.assertNotIn(b"INSERT 2", fhdr.read())
+
+    def test_profile(self):
+
+        """Function:  test_profile
+
+        Description:  Test that the fast restore profile is set before the
+            binary logs and restored after them.
+
+        Arguments:
+
+        """
+
+        binlog_apply.apply_binlog(
+            [self.crt_binlog("INSERT 2\n")], self.cmd, 1, profile=True)
+
+        for name in os.listdir(self.tmp_dir):
+            if name.startswith("session."):
+                with open(os.path.join(self.tmp_dir, name), "rb") as fhdr:
+                    data = fhdr.read()
+
+        self.assertTrue(data.startswith(binlog_apply.PROFILE_START))
+        self.assertTrue(data.endswith(binlog_apply.PROFILE_END))
+
+    @mock.patch("binlog_tee.throttle_wait")
+    def test_throttle(self, mock_wait):
+
+        """Function:  test_throttle
+
+        Description:  Test that the events are passed to the throttle.
+
+        Arguments:
+
+        """
+
+        binlog_cmd = self.crt_binlog("INSERT 2\n")
+        binlog_apply.apply_binlog(
+            [binlog_cmd], self.cmd, 2, throttle="throttle")
+
+        self.assertEqual(
+            sum(call[0][1] for call in mock_wait.call_args_list),
+            os.path.getsize(binlog_cmd[1]))
+
+    def test_filter(self):
+
+        """Function:  test_filter
+
+        Description:  Test that the dropped transactions are not applied and
+            their session state is.
+
+        Arguments:
+
+        """
+
+        binlog_apply.apply_binlog(
+            [self.crt_binlog("INSERT 2\n")], self.cmd, 2,
+            filt={"skip_dbs": ["db1"]})
+        data = b""
+
+        for name in os.listdir(self.tmp_dir):
+            if name.startswith("session."):
+                with open(os.path.join(self.tmp_dir, name), "rb") as fhdr:
+                    data += fhdr.read()
+
+        self.assertNotIn(b"INSERT", data)
+        self.assertIn(b"use `db1`", data)
+
+    def test_apply_binlog(self):
+
+        """Function:  test_apply_binlog
+
+        Description:  Test that each transaction is applied once with the
+            session state it needs.
+
+        Arguments:
+
+        """
+
+        binlog_cmd = self.crt_binlog("INSERT 2\n")
+
+        self.assertEqual(
+            binlog_apply.apply_binlog([binlog_cmd], self.cmd, 2),
+            (os.path.getsize(binlog_cmd[1]), 3))
+
+        outputs = []
+
+        for name in os.listdir(self.tmp_dir):
+            if name.startswith("session."):
+                with open(os.path.join(self.tmp_dir, name), "rb") as fhdr:
+                    outputs.append(fhdr.read())
+
+        self.assertEqual(len(outputs), 2)
+        self.assertEqual(sum(data.count(b"INSERT") for data in outputs), 2)
+
+        for data in outputs:
+            self.assertTrue(data.startswith(b"DELIMITER /*!*/;\n"))
+            self.assertTrue(data.endswith(b"# End of log file\n"))
+
+            if b"INSERT 2" in data:
+                self.assertIn(b"use `db1`", data[:data.index(b"INSERT 2")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  binlog_tables.py
+
+    Description:  Unit testing of binlog_tables in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/binlog_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import struct
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_filter                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_event(etype, body):
+
+    """Function:  crt_event
+
+    Description:  Create a binary log event with a CRC32 checksum.
+
+    Arguments:
+        (input) etype -> Event type code
+        (input) body -> Event body without the checksum
+
+    """
+
+    return binlog_files.crt_event(
+        100, etype, 0, body + b"\xaa\xbb\xcc\xdd", end_pos=0)
+
+
+def query_body(dbase, stmt):
+
+    """Function:  query_body
+
+    Description:  Create the body of a Query event.
+
+    Arguments:
+        (input) dbase -> Default database
+        (input) stmt -> Statement
+
+    """
+
+    return struct.pack("<IIBHH", 5, 0, len(dbase), 0, 3) + b"\x01\x02\x03" \
+        + dbase + b"\0" + stmt
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        crt_binlog
+        test_statement
+        test_payload
+        test_binlog_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.events = [
+            crt_event(15, struct.pack("<H", 4) + b"8.0.36".ljust(50, b"\0")
+                      + struct.pack("<IB", 0, 19) + b"\x0d" * 40 + b"\x01"),
+            crt_event(2, query_body(b"shop", b"BEGIN")),
+            crt_event(19, b"\x6c\0\0\0\0\0\x01\0" + b"\x04shop\0"
+                      + b"\x06orders\0" + b"\x01\x03\0"),
+            crt_event(2, query_body(b"shop", b"COMMIT")),
+            crt_event(2, query_body(
+                b"logs", b"DROP TABLE IF EXISTS `t1` /* generated by server */"
+            ))]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def crt_binlog(self, events):
+
+        """Function:  crt_binlog
+
+        Description:  Create the binary log file.
+
+        Arguments:
+            (input) events -> List of events
+
+        """
+
+        with open(self.binlog, "wb") as f_hdlr:
+            f_hdlr.write(b"\xfebin" + b"".join(events))
+
+    def test_statement(self):
+
+        """Function:  test_statement
+
+        Description:  Test that a statement that does not change a single
+            table changes tables that are not known.
+
+        Arguments:
+
+        """
+
+        self.crt_binlog(self.events + [
+            crt_event(2, query_body(b"shop", b"INSERT INTO t2 VALUES (1)"))])
+
+        self.assertEqual(
+            binlog_filter.binlog_tables(self.binlog),
+            ({"shop.orders", "logs.t1"}, True))
+
+    def test_payload(self):
+
+        """Function:  test_payload
+
+        Description:  Test that a compressed transaction changes tables that
+            are not known.
+
+        Arguments:
+
+        """
+
+        self.crt_binlog(self.events[:1] + [crt_event(40, b"\0" * 8)])
+
+        self.assertEqual(
+            binlog_filter.binlog_tables(self.binlog), (set(), True))
+
+    def test_binlog_tables(self):
+
+        """Function:  test_binlog_tables
+
+        Description:  Test with the tables of Table_map events and DDL.
+
+        Arguments:
+
+        """
+
+        self.crt_binlog(self.events)
+
+        self.assertEqual(
+            binlog_filter.binlog_tables(self.binlog),
+            ({"shop.orders", "logs.t1"}, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
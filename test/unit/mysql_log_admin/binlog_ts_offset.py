@@ -0,0 +1,196 @@
+# Classification (U)
+
+"""Program:  binlog_ts_offset.py
+
+    Description:  Unit testing of binlog_ts_offset in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/binlog_ts_offset.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def stream_binlog_events(server, binlog, start_pos=None):
+
+    """Function:  stream_binlog_events
+
+    Description:  Stub of stream_binlog_events which yields events from the
+        start position.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) start_pos -> Position of the first event to stream
+
+    """
+
+    for tstamp, offset in [(100, 4), (110, 27), (120, 50), (130, 73)]:
+        if server and binlog and offset >= (start_pos or 4):
+            yield binlog_reader.BinlogEvent(
+                tstamp, 2, 1, 23, offset + 23, 0, offset, None)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_readable
+        test_not_local
+        test_remote
+        test_no_event
+        test_start_pos
+        test_binlog_ts_offset
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = "Server"
+        data = b"\xfebin"
+
+        for tstamp, etype in [(100, 15), (110, 2), (105, 16), (130, 2),
+                              (140, 16)]:
+            data += binlog_files.crt_event(tstamp, etype, len(data), b"body")
+
+        with open(os.path.join(self.tmp_dir.name, "binlog.000001"),
+                  "wb") as f_hdlr:
+            f_hdlr.write(data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_not_readable(self):
+
+        """Function:  test_not_readable
+
+        Description:  Test with no binary log directory and no remote.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_search.binlog_ts_offset(
+            self.server, "binlog.000001", 120))
+
+    @mock.patch("binlog_stream.stream_binlog_events")
+    def test_not_local(self, mock_stream):
+
+        """Function:  test_not_local
+
+        Description:  Test with a binary log that is not in the binary log
+            directory and no remote.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_search.binlog_ts_offset(
+            self.server, "binlog.000002", 120, binlog_dir=self.tmp_dir.name))
+        mock_stream.assert_not_called()
+
+    @mock.patch("binlog_stream.stream_binlog_events",
+                mock.Mock(side_effect=stream_binlog_events))
+    def test_remote(self):
+
+        """Function:  test_remote
+
+        Description:  Test with the binary log streamed from the server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_search.binlog_ts_offset(
+            self.server, "binlog.000002", 115, start_pos=27,
+            binlog_dir=self.tmp_dir.name, remote=True), 50)
+
+    def test_no_event(self):
+
+        """Function:  test_no_event
+
+        Description:  Test with all the events earlier than the timestamp.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_search.binlog_ts_offset(
+            self.server, "binlog.000001", 150, binlog_dir=self.tmp_dir.name))
+
+    def test_start_pos(self):
+
+        """Function:  test_start_pos
+
+        Description:  Test with the events read from a start position.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_search.binlog_ts_offset(
+            self.server, "binlog.000001", 100, start_pos=50,
+            binlog_dir=self.tmp_dir.name), 50)
+
+    def test_binlog_ts_offset(self):
+
+        """Function:  test_binlog_ts_offset
+
+        Description:  Test that the first event at or after the timestamp is
+            found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_search.binlog_ts_offset(
+            self.server, "binlog.000001", 106, binlog_dir=self.tmp_dir.name),
+            27)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+# Classification (U)
+
+"""Program:  bloom_bits.py
+
+    Description:  Unit testing of bloom_bits in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/bloom_bits.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_bloom_bits
+
+    """
+
+    def test_bloom_bits(self):
+
+        """Function:  test_bloom_bits
+
+        Description:  Test that the bits are the same for each run and in
+            range.
+
+        Arguments:
+
+        """
+
+        bits = binlog_filter.bloom_bits("shop.orders", 100, 7)
+
+        self.assertEqual(len(bits), 7)
+        self.assertTrue(all(0 <= bit < 100 for bit in bits))
+        self.assertEqual(
+            bits, binlog_filter.bloom_bits("shop.orders", 100, 7))
+        self.assertNotEqual(
+            bits, binlog_filter.bloom_bits("shop.order", 100, 7))
+
+
+if __name__ == "__main__":
+    unittest.main()
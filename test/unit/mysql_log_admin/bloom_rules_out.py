@@ -0,0 +1,149 @@
+# Classification (U)
+
+"""Program:  bloom_rules_out.py
+
+    Description:  Unit testing of bloom_rules_out in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/bloom_rules_out.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tables
+        test_wildcards
+        test_any_table
+        test_query_dropped
+        test_table_found
+        test_bloom_rules_out
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = binlog_filter.BLOOM_HEADER.pack(
+            b"MLABLM01", 1000, 16, 2, 0) + b"\0\0"
+        self.any_data = binlog_filter.BLOOM_HEADER.pack(
+            b"MLABLM01", 1000, 16, 2, binlog_filter.BLOOM_ANY) + b"\0\0"
+        self.filt = {"tables": ["shop.orders", "shop.items"]}
+
+    def test_no_tables(self):
+
+        """Function:  test_no_tables
+
+        Description:  Test with no list of tables to keep.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(binlog_filter.bloom_rules_out(
+            {"dbs": ["shop"]}, self.data))
+
+    def test_wildcards(self):
+
+        """Function:  test_wildcards
+
+        Description:  Test with a list of tables with wildcards.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(binlog_filter.bloom_rules_out(
+            {"tables": ["shop.orders", "shop.item?"]}, self.data))
+
+    def test_any_table(self):
+
+        """Function:  test_any_table
+
+        Description:  Test with a binary log that changes tables that are not
+            known.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            binlog_filter.bloom_rules_out(self.filt, self.any_data))
+
+    def test_query_dropped(self):
+
+        """Function:  test_query_dropped
+
+        Description:  Test with a binary log that changes tables that are not
+            known and Query events dropped by type.
+
+        Arguments:
+
+        """
+
+        self.filt["types"] = ["write_rows"]
+
+        self.assertTrue(
+            binlog_filter.bloom_rules_out(self.filt, self.any_data))
+
+    @mock.patch("binlog_filter.search_binlog_bloom")
+    def test_table_found(self, mock_search):
+
+        """Function:  test_table_found
+
+        Description:  Test with a table that may be in the binary log.
+
+        Arguments:
+
+        """
+
+        mock_search.side_effect = [False, True]
+
+        self.assertFalse(
+            binlog_filter.bloom_rules_out(self.filt, self.data))
+
+    def test_bloom_rules_out(self):
+
+        """Function:  test_bloom_rules_out
+
+        Description:  Test with none of the tables in the binary log.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(binlog_filter.bloom_rules_out(self.filt, self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
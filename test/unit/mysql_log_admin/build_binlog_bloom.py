@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  build_binlog_bloom.py
+
+    Description:  Unit testing of build_binlog_bloom in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/build_binlog_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_tables
+        test_build_binlog_bloom
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.bloom_file = self.binlog + ".blm"
+
+        with open(self.binlog, "wb") as f_hdlr:
+            f_hdlr.write(b"\xfebin" + b"\0" * 96)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_filter.binlog_tables",
+                mock.Mock(return_value=(set(), True)))
+    def test_no_tables(self):
+
+        """Function:  test_no_tables
+
+        Description:  Test with no tables and tables that are not known.
+
+        Arguments:
+
+        """
+
+        binlog_filter.build_binlog_bloom(self.binlog, self.bloom_file)
+
+        with open(self.bloom_file, "rb") as f_hdlr:
+            self.assertEqual(
+                binlog_filter.BLOOM_HEADER.unpack_from(f_hdlr.read()),
+                (b"MLABLM01", 100, 10, 7, binlog_filter.BLOOM_ANY))
+
+    @mock.patch("binlog_filter.binlog_tables")
+    def test_build_binlog_bloom(self, mock_tables):
+
+        """Function:  test_build_binlog_bloom
+
+        Description:  Test that the tables are in the Bloom filter, sized for
+            the false positive rate.
+
+        Arguments:
+
+        """
+
+        names = [f"shop.t{num}" for num in range(50)]
+        mock_tables.return_value = set(names), False
+        binlog_filter.build_binlog_bloom(self.binlog, self.bloom_file, 1000)
+        data = binlog_filter.open_binlog_bloom(
+            self.tmp_dir.name, "binlog.000001", 100)
+
+        self.assertEqual(
+            binlog_filter.BLOOM_HEADER.unpack_from(data),
+            (b"MLABLM01", 100, 719, 10, 0))
+        self.assertTrue(all(
+            binlog_filter.search_binlog_bloom(data, name)
+            for name in names))
+        self.assertFalse(os.path.exists(self.bloom_file + ".tmp"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  build_binlog_index.py
+
+    Description:  Unit testing of build_binlog_index in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/build_binlog_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_build_binlog_index
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.index_file = self.binlog + ".idx"
+        self.layout = [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)]
+        binlog_files.crt_binlog(self.binlog, self.layout)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_reader.INDEX_EVENTS", 2)
+    def test_build_binlog_index(self):
+
+        """Function:  test_build_binlog_index
+
+        Description:  Test with a binary log file.
+
+        Arguments:
+
+        """
+
+        binlog_reader.build_binlog_index(self.binlog, self.index_file)
+
+        with open(self.index_file, "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertEqual(
+            (data[:16], len(data)),
+            (b"MLAIDX01" + struct.pack("<Q", 294), 16 + 4 * 24))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Classification (U)
+
+"""Program:  catalog_binlog.py
+
+    Description:  Unit testing of catalog_binlog in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/catalog_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def catalog_events(events, crc=0, count=False):
+
+    """Function:  catalog_events
+
+    Description:  Stub of catalog_events which yields one row per event,
+        with one row counted with count.
+
+    Arguments:
+        (input) events -> List of positions
+        (input) crc -> Checksum length of the events
+        (input) count -> True|False - Count the rows of rows events
+
+    """
+
+    for pos in events:
+        yield [(pos, pos, 100, "Query", 7, None, None, None, 10,
+                1 if count else None)], pos + 10, crc or 4
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_events
+        test_count
+        test_catalog_binlog
+
+    """
+
+    @mock.patch("binlog_catalog.write_catalog")
+    def test_no_events(self, mock_write):
+
+        """Function:  test_no_events
+
+        Description:  Test that the binary log is marked read to its end
+            with no new events.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_binlog(
+                "Conn", "binlog.000001", [], 500, 4, True), 0)
+        mock_write.assert_called_once_with(
+            "Conn", "binlog.000001", [], 500, 4, True)
+
+    @mock.patch("binlog_catalog.catalog_events",
+                mock.Mock(side_effect=catalog_events))
+    @mock.patch("binlog_catalog.write_catalog")
+    def test_count(self, mock_write):
+
+        """Function:  test_count
+
+        Description:  Test that the rows are counted with count.
+
+        Arguments:
+
+        """
+
+        binlog_catalog.catalog_binlog(
+            "Conn", "binlog.000001", [4], count=True)
+
+        mock_write.assert_called_once_with(
+            "Conn", "binlog.000001",
+            [(4, 4, 100, "Query", 7, None, None, None, 10, 1)], 14, 4, False)
+
+    @mock.patch("binlog_catalog.CATALOG_BATCH", 2)
+    @mock.patch("binlog_catalog.catalog_events",
+                mock.Mock(side_effect=catalog_events))
+    @mock.patch("binlog_catalog.write_catalog")
+    def test_catalog_binlog(self, mock_write):
+
+        """Function:  test_catalog_binlog
+
+        Description:  Test that the rows are written in batches that end at
+            the end of a transaction.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_binlog(
+                "Conn", "binlog.000001", [4, 14, 24]), 3)
+        self.assertEqual(
+            [call[0][2:] for call in mock_write.call_args_list],
+            [([(4, 4, 100, "Query", 7, None, None, None, 10, None),
+               (14, 14, 100, "Query", 7, None, None, None, 10, None)], 24, 4),
+             ([(24, 24, 100, "Query", 7, None, None, None, 10, None)], 34, 4,
+              False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
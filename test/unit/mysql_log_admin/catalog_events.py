@@ -0,0 +1,274 @@
+# Classification (U)
+
+"""Program:  catalog_events.py
+
+    Description:  Unit testing of catalog_events in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/catalog_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def event(offset, code, body=b"", size=10):
+
+    """Function:  event
+
+    Description:  Create a BinlogEvent record.
+
+    Arguments:
+        (input) offset -> Event position
+        (input) code -> Event type code
+        (input) body -> Event body
+        (input) size -> Event size
+
+    """
+
+    return binlog_reader.BinlogEvent(
+        100 + offset, code, 7, size, offset + size, 0, offset, body)
+
+
+def query_body(dbase, stmt):
+
+    """Function:  query_body
+
+    Description:  Create the body of a Query event.
+
+    Arguments:
+        (input) dbase -> Default database
+        (input) stmt -> Statement
+
+    """
+
+    return struct.pack("<IIBHH", 5, 0, len(dbase), 0, 0) + dbase + b"\0" \
+        + stmt
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_outside_txn
+        test_ddl
+        test_begin_commit
+        test_payload
+        test_not_ended
+        test_xa_txn
+        test_no_count
+        test_catalog_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtid = event(
+            10, 33, b"\x01" + bytes(range(16)) + struct.pack("<q", 42))
+        self.uuid = "00010203-0405-0607-0809-0a0b0c0d0e0f:42"
+        self.table_map = event(
+            30, 19, b"\x6c\0\0\0\0\0\x01\0\x04shop\0\x06orders\0\x01\x03\0")
+        self.rows = event(
+            40, 30, b"\x6c\0\0\0\0\0\x01\0\x02\0\x01\x01"
+            + b"\0\x01\0\0\0" + b"\0\x02\0\0\0" + b"\0" * 4)
+
+    def test_outside_txn(self):
+
+        """Function:  test_outside_txn
+
+        Description:  Test that events outside a transaction are on their
+            own.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events(
+                [event(4, 35, size=6), event(10, 4)])),
+            [([(4, 4, 104, "Previous-GTIDs", 7, None, None, None, 6, None)],
+              10, 0),
+             ([(10, 10, 110, "Rotate", 7, None, None, None, 10, None)], 20,
+              0)])
+
+    def test_ddl(self):
+
+        """Function:  test_ddl
+
+        Description:  Test that a DDL statement ends its transaction.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events([
+                self.gtid,
+                event(20, 2, query_body(b"logs", b"DROP TABLE `t1`"))])),
+            [([(10, 10, 110, "GTID", 7, self.uuid, None, None, 10, None),
+               (20, 10, 120, "Query", 7, self.uuid, "logs", "t1", 10,
+                None)], 30, 0)])
+
+    def test_begin_commit(self):
+
+        """Function:  test_begin_commit
+
+        Description:  Test with a statement based transaction without a
+            GTID event.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events([
+                event(20, 2, query_body(b"shop", b"BEGIN")),
+                event(30, 2, query_body(b"shop", b"INSERT INTO t1 SET a=1")),
+                event(40, 2, query_body(b"", b"COMMIT"))])),
+            [([(20, 20, 120, "Query", 7, None, "shop", None, 10, None),
+               (30, 20, 130, "Query", 7, None, "shop", None, 10, None),
+               (40, 20, 140, "Query", 7, None, None, None, 10, None)], 50,
+              0)])
+
+    def test_payload(self):
+
+        """Function:  test_payload
+
+        Description:  Test that a compressed transaction ends its
+            transaction.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events(
+                [self.gtid, event(20, 40, size=100)])),
+            [([(10, 10, 110, "GTID", 7, self.uuid, None, None, 10, None),
+               (20, 10, 120, "Transaction_payload", 7, self.uuid, None, None,
+                100, None)], 120, 0)])
+
+    def test_not_ended(self):
+
+        """Function:  test_not_ended
+
+        Description:  Test that a transaction whose end is not read is not
+            yielded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events([
+                self.gtid, event(20, 2, query_body(b"shop", b"BEGIN")),
+                self.table_map])), [])
+
+    @mock.patch("binlog_reader.fde_checksum", mock.Mock(return_value=4))
+    def test_xa_txn(self):
+
+        """Function:  test_xa_txn
+
+        Description:  Test that an XA transaction is not split at XA START
+            and ends at its XA_prepare event.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events([
+                event(4, 15, size=6), self.gtid,
+                event(20, 2, query_body(b"shop", b"XA START X'78',X'',1")
+                      + b"\0" * 4),
+                self.table_map, self.rows,
+                event(50, 2, query_body(b"shop", b"XA END X'78',X'',1")
+                      + b"\0" * 4),
+                event(60, 38)], count=True))[1:],
+            [([(10, 10, 110, "GTID", 7, self.uuid, None, None, 10, None),
+               (20, 10, 120, "Query", 7, self.uuid, "shop", None, 10, None),
+               (30, 10, 130, "Table_map", 7, self.uuid, "shop", "orders",
+                10, None),
+               (40, 10, 140, "Write_rows", 7, self.uuid, "shop", "orders",
+                10, 2),
+               (50, 10, 150, "Query", 7, self.uuid, "shop", None, 10, None),
+               (60, 10, 160, "XA_prepare", 7, self.uuid, None, None, 10,
+                None)], 70, 4)])
+
+    @mock.patch("binlog_catalog.count_rows")
+    def test_no_count(self, mock_count):
+
+        """Function:  test_no_count
+
+        Description:  Test that the rows are not counted without count.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events(
+                [self.table_map, self.rows, event(50, 16)]))[0][0][1][9],
+            None)
+        mock_count.assert_not_called()
+
+    @mock.patch("binlog_reader.fde_checksum", mock.Mock(return_value=4))
+    def test_catalog_events(self):
+
+        """Function:  test_catalog_events
+
+        Description:  Test that the rows events have the table of their
+            Table_map event and their rows are counted with the checksum
+            length found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_catalog.catalog_events([
+                event(4, 15, size=6), self.gtid,
+                event(20, 2, query_body(b"shop", b"BEGIN") + b"\0" * 4),
+                self.table_map, self.rows, event(50, 16)], count=True)),
+            [([(4, 4, 104, "Start", 7, None, None, None, 6, None)], 10, 4),
+             ([(10, 10, 110, "GTID", 7, self.uuid, None, None, 10, None),
+               (20, 10, 120, "Query", 7, self.uuid, "shop", None, 10, None),
+               (30, 10, 130, "Table_map", 7, self.uuid, "shop", "orders",
+                10, None),
+               (40, 10, 140, "Write_rows", 7, self.uuid, "shop", "orders",
+                10, 2),
+               (50, 10, 150, "Xid", 7, self.uuid, None, None, 10, None)], 60,
+              4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,283 @@
+# Classification (U)
+
+"""Program:  catalog_log.py
+
+    Description:  Unit testing of catalog_log in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/catalog_log.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import io
+import sqlite3
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self, catalog_file, binlog_dir):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) catalog_file -> Path to the event catalogue
+            (input) binlog_dir -> Directory path to local binary log files
+
+        """
+
+        self.args_array = {"-C": catalog_file, "-b": binlog_dir}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_open_error
+        test_not_local
+        test_stream
+        test_resume
+        test_catalog_log
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.catalog_file = os.path.join(self.tmp_dir.name, "catalog.db")
+        self.args = ArgParser(self.catalog_file, self.tmp_dir.name)
+        self.logs = [{"Log_name": "binlog.000001"},
+                     {"Log_name": "binlog.000002"}]
+        self.server = "Server"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_catalog.mysql_libs.fetch_logs")
+    def test_open_error(self, mock_logs):
+
+        """Function:  test_open_error
+
+        Description:  Test with an event catalogue that cannot be opened.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = os.path.join(
+            self.tmp_dir.name, "missing", "catalog.db")
+        mock_logs.return_value = self.logs
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                binlog_catalog.catalog_log(self.server, self.args, []))
+
+    @mock.patch("binlog_stream.stream_binlog_events")
+    @mock.patch("binlog_catalog.catalog_binlog")
+    @mock.patch("binlog_catalog.mysql_libs.fetch_logs")
+    def test_not_local(self, mock_logs, mock_catalog, mock_stream):
+
+        """Function:  test_not_local
+
+        Description:  Test that the binary logs that are not local are not
+            read without -P.
+
+        Arguments:
+
+        """
+
+        mock_logs.return_value = self.logs
+
+        binlog_catalog.catalog_log(self.server, self.args, [])
+
+        mock_catalog.assert_not_called()
+        mock_stream.assert_not_called()
+        self.assertTrue(os.path.isfile(self.catalog_file))
+
+    @mock.patch("binlog_stream.stream_binlog_events")
+    @mock.patch("binlog_catalog.catalog_binlog")
+    @mock.patch("binlog_catalog.mysql_libs.fetch_logs")
+    def test_stream(self, mock_logs, mock_catalog, mock_stream):
+
+        """Function:  test_stream
+
+        Description:  Test that the binary logs that are not local are
+            streamed with -P and only the active binary log is not closed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = True
+        self.args.args_array["-U"] = True
+        mock_logs.return_value = self.logs
+        mock_stream.return_value = "Events"
+        mock_catalog.return_value = 0
+
+        binlog_catalog.catalog_log(self.server, self.args, [])
+
+        self.assertEqual(
+            mock_stream.call_args_list,
+            [mock.call(self.server, "binlog.000001", None, body=True),
+             mock.call(self.server, "binlog.000002", None, body=True)])
+        self.assertEqual(
+            [call[0][1:] for call in mock_catalog.call_args_list],
+            [("binlog.000001", "Events", None, 0, True, True),
+             ("binlog.000002", "Events", None, 0, False, True)])
+
+    @mock.patch("binlog_reader.read_binlog_events")
+    @mock.patch("binlog_catalog.catalog_binlog")
+    @mock.patch("binlog_catalog.mysql_libs.fetch_logs")
+    def test_resume(self, mock_logs, mock_catalog, mock_read):
+
+        """Function:  test_resume
+
+        Description:  Test that a closed binary log read to its end is not
+            read again and the others are read from their position.
+
+        Arguments:
+
+        """
+
+        for log in self.logs:
+            with open(os.path.join(self.tmp_dir.name, log["Log_name"]),
+                      "wb") as f_hdlr:
+                f_hdlr.write(b"\xfebin")
+
+        conn = binlog_catalog.open_catalog(self.catalog_file)
+        binlog_catalog.write_catalog(conn, "binlog.000001", [], 400, 4, True)
+        binlog_catalog.write_catalog(conn, "binlog.000002", [], 500, 4)
+        conn.close()
+        mock_logs.return_value = self.logs
+        mock_read.return_value = "Events"
+        mock_catalog.return_value = 0
+
+        binlog_catalog.catalog_log(self.server, self.args, [])
+
+        mock_read.assert_called_once_with(
+            os.path.join(self.tmp_dir.name, "binlog.000002"), 500, body=True)
+        self.assertEqual(
+            mock_catalog.call_args[0][1:],
+            ("binlog.000002", "Events", 500, 4, False, False))
+
+    @mock.patch("binlog_catalog.mysql_libs.fetch_logs")
+    def test_catalog_log(self, mock_logs):
+
+        """Function:  test_catalog_log
+
+        Description:  Test that the events of the local binary logs are
+            added once.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.tmp_dir.name, "binlog.000001"),
+                  "wb") as f_hdlr:
+            f_hdlr.write(
+                binlog_files.BINLOG_MAGIC
+                + binlog_files.crt_event(100, 35, 4, b"\0" * 8, server_id=7)
+                + binlog_files.crt_event(100, 4, 31, b"\0" * 8, server_id=7))
+
+        mock_logs.return_value = self.logs[:1]
+        self.args.args_array["-x"] = True
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as mock_err:
+            binlog_catalog.catalog_log(self.server, self.args, [])
+            binlog_catalog.catalog_log(self.server, self.args, [])
+
+        self.assertEqual(
+            mock_err.getvalue(),
+            "Binary logs read: 1, Events added: 2\n"
+            "Binary logs read: 1, Events added: 0\n")
+
+        with sqlite3.connect(self.catalog_file) as conn:
+            self.assertEqual(
+                conn.execute("SELECT binlog, pos, type FROM events"
+                             " ORDER BY pos").fetchall(),
+                [("binlog.000001", 4, "Previous-GTIDs"),
+                 ("binlog.000001", 31, "Rotate")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  catalog_query.py
+
+    Description:  Unit testing of catalog_query in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/catalog_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def query_body(dbase, stmt):
+
+    """Function:  query_body
+
+    Description:  Create the body of a Query event.
+
+    Arguments:
+        (input) dbase -> Default database
+        (input) stmt -> Statement
+
+    """
+
+    return struct.pack("<IIBHH", 5, 0, len(dbase), 0, 0) + dbase + b"\0" \
+        + stmt
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_begin
+        test_xa_start
+        test_xa_end
+        test_xa_commit
+        test_ddl
+        test_commit
+
+    """
+
+    def test_begin(self):
+
+        """Function:  test_begin
+
+        Description:  Test that BEGIN opens a transaction.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_query(
+                query_body(b"shop", b"BEGIN"), 0, False),
+            ("shop", None, True, False))
+
+    def test_xa_start(self):
+
+        """Function:  test_xa_start
+
+        Description:  Test that XA START opens a transaction.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_query(
+                query_body(b"shop", b"XA START X'78',X'',1"), 0, False),
+            ("shop", None, True, False))
+
+    def test_xa_end(self):
+
+        """Function:  test_xa_end
+
+        Description:  Test that XA END does not end an XA transaction.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_query(
+                query_body(b"shop", b"XA END X'78',X'',1"), 0, True),
+            ("shop", None, True, False))
+
+    def test_xa_commit(self):
+
+        """Function:  test_xa_commit
+
+        Description:  Test that XA COMMIT of a prepared XA transaction ends
+            on its own.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_query(
+                query_body(b"shop", b"XA COMMIT X'78',X'',1"), 0, False),
+            ("shop", None, False, True))
+
+    def test_ddl(self):
+
+        """Function:  test_ddl
+
+        Description:  Test that a DDL statement has its table and ends on
+            its own.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_query(
+                query_body(b"logs", b"DROP TABLE `t1`") + b"\0" * 4, 4,
+                False), ("logs", "t1", False, True))
+
+    def test_commit(self):
+
+        """Function:  test_commit
+
+        Description:  Test that COMMIT ends an open transaction.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.catalog_query(
+                query_body(b"", b"COMMIT"), 0, True),
+            ("", None, True, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# Classification (U)
+
+"""Program:  check_binlog_cmds.py
+
+    Description:  Unit testing of check_binlog_cmds in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/check_binlog_cmds.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_cmds
+        test_failed
+        test_check_binlog_cmds
+
+    """
+
+    def test_no_cmds(self):
+
+        """Function:  test_no_cmds
+
+        Description:  Test with no commands run.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_tee.check_binlog_cmds([]))
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test that a failed command is an error.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "mysqlbinlog exited with 1"):
+            binlog_tee.check_binlog_cmds([0, 1])
+
+    def test_check_binlog_cmds(self):
+
+        """Function:  test_check_binlog_cmds
+
+        Description:  Test with the commands all successful.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_tee.check_binlog_cmds([0, 0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  check_packet.py
+
+    Description:  Unit testing of check_packet in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/check_packet.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_stream                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_state
+        test_error
+        test_check_packet
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.err = b"\xff\x15\x04#28000Access denied"
+
+    def test_no_state(self):
+
+        """Function:  test_no_state
+
+        Description:  Test with an error packet without SQL state.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "1045: Access denied"):
+            binlog_stream.check_packet(b"\xff\x15\x04Access denied")
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test with an error packet.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "1045: Access denied"):
+            binlog_stream.check_packet(self.err)
+
+    def test_check_packet(self):
+
+        """Function:  test_check_packet
+
+        Description:  Test with an OK packet.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_stream.check_packet(b"\x00ok"), b"\x00ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
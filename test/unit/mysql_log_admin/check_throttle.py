@@ -0,0 +1,181 @@
+# Classification (U)
+
+"""Program:  check_throttle.py
+
+    Description:  Unit testing of check_throttle in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/check_throttle.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        is_connected
+        reconnect
+
+    """
+
+    def __init__(self, connected=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) connected -> True|False - Connection is open
+
+        """
+
+        self.connected = connected
+        self.reconnects = 0
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Method stub holder for mysql_class.Server.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def reconnect(self):
+
+        """Method:  reconnect
+
+        Description:  Method stub holder for mysql_class.Server.reconnect.
+
+        Arguments:
+
+        """
+
+        self.reconnects += 1
+        self.connected = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_error
+        test_reconnect
+        test_check_throttle
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.target = Server()
+        self.replica = Server()
+        self.throttle = {"error": None, "targets": [self.target],
+                         "replicas": [self.replica]}
+
+    @mock.patch("binlog_tee.throttle_pressure")
+    def test_error(self, mock_pressure):
+
+        """Function:  test_error
+
+        Description:  Test that an error reading the metrics is kept and
+            printed once and the pressure is not known.
+
+        Arguments:
+
+        """
+
+        mock_pressure.side_effect = RuntimeError("Lost connection")
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertIsNone(
+                binlog_tee.check_throttle(self.throttle, 30))
+            self.assertIsNone(
+                binlog_tee.check_throttle(self.throttle, 30))
+
+        self.assertEqual(self.throttle["error"], "Lost connection")
+        self.assertEqual(
+            mock_out.getvalue(),
+            "load_log:  Error encountered on throttle: Lost connection\n")
+
+    @mock.patch("binlog_tee.throttle_pressure",
+                mock.Mock(return_value=0.5))
+    def test_reconnect(self):
+
+        """Function:  test_reconnect
+
+        Description:  Test that a closed connection is reconnected and the
+            error is cleared once the metrics are read.
+
+        Arguments:
+
+        """
+
+        self.replica.connected = False
+        self.throttle["error"] = "Lost connection"
+
+        self.assertEqual(
+            binlog_tee.check_throttle(self.throttle, 30), 0.5)
+        self.assertEqual(
+            (self.target.reconnects, self.replica.reconnects), (0, 1))
+        self.assertIsNone(self.throttle["error"])
+
+    @mock.patch("binlog_tee.throttle_pressure")
+    def test_check_throttle(self, mock_pressure):
+
+        """Function:  test_check_throttle
+
+        Description:  Test that the pressure of the throttle connections is
+            measured.
+
+        Arguments:
+
+        """
+
+        mock_pressure.return_value = 1.5
+
+        self.assertEqual(
+            binlog_tee.check_throttle(self.throttle, 30, 8), 1.5)
+        mock_pressure.assert_called_once_with(
+            [self.target], [self.replica], 30, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
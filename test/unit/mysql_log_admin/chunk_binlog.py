@@ -0,0 +1,197 @@
+# Classification (U)
+
+"""Program:  chunk_binlog.py
+
+    Description:  Unit testing of chunk_binlog in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/chunk_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_chunk_bytes
+        test_small_binlog
+        test_no_boundaries
+        test_size_changed
+        test_start_stop_pos
+        test_index
+        test_chunk_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = "binlog.000001"
+        self.size = 294
+        path = os.path.join(self.tmp_dir.name, self.binlog)
+
+        # GTID events at 33, 120 and 207.
+        binlog_files.crt_binlog(path, [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)])
+
+        with mock.patch("binlog_reader.INDEX_EVENTS", 2):
+            binlog_reader.build_binlog_index(path, path + ".idx")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_no_chunk_bytes(self):
+
+        """Function:  test_no_chunk_bytes
+
+        Description:  Test with no chunk size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlog(
+                self.binlog, self.size, None, 33, None,
+                binlog_dir=self.tmp_dir.name), [(33, None)])
+
+    def test_small_binlog(self):
+
+        """Function:  test_small_binlog
+
+        Description:  Test with a binary log smaller than the chunk size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlog(
+                self.binlog, self.size, 300, binlog_dir=self.tmp_dir.name),
+            [(None, None)])
+
+    def test_no_boundaries(self):
+
+        """Function:  test_no_boundaries
+
+        Description:  Test with no index and no local binary log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlog(self.binlog, self.size, 60),
+            [(None, None)])
+
+    def test_size_changed(self):
+
+        """Function:  test_size_changed
+
+        Description:  Test with a local binary log that is not the size of
+            the binary log on the server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlog(
+                self.binlog, 400, 60, binlog_dir=self.tmp_dir.name),
+            [(None, None)])
+
+    def test_start_stop_pos(self):
+
+        """Function:  test_start_stop_pos
+
+        Description:  Test that the ranges are between the start and stop
+            positions.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlog(
+                self.binlog, self.size, 100, 33, 236,
+                binlog_dir=self.tmp_dir.name), [(33, 207), (207, 236)])
+
+    def test_index(self):
+
+        """Function:  test_index
+
+        Description:  Test with the boundaries from the binary log index.
+
+        Arguments:
+
+        """
+
+        os.remove(os.path.join(self.tmp_dir.name, self.binlog))
+
+        self.assertEqual(
+            binlog_reader.chunk_binlog(
+                self.binlog, self.size, 60, index_dir=self.tmp_dir.name),
+            [(None, 120), (120, 207), (207, None)])
+
+    def test_chunk_binlog(self):
+
+        """Function:  test_chunk_binlog
+
+        Description:  Test with the boundaries from the local binary log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlog(
+                self.binlog, self.size, 60, binlog_dir=self.tmp_dir.name),
+            [(None, 120), (120, 207), (207, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
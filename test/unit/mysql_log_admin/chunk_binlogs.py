@@ -0,0 +1,181 @@
+# Classification (U)
+
+"""Program:  chunk_binlogs.py
+
+    Description:  Unit testing of chunk_binlogs in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/chunk_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-j": "1", "-i": "/dir/index", "-m": "/dir/mirror"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def chunk_binlog(                                       # pylint:disable=R0913
+        binlog, size, chunk_bytes, start_pos=None, stop_pos=None,
+        index_dir=None, binlog_dir=None):
+
+    """Function:  chunk_binlog
+
+    Description:  Stub of chunk_binlog which splits the binary logs, except
+        binlog1, in the middle of their ranges.
+
+    Arguments:
+        (input) binlog -> Binary log name
+        (input) size -> Size of the binary log from SHOW BINARY LOGS
+        (input) chunk_bytes -> Size in bytes of a range
+        (input) start_pos -> Start position in the binary log or None
+        (input) stop_pos -> Stop position in the binary log or None
+        (input) index_dir -> Directory path to the binary log indexes
+        (input) binlog_dir -> Directory path to local binary log files
+
+    """
+
+    if binlog == "binlog1" or chunk_bytes != 1048576 or not index_dir \
+       or not binlog_dir:
+        return [(start_pos, stop_pos)]
+
+    middle = ((start_pos or 4) + (stop_pos or size)) // 2
+
+    return [(start_pos, middle), (middle, stop_pos)]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_chunk_size
+        test_not_split
+        test_chunk_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.binlog_list = ["binlog1", "binlog2", "binlog3"]
+        self.sizes = {"binlog1": 1000, "binlog2": 2000, "binlog3": 3000}
+
+    @mock.patch("binlog_reader.chunk_binlog")
+    def test_no_chunk_size(self, mock_chunk):
+
+        """Function:  test_no_chunk_size
+
+        Description:  Test with no -j option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-j"]
+
+        self.assertEqual(
+            binlog_reader.chunk_binlogs(
+                self.args, self.binlog_list, self.sizes), {})
+        mock_chunk.assert_not_called()
+
+    @mock.patch("binlog_reader.chunk_binlog",
+                mock.Mock(side_effect=chunk_binlog))
+    def test_not_split(self):
+
+        """Function:  test_not_split
+
+        Description:  Test that binary logs with a single range are not
+            returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlogs(
+                self.args, self.binlog_list[:1], self.sizes), {})
+
+    @mock.patch("binlog_reader.chunk_binlog",
+                mock.Mock(side_effect=chunk_binlog))
+    def test_chunk_binlogs(self):
+
+        """Function:  test_chunk_binlogs
+
+        Description:  Test that the start and stop positions bound the first
+            and last binary logs.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.chunk_binlogs(
+                self.args, self.binlog_list[1:], self.sizes,
+                ["--start-position=400"], ["--stop-position=1000"]),
+            {"binlog2": [(400, 1200), (1200, None)],
+             "binlog3": [(None, 502), (502, 1000)]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+# Classification (U)
+
+"""Program:  close_unit.py
+
+    Description:  Unit testing of close_unit in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/close_unit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_xid
+        test_xa_prepare
+        test_begin
+        test_xa_start
+        test_commit
+        test_in_txn
+        test_statement
+        test_rows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {"closed": False, "in_txn": False}
+        self.header = [
+            b"# at 204\n",
+            b"#240101 10:00:01 server id 1  end_log_pos 280 \tQuery\n",
+            b"SET TIMESTAMP=1704103201/*!*/;\n"]
+
+    def test_xid(self):
+
+        """Function:  test_xid
+
+        Description:  Test that an Xid event ends the transaction.
+
+        Arguments:
+
+        """
+
+        self.state["in_txn"] = True
+        binlog_apply.close_unit(
+            self.state, b"Xid", self.header[:2] + [b"COMMIT/*!*/;\n"])
+
+        self.assertTrue(self.state["closed"])
+
+    def test_xa_prepare(self):
+
+        """Function:  test_xa_prepare
+
+        Description:  Test that an XA_prepare event ends the transaction.
+
+        Arguments:
+
+        """
+
+        self.state["in_txn"] = True
+        binlog_apply.close_unit(self.state, b"XA_prepare", self.header[:2])
+
+        self.assertTrue(self.state["closed"])
+
+    def test_begin(self):
+
+        """Function:  test_begin
+
+        Description:  Test that BEGIN opens a transaction.
+
+        Arguments:
+
+        """
+
+        binlog_apply.close_unit(
+            self.state, b"Query", self.header + [b"BEGIN\n", b"/*!*/;\n"])
+
+        self.assertTrue(self.state["in_txn"])
+        self.assertFalse(self.state["closed"])
+
+    def test_xa_start(self):
+
+        """Function:  test_xa_start
+
+        Description:  Test that XA START opens a transaction.
+
+        Arguments:
+
+        """
+
+        binlog_apply.close_unit(
+            self.state, b"Query",
+            self.header + [b"XA START X'01',X'',1\n", b"/*!*/;\n"])
+
+        self.assertTrue(self.state["in_txn"])
+        self.assertFalse(self.state["closed"])
+
+    def test_commit(self):
+
+        """Function:  test_commit
+
+        Description:  Test that COMMIT ends the transaction.
+
+        Arguments:
+
+        """
+
+        self.state["in_txn"] = True
+        binlog_apply.close_unit(
+            self.state, b"Query", self.header + [b"COMMIT\n", b"/*!*/;\n"])
+
+        self.assertTrue(self.state["closed"])
+
+    def test_in_txn(self):
+
+        """Function:  test_in_txn
+
+        Description:  Test that a statement in a transaction does not end
+            it.
+
+        Arguments:
+
+        """
+
+        self.state["in_txn"] = True
+        binlog_apply.close_unit(
+            self.state, b"Query",
+            self.header + [b"INSERT INTO t1 VALUES (1)\n", b"/*!*/;\n"])
+
+        self.assertFalse(self.state["closed"])
+
+    def test_statement(self):
+
+        """Function:  test_statement
+
+        Description:  Test that a statement outside a transaction is a
+            transaction of its own.
+
+        Arguments:
+
+        """
+
+        binlog_apply.close_unit(
+            self.state, b"Query",
+            self.header + [b"CREATE TABLE t1 (a INT)\n", b"/*!*/;\n"])
+
+        self.assertTrue(self.state["closed"])
+
+    def test_rows(self):
+
+        """Function:  test_rows
+
+        Description:  Test that a rows event does not end the transaction.
+
+        Arguments:
+
+        """
+
+        self.state["in_txn"] = True
+        binlog_apply.close_unit(self.state, b"Write_rows", self.header[:2])
+
+        self.assertFalse(self.state["closed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
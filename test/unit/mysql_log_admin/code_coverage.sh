@@ -4,19 +4,170 @@
 # This will show the amount of code that was tested and which lines of code
 #   that was skipped during the test.
 
+# Program modules.
+SOURCE=mysql_log_admin,binlog_reader,binlog_stream,binlog_filter,binlog_fetch,binlog_search,binlog_display,binlog_tee,binlog_apply,binlog_restore,binlog_catalog,binlog_workload,binlog_service
+
 coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/fetch_binlog.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/fetch_log_entries.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/fetch_log_pos.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/find_dt_pos.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/help_message.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/load_log.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/main.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/process_logs_list.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/run_program.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/add_workload.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/adjust_rate.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/analyse_log.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/apply_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/binlog_tables.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/binlog_ts_offset.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/bloom_bits.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/bloom_rules_out.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/build_binlog_bloom.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/build_binlog_index.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/catalog_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/catalog_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/catalog_log.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/catalog_query.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/check_binlog_cmds.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/check_packet.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/check_throttle.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/chunk_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/chunk_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/close_unit.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/column_size.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/connect_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/connect_targets.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/copy_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/copy_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/count_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/count_pipe.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/count_rows.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/crt_binlog_cmd.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/crt_filter.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/crt_pipe.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/crt_request_args.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/crt_workload.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/ddl_table.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/dt_to_ts.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/end_unit.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/evict_mirror.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fde_checksum.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/feed_applier.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_file_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_first_ts.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_log_entries.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_log_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_range_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/filter_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/filter_binlog_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/filter_group.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/find_dt_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/find_file_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/find_window_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/first_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fixed_size.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/flush_checkpoint.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/follow_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/follow_log_entries.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/group_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/help_message.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/index_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/index_last_query.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/last_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/last_query_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/latency_stats.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/latest_in_ranges.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/length_prefix.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/load_binlog_bloom.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/load_log.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/main.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/map_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/match_filter.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/merge_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/mirror_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/mirror_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/monitor_throttle.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/open_binlog_bloom.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/open_binlog_index.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/open_catalog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/plan_binlog_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/plan_index_start.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/plan_mirror.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/plan_restore.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/process_logs_list.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/prune_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/prune_bloom_binlogs.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/purge_binlog_index.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/put_block.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/query_event.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/query_stmt.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/range_query_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_applier.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_binlog_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_blocks.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_checkpoint.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_packed_int.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_packet.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_windows.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/read_workload.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/reduce_ranges.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/restore_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/restore_stats.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/route_event.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/row_layout.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/run_binlog_cmds.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/run_program.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/run_restore.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/run_tasks.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/save_checkpoint.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/scan_follow.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/scan_last_query.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/scan_spool.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/schedule_tasks.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/scramble_password.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/search_binlog_bloom.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/search_binlog_index.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/send_request.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/serve_request.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/serve_requests.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/session_edits.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/session_line.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/skip_image.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/split_binlog_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/spool_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/spool_tasks.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/start_appliers.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/start_tees.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/start_throttle.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/start_unit.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/stop_throttle.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/stream_binlog_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/stream_file_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/submit_tasks.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/sweep_fetch_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/sweep_file_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/sweep_query_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/sweep_stream_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/sync_mirror.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/table_map_columns.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/table_map_name.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/tag_query.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/tee_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/text_binlog_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/throttle_pressure.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/throttle_wait.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/track_unit.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/wait_applier.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/worker_stats.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/workload_events.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/workload_minute.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/workload_report.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_catalog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_checkpoint.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_log_entries.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_packet.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_spool.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_spools.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_target.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/write_workload.py
 
 echo ""
 echo "Producing code coverage report"
@@ -0,0 +1,194 @@
+# Classification (U)
+
+"""Program:  column_size.py
+
+    Description:  Unit testing of column_size in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/column_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_fixed
+        test_float
+        test_fraction
+        test_bit
+        test_decimal
+        test_blob
+        test_varchar
+        test_long_varchar
+        test_char
+        test_long_char
+        test_enum
+
+    """
+
+    def test_fixed(self):
+
+        """Function:  test_fixed
+
+        Description:  Test with a column type of a fixed size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.column_size(b"", 0, 8, b""), 8)
+
+    def test_float(self):
+
+        """Function:  test_float
+
+        Description:  Test with a DOUBLE column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.column_size(b"", 0, 5, b"\x08"), 8)
+
+    def test_fraction(self):
+
+        """Function:  test_fraction
+
+        Description:  Test with a DATETIME2 column with fractional seconds.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.column_size(b"", 0, 18, b"\x03"), 7)
+
+    def test_bit(self):
+
+        """Function:  test_bit
+
+        Description:  Test with a BIT(10) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"", 0, 16, b"\x02\x01"), 2)
+
+    def test_decimal(self):
+
+        """Function:  test_decimal
+
+        Description:  Test with a DECIMAL(20,4) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"", 0, 246, b"\x14\x04"), 10)
+
+    def test_blob(self):
+
+        """Function:  test_blob
+
+        Description:  Test with a BLOB column with two length bytes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"\0\x05\x01", 1, 252, b"\x02"), 263)
+
+    def test_varchar(self):
+
+        """Function:  test_varchar
+
+        Description:  Test with a VARCHAR(64) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"\x03abc", 0, 15, b"\x40\x00"), 4)
+
+    def test_long_varchar(self):
+
+        """Function:  test_long_varchar
+
+        Description:  Test with a VARCHAR(300) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"\x03\x00abc", 0, 15, b"\x2c\x01"),
+            5)
+
+    def test_char(self):
+
+        """Function:  test_char
+
+        Description:  Test with a CHAR(10) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"\x02ab", 0, 254, b"\xfe\x0a"), 3)
+
+    def test_long_char(self):
+
+        """Function:  test_long_char
+
+        Description:  Test with a CHAR column longer than 255 bytes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"\x02\x00ab", 0, 254, b"\xee\x2c"),
+            4)
+
+    def test_enum(self):
+
+        """Function:  test_enum
+
+        Description:  Test with an ENUM column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.column_size(b"\x01", 0, 254, b"\xf7\x01"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
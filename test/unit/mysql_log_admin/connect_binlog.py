@@ -0,0 +1,233 @@
+# Classification (U)
+
+"""Program:  connect_binlog.py
+
+    Description:  Unit testing of connect_binlog in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/connect_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import binlog_server                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def handshake(plugin):
+
+    """Function:  handshake
+
+    Description:  Create a handshake packet for an authentication plugin.
+
+    Arguments:
+        (input) plugin -> Authentication plugin name
+        (output) -> Handshake packet payload
+
+    """
+
+    return b"\x0a8.0.36\x00" + b"\x00" * 4 + b"a" * 8 + b"\x00" \
+        + b"\xff\xff\x21\x02\x00\xff\xdf\x15" + b"\x00" * 10 \
+        + b"b" * 12 + b"\x00" + plugin + b"\x00"
+
+
+def login_switch(handler):
+
+    """Function:  login_switch
+
+    Description:  Stub holder for binlog_server.BinlogHandler.login, which
+        switches the client to caching_sha2_password with fast
+        authentication.
+
+    Arguments:
+        (input) handler -> BinlogHandler instance
+
+    """
+
+    handler.send(handshake(b"mysql_native_password"))
+    handler.recv()
+    handler.send(b"\xfecaching_sha2_password\x00" + b"c" * 20 + b"\x00")
+    handler.recv()
+    handler.send(b"\x01\x03")
+    handler.send_ok()
+
+    return True
+
+
+def login_full_auth(handler):
+
+    """Function:  login_full_auth
+
+    Description:  Stub holder for binlog_server.BinlogHandler.login, which
+        asks for caching_sha2_password full authentication.
+
+    Arguments:
+        (input) handler -> BinlogHandler instance
+
+    """
+
+    handler.send(handshake(b"caching_sha2_password"))
+    handler.recv()
+    handler.send(b"\x01\x04")
+
+    return False
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, host, port):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.host = host
+        self.port = port
+        self.sql_user = "mysql"
+        self.sql_pass = "japd"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_auth_switch
+        test_full_auth
+        test_access_denied
+        test_connect_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        binlog_files.crt_binlog(
+            os.path.join(self.tmp_dir.name, "binlog1"),
+            [(100, 15), (100, 2), (110, 2)], "binlog2")
+        binlog_files.crt_binlog(
+            os.path.join(self.tmp_dir.name, "binlog2"), [(120, 15), (130, 2)])
+        self.binlog_srv = binlog_server.BinlogServer(
+            self.tmp_dir.name, password="japd")
+        self.binlog_srv.start()
+        self.server = Server(self.binlog_srv.host, self.binlog_srv.port)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.binlog_srv.stop()
+        self.tmp_dir.cleanup()
+
+    @mock.patch.object(
+        binlog_server.BinlogHandler, "login", login_switch)
+    def test_auth_switch(self):
+
+        """Function:  test_auth_switch
+
+        Description:  Test with a switch to caching_sha2_password.
+
+        Arguments:
+
+        """
+
+        conn = binlog_stream.connect_binlog(self.server)
+        conn.close()
+
+    @mock.patch.object(
+        binlog_server.BinlogHandler, "login", login_full_auth)
+    def test_full_auth(self):
+
+        """Function:  test_full_auth
+
+        Description:  Test with caching_sha2_password full authentication.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "full authentication"):
+            binlog_stream.connect_binlog(self.server)
+
+    def test_access_denied(self):
+
+        """Function:  test_access_denied
+
+        Description:  Test with a wrong password.
+
+        Arguments:
+
+        """
+
+        self.server.sql_pass = "wrong"
+
+        with self.assertRaisesRegex(ValueError, "1045"):
+            binlog_stream.connect_binlog(self.server)
+
+    def test_connect_binlog(self):
+
+        """Function:  test_connect_binlog
+
+        Description:  Test with the connection logged in.
+
+        Arguments:
+
+        """
+
+        conn = binlog_stream.connect_binlog(self.server)
+        binlog_stream.write_packet(conn, b"\x03SELECT 1")
+
+        self.assertEqual(binlog_stream.read_packet(conn)[:1], b"\x00")
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+# Classification (U)
+
+"""Program:  connect_targets.py
+
+    Description:  Unit testing of connect_targets in binlog_restore.py.
+
+    Usage:
+        test/unit/mysql_log_admin/connect_targets.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_restore                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-e": ["target1", "target2"], "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, name, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Server name
+            (input) conn_msg -> Connection error message
+
+        """
+
+        self.name = name
+        self.conn_msg = conn_msg
+        self.silent = None
+
+    def connect(self, silent):
+
+        """Method:  connect
+
+        Description:  Connect method.
+
+        Arguments:
+            (input) silent
+
+        """
+
+        self.silent = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_single
+        test_connect_error
+        test_connect_targets
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.server1 = Server("target1")
+        self.server2 = Server("target2", "Error Message")
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    def test_single(self, mock_inst, mock_disconn):
+
+        """Function:  test_single
+
+        Description:  Test that more than one target of a restore to a
+            single target are disconnected.
+
+        Arguments:
+
+        """
+
+        self.server2.conn_msg = None
+        mock_inst.side_effect = [self.server1, self.server2]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                binlog_restore.connect_targets(self.args, True), [])
+
+        self.assertEqual(mock_disconn.call_count, 2)
+
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    def test_connect_error(self, mock_inst):
+
+        """Function:  test_connect_error
+
+        Description:  Test that a target that cannot be connected to is left
+            out.
+
+        Arguments:
+
+        """
+
+        mock_inst.side_effect = [self.server1, self.server2]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                binlog_restore.connect_targets(self.args), [self.server1])
+
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    def test_connect_targets(self, mock_inst):
+
+        """Function:  test_connect_targets
+
+        Description:  Test that each target is connected to.
+
+        Arguments:
+
+        """
+
+        self.server2.conn_msg = None
+        mock_inst.side_effect = [self.server1, self.server2]
+
+        self.assertEqual(binlog_restore.connect_targets(self.args),
+                         [self.server1, self.server2])
+        mock_inst.assert_called_with(
+            "target2", "config", binlog_restore.mysql_class.Server)
+        self.assertTrue(self.server2.silent)
+
+
+if __name__ == "__main__":
+    unittest.main()
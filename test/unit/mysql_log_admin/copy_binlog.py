@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  copy_binlog.py
+
+    Description:  Unit testing of copy_binlog in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/copy_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import errno
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_splice_error
+        test_write_error
+        test_no_fileno
+        test_pipe
+        test_copy_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.out_file = os.path.join(self.tmp_dir.name, "binlog.sql")
+        self.data = b"# at 4\n#250101 10:00:00 Start\n" * 1000
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_display.os.splice",
+                mock.Mock(side_effect=OSError(errno.EINVAL, "Invalid")))
+    def test_splice_error(self):
+
+        """Function:  test_splice_error
+
+        Description:  Test with the output not supporting splice.
+
+        Arguments:
+
+        """
+
+        read_fd, write_fd = os.pipe()
+
+        with open(write_fd, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+        with open(read_fd, "rb") as lines, open(self.out_file, "wb") as out:
+            binlog_display.copy_binlog(lines, out)
+
+        with open(self.out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("binlog_display.os.splice",
+                mock.Mock(side_effect=OSError(errno.ENOSPC, "No space")))
+    def test_write_error(self):
+
+        """Function:  test_write_error
+
+        Description:  Test that a write error is raised.
+
+        Arguments:
+
+        """
+
+        read_fd, write_fd = os.pipe()
+
+        with open(write_fd, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+        with open(read_fd, "rb") as lines, open(self.out_file, "wb") as out:
+            with self.assertRaises(OSError):
+                binlog_display.copy_binlog(lines, out)
+
+    def test_no_fileno(self):
+
+        """Function:  test_no_fileno
+
+        Description:  Test with an output that is not a file, as with a -u
+            request.
+
+        Arguments:
+
+        """
+
+        read_fd, write_fd = os.pipe()
+
+        with open(write_fd, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+        out = io.BytesIO()
+
+        with open(read_fd, "rb") as lines:
+            binlog_display.copy_binlog(lines, out)
+
+        self.assertEqual(out.getvalue(), self.data)
+
+    def test_pipe(self):
+
+        """Function:  test_pipe
+
+        Description:  Test with the mysqlbinlog pipe.
+
+        Arguments:
+
+        """
+
+        read_fd, write_fd = os.pipe()
+
+        with open(write_fd, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+        with open(read_fd, "rb") as lines, open(self.out_file, "wb") as out:
+            binlog_display.copy_binlog(lines, out)
+
+        with open(self.out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_copy_binlog(self):
+
+        """Function:  test_copy_binlog
+
+        Description:  Test with a list of lines.
+
+        Arguments:
+
+        """
+
+        with open(self.out_file, "wb") as out:
+            binlog_display.copy_binlog([b"line1\n", "line2\n"], out)
+
+        with open(self.out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"line1\nline2\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
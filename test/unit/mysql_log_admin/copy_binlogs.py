@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  copy_binlogs.py
+
+    Description:  Unit testing of copy_binlogs in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/copy_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import binlog_filter                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-s": "start", "-t": "stop", "-p": "/dir/path"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_filter
+        test_copy_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.runs = [("/mirror", ["binlog1", "binlog2"], ["--start"]),
+                     (None, ["binlog3"], ["--stop"])]
+        self.out = io.BytesIO()
+
+    @mock.patch("binlog_filter.filter_binlog")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_filter(self, mock_fetch, mock_filter):
+
+        """Function:  test_filter
+
+        Description:  Test that the output is copied through the filter.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = [b"line1\n"]
+        mock_filter.return_value = [b"kept\n"]
+        binlog_display.copy_binlogs(
+            "Server", self.args, self.runs[1:], self.out, "filter")
+
+        mock_filter.assert_called_once_with([b"line1\n"], "filter")
+        self.assertEqual(self.out.getvalue(), b"kept\n")
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_copy_binlogs(self, mock_fetch):
+
+        """Function:  test_copy_binlogs
+
+        Description:  Test that each run is decoded in turn into the output
+            file.
+
+        Arguments:
+
+        """
+
+        mock_fetch.side_effect = [[b"run1\n"], [b"run2\n"]]
+        binlog_display.copy_binlogs("Server", self.args, self.runs, self.out)
+
+        self.assertEqual(self.out.getvalue(), b"run1\nrun2\n")
+        mock_fetch.assert_called_with(
+            "Server", opt_arg_list=["--stop"], start_dt="start",
+            stop_dt="stop", binlog_files=["binlog3"], bin_path="/dir/path",
+            binlog_dir=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  count_events.py
+
+    Description:  Unit testing of count_events in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/count_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_short_block
+        test_across_edge
+        test_count_events
+
+    """
+
+    def test_short_block(self):
+
+        """Function:  test_short_block
+
+        Description:  Test that a block shorter than the marker is kept in
+            the tail.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.count_events(b"# ", b"x\n"), (0, b"x\n# "))
+
+    def test_across_edge(self):
+
+        """Function:  test_across_edge
+
+        Description:  Test with a marker across the edge of two blocks.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.count_events(b"at 4\n", b"abc\n# "),
+            (1, b"at 4\n"))
+
+    def test_count_events(self):
+
+        """Function:  test_count_events
+
+        Description:  Test with markers in the block.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.count_events(
+                b"x\n# at 4\ny\n# at 125\nabcdef", b""), (2, b"bcdef"))
+
+
+if __name__ == "__main__":
+    unittest.main()
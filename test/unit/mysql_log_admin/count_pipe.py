@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  count_pipe.py
+
+    Description:  Unit testing of count_pipe in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/count_pipe.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_small_blocks
+        test_block_edge
+        test_empty
+        test_throttle
+        test_filter
+        test_count_pipe
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.read_fd, self.write_fd = os.pipe()
+        self.read_fd2, self.write_fd2 = os.pipe()
+        self.data = b"DELIMITER /*!*/;\n# at 4\nevent\n# at 120\nevent\n"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fdesc in [self.read_fd, self.read_fd2, self.write_fd2]:
+            os.close(fdesc)
+
+    @mock.patch("binlog_fetch.COPY_BYTES", 3)
+    def test_small_blocks(self):
+
+        """Function:  test_small_blocks
+
+        Description:  Test with event markers split over several blocks.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.data)
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            binlog_tee.count_pipe(self.read_fd, self.write_fd2),
+            (len(self.data), 2))
+        self.assertEqual(os.read(self.read_fd2, 100), self.data)
+
+    @mock.patch("binlog_fetch.COPY_BYTES", 20)
+    def test_block_edge(self):
+
+        """Function:  test_block_edge
+
+        Description:  Test with an event marker split over two blocks.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.data)
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            binlog_tee.count_pipe(self.read_fd, self.write_fd2),
+            (len(self.data), 2))
+        self.assertEqual(os.read(self.read_fd2, 100), self.data)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no data in the pipe.
+
+        Arguments:
+
+        """
+
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            binlog_tee.count_pipe(self.read_fd, self.write_fd2), (0, 0))
+
+    @mock.patch("binlog_tee.throttle_wait")
+    def test_throttle(self, mock_wait):
+
+        """Function:  test_throttle
+
+        Description:  Test that each block is passed to the throttle.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.data)
+        os.close(self.write_fd)
+        binlog_tee.count_pipe(self.read_fd, self.write_fd2, "throttle")
+
+        mock_wait.assert_called_once_with("throttle", len(self.data))
+
+    @mock.patch("binlog_tee.read_blocks")
+    def test_filter(self, mock_read):
+
+        """Function:  test_filter
+
+        Description:  Test that the blocks the filter keeps are copied.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = [self.data[:30]]
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            binlog_tee.count_pipe(
+                self.read_fd, self.write_fd2, filt="filter"), (30, 1))
+        self.assertEqual(os.read(self.read_fd2, 100), self.data[:30])
+        mock_read.assert_called_once_with(self.read_fd, "filter")
+
+    def test_count_pipe(self):
+
+        """Function:  test_count_pipe
+
+        Description:  Test with data in a single block.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.data)
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            binlog_tee.count_pipe(self.read_fd, self.write_fd2),
+            (len(self.data), 2))
+        self.assertEqual(os.read(self.read_fd2, 100), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
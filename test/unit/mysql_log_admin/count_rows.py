@@ -0,0 +1,162 @@
+# Classification (U)
+
+"""Program:  count_rows.py
+
+    Description:  Unit testing of count_rows in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/count_rows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_columns
+        test_partial_update
+        test_column_count
+        test_short
+        test_v1
+        test_update
+        test_count_rows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.columns = [(3, b""), (15, b"\x40\x00")]
+        self.head = b"\x6c\0\0\0\0\0\x01\0"
+        self.rows = b"\x00\x01\0\0\0\x02ab" + b"\x02\x02\0\0\0"
+
+    def test_no_columns(self):
+
+        """Function:  test_no_columns
+
+        Description:  Test with the column types not known.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_catalog.count_rows(
+            self.head + b"\x02\0\x02\x03" + self.rows, 30, None))
+
+    def test_partial_update(self):
+
+        """Function:  test_partial_update
+
+        Description:  Test with a partial JSON update rows event.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_catalog.count_rows(
+            self.head + b"\x02\0\x02\x03\x03" + self.rows, 39,
+            self.columns))
+
+    def test_column_count(self):
+
+        """Function:  test_column_count
+
+        Description:  Test with a column count that is not the one of the
+            Table_map event.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_catalog.count_rows(
+            self.head + b"\x02\0\x03\x07" + self.rows, 30, self.columns))
+
+    def test_short(self):
+
+        """Function:  test_short
+
+        Description:  Test with a row that is cut short.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_catalog.count_rows(
+            self.head + b"\x02\0\x02\x03" + self.rows[:-1], 30,
+            self.columns))
+
+    def test_v1(self):
+
+        """Function:  test_v1
+
+        Description:  Test with a rows event without extra data.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.count_rows(
+                self.head + b"\x02\x03" + self.rows, 25, self.columns), 2)
+
+    def test_update(self):
+
+        """Function:  test_update
+
+        Description:  Test with a before and after image of each row.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.count_rows(
+                self.head + b"\x02\0\x02\x03\x01" + self.rows[:8]
+                + b"\x00\x05\0\0\0", 31, self.columns), 1)
+
+    def test_count_rows(self):
+
+        """Function:  test_count_rows
+
+        Description:  Test with the checksum after the rows.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.count_rows(
+                self.head + b"\x04\0\xaa\xbb\x02\x03" + self.rows + b"\0" * 4,
+                30, self.columns, 4), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Classification (U)
+
+"""Program:  crt_binlog_cmd.py
+
+    Description:  Unit testing of crt_binlog_cmd in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/crt_binlog_cmd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_binlogs
+        test_binlog_dir
+        test_bin_path
+        test_crt_binlog_cmd
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.binlog_files = [{"Log_name": "binlog1"}, {"Log_name": "binlog2"}]
+        self.opt_arg_list = ["--force-read", "--read-from-remote-server"]
+
+    @mock.patch("binlog_fetch.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysqlbinlog"]))
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    def test_all_binlogs(self, mock_fetch):
+
+        """Function:  test_all_binlogs
+
+        Description:  Test with binary logs from the server.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files
+
+        self.assertEqual(
+            binlog_fetch.crt_binlog_cmd(self.server),
+            ["mysqlbinlog", "binlog1", "binlog2"])
+
+    @mock.patch("binlog_fetch.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysqlbinlog"]))
+    def test_binlog_dir(self):
+
+        """Function:  test_binlog_dir
+
+        Description:  Test with the binary logs read from a local directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.crt_binlog_cmd(
+                self.server, binlog_files=["binlog1", "binlog2"],
+                opt_arg_list=self.opt_arg_list, binlog_dir="/dir"),
+            ["mysqlbinlog", "--force-read", "/dir/binlog1", "/dir/binlog2"])
+
+    @mock.patch("binlog_fetch.mysql_libs.crt_cmd")
+    def test_bin_path(self, mock_cmd):
+
+        """Function:  test_bin_path
+
+        Description:  Test with bin_path argument passed.
+
+        Arguments:
+
+        """
+
+        binlog_fetch.crt_binlog_cmd(
+            self.server, binlog_files=["binlog1"], bin_path="/dir/")
+
+        mock_cmd.assert_called_once_with(self.server, "/dir/mysqlbinlog")
+
+    @mock.patch("binlog_fetch.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysqlbinlog"]))
+    def test_crt_binlog_cmd(self):
+
+        """Function:  test_crt_binlog_cmd
+
+        Description:  Test with all arguments passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.crt_binlog_cmd(
+                self.server, "start", "stop", ["binlog1"], self.opt_arg_list),
+            ["mysqlbinlog", "--force-read", "--read-from-remote-server",
+             "--start-datetime=start", "--stop-datetime=stop", "binlog1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  crt_filter.py
+
+    Description:  Unit testing of crt_filter in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/crt_filter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-B": ["shop"],
+                           "-N": ["shop.tmp_*"], "-Y": ["Delete_rows"]}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_filter
+        test_crt_filter
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_no_filter(self):
+
+        """Function:  test_no_filter
+
+        Description:  Test with no filter options.
+
+        Arguments:
+
+        """
+
+        for opt in ["-B", "-N", "-Y"]:
+            del self.args.args_array[opt]
+
+        self.assertIsNone(binlog_filter.crt_filter(self.args))
+
+    def test_crt_filter(self):
+
+        """Function:  test_crt_filter
+
+        Description:  Test that the event types are in lower case.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_filter.crt_filter(self.args),
+            {"dbs": ["shop"], "skip_tables": ["shop.tmp_*"],
+             "skip_types": ["delete_rows"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  crt_pipe.py
+
+    Description:  Unit testing of crt_pipe in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/crt_pipe.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_setpipe
+        test_crt_pipe
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fds = []
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fdesc in self.fds:
+            os.close(fdesc)
+
+    @mock.patch("binlog_tee.fcntl.fcntl",
+                mock.Mock(side_effect=OSError))
+    def test_no_setpipe(self):
+
+        """Function:  test_no_setpipe
+
+        Description:  Test with the pipe buffer not able to be set.
+
+        Arguments:
+
+        """
+
+        self.fds = binlog_tee.crt_pipe()
+        os.write(self.fds[1], b"data")
+
+        self.assertEqual(os.read(self.fds[0], 4), b"data")
+
+    @mock.patch("binlog_tee.fcntl.fcntl")
+    def test_crt_pipe(self, mock_fcntl):
+
+        """Function:  test_crt_pipe
+
+        Description:  Test the pipe buffer is raised.
+
+        Arguments:
+
+        """
+
+        self.fds = binlog_tee.crt_pipe()
+
+        mock_fcntl.assert_called_once_with(
+            self.fds[1], binlog_tee.F_SETPIPE_SZ,
+            binlog_tee.PIPE_BYTES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,332 @@
+# Classification (U)
+
+"""Program:  crt_request_args.py
+
+    Description:  Unit testing of crt_request_args in binlog_service.py.
+
+    Usage:
+        test/unit/mysql_log_admin/crt_request_args.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_service                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+        arg_parse2
+        arg_xor_dict
+        arg_validate
+        arg_dir_chk
+        arg_cond_req
+
+    """
+
+    def __init__(self, argv=None, opt_val=None, multi_val=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) argv -> List of command line arguments
+            (input) opt_val -> List of options that require values
+            (input) multi_val -> List of options with multiple values
+
+        """
+
+        self.argv = argv
+        self.opt_val = opt_val
+        self.multi_val = multi_val
+        self.args_array = {}
+        self.argparse2 = True
+        self.valid_func2 = True
+        self.dir_chk = True
+        self.cond_req = True
+
+        if argv:
+            self.args_array = {"-L": True, "-s": "2024-01-01 00:00:00",
+                               "-n": "2"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+    def arg_parse2(self):
+
+        """Method:  arg_parse2
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_parse2.
+
+        Arguments:
+
+        """
+
+        return self.argparse2
+
+    def arg_xor_dict(self, opt_xor_val):
+
+        """Method:  arg_xor_dict
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_xor_dict.
+
+        Arguments:
+
+        """
+
+        return bool(opt_xor_val)
+
+    def arg_validate(self, valid_func):
+
+        """Method:  arg_validate
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_validate.
+
+        Arguments:
+
+        """
+
+        return bool(valid_func) and self.valid_func2
+
+    def arg_dir_chk(self, dir_perms_chk):
+
+        """Method:  arg_dir_chk
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_dir_chk.
+
+        Arguments:
+
+        """
+
+        return bool(dir_perms_chk) and self.dir_chk
+
+    def arg_cond_req(self, opt_con_req):
+
+        """Method:  arg_cond_req
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_cond_req.
+
+        Arguments:
+
+        """
+
+        return bool(opt_con_req) and self.cond_req
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_parse_error
+        test_not_valid
+        test_dir_chk
+        test_cond_req
+        test_relative
+        test_crt_request_args
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "mysql_cfg", "-d": "config", "-S": "/dir/sock",
+            "-i": "/dir/index", "-n": "4", "-p": "/dir/bin"}
+        self.req = ArgParser(["mysql_log_admin.py"])
+        self.argv = ["-L", "-s", "2024-01-01 00:00:00", "-n", "2"]
+        self.req_opts = {"opt_val": ["-s", "-n"], "multi_val": ["-e"],
+                         "valid_func": {"-s": 1},
+                         "opt_xor_val": {"-L": ["-D"]},
+                         "dir_perms_chk": {"-d": 5, "-i": 7},
+                         "opt_con_req": {"-R": ["-e"]}}
+
+    @mock.patch("binlog_service.gen_class.ArgParser")
+    def test_parse_error(self, mock_arg):
+
+        """Function:  test_parse_error
+
+        Description:  Test with request arguments that do not parse.
+
+        Arguments:
+
+        """
+
+        self.req.argparse2 = False
+        mock_arg.return_value = self.req
+
+        self.assertIsNone(binlog_service.crt_request_args(
+            self.args, self.argv, self.req_opts))
+
+    @mock.patch("binlog_service.gen_class.ArgParser")
+    def test_not_valid(self, mock_arg):
+
+        """Function:  test_not_valid
+
+        Description:  Test with request arguments that are not valid.
+
+        Arguments:
+
+        """
+
+        self.req.valid_func2 = False
+        mock_arg.return_value = self.req
+
+        self.assertIsNone(binlog_service.crt_request_args(
+            self.args, self.argv, self.req_opts))
+
+    @mock.patch("binlog_service.gen_class.ArgParser")
+    def test_dir_chk(self, mock_arg):
+
+        """Function:  test_dir_chk
+
+        Description:  Test with a request directory that cannot be read.
+
+        Arguments:
+
+        """
+
+        self.req.dir_chk = False
+        mock_arg.return_value = self.req
+
+        self.assertIsNone(binlog_service.crt_request_args(
+            self.args, self.argv, self.req_opts))
+
+    @mock.patch("binlog_service.gen_class.ArgParser")
+    def test_cond_req(self, mock_arg):
+
+        """Function:  test_cond_req
+
+        Description:  Test with a request missing an option another option
+            requires.
+
+        Arguments:
+
+        """
+
+        self.req.cond_req = False
+        mock_arg.return_value = self.req
+
+        self.assertIsNone(binlog_service.crt_request_args(
+            self.args, self.argv, self.req_opts))
+
+    @mock.patch("binlog_service.gen_class.ArgParser")
+    def test_relative(self, mock_arg):
+
+        """Function:  test_relative
+
+        Description:  Test that the request paths have to be absolute.
+
+        Arguments:
+
+        """
+
+        self.req.args_array.update({"-o": "out.log", "-k": "/dir/ckpt"})
+        mock_arg.return_value = self.req
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertIsNone(binlog_service.crt_request_args(
+                self.args, self.argv, self.req_opts))
+
+        self.assertEqual(
+            mock_out.getvalue(),
+            "crt_request_args:  Error:  -o must be absolute paths with"
+            " -u.\n")
+
+    @mock.patch("binlog_service.gen_class.ArgParser")
+    def test_crt_request_args(self, mock_arg):
+
+        """Function:  test_crt_request_args
+
+        Description:  Test that the service options are added to the
+            request options.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.req
+
+        self.assertEqual(
+            binlog_service.crt_request_args(
+                self.args, self.argv, self.req_opts).args_array,
+            {"-L": True, "-s": "2024-01-01 00:00:00", "-n": "2",
+             "-d": "config", "-i": "/dir/index", "-p": "/dir/bin"})
+        mock_arg.assert_called_once_with(
+            ["mysql_log_admin.py"] + self.argv, opt_val=["-s", "-n"],
+            multi_val=["-e"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# Classification (U)
+
+"""Program:  crt_workload.py
+
+    Description:  Unit testing of crt_workload in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/crt_workload.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_crt_workload
+
+    """
+
+    def test_crt_workload(self):
+
+        """Function:  test_crt_workload
+
+        Description:  Test that the counters are empty.
+
+        Arguments:
+
+        """
+
+        stats = binlog_workload.crt_workload()
+
+        self.assertIsNone(stats["minute"])
+        self.assertEqual(
+            [len(stats[key]) for key in binlog_workload.WORKLOAD_MINUTES],
+            [0, 0, 0, 0])
+        self.assertEqual(list(stats["sizes"]), [0] * 65)
+        self.assertEqual(list(stats["size_bytes"]), [0] * 65)
+        self.assertEqual(
+            (stats["types"], stats["tables"], stats["undecoded"]),
+            ({}, {}, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  ddl_table.py
+
+    Description:  Unit testing of ddl_table in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/ddl_table.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_ddl
+        test_several_tables
+        test_rename
+        test_no_database
+        test_database
+        test_ddl_table
+
+    """
+
+    def test_not_ddl(self):
+
+        """Function:  test_not_ddl
+
+        Description:  Test with a statement that is not DDL on a table.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_filter.ddl_table(
+            b"INSERT INTO t1 VALUES (1)", "shop"))
+        self.assertIsNone(binlog_filter.ddl_table(
+            b"CREATE DATABASE shop", "shop"))
+
+    def test_several_tables(self):
+
+        """Function:  test_several_tables
+
+        Description:  Test with DDL on more than one table.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_filter.ddl_table(
+            b"DROP TABLE `t1`,`t2` /* generated by server */", "shop"))
+
+    def test_rename(self):
+
+        """Function:  test_rename
+
+        Description:  Test with DDL that renames a table.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_filter.ddl_table(
+            b"ALTER TABLE t1\nRENAME TO t2", "shop"))
+
+    def test_no_database(self):
+
+        """Function:  test_no_database
+
+        Description:  Test with no default database.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_filter.ddl_table(
+            b"TRUNCATE TABLE t1", None))
+
+    def test_database(self):
+
+        """Function:  test_database
+
+        Description:  Test with the database in the statement.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_filter.ddl_table(
+                b"create temporary table if not exists `my``db`.t1(id int)",
+                "shop"), ("my`db", "t1"))
+
+    def test_ddl_table(self):
+
+        """Function:  test_ddl_table
+
+        Description:  Test with DDL on a single table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_filter.ddl_table(
+                b"ALTER TABLE `orders` ADD COLUMN note TEXT", "shop"),
+            ("shop", "orders"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  dt_to_ts.py
+
+    Description:  Unit testing of dt_to_ts in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/dt_to_ts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_dt
+        test_none_dt
+        test_dt_to_ts
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dtime = "2024-01-02 03:04:05"
+        self.results = int(time.mktime((2024, 1, 2, 3, 4, 5, 0, 0, -1)))
+
+    def test_empty_dt(self):
+
+        """Function:  test_empty_dt
+
+        Description:  Test with an empty datetime.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_fetch.dt_to_ts(""))
+
+    def test_none_dt(self):
+
+        """Function:  test_none_dt
+
+        Description:  Test with datetime set to None.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_fetch.dt_to_ts(None))
+
+    def test_dt_to_ts(self):
+
+        """Function:  test_dt_to_ts
+
+        Description:  Test with a datetime passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_fetch.dt_to_ts(self.dtime), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
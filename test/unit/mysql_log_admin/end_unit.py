@@ -0,0 +1,140 @@
+# Classification (U)
+
+"""Program:  end_unit.py
+
+    Description:  Unit testing of end_unit in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/end_unit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import collections
+import queue
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_state(workers):
+
+    """Function:  crt_state
+
+    Description:  Creates the parallel applier state with mysql client
+        sessions that write to memory.
+
+    Arguments:
+        (input) workers -> Number of mysql client sessions
+        (output) -> Dictionary of the parallel applier state
+
+    """
+
+    procs = [mock.Mock(stdin=io.BytesIO()) for _ in range(workers)]
+
+    return {"procs": procs, "acks": queue.Queue(), "outstanding": {},
+            "depth": [0] * workers,
+            "sessions": [{} for _ in range(workers)], "session": {},
+            "unit": None, "targets": [], "txns": 0, "bytes": 0,
+            "binlog": "binlog1", "skipped": 0, "ckpt": None,
+            "units": collections.OrderedDict(), "skip": set(),
+            "profile": False, "files": [], "gtid": False, "closed": False,
+            "in_txn": False}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_unit
+        test_barrier
+        test_end_unit
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = crt_state(2)
+        self.state["session"] = {b"use": b"use `db1`/*!*/;\n"}
+
+    def test_no_unit(self):
+
+        """Function:  test_no_unit
+
+        Description:  Test with no current transaction.
+
+        Arguments:
+
+        """
+
+        binlog_apply.end_unit(self.state)
+
+        self.assertEqual(self.state["sessions"], [{}, {}])
+        self.assertIsNone(self.state["unit"])
+
+    def test_barrier(self):
+
+        """Function:  test_barrier
+
+        Description:  Test that a barrier has no marker and updates the
+            session state of every session.
+
+        Arguments:
+
+        """
+
+        self.state["unit"], self.state["targets"] = 0, [0, 1]
+        binlog_apply.end_unit(self.state)
+
+        self.assertEqual(self.state["procs"][0].stdin.getvalue(), b"")
+        self.assertEqual(self.state["sessions"],
+                         [self.state["session"]] * 2)
+        self.assertEqual(self.state["targets"], [])
+
+    def test_end_unit(self):
+
+        """Function:  test_end_unit
+
+        Description:  Test that a transaction is followed by its marker.
+
+        Arguments:
+
+        """
+
+        self.state["unit"], self.state["targets"] = 7, [1]
+        binlog_apply.end_unit(self.state)
+
+        self.assertEqual(self.state["procs"][1].stdin.getvalue(),
+                         b"SELECT 'mla:7'/*!*/;\n")
+        self.assertEqual(self.state["sessions"],
+                         [{}, self.state["session"]])
+        self.assertIsNone(self.state["unit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  evict_mirror.py
+
+    Description:  Unit testing of evict_mirror in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/evict_mirror.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_keep
+        test_within_budget
+        test_evict_mirror
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        # Last used in the order binlog.000002, binlog.000001, binlog.000003.
+        for name, mtime in [("binlog.000001", 200), ("binlog.000002", 100),
+                            ("binlog.000003", 300), (".fetch-work", 50)]:
+            path = os.path.join(self.tmp_dir.name, name)
+
+            with open(path, "wb") as f_hdlr:
+                f_hdlr.write(b"\0" * 100)
+
+            os.utime(path, (mtime, mtime))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_keep(self):
+
+        """Function:  test_keep
+
+        Description:  Test that binary logs in use are not removed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.evict_mirror(
+                self.tmp_dir.name, 150, ["binlog.000002"]), 100)
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir.name)),
+            [".fetch-work", "binlog.000002"])
+
+    def test_within_budget(self):
+
+        """Function:  test_within_budget
+
+        Description:  Test with the mirror within the disk budget.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.evict_mirror(self.tmp_dir.name, 300), 300)
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 4)
+
+    def test_evict_mirror(self):
+
+        """Function:  test_evict_mirror
+
+        Description:  Test that the least recently used binary logs are
+            removed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.evict_mirror(self.tmp_dir.name, 150), 100)
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir.name)),
+            [".fetch-work", "binlog.000003"])
+
+
+if __name__ == "__main__":
+    unittest.main()
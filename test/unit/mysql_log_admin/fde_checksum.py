@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  fde_checksum.py
+
+    Description:  Unit testing of fde_checksum in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/fde_checksum.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def fde_body(version, alg):
+
+    """Function:  fde_body
+
+    Description:  Create the body of a Format_description event.
+
+    Arguments:
+        (input) version -> Server version
+        (input) alg -> Checksum algorithm byte
+
+    """
+
+    return struct.pack("<H", 4) + version.ljust(50, b"\0") \
+        + struct.pack("<IB", 0, 19) + b"\x0d" * 40 + bytes([alg]) \
+        + b"\xaa\xbb\xcc\xdd"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_old_version
+        test_checksum_off
+        test_fde_checksum
+
+    """
+
+    def test_old_version(self):
+
+        """Function:  test_old_version
+
+        Description:  Test with a server version before 5.6.1.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.fde_checksum(fde_body(b"5.5.62-log", 1)[:-5]),
+            0)
+
+    def test_checksum_off(self):
+
+        """Function:  test_checksum_off
+
+        Description:  Test with the checksum turned off.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.fde_checksum(fde_body(b"8.0.36", 0)), 0)
+
+    def test_fde_checksum(self):
+
+        """Function:  test_fde_checksum
+
+        Description:  Test with the CRC32 checksum.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.fde_checksum(fde_body(b"8.0.36", 1)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
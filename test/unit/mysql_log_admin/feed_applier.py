@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  feed_applier.py
+
+    Description:  Unit testing of feed_applier in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/feed_applier.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import collections
+import queue
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_state(workers):
+
+    """Function:  crt_state
+
+    Description:  Creates the parallel applier state with mysql client
+        sessions that write to memory.
+
+    Arguments:
+        (input) workers -> Number of mysql client sessions
+        (output) -> Dictionary of the parallel applier state
+
+    """
+
+    procs = [mock.Mock(stdin=io.BytesIO()) for _ in range(workers)]
+
+    return {"procs": procs, "acks": queue.Queue(), "outstanding": {},
+            "depth": [0] * workers,
+            "sessions": [{} for _ in range(workers)], "session": {},
+            "unit": None, "targets": [], "txns": 0, "bytes": 0,
+            "binlog": "binlog1", "skipped": 0, "ckpt": None,
+            "units": collections.OrderedDict(), "skip": set(),
+            "profile": False, "files": [], "gtid": False, "closed": False,
+            "in_txn": False}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_binlog_error
+        test_throttle
+        test_feed_applier
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = crt_state(1)
+        self.data = (
+            b"DELIMITER /*!*/;\n# at 4\n"
+            b"#240101 10:00:00 server id 1  end_log_pos 125 CRC32 0x01"
+            b" \tStart: binlog v 4\n")
+        self.binlog_cmd = ["printf", "%s", self.data.decode()]
+
+    @mock.patch("binlog_apply.end_unit")
+    @mock.patch("binlog_apply.route_event")
+    def test_binlog_error(self, mock_route, mock_end):
+
+        """Function:  test_binlog_error
+
+        Description:  Test that a failed mysqlbinlog command is an error
+            before the current transaction is finished.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "mysqlbinlog exited with 2"):
+            binlog_apply.feed_applier(self.state, ["sh", "-c", "exit 2"])
+
+        mock_route.assert_not_called()
+        mock_end.assert_not_called()
+
+    @mock.patch("binlog_apply.end_unit", mock.Mock())
+    @mock.patch("binlog_tee.throttle_wait")
+    @mock.patch("binlog_apply.route_event")
+    def test_throttle(self, mock_route, mock_wait):
+
+        """Function:  test_throttle
+
+        Description:  Test that the bytes of each event are passed to the
+            throttle.
+
+        Arguments:
+
+        """
+
+        mock_route.side_effect = lambda state, kind, lines: state.update(
+            bytes=state["bytes"] + sum(len(line) for line in lines))
+        binlog_apply.feed_applier(self.state, self.binlog_cmd, "throttle")
+
+        self.assertEqual(
+            [call[0][1] for call in mock_wait.call_args_list], [17, 83])
+
+    @mock.patch("binlog_apply.end_unit")
+    @mock.patch("binlog_apply.route_event")
+    def test_feed_applier(self, mock_route, mock_end):
+
+        """Function:  test_feed_applier
+
+        Description:  Test that each event is routed and the last
+            transaction is finished.
+
+        Arguments:
+
+        """
+
+        binlog_apply.feed_applier(self.state, self.binlog_cmd)
+
+        self.assertEqual(
+            [call[0][1] for call in mock_route.call_args_list],
+            [b"header", b"Start"])
+        mock_end.assert_called_once_with(self.state)
+
+
+if __name__ == "__main__":
+    unittest.main()
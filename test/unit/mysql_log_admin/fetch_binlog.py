@@ -2,7 +2,7 @@
 
 """Program:  fetch_binlog.py
 
-    Description:  Unit testing of fetch_binlog in mysql_log_admin.py.
+    Description:  Unit testing of fetch_binlog in binlog_fetch.py.
 
     Usage:
         test/unit/mysql_log_admin/fetch_binlog.py
@@ -21,7 +21,7 @@ import mock
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -115,8 +115,8 @@ class UnitTest(unittest.TestCase):
         self.start_dt = "start_datetime_format"
         self.stop_dt = "end_datetime_format"
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_binpath_empty(self, mock_sub, mock_fetch):
 
         """Function:  test_binpath_empty
@@ -130,13 +130,13 @@ class UnitTest(unittest.TestCase):
         mock_sub.return_value = Popen()
         mock_fetch.return_value = self.binlog_files
 
-        dataout = mysql_log_admin.fetch_binlog(self.server, bin_path="")
+        dataout = binlog_fetch.fetch_binlog(self.server, bin_path="")
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_binpath_none(self, mock_sub, mock_fetch):
 
         """Function:  test_binpath_none
@@ -150,13 +150,13 @@ class UnitTest(unittest.TestCase):
         mock_sub.return_value = Popen()
         mock_fetch.return_value = self.binlog_files
 
-        dataout = mysql_log_admin.fetch_binlog(self.server, bin_path=None)
+        dataout = binlog_fetch.fetch_binlog(self.server, bin_path=None)
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_stop_dt(self, mock_sub, mock_fetch):
 
         """Function:  test_stop_dt
@@ -170,14 +170,14 @@ class UnitTest(unittest.TestCase):
         mock_sub.return_value = Popen()
         mock_fetch.return_value = self.binlog_files
 
-        dataout = mysql_log_admin.fetch_binlog(
+        dataout = binlog_fetch.fetch_binlog(
             self.server, bin_path="./", stop_dt=self.stop_dt)
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_start_dt(self, mock_sub, mock_fetch):
 
         """Function:  test_start_dt
@@ -191,14 +191,14 @@ class UnitTest(unittest.TestCase):
         mock_sub.return_value = Popen()
         mock_fetch.return_value = self.binlog_files
 
-        dataout = mysql_log_admin.fetch_binlog(
+        dataout = binlog_fetch.fetch_binlog(
             self.server, bin_path="./", start_dt=self.start_dt)
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_opt_arg_list(self, mock_sub, mock_fetch):
 
         """Function:  test_opt_arg_list
@@ -212,13 +212,13 @@ class UnitTest(unittest.TestCase):
         mock_sub.return_value = Popen()
         mock_fetch.return_value = self.binlog_files
 
-        dataout = mysql_log_admin.fetch_binlog(
+        dataout = binlog_fetch.fetch_binlog(
             self.server, bin_path="./", opt_arg_list=self.opt_arg_list)
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
 
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_binlog_files(self, mock_sub):
 
         """Function:  test_binlog_files
@@ -231,14 +231,14 @@ class UnitTest(unittest.TestCase):
 
         mock_sub.return_value = Popen()
 
-        dataout = mysql_log_admin.fetch_binlog(
+        dataout = binlog_fetch.fetch_binlog(
             self.server, bin_path="./", binlog_files=self.binlog_files)
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_binpath(self, mock_sub, mock_fetch):
 
         """Function:  test_binpath
@@ -252,13 +252,13 @@ class UnitTest(unittest.TestCase):
         mock_sub.return_value = Popen()
         mock_fetch.return_value = self.binlog_files
 
-        dataout = mysql_log_admin.fetch_binlog(self.server, bin_path="./")
+        dataout = binlog_fetch.fetch_binlog(self.server, bin_path="./")
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
-    @mock.patch("mysql_log_admin.subprocess.Popen")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.subprocess.Popen")
     def test_fetch_binlog(self, mock_sub, mock_fetch):
 
         """Function:  test_fetch_binlog
@@ -272,7 +272,7 @@ class UnitTest(unittest.TestCase):
         mock_sub.return_value = Popen()
         mock_fetch.return_value = self.binlog_files
 
-        dataout = mysql_log_admin.fetch_binlog(self.server)
+        dataout = binlog_fetch.fetch_binlog(self.server)
 
         self.assertEqual(
             [x for x in dataout], self.filehandler)     # pylint:disable=R1721
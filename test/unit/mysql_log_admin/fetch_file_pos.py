@@ -0,0 +1,177 @@
+# Classification (U)
+
+"""Program:  fetch_file_pos.py
+
+    Description:  Unit testing of fetch_file_pos in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/fetch_file_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.crc = "CRC32"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_lines
+        test_no_query
+        test_crc_none
+        test_single_binlog
+        test_fetch_file_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.lines = [
+            "#250101 10:00:00 server id 1  end_log_pos 120 CRC32 0x1 Start",
+            "#250101 10:00:01 server id 1  end_log_pos 200 CRC32 0x2 Query",
+            b"#250101 10:00:02 server id 1  end_log_pos 300 CRC32 0x3 Query",
+            "#250101 10:00:03 server id 1  end_log_pos 350 CRC32 0x4 Xid"]
+        self.lines2 = [
+            "#250101 10:00:01 server id 1  end_log_pos 200 Query",
+            "#250101 10:00:03 server id 1  end_log_pos 250 Xid"]
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_no_lines(self, mock_fetch):
+
+        """Function:  test_no_lines
+
+        Description:  Test with no lines from mysqlbinlog.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = []
+
+        self.assertIsNone(binlog_search.fetch_file_pos(
+            self.server, "binlog1", None, None))
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_no_query(self, mock_fetch):
+
+        """Function:  test_no_query
+
+        Description:  Test with no Query lines from mysqlbinlog.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = [self.lines[0], self.lines[3]]
+
+        self.assertIsNone(binlog_search.fetch_file_pos(
+            self.server, "binlog1", None, None))
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_crc_none(self, mock_fetch):
+
+        """Function:  test_crc_none
+
+        Description:  Test with CRC set to None.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.lines2
+        self.server.crc = None
+
+        self.assertEqual(binlog_search.fetch_file_pos(
+            self.server, "binlog1", None, None), "200")
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_single_binlog(self, mock_fetch):
+
+        """Function:  test_single_binlog
+
+        Description:  Test that only the one binary log is passed.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = []
+
+        binlog_search.fetch_file_pos(
+            self.server, "binlog1", "start", "stop", ["--opt"], "/bin")
+
+        mock_fetch.assert_called_once_with(
+            self.server, "start", "stop", ["binlog1"], ["--opt"], "/bin")
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_fetch_file_pos(self, mock_fetch):
+
+        """Function:  test_fetch_file_pos
+
+        Description:  Test with last Query in the binary log.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.lines
+
+        self.assertEqual(binlog_search.fetch_file_pos(
+            self.server, "binlog1", None, None), "300")
+
+
+if __name__ == "__main__":
+    unittest.main()
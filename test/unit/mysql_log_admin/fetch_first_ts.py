@@ -0,0 +1,294 @@
+# Classification (U)
+
+"""Program:  fetch_first_ts.py
+
+    Description:  Unit testing of fetch_first_ts in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/fetch_first_ts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+import tempfile
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_stream                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Popen():                                          # pylint:disable=R0903
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        terminate
+        wait
+
+    """
+
+    def __init__(self, lines):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdout = mock.MagicMock()
+        self.stdout.__iter__.return_value = iter(lines)
+
+    def terminate(self):
+
+        """Method:  terminate
+
+        Description:  Stub holder for subprocess.Popen.terminate.
+
+        Arguments:
+
+        """
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Stub holder for subprocess.Popen.wait.
+
+        Arguments:
+
+        """
+
+        return 0
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "mysql"
+        self.host = "hostname"
+        self.port = 3306
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_remote
+        test_binlog_dir_missing
+        test_binlog_dir_empty
+        test_binlog_dir
+        test_no_match
+        test_crc_none
+        test_fetch_first_ts
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = "binlog.000001"
+        self.tstamp = int(time.mktime((2024, 1, 2, 3, 4, 5, 0, 0, -1)))
+        self.line1 = b"# at 4\n"
+        self.line2 = b"#240102  3:04:05 server id 1  end_log_pos 126 CRC32" \
+            b" 0x1a2b3c4d  Start: binlog v 4, server v 8.0.36 created\n"
+        self.line3 = b"#240102  3:04:05 server id 1  end_log_pos 126" \
+            b"  Start: binlog v 4, server v 8.0.36 created\n"
+
+        with open(os.path.join(self.tmp_dir.name, self.binlog), "wb") \
+                as f_hdlr:
+            f_hdlr.write(b"\xfebin" + struct.pack(
+                "<IBIIIH", self.tstamp, 15, 1, 19, 23, 0))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_stream.stream_binlog_events")
+    def test_remote(self, mock_stream):
+
+        """Function:  test_remote
+
+        Description:  Test with the replication stream client.
+
+        Arguments:
+
+        """
+
+        mock_stream.return_value = iter(binlog_reader.read_binlog_events(
+            os.path.join(self.tmp_dir.name, self.binlog)))
+
+        self.assertEqual(
+            binlog_fetch.fetch_first_ts(
+                self.server, self.binlog, remote=True), self.tstamp)
+        mock_stream.assert_called_once_with(self.server, self.binlog)
+
+    @mock.patch("binlog_stream.stream_binlog_events")
+    def test_binlog_dir_missing(self, mock_stream):
+
+        """Function:  test_binlog_dir_missing
+
+        Description:  Test with the binary log not in the binary log
+            directory.
+
+        Arguments:
+
+        """
+
+        os.rename(os.path.join(self.tmp_dir.name, self.binlog),
+                  os.path.join(self.tmp_dir.name, "binlog.000002"))
+        mock_stream.return_value = iter(binlog_reader.read_binlog_events(
+            os.path.join(self.tmp_dir.name, "binlog.000002")))
+
+        self.assertEqual(
+            binlog_fetch.fetch_first_ts(
+                self.server, self.binlog, binlog_dir=self.tmp_dir.name,
+                remote=True), self.tstamp)
+        mock_stream.assert_called_once_with(self.server, self.binlog)
+
+    def test_binlog_dir_empty(self):
+
+        """Function:  test_binlog_dir_empty
+
+        Description:  Test with binary log file with no events.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.tmp_dir.name, self.binlog), "wb") \
+                as f_hdlr:
+            f_hdlr.write(b"\xfebin")
+
+        self.assertIsNone(binlog_fetch.fetch_first_ts(
+            self.server, self.binlog, binlog_dir=self.tmp_dir.name))
+
+    def test_binlog_dir(self):
+
+        """Function:  test_binlog_dir
+
+        Description:  Test with binary log directory passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.fetch_first_ts(
+                self.server, self.binlog, binlog_dir=self.tmp_dir.name),
+            self.tstamp)
+
+    @mock.patch("binlog_fetch.subprocess.Popen")
+    def test_no_match(self, mock_popen):
+
+        """Function:  test_no_match
+
+        Description:  Test with no first event found in mysqlbinlog output.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen([self.line1])
+
+        self.assertIsNone(
+            binlog_fetch.fetch_first_ts(self.server, self.binlog))
+
+    @mock.patch("binlog_fetch.subprocess.Popen")
+    def test_crc_none(self, mock_popen):
+
+        """Function:  test_crc_none
+
+        Description:  Test with mysqlbinlog output with no checksum.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen([self.line1, self.line3])
+
+        self.assertEqual(
+            binlog_fetch.fetch_first_ts(self.server, self.binlog),
+            self.tstamp)
+
+    @mock.patch("binlog_fetch.subprocess.Popen")
+    def test_fetch_first_ts(self, mock_popen):
+
+        """Function:  test_fetch_first_ts
+
+        Description:  Test with mysqlbinlog output.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen([self.line1, self.line2])
+
+        self.assertEqual(
+            binlog_fetch.fetch_first_ts(
+                self.server, self.binlog, ["--read-from-remote-server"],
+                "/usr/bin/"),
+            self.tstamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@
 
 """Program:  fetch_log_entries.py
 
-    Description:  Unit testing of fetch_log_entries in mysql_log_admin.py.
+    Description:  Unit testing of fetch_log_entries in binlog_display.py.
 
     Usage:
         test/unit/mysql_log_admin/fetch_log_entries.py
@@ -17,17 +17,38 @@
 import sys
 import os
 import unittest
+import tempfile
 import mock
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_display                           # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import binlog_search                            # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
 
 
+def plan_binlog_pos(server, args, binlog_list, *opt_args):
+
+    """Function:  plan_binlog_pos
+
+    Description:  Stub holder for binlog_search.plan_binlog_pos function.
+
+    Arguments:
+
+    """
+
+    status = True
+
+    if server and args and opt_args:
+        status = True
+
+    return (binlog_list, [], []) if status else ([], [], [])
+
+
 class ArgParser():
 
     """Class:  ArgParser
@@ -116,6 +137,10 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        tearDown
+        test_out_file
+        test_workers
+        test_plan_pos
         test_log_failure
         test_log_success
         test_no_binlogs
@@ -140,9 +165,109 @@ class UnitTest(unittest.TestCase):
         self.binlog_list = ["binarylog1", "binarylog2"]
         self.status = (True, None)
         self.status2 = (False, "Error Message")
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_out_file(self, mock_fetch, mock_logs):
+
+        """Function:  test_out_file
+
+        Description:  Test with the binary log entries written to a file.
+
+        Arguments:
+
+        """
 
-    @mock.patch("mysql_log_admin.process_logs_list")
-    @mock.patch("mysql_log_admin.fetch_binlog")
+        out_file = os.path.join(self.tmp_dir.name, "binlog.sql")
+        self.args.args_array["-o"] = out_file
+        mock_fetch.return_value = [b"line1\n", "line2\n"]
+        mock_logs.return_value = self.status, self.binlog_list
+
+        binlog_display.fetch_log_entries(
+            self.server, self.args, self.opt_arg_list)
+
+        with open(out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"line1\nline2\n")
+
+    @mock.patch("binlog_display.mysql_libs.fetch_logs",
+                mock.Mock(return_value=[]))
+    @mock.patch("binlog_display.merge_binlogs")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_workers(self, mock_fetch, mock_logs, mock_merge):
+
+        """Function:  test_workers
+
+        Description:  Test with binary logs decoded at the same time.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = "4"
+        mock_logs.return_value = self.status, self.binlog_list
+
+        self.assertFalse(binlog_display.fetch_log_entries(
+            self.server, self.args, self.opt_arg_list))
+        mock_fetch.assert_not_called()
+        mock_merge.assert_called_once_with(
+            self.server, self.args, self.binlog_list, self.opt_arg_list, [],
+            mock.ANY, None, [], {}, {}, None)
+
+    @mock.patch("binlog_search.plan_binlog_pos")
+    @mock.patch("binlog_fetch.process_logs_list")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_plan_pos(self, mock_fetch, mock_logs, mock_plan):
+
+        """Function:  test_plan_pos
+
+        Description:  Test with start and stop positions from the planning
+            step.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.loglist
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_plan.return_value = (
+            self.binlog_list[1:], ["--start-position=207"],
+            ["--stop-position=900"])
+
+        with gen_libs.no_std_out():
+            binlog_display.fetch_log_entries(
+                self.server, self.args, self.opt_arg_list)
+
+        mock_plan.assert_called_once_with(
+            self.server, self.args, self.binlog_list, self.opt_arg_list)
+        self.assertEqual(
+            mock_fetch.call_args[1]["opt_arg_list"],
+            self.opt_arg_list + ["--start-position=207",
+                                 "--stop-position=900"])
+        self.assertEqual(
+            mock_fetch.call_args[1]["binlog_files"], self.binlog_list[1:])
+
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    @mock.patch("binlog_fetch.fetch_binlog")
     def test_log_failure(self, mock_fetch, mock_logs):
 
         """Function:  test_log_failure
@@ -157,11 +282,13 @@ class UnitTest(unittest.TestCase):
         mock_logs.return_value = self.status2, []
 
         with gen_libs.no_std_out():
-            self.assertFalse(mysql_log_admin.fetch_log_entries(
+            self.assertFalse(binlog_display.fetch_log_entries(
                 self.server, self.args, self.opt_arg_list))
 
-    @mock.patch("mysql_log_admin.process_logs_list")
-    @mock.patch("mysql_log_admin.fetch_binlog")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    @mock.patch("binlog_fetch.fetch_binlog")
     def test_log_success(self, mock_fetch, mock_logs):
 
         """Function:  test_log_success
@@ -176,11 +303,13 @@ class UnitTest(unittest.TestCase):
         mock_logs.return_value = self.status, self.binlog_list
 
         with gen_libs.no_std_out():
-            self.assertFalse(mysql_log_admin.fetch_log_entries(
+            self.assertFalse(binlog_display.fetch_log_entries(
                 self.server, self.args, self.opt_arg_list))
 
-    @mock.patch("mysql_log_admin.process_logs_list")
-    @mock.patch("mysql_log_admin.fetch_binlog")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    @mock.patch("binlog_fetch.fetch_binlog")
     def test_no_binlogs(self, mock_fetch, mock_logs):
 
         """Function:  test_no_binlogs
@@ -194,11 +323,13 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = []
         mock_logs.return_value = self.status, self.binlog_list
 
-        self.assertFalse(mysql_log_admin.fetch_log_entries(
+        self.assertFalse(binlog_display.fetch_log_entries(
             self.server, self.args, self.opt_arg_list))
 
-    @mock.patch("mysql_log_admin.process_logs_list")
-    @mock.patch("mysql_log_admin.fetch_binlog")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    @mock.patch("binlog_fetch.fetch_binlog")
     def test_fetch_log_entries(self, mock_fetch, mock_logs):
 
         """Function:  test_fetch_log_entries
@@ -213,7 +344,7 @@ class UnitTest(unittest.TestCase):
         mock_logs.return_value = self.status, self.binlog_list
 
         with gen_libs.no_std_out():
-            self.assertFalse(mysql_log_admin.fetch_log_entries(
+            self.assertFalse(binlog_display.fetch_log_entries(
                 self.server, self.args, self.opt_arg_list))
 
 
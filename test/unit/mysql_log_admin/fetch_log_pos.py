@@ -2,7 +2,7 @@
 
 """Program:  fetch_log_pos.py
 
-    Description:  Unit testing of fetch_log_pos in mysql_log_admin.py.
+    Description:  Unit testing of fetch_log_pos in binlog_search.py.
 
     Usage:
         test/unit/mysql_log_admin/fetch_log_pos.py
@@ -16,13 +16,15 @@
 # Standard
 import sys
 import os
+import io
 import unittest
 import collections
 import mock
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
@@ -117,6 +119,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_windows_error
+        test_windows
+        test_binlog_error
+        test_chunk_size
+        test_worker_stats
         test_opt_arg_list
         test_fetch_log_pos
 
@@ -138,7 +145,116 @@ class UnitTest(unittest.TestCase):
         position = collections.namedtuple("Position", "file pos")
         self.pos = position("Filename", "123")
 
-    @mock.patch("mysql_log_admin.find_dt_pos")
+    @mock.patch("binlog_search.read_windows")
+    def test_windows_error(self, mock_read):
+
+        """Function:  test_windows_error
+
+        Description:  Test with a windows file that cannot be read.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-l": "/dir/windows"}
+        mock_read.side_effect = OSError("No such file")
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                binlog_search.fetch_log_pos(self.server, self.args))
+
+    @mock.patch("binlog_search.find_dt_pos")
+    @mock.patch("binlog_search.find_window_pos")
+    @mock.patch("binlog_search.read_windows")
+    def test_windows(self, mock_read, mock_window, mock_pos):
+
+        """Function:  test_windows
+
+        Description:  Test that one position is printed per window.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-l": "/dir/windows", "-n": "4"}
+        mock_read.return_value = [("start1", "stop1"), ("start2", None)]
+        mock_window.return_value = [self.pos, self.pos]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as out:
+            binlog_search.fetch_log_pos(self.server, self.args)
+
+        self.assertEqual(
+            out.getvalue(),
+            "Start: start1, Stop: stop1, Filename: Filename, Position: 123\n"
+            "Start: start2, Stop: None, Filename: Filename, Position: 123\n")
+        mock_window.assert_called_once_with(
+            self.server, mock_read.return_value, [], None, binlog_dir=None,
+            workers=4, remote=None, mirror_bytes=None)
+        mock_pos.assert_not_called()
+
+    @mock.patch("binlog_search.find_dt_pos")
+    def test_binlog_error(self, mock_pos):
+
+        """Function:  test_binlog_error
+
+        Description:  Test with error reading the binary log files.
+
+        Arguments:
+
+        """
+
+        mock_pos.side_effect = ValueError("binlog1 is not a binary log file")
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                binlog_search.fetch_log_pos(self.server, self.args))
+
+    @mock.patch("binlog_search.find_dt_pos")
+    def test_chunk_size(self, mock_pos):
+
+        """Function:  test_chunk_size
+
+        Description:  Test that the -j chunk size is passed in bytes.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-j": "64", "-i": "/dir/index", "-n": "4"}
+        mock_pos.return_value = self.pos
+
+        with gen_libs.no_std_out():
+            binlog_search.fetch_log_pos(self.server, self.args)
+
+        mock_pos.assert_called_once_with(
+            self.server, None, None, [], None, binlog_dir=None,
+            index_dir="/dir/index", workers=4, remote=None, mirror_bytes=None,
+            chunk_bytes=67108864)
+
+    @mock.patch("binlog_fetch.worker_stats",
+                mock.Mock(return_value="Tasks: 2"))
+    @mock.patch("binlog_search.find_dt_pos")
+    def test_worker_stats(self, mock_pos):
+
+        """Function:  test_worker_stats
+
+        Description:  Test that the worker utilisation is printed to
+            standard error with -x.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-x": True}
+        mock_pos.return_value = self.pos
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err, \
+                gen_libs.no_std_out():
+            binlog_search.fetch_log_pos(self.server, self.args)
+
+        self.assertEqual(err.getvalue(), "Tasks: 2\n")
+
+    @mock.patch("binlog_search.find_dt_pos")
     def test_opt_arg_list(self, mock_pos):
 
         """Function:  test_opt_arg_list
@@ -152,10 +268,10 @@ class UnitTest(unittest.TestCase):
         mock_pos.return_value = self.pos
 
         with gen_libs.no_std_out():
-            self.assertFalse(mysql_log_admin.fetch_log_pos(
+            self.assertFalse(binlog_search.fetch_log_pos(
                 self.server, self.args, opt_arg_list=self.opt_arg_list))
 
-    @mock.patch("mysql_log_admin.find_dt_pos")
+    @mock.patch("binlog_search.find_dt_pos")
     def test_fetch_log_pos(self, mock_pos):
 
         """Function:  test_fetch_log_pos
@@ -170,7 +286,7 @@ class UnitTest(unittest.TestCase):
 
         with gen_libs.no_std_out():
             self.assertFalse(
-                mysql_log_admin.fetch_log_pos(self.server, self.args))
+                binlog_search.fetch_log_pos(self.server, self.args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,248 @@
+# Classification (U)
+
+"""Program:  fetch_range_pos.py
+
+    Description:  Unit testing of fetch_range_pos in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/fetch_range_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Popen():
+
+    """Class:  Popen
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        __enter__
+        __exit__
+        terminate
+        wait
+
+    """
+
+    def __init__(self, lines, code=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdout = mock.MagicMock()
+        self.stdout.__iter__.return_value = iter(lines)
+        self.code = code
+        self.returncode = None
+        self.terminated = False
+
+    def __enter__(self):
+
+        """Method:  __enter__
+
+        Description:  Stub holder for subprocess.Popen.__enter__.
+
+        Arguments:
+
+        """
+
+        return self
+
+    def __exit__(self, *args):
+
+        """Method:  __exit__
+
+        Description:  Stub holder for subprocess.Popen.__exit__.
+
+        Arguments:
+
+        """
+
+        self.wait()
+
+    def terminate(self):
+
+        """Method:  terminate
+
+        Description:  Stub holder for subprocess.Popen.terminate.
+
+        Arguments:
+
+        """
+
+        self.terminated = True
+        self.code = -15
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Stub holder for subprocess.Popen.wait.
+
+        Arguments:
+
+        """
+
+        self.returncode = self.code
+
+        return self.returncode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_terminated
+        test_failed
+        test_stop_ts
+        test_fetch_range_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.lines = [
+            "#240101 10:00:00 server id 1  end_log_pos 199 \tQuery\n",
+            "#240101 10:00:05 server id 1  end_log_pos 280 \tQuery\n"]
+        self.tstamp = int(time.mktime(time.strptime(
+            "240101 10:00:00", "%y%m%d %H:%M:%S")))
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd",
+                mock.Mock(return_value=["mysqlbinlog"]))
+    @mock.patch("binlog_search.subprocess.Popen")
+    def test_terminated(self, mock_popen):
+
+        """Function:  test_terminated
+
+        Description:  Test that mysqlbinlog is stopped after the stop timestamp
+            and its exit status is not an error.
+
+        Arguments:
+
+        """
+
+        proc = Popen(self.lines)
+        mock_popen.return_value = proc
+
+        self.assertEqual(
+            binlog_search.fetch_range_pos(
+                self.server, "binlog1", stop_ts=self.tstamp + 5),
+            (199, True))
+        self.assertTrue(proc.terminated)
+        self.assertEqual(proc.returncode, -15)
+        proc.stdout.close.assert_called_once_with()
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd",
+                mock.Mock(return_value=["mysqlbinlog"]))
+    @mock.patch("binlog_search.subprocess.Popen")
+    def test_failed(self, mock_popen):
+
+        """Function:  test_failed
+
+        Description:  Test with mysqlbinlog failing on the range.
+
+        Arguments:
+
+        """
+
+        proc = Popen(self.lines, code=1)
+        mock_popen.return_value = proc
+
+        with self.assertRaises(ValueError) as context:
+            binlog_search.fetch_range_pos(
+                self.server, "binlog1", stop_ts=self.tstamp + 10)
+
+        self.assertEqual(
+            str(context.exception), "mysqlbinlog exited with 1 on binlog1")
+        self.assertFalse(proc.terminated)
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd",
+                mock.Mock(return_value=["mysqlbinlog"]))
+    @mock.patch("binlog_search.subprocess.Popen")
+    def test_stop_ts(self, mock_popen):
+
+        """Function:  test_stop_ts
+
+        Description:  Test with a range that reaches the stop timestamp.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = Popen(self.lines)
+
+        self.assertEqual(
+            binlog_search.fetch_range_pos(
+                self.server, "binlog1", stop_ts=self.tstamp + 5),
+            (199, True))
+        mock_popen.assert_called_once_with(
+            ["mysqlbinlog"], stdout=binlog_search.subprocess.PIPE)
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd")
+    @mock.patch("binlog_search.subprocess.Popen")
+    def test_fetch_range_pos(self, mock_popen, mock_cmd):
+
+        """Function:  test_fetch_range_pos
+
+        Description:  Test that mysqlbinlog is run against the range.
+
+        Arguments:
+
+        """
+
+        proc = Popen(self.lines)
+        mock_popen.return_value = proc
+        mock_cmd.return_value = ["mysqlbinlog"]
+
+        self.assertEqual(
+            binlog_search.fetch_range_pos(
+                self.server, "binlog1", 120, 300, self.tstamp,
+                self.tstamp + 10, ["--force-read"], "/dir/path"),
+            (280, False))
+        mock_cmd.assert_called_once_with(
+            self.server, binlog_files=["binlog1"],
+            opt_arg_list=["--force-read", "--start-position=120",
+                          "--stop-position=300"], bin_path="/dir/path")
+        self.assertFalse(proc.terminated)
+        self.assertEqual(proc.returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  filter_binlog.py
+
+    Description:  Unit testing of filter_binlog in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/filter_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_str_lines
+        test_filter_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lines = [
+            "DELIMITER /*!*/;\n", "# at 126\n",
+            "#240101 10:00:00 server id 1  end_log_pos 205 \tGTID\n",
+            "SET @@SESSION.GTID_NEXT= 'uuid:5'/*!*/;\n", "# at 205\n",
+            "#240101 10:00:00 server id 1  end_log_pos 300 \tQuery\n",
+            "use `logs`/*!*/;\n", "DROP TABLE t1\n", "/*!*/;\n",
+            "SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /*!*/;\n", "DELIMITER ;\n"]
+
+    def test_str_lines(self):
+
+        """Function:  test_str_lines
+
+        Description:  Test that the lines are returned as bytes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog(
+                self.lines, {"dbs": ["logs"]})),
+            [line.encode("utf-8") for line in self.lines])
+
+    def test_filter_binlog(self):
+
+        """Function:  test_filter_binlog
+
+        Description:  Test that the lines of a dropped transaction are not
+            returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog(
+                [line.encode("utf-8") for line in self.lines],
+                {"skip_dbs": ["logs"]})),
+            [b"DELIMITER /*!*/;\n", b"use `logs`/*!*/;\n",
+             b"SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /*!*/;\n",
+             b"DELIMITER ;\n"])
+
+
+if __name__ == "__main__":
+    unittest.main()
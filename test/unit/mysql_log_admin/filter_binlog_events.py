@@ -0,0 +1,212 @@
+# Classification (U)
+
+"""Program:  filter_binlog_events.py
+
+    Description:  Unit testing of filter_binlog_events in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/filter_binlog_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def event(pos, kind, lines):
+
+    """Function:  event
+
+    Description:  Creates a mysqlbinlog event of the type with the lines.
+
+    Arguments:
+        (input) pos -> Position of the event
+        (input) kind -> Event type and the rest of the header line
+        (input) lines -> List of the event lines after the header
+
+    """
+
+    return kind.split()[0].rstrip(b":"), [
+        b"# at " + str(pos).encode() + b"\n",
+        b"#240101 10:00:00 server id 1  end_log_pos " + str(pos + 10).encode()
+        + b" CRC32 0x1a2b3c4d \t" + kind + b"\n"] + lines
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_include_db
+        test_exclude_type
+        test_include_table
+        test_no_match
+        test_no_gtid
+        test_filter_binlog_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.header = (b"header", [b"DELIMITER /*!*/;\n"])
+        self.start = event(4, b"Start: binlog v 4", [b"BINLOG 'AAAA'/*!*/;\n"])
+        self.rows = [
+            event(126, b"Anonymous_GTID\tlast_committed=0",
+                  [b"SET @@SESSION.GTID_NEXT= 'ANONYMOUS'/*!*/;\n"]),
+            event(205, b"Query\tthread_id=5",
+                  [b"SET TIMESTAMP=1704103200/*!*/;\n",
+                   b"SET @@session.sql_mode=1436549152/*!*/;\n",
+                   b"BEGIN\n", b"/*!*/;\n"]),
+            event(280, b"Table_map: `shop`.`orders` mapped to number 108",
+                  []),
+            event(340, b"Write_rows: table id 108 flags: STMT_END_F",
+                  [b"BINLOG '\n", b"AAAA\n", b"'/*!*/;\n"]),
+            event(390, b"Xid = 10", [b"COMMIT/*!*/;\n"])]
+        self.ddl = [
+            event(421, b"Anonymous_GTID\tlast_committed=1",
+                  [b"SET @@SESSION.GTID_NEXT= 'ANONYMOUS'/*!*/;\n"]),
+            event(500, b"Query\tthread_id=5",
+                  [b"use `logs`/*!*/;\n", b"SET TIMESTAMP=1704103200/*!*/;\n",
+                   b"CREATE TABLE t1 (id INT)\n", b"/*!*/;\n"])]
+        self.rotate = event(600, b"Rotate to binlog2  pos: 4", [])
+        self.trailer = (b"trailer", [
+            b"SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /*!*/;\n",
+            b"DELIMITER ;\n"])
+        self.events = [self.header, self.start] + self.rows + self.ddl \
+            + [self.rotate, self.trailer]
+
+    def test_include_db(self):
+
+        """Function:  test_include_db
+
+        Description:  Test that only the session state of a transaction on
+            another database is kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog_events(
+                self.events, {"dbs": ["shop"]})),
+            [self.header, self.start] + self.rows
+            + [(b"Query", [b"use `logs`/*!*/;\n"]), self.rotate,
+               self.trailer])
+
+    def test_exclude_type(self):
+
+        """Function:  test_exclude_type
+
+        Description:  Test that a transaction with only excluded event types
+            is dropped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog_events(
+                self.events, {"skip_types": ["write_rows"]})),
+            [self.header, self.start,
+             (b"Query", [b"SET @@session.sql_mode=1436549152/*!*/;\n"])]
+            + self.ddl + [self.rotate, self.trailer])
+
+    def test_include_table(self):
+
+        """Function:  test_include_table
+
+        Description:  Test that DDL on a single table is matched by table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog_events(
+                self.events, {"tables": ["logs.t?"]})),
+            [self.header, self.start,
+             (b"Query", [b"SET @@session.sql_mode=1436549152/*!*/;\n"])]
+            + self.ddl + [self.rotate, self.trailer])
+
+    def test_no_match(self):
+
+        """Function:  test_no_match
+
+        Description:  Test that the events outside of transactions are kept
+            when no transaction is.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog_events(
+                self.events, {"skip_dbs": ["*"]})),
+            [self.header, self.start,
+             (b"Query", [b"SET @@session.sql_mode=1436549152/*!*/;\n"]),
+             (b"Query", [b"use `logs`/*!*/;\n"]), self.rotate, self.trailer])
+
+    def test_no_gtid(self):
+
+        """Function:  test_no_gtid
+
+        Description:  Test with transactions that do not start with a GTID
+            event.
+
+        Arguments:
+
+        """
+
+        events = [self.header, self.start] + self.rows[1:] + self.ddl[1:] \
+            + [self.rotate, self.trailer]
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog_events(
+                events, {"dbs": ["logs"]})),
+            [self.header, self.start,
+             (b"Query", [b"SET @@session.sql_mode=1436549152/*!*/;\n"])]
+            + self.ddl[1:] + [self.rotate, self.trailer])
+
+    def test_filter_binlog_events(self):
+
+        """Function:  test_filter_binlog_events
+
+        Description:  Test that the transactions that pass the filter are
+            kept whole.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_binlog_events(
+                self.events, {"dbs": ["shop", "logs"], "types": ["*"]})),
+            self.events)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  filter_group.py
+
+    Description:  Unit testing of filter_group in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/filter_group.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tags
+        test_no_session
+        test_dropped
+        test_filter_group
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.filt = {"dbs": ["shop"]}
+        self.group = [
+            (b"GTID", [b"# at 126\n",
+                       b"SET @@SESSION.GTID_NEXT= 'uuid:5'/*!*/;\n"]),
+            (b"Query", [b"# at 205\n", b"use `logs`/*!*/;\n",
+                        b"SET @@session.sql_mode=0/*!*/;\n",
+                        b"INSERT INTO t1 VALUES (1)\n", b"/*!*/;\n"])]
+
+    def test_no_tags(self):
+
+        """Function:  test_no_tags
+
+        Description:  Test that a group without Query or rows events is kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_group(self.filt, self.group[:1], [])),
+            self.group[:1])
+
+    def test_no_session(self):
+
+        """Function:  test_no_session
+
+        Description:  Test with a dropped group without session state lines.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_group(
+                self.filt, self.group[:1], [("logs", None, "query")])), [])
+
+    def test_dropped(self):
+
+        """Function:  test_dropped
+
+        Description:  Test that only the session state lines of a dropped
+            group are kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_group(
+                self.filt, self.group, [("logs", None, "query")])),
+            [(b"Query", [b"use `logs`/*!*/;\n",
+                         b"SET @@session.sql_mode=0/*!*/;\n"])])
+
+    def test_filter_group(self):
+
+        """Function:  test_filter_group
+
+        Description:  Test that a group is kept if any event passes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.filter_group(
+                self.filt, self.group,
+                [("logs", None, "query"), ("shop", "t1", "write_rows")])),
+            self.group)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@
 
 """Program:  find_dt_pos.py
 
-    Description:  Unit testing of find_dt_pos in mysql_log_admin.py.
+    Description:  Unit testing of find_dt_pos in binlog_search.py.
 
     Usage:
         test/unit/mysql_log_admin/find_dt_pos.py
@@ -22,12 +22,33 @@ import mock
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
 
 
+def prune_binlogs(server, log_files, *args):
+
+    """Method:  prune_binlogs
+
+    Description:  Stub holder for binlog_fetch.prune_binlogs function.
+
+    Arguments:
+
+    """
+
+    status = True
+
+    if server and args:
+        status = True
+
+    return log_files if status else []
+
+
 class Slave():                                          # pylint:disable=R0903
 
     """Class:  Slave
@@ -92,6 +113,19 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_remote
+        test_chunks
+        test_workers_process
+        test_workers_reduce
+        test_workers_batch
+        test_newest_first
+        test_no_overlap
+        test_index_dir
+        test_binlog_dir_no_query
+        test_binlog_dir_slave
+        test_binlog_dir
+        test_mirror
+        test_mirror_newest
         test_binpath_empty
         test_binpath_none
         test_slave
@@ -132,10 +166,299 @@ class UnitTest(unittest.TestCase):
         self.match1 = re.match(r"(?P<type>\w+)\s+(?P<epos>\w+)", "Start line")
         self.match2 = re.match(r"(?P<type>\w+)\s+(?P<epos>\w+)", "Query 123")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_stream.stream_file_pos")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_remote(self, mock_fetch, mock_stream):
+
+        """Function:  test_remote
+
+        Description:  Test with the replication stream client.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files
+        mock_stream.side_effect = [None, 123]
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, remote=True)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog1", 123))
+        self.assertEqual(
+            [call[0][1] for call in mock_stream.call_args_list],
+            ["binlog2", "binlog1"])
+
+    @mock.patch("binlog_search.fetch_range_pos")
+    @mock.patch("binlog_reader.chunk_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_chunks(self, mock_fetch, mock_chunk, mock_range):
+
+        """Function:  test_chunks
+
+        Description:  Test that the ranges of the closed binary logs are
+            read with mysqlbinlog and reduced in order.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = [
+            {"Log_name": "binlog1", "File_size": 1000},
+            {"Log_name": "binlog2", "File_size": 500}]
+        mock_chunk.side_effect = [[(None, None)], [(None, 500), (500, None)]]
+        mock_range.side_effect = [(None, False), (300, False), (None, True)]
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, index_dir="/dir/index", chunk_bytes=400)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog1", 300))
+        mock_chunk.assert_has_calls([
+            mock.call("binlog2", None, 400, index_dir="/dir/index"),
+            mock.call("binlog1", 1000, 400, index_dir="/dir/index")])
+        self.assertEqual(
+            [call[0][1:4] for call in mock_range.call_args_list],
+            [("binlog2", None, None), ("binlog1", None, 500),
+             ("binlog1", 500, None)])
+
+    @mock.patch("binlog_fetch.map_binlogs")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_workers_process(self, mock_fetch, mock_map):
+
+        """Function:  test_workers_process
+
+        Description:  Test with binary log directory and workers.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files
+        mock_map.side_effect = [[123, None], []]
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, binlog_dir="/dir", workers=4)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog1", 123))
+        self.assertEqual(mock_map.call_args_list[0][0][2], 4)
+        self.assertTrue(mock_map.call_args_list[0][1]["process"])
+
+    @mock.patch("binlog_search.fetch_file_pos")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_workers_reduce(self, mock_fetch, mock_file):
+
+        """Function:  test_workers_reduce
+
+        Description:  Test the last binary log with a Query is kept.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files2
+        mock_file.side_effect = \
+            lambda server, binlog, *args: {"binlog2": "456"}.get(binlog)
+
+        pos = binlog_search.find_dt_pos(
+            self.master, self.start_dt, self.stop_dt, workers=3)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog2", "456"))
+        self.assertEqual(mock_file.call_count, 3)
+
+    @mock.patch("binlog_search.fetch_file_pos")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_workers_batch(self, mock_fetch, mock_file):
+
+        """Function:  test_workers_batch
+
+        Description:  Test that the binary logs are checked a batch of
+            workers at a time from the newest back.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files2
+        mock_file.side_effect = \
+            lambda server, binlog, *args: {"binlog1": "123"}.get(binlog)
+
+        pos = binlog_search.find_dt_pos(
+            self.master, self.start_dt, self.stop_dt, workers=2)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog1", "123"))
+        self.assertEqual(
+            sorted(call[0][1] for call in mock_file.call_args_list[:2]),
+            ["binlog2", "binlog3"])
+        self.assertEqual(mock_file.call_args[0][1], "binlog1")
+
+    @mock.patch("binlog_search.fetch_file_pos")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_newest_first(self, mock_fetch, mock_file):
+
+        """Function:  test_newest_first
+
+        Description:  Test that the older binary logs are not read once the
+            newest binary log has a Query.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files2
+        mock_file.return_value = "789"
+
+        pos = binlog_search.find_dt_pos(
+            self.master, self.start_dt, self.stop_dt)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog3", "789"))
+        mock_file.assert_called_once_with(
+            self.master, "binlog3", self.start_dt, self.stop_dt, [], "")
+
+    @mock.patch("binlog_reader.scan_last_query")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_binlog_dir_no_query(self, mock_fetch, mock_scan):
+
+        """Function:  test_binlog_dir_no_query
+
+        Description:  Test with binary log directory and no Query found.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files
+        mock_scan.return_value = None
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, binlog_dir="/dir")
+
+        self.assertEqual((pos.file, pos.pos), ("binlog2", None))
+
+    @mock.patch("binlog_reader.scan_last_query")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_binlog_dir_slave(self, mock_fetch, mock_scan):
+
+        """Function:  test_binlog_dir_slave
+
+        Description:  Test with binary log directory and slave database.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files2
+        mock_scan.side_effect = [None, 456]
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, slave=self.slave, binlog_dir="/dir")
+
+        self.assertEqual((pos.file, pos.pos), ("binlog2", 456))
+
+    @mock.patch("binlog_reader.scan_last_query")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_binlog_dir(self, mock_fetch, mock_scan):
+
+        """Function:  test_binlog_dir
+
+        Description:  Test with binary log directory passed.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files
+        mock_scan.side_effect = [None, 123]
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, binlog_dir="/dir")
+
+        self.assertEqual((pos.file, pos.pos), ("binlog1", 123))
+
+    @mock.patch("binlog_search.fetch_file_pos")
+    @mock.patch("binlog_reader.scan_last_query")
+    @mock.patch("binlog_fetch.mirror_binlogs")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_mirror(self, mock_fetch, mock_mirror, mock_scan, mock_file):
+
+        """Function:  test_mirror
+
+        Description:  Test with the mirrored binary logs read locally and the
+            active binary log read from the server.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files
+        mock_mirror.return_value = ["binlog1"]
+        mock_scan.return_value = 123
+        mock_file.return_value = None
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, binlog_dir="/dir", mirror_bytes=1024)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog1", 123))
+        self.assertEqual(mock_mirror.call_args_list, [
+            mock.call(self.master, ["binlog2"], "/dir", 1024, "", 1),
+            mock.call(self.master, ["binlog1"], "/dir", 1024, "", 1)])
+        mock_scan.assert_called_once_with(
+            os.path.join("/dir", "binlog1"), None, None)
+        self.assertEqual(mock_file.call_args[0][1], "binlog2")
+
+    @mock.patch("binlog_reader.scan_last_query")
+    @mock.patch("binlog_fetch.mirror_binlogs")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_mirror_newest(self, mock_fetch, mock_mirror, mock_scan):
+
+        """Function:  test_mirror_newest
+
+        Description:  Test that the older binary logs are not mirrored once
+            the newest batch has a position.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.binlog_files2
+        mock_mirror.return_value = ["binlog2", "binlog3"]
+        mock_scan.return_value = 123
+
+        pos = binlog_search.find_dt_pos(
+            self.master, None, None, binlog_dir="/dir", workers=2,
+            mirror_bytes=1024)
+
+        self.assertEqual((pos.file, pos.pos), ("binlog3", 123))
+        mock_mirror.assert_called_once_with(
+            self.master, ["binlog2", "binlog3"], "/dir", 1024, "", 2)
+
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_binpath_empty(self, mock_fetch, mock_binlog):
 
         """Function:  test_binpath_empty
@@ -150,14 +473,16 @@ class UnitTest(unittest.TestCase):
         mock_binlog.return_value = []
 
         self.assertEqual(
-            mysql_log_admin.find_dt_pos(
+            binlog_search.find_dt_pos(
                 self.master, self.start_dt, self.stop_dt, bin_path=""),
             "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_binpath_none(self, mock_fetch, mock_binlog):
 
         """Function:  test_binpath_none
@@ -172,15 +497,17 @@ class UnitTest(unittest.TestCase):
         mock_binlog.return_value = []
 
         self.assertEqual(
-            mysql_log_admin.find_dt_pos(
+            binlog_search.find_dt_pos(
                 self.master, self.start_dt, self.stop_dt, bin_path=None),
             "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.re.match")
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_search.re.match")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_slave(self, mock_fetch, mock_binlog, mock_match):
 
         """Function:  test_slave
@@ -196,15 +523,17 @@ class UnitTest(unittest.TestCase):
         mock_match.return_value = self.match2
 
         self.assertEqual(
-            mysql_log_admin.find_dt_pos(
+            binlog_search.find_dt_pos(
                 self.master, self.start_dt, self.stop_dt, slave=self.slave),
             "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.re.match")
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_search.re.match")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_match_query(self, mock_fetch, mock_binlog, mock_match):
 
         """Function:  test_match_query
@@ -219,14 +548,16 @@ class UnitTest(unittest.TestCase):
         mock_binlog.return_value = self.fetch_log
         mock_match.return_value = self.match2
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.re.match")
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_search.re.match")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_match_start(self, mock_fetch, mock_binlog, mock_match):
 
         """Function:  test_match_start
@@ -241,14 +572,16 @@ class UnitTest(unittest.TestCase):
         mock_binlog.return_value = self.fetch_log
         mock_match.return_value = self.match1
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.re.match")
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_search.re.match")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_crc_32_match(self, mock_fetch, mock_binlog, mock_match):
 
         """Function:  test_crc_32_match
@@ -263,13 +596,15 @@ class UnitTest(unittest.TestCase):
         mock_binlog.return_value = self.fetch_log
         mock_match.return_value = self.match1
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_crc_none(self, mock_fetch, mock_binlog):
 
         """Function:  test_crc_none
@@ -285,13 +620,15 @@ class UnitTest(unittest.TestCase):
 
         self.master.crc = None
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_crc_32(self, mock_fetch, mock_binlog):
 
         """Function:  test_crc_32
@@ -305,13 +642,15 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.binlog_files
         mock_binlog.return_value = self.fetch_log
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_fetch_binlog_data(self, mock_fetch, mock_binlog):
 
         """Function:  test_fetch_binlog_data
@@ -325,13 +664,15 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.binlog_files
         mock_binlog.return_value = self.fetch_log
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_fetch_binlog_empty(self, mock_fetch, mock_binlog):
 
         """Function:  test_fetch_binlog_empty
@@ -345,13 +686,15 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.binlog_files
         mock_binlog.return_value = []
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_opt_arg_list(self, mock_fetch, mock_binlog):
 
         """Function:  test_opt_arg_list
@@ -366,14 +709,16 @@ class UnitTest(unittest.TestCase):
         mock_binlog.return_value = []
 
         self.assertEqual(
-            mysql_log_admin.find_dt_pos(
+            binlog_search.find_dt_pos(
                 self.master, self.start_dt, self.stop_dt, bin_path="./",
                 opt_arg_list=self.opt_arg_list), "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_binpath(self, mock_fetch, mock_binlog):
 
         """Function:  test_binpath
@@ -388,14 +733,16 @@ class UnitTest(unittest.TestCase):
         mock_binlog.return_value = []
 
         self.assertEqual(
-            mysql_log_admin.find_dt_pos(
+            binlog_search.find_dt_pos(
                 self.master, self.start_dt, self.stop_dt, bin_path="./"),
             "Position")
 
-    @mock.patch("mysql_log_admin.mysql_class.Position",
+    @mock.patch("binlog_search.mysql_class.Position",
                 mock.Mock(return_value="Position"))
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.prune_binlogs",
+                mock.Mock(side_effect=prune_binlogs))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
     def test_find_dt_pos(self, mock_fetch, mock_binlog):
 
         """Function:  test_find_dt_pos
@@ -409,7 +756,7 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.binlog_files
         mock_binlog.return_value = []
 
-        self.assertEqual(mysql_log_admin.find_dt_pos(
+        self.assertEqual(binlog_search.find_dt_pos(
             self.master, self.start_dt, self.stop_dt), "Position")
 
 
@@ -0,0 +1,148 @@
+# Classification (U)
+
+"""Program:  find_file_pos.py
+
+    Description:  Unit testing of find_file_pos in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/find_file_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_index_used
+        test_index_built
+        test_active_binlog
+        test_find_file_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.index_file = self.binlog + ".idx"
+        self.layout = [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)]
+        binlog_files.crt_binlog(self.binlog, self.layout)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_reader.index_last_query")
+    def test_index_used(self, mock_index):
+
+        """Function:  test_index_used
+
+        Description:  Test with closed binary log and an index.
+
+        Arguments:
+
+        """
+
+        with mock.patch("binlog_reader.INDEX_EVENTS", 2):
+            binlog_reader.build_binlog_index(self.binlog, self.index_file)
+
+        mock_index.return_value = 178
+
+        self.assertEqual(
+            binlog_reader.find_file_pos(
+                self.tmp_dir.name, "binlog.000001", stop_ts=115,
+                index_dir=self.tmp_dir.name, closed=True), 178)
+
+    def test_index_built(self):
+
+        """Function:  test_index_built
+
+        Description:  Test with closed binary log and no index.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.find_file_pos(
+                self.tmp_dir.name, "binlog.000001",
+                index_dir=self.tmp_dir.name, closed=True), 265)
+        self.assertTrue(os.path.exists(self.index_file))
+
+    def test_active_binlog(self):
+
+        """Function:  test_active_binlog
+
+        Description:  Test with the active binary log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.find_file_pos(
+                self.tmp_dir.name, "binlog.000001",
+                index_dir=self.tmp_dir.name), 265)
+        self.assertFalse(os.path.exists(self.index_file))
+
+    def test_find_file_pos(self):
+
+        """Function:  test_find_file_pos
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.find_file_pos(self.tmp_dir.name, "binlog.000001"),
+            265)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+# Classification (U)
+
+"""Program:  find_window_pos.py
+
+    Description:  Unit testing of find_window_pos in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/find_window_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_windows
+        test_no_overlap
+        test_prune_range
+        test_remote
+        test_mysqlbinlog
+        test_mirror
+        test_find_window_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = "Server"
+        self.logs = [{"Log_name": "binlog.000001"},
+                     {"Log_name": "binlog.000002"}]
+
+        for binlog, layout in [
+                ("binlog.000001",
+                 [("2025-01-01 00:00:00", 15), ("2025-01-01 00:05:00", 2),
+                  ("2025-01-01 00:10:00", 2), ("2025-01-01 00:20:00", 2)]),
+                ("binlog.000002",
+                 [("2025-01-01 00:25:00", 15), ("2025-01-01 00:26:00", 2),
+                  ("2025-01-01 00:40:00", 16)])]:
+            binlog_files.crt_binlog(
+                os.path.join(self.tmp_dir.name, binlog),
+                [(binlog_fetch.dt_to_ts(dtime), etype)
+                 for dtime, etype in layout])
+
+        self.windows = [
+            ("2025-01-01 00:15:00", "2025-01-01 00:30:00"),
+            ("2025-01-01 00:00:00", "2025-01-01 00:15:00"),
+            ("2025-01-01 00:00:00", "2025-01-01 00:05:00"),
+            (None, "2025-01-01 00:25:00"),
+            ("2025-01-01 00:27:00", None),
+            ("2025-01-01 00:10:00", "2025-01-01 00:10:00")]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_no_windows(self):
+
+        """Function:  test_no_windows
+
+        Description:  Test with no windows.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.find_window_pos(self.server, []), [])
+
+    @mock.patch("binlog_fetch.prune_binlogs", mock.Mock(return_value=[]))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_no_overlap(self, mock_fetch):
+
+        """Function:  test_no_overlap
+
+        Description:  Test with no binary logs within the windows.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+
+        self.assertEqual(
+            [(pos.file, pos.pos) for pos in binlog_search.find_window_pos(
+                self.server, self.windows[:2])],
+            [("binlog.000002", None)] * 2)
+
+    @mock.patch("binlog_search.sweep_fetch_pos",
+                mock.Mock(return_value={}))
+    @mock.patch("binlog_fetch.prune_binlogs")
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_prune_range(self, mock_fetch, mock_prune):
+
+        """Function:  test_prune_range
+
+        Description:  Test that the binary logs are pruned to the earliest
+            start and latest stop of the windows.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        mock_prune.return_value = ["binlog.000001"]
+
+        binlog_search.find_window_pos(self.server, self.windows[:3])
+        binlog_search.find_window_pos(self.server, self.windows[3:5])
+
+        self.assertEqual(
+            mock_prune.call_args_list[0][0][2:4],
+            ("2025-01-01 00:00:00", "2025-01-01 00:30:00"))
+        self.assertEqual(mock_prune.call_args_list[1][0][2:4], (None, None))
+
+    @mock.patch("binlog_stream.sweep_stream_pos")
+    @mock.patch("binlog_fetch.prune_binlogs")
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_remote(self, mock_fetch, mock_prune, mock_stream):
+
+        """Function:  test_remote
+
+        Description:  Test with the replication stream client.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        mock_prune.return_value = ["binlog.000001", "binlog.000002"]
+        mock_stream.side_effect = [{0: 100, 1: 120, 2: 150}, {1: 200}]
+
+        self.assertEqual(
+            [(pos.file, pos.pos) for pos in binlog_search.find_window_pos(
+                self.server, self.windows[:2], remote=True)],
+            [("binlog.000001", 150), ("binlog.000002", 200)])
+        mock_stream.assert_called_with(
+            self.server, "binlog.000002",
+            [binlog_fetch.dt_to_ts("2025-01-01 00:00:00"),
+             binlog_fetch.dt_to_ts("2025-01-01 00:15:00"),
+             binlog_fetch.dt_to_ts("2025-01-01 00:30:00")])
+
+    @mock.patch("binlog_search.sweep_fetch_pos")
+    @mock.patch("binlog_fetch.prune_binlogs")
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_mysqlbinlog(self, mock_fetch, mock_prune, mock_fetch_pos):
+
+        """Function:  test_mysqlbinlog
+
+        Description:  Test that each binary log is read once with mysqlbinlog.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        mock_prune.return_value = ["binlog.000001", "binlog.000002"]
+        mock_fetch_pos.side_effect = [{2: 300}, {}]
+
+        self.assertEqual(
+            [(pos.file, pos.pos) for pos in binlog_search.find_window_pos(
+                self.server, self.windows[:2], ["--opt"], "/bin/")],
+            [("binlog.000001", 300), ("binlog.000002", None)])
+        self.assertEqual(mock_fetch_pos.call_count, 2)
+        self.assertEqual(mock_fetch_pos.call_args[0][3:], (["--opt"], "/bin/"))
+
+    @mock.patch("binlog_search.sweep_fetch_pos")
+    @mock.patch("binlog_fetch.mirror_binlogs")
+    @mock.patch("binlog_fetch.prune_binlogs")
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_mirror(self, mock_fetch, mock_prune, mock_mirror,
+                    mock_fetch_pos):
+
+        """Function:  test_mirror
+
+        Description:  Test that mirrored binary logs are read locally and the
+            rest with mysqlbinlog.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        mock_prune.return_value = ["binlog.000001", "binlog.000002"]
+        mock_mirror.return_value = ["binlog.000001"]
+        mock_fetch_pos.return_value = {}
+
+        self.assertEqual(
+            [(pos.file, pos.pos) for pos in binlog_search.find_window_pos(
+                self.server, self.windows[:2], binlog_dir=self.tmp_dir.name,
+                mirror_bytes=1000)],
+            [("binlog.000001", 120), ("binlog.000001", 91)])
+        mock_fetch_pos.assert_called_once()
+        self.assertEqual(mock_fetch_pos.call_args[0][1], "binlog.000002")
+
+    @mock.patch("binlog_fetch.prune_binlogs")
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_find_window_pos(self, mock_fetch, mock_prune):
+
+        """Function:  test_find_window_pos
+
+        Description:  Test that every window is answered from one pass over
+            the local binary logs.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        mock_prune.side_effect = lambda server, log_files, *args: log_files
+
+        with mock.patch("binlog_reader.read_binlog_events",
+                        side_effect=binlog_reader.read_binlog_events) \
+                as mock_read:
+            pos_list = binlog_search.find_window_pos(
+                self.server, self.windows, binlog_dir=self.tmp_dir.name)
+
+        self.assertEqual(
+            [(pos.file, pos.pos) for pos in pos_list],
+            [("binlog.000002", 62), ("binlog.000001", 91),
+             ("binlog.000002", None), ("binlog.000001", 120),
+             ("binlog.000002", None), ("binlog.000002", None)])
+        self.assertEqual(mock_read.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
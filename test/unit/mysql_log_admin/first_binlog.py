@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  first_binlog.py
+
+    Description:  Unit testing of first_binlog in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/first_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_start
+        test_start_first
+        test_start_middle
+        test_start_after_last
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.first_ts = [100, 200, 300, 400]
+        self.probe = self.first_ts.__getitem__
+
+    def test_no_start(self):
+
+        """Function:  test_no_start
+
+        Description:  Test with no start time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_fetch.first_binlog(self.probe, 4, None), 0)
+
+    def test_start_first(self):
+
+        """Function:  test_start_first
+
+        Description:  Test with a start time in the first binary log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_fetch.first_binlog(self.probe, 4, 150), 0)
+
+    def test_start_middle(self):
+
+        """Function:  test_start_middle
+
+        Description:  Test with a start time in a middle binary log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_fetch.first_binlog(self.probe, 4, 350), 2)
+
+    def test_start_after_last(self):
+
+        """Function:  test_start_after_last
+
+        Description:  Test with a start time after the last binary log
+            starts.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_fetch.first_binlog(self.probe, 4, 900), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  fixed_size.py
+
+    Description:  Unit testing of fixed_size in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/fixed_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_fixed
+        test_fraction
+        test_decimal
+        test_enum
+        test_varchar
+        test_char
+
+    """
+
+    def test_fixed(self):
+
+        """Function:  test_fixed
+
+        Description:  Test with a column type of a fixed size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.fixed_size(3, b""), 4)
+
+    def test_fraction(self):
+
+        """Function:  test_fraction
+
+        Description:  Test with a TIME2 column with fractional seconds.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.fixed_size(19, b"\x06"), 6)
+
+    def test_decimal(self):
+
+        """Function:  test_decimal
+
+        Description:  Test with a DECIMAL(10,2) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.fixed_size(246, b"\x0a\x02"), 5)
+
+    def test_enum(self):
+
+        """Function:  test_enum
+
+        Description:  Test with a SET column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.fixed_size(254, b"\xf8\x02"), 2)
+
+    def test_varchar(self):
+
+        """Function:  test_varchar
+
+        Description:  Test that a VARCHAR column has no fixed size.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_catalog.fixed_size(15, b"\x40\x00"))
+
+    def test_char(self):
+
+        """Function:  test_char
+
+        Description:  Test that a CHAR column has no fixed size.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_catalog.fixed_size(254, b"\xfe\x0a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# Classification (U)
+
+"""Program:  flush_checkpoint.py
+
+    Description:  Unit testing of flush_checkpoint in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/flush_checkpoint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import collections
+import queue
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_state(workers):
+
+    """Function:  crt_state
+
+    Description:  Creates the parallel applier state with mysql client
+        sessions that write to memory.
+
+    Arguments:
+        (input) workers -> Number of mysql client sessions
+        (output) -> Dictionary of the parallel applier state
+
+    """
+
+    procs = [mock.Mock(stdin=io.BytesIO()) for _ in range(workers)]
+
+    return {"procs": procs, "acks": queue.Queue(), "outstanding": {},
+            "depth": [0] * workers,
+            "sessions": [{} for _ in range(workers)], "session": {},
+            "unit": None, "targets": [], "txns": 0, "bytes": 0,
+            "binlog": "binlog1", "skipped": 0, "ckpt": None,
+            "units": collections.OrderedDict(), "skip": set(),
+            "profile": False, "files": [], "gtid": False, "closed": False,
+            "in_txn": False}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_flush_checkpoint
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = crt_state(2)
+        self.state["ckpt"] = {"path": "/dir/restore.ckpt"}
+        self.state["units"].update(
+            [(1, ["binlog1", 100, 150, False]),
+             (2, ["binlog1", 150, 200, False])])
+
+    @mock.patch("binlog_apply.save_checkpoint")
+    def test_flush_checkpoint(self, mock_save):
+
+        """Function:  test_flush_checkpoint
+
+        Description:  Test that the transactions committed before the
+            sessions exited are marked before the checkpoint is written.
+
+        Arguments:
+
+        """
+
+        self.state["acks"].put((0, 2))
+        self.state["acks"].put((1, 5))
+        binlog_apply.flush_checkpoint(self.state)
+
+        self.assertEqual(
+            [unit[3] for unit in self.state["units"].values()],
+            [False, True])
+        self.assertTrue(self.state["acks"].empty())
+        mock_save.assert_called_once_with(self.state, force=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  follow_binlog.py
+
+    Description:  Unit testing of follow_binlog in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/follow_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import collections
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_error
+        test_follow_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = (
+            b"DELIMITER /*!*/;\n# at 4\n"
+            b"#240102  3:04:05 server id 1  end_log_pos 126 CRC32 0x1a2b3c4d"
+            b" \tStart: binlog v 4, server v 8.0.36 created\n"
+            b"#700101  0:00:00 server id 1  end_log_pos 0 CRC32 0x1a2b3c4d"
+            b" \tRotate to binlog.000002  pos: 4\n# at 157\n"
+            b"#240102  3:04:06 server id 1  end_log_pos 236 CRC32 0x1a2b3c4d"
+            b" \tAnonymous_GTID\tlast_committed=0\n# at 236\n"
+            b"#240102  3:04:06 server id 1  end_log_pos 315"
+            b" \tQuery\tthread_id=8\nBEGIN\n/*!*/;\n# at 315\n"
+            b"#240102  3:04:06 server id 1  end_log_pos 346"
+            b" \tXid = 12\nCOMMIT/*!*/;\n# at 346\n"
+            b"#240102  3:04:07 server id 1  end_log_pos 0 CRC32 0x1a2b3c4d"
+            b" \tRotate to binlog.000003  pos: 4\n")
+        self.state = {"binlog": None, "pos": None, "events": 0,
+                      "latency": collections.deque(), "end": None}
+        self.out = io.BytesIO()
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test that only the output up to the last transaction
+            boundary is written when mysqlbinlog exits with an error.
+
+        Arguments:
+
+        """
+
+        data = self.data[:self.data.index(b"# at 315")]
+        cmd = ["sh", "-c", "printf '%s# at 3' \"$1\"; exit 2", "sh",
+               data.decode()]
+
+        self.assertEqual(
+            binlog_display.follow_binlog(cmd, self.out, self.state), 2)
+        self.assertEqual(
+            self.out.getvalue(), data[:data.index(b"# at 157")])
+        self.assertEqual(
+            (self.state["binlog"], self.state["pos"]), ("binlog.000002", 157))
+
+    def test_follow_binlog(self):
+
+        """Function:  test_follow_binlog
+
+        Description:  Test that the output is written and tracked.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_display.follow_binlog(
+                ["printf", "%s", self.data.decode()], self.out, self.state),
+            0)
+        self.assertEqual(self.out.getvalue(), self.data)
+        self.assertEqual(
+            (self.state["binlog"], self.state["pos"]), ("binlog.000003", 4))
+        self.assertEqual(self.state["events"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+# Classification (U)
+
+"""Program:  follow_log_entries.py
+
+    Description:  Unit testing of follow_log_entries in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/follow_log_entries.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-s": "start", "-t": "stop", "-p": "/dir/path"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def follow_binlog(cmd, out, state):
+
+    """Function:  follow_binlog
+
+    Description:  Stub of follow_binlog which moves to binlog3 and fails
+        the first time it is called.
+
+    Arguments:
+        (input) cmd -> mysqlbinlog command line list
+        (input) out -> Binary output file
+        (input) state -> Follow state dictionary
+
+    """
+
+    out.write(cmd[0])
+
+    if state["binlog"] == "binlog3":
+        return 0
+
+    state["binlog"], state["pos"] = "binlog3", 700
+    state["events"] += 1
+
+    return 1
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_interrupt
+        test_backoff
+        test_restart
+        test_follow_log_entries
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.binlog_list = ["binlog1", "binlog2"]
+        self.opt_arg_list = ["--force-read"]
+        self.pos_args = ["--start-position=120"]
+        self.out = io.BytesIO()
+        self.logs = [{"Log_name": "binlog2", "File_size": 500}]
+
+    @mock.patch("sys.stderr", new_callable=io.StringIO)
+    @mock.patch("binlog_display.follow_binlog",
+                mock.Mock(side_effect=KeyboardInterrupt))
+    @mock.patch("binlog_fetch.crt_binlog_cmd", mock.Mock())
+    def test_interrupt(self, mock_err):
+
+        """Function:  test_interrupt
+
+        Description:  Test that the latency stats are printed when
+            interrupted.
+
+        Arguments:
+
+        """
+
+        binlog_display.follow_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        self.assertEqual(mock_err.getvalue(), "Events: 0\n")
+
+    @mock.patch("sys.stderr", io.StringIO())
+    @mock.patch("binlog_display.time.sleep")
+    @mock.patch("binlog_display.follow_binlog")
+    @mock.patch("binlog_fetch.crt_binlog_cmd", mock.Mock())
+    def test_backoff(self, mock_follow, mock_sleep):
+
+        """Function:  test_backoff
+
+        Description:  Test that the restart delay doubles while no events
+            arrive.
+
+        Arguments:
+
+        """
+
+        mock_follow.side_effect = [1] * 8 + [0]
+
+        binlog_display.follow_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list],
+            [1, 2, 4, 8, 16, 32, 60, 60])
+
+    @mock.patch("sys.stderr", io.StringIO())
+    @mock.patch("binlog_display.time.sleep", mock.Mock())
+    @mock.patch("binlog_display.follow_binlog",
+                mock.Mock(side_effect=follow_binlog))
+    @mock.patch("binlog_fetch.crt_binlog_cmd")
+    def test_restart(self, mock_cmd):
+
+        """Function:  test_restart
+
+        Description:  Test that mysqlbinlog is restarted at the last event
+            position.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = [b"cmd"]
+
+        binlog_display.follow_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        self.assertEqual(mock_cmd.call_args_list, [
+            mock.call(self.server, "start", "stop", ["binlog1"],
+                      self.opt_arg_list + ["--stop-never"] + self.pos_args,
+                      "/dir/path"),
+            mock.call(self.server, None, "stop", ["binlog3"],
+                      self.opt_arg_list + ["--stop-never",
+                                           "--start-position=700"],
+                      "/dir/path")])
+
+    @mock.patch("sys.stderr", io.StringIO())
+    @mock.patch("binlog_display.follow_binlog", mock.Mock(return_value=0))
+    @mock.patch("binlog_display.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.crt_binlog_cmd")
+    def test_follow_log_entries(self, mock_cmd, mock_fetch):
+
+        """Function:  test_follow_log_entries
+
+        Description:  Test that following starts at the end of the active
+            binary log.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-s"]
+        mock_fetch.return_value = self.logs
+
+        binlog_display.follow_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_cmd.assert_called_once_with(
+            self.server, None, "stop", ["binlog2"],
+            self.opt_arg_list + ["--stop-never", "--start-position=500"],
+            "/dir/path")
+
+
+if __name__ == "__main__":
+    unittest.main()
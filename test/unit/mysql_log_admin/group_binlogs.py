@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  group_binlogs.py
+
+    Description:  Unit testing of group_binlogs in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/group_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_binlog_dir
+        test_empty_list
+        test_group_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog_list = [
+            "binlog.000001", "binlog.000002", "binlog.000003",
+            "binlog.000004"]
+
+        for name in ["binlog.000001", "binlog.000002", "binlog.000004"]:
+            with open(os.path.join(self.tmp_dir.name, name), "wb") as f_hdlr:
+                f_hdlr.write(b"")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_no_binlog_dir(self):
+
+        """Function:  test_no_binlog_dir
+
+        Description:  Test with no binary log directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.group_binlogs(self.binlog_list),
+            [(None, self.binlog_list)])
+
+    def test_empty_list(self):
+
+        """Function:  test_empty_list
+
+        Description:  Test with no binary logs.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.group_binlogs([], self.tmp_dir.name), [])
+
+    def test_group_binlogs(self):
+
+        """Function:  test_group_binlogs
+
+        Description:  Test with runs of local and remote binary logs.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.group_binlogs(self.binlog_list, self.tmp_dir.name),
+            [(self.tmp_dir.name, ["binlog.000001", "binlog.000002"]),
+             (None, ["binlog.000003"]),
+             (self.tmp_dir.name, ["binlog.000004"])])
+
+
+if __name__ == "__main__":
+    unittest.main()
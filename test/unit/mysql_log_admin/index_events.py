@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  index_events.py
+
+    Description:  Unit testing of index_events in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/index_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+import tempfile
+import collections
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_early_exit
+        test_pass_through
+        test_index_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.index_file = self.binlog + ".idx"
+        self.layout = [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)]
+        binlog_files.crt_binlog(self.binlog, self.layout)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_reader.INDEX_EVENTS", 2)
+    def test_early_exit(self):
+
+        """Function:  test_early_exit
+
+        Description:  Test with the events not all read.
+
+        Arguments:
+
+        """
+
+        events = binlog_reader.index_events(
+            binlog_reader.read_binlog_events(self.binlog), self.index_file,
+            294)
+        next(events)
+        events.close()
+
+        self.assertFalse(os.path.exists(self.index_file))
+
+    @mock.patch("binlog_reader.INDEX_EVENTS", 2)
+    def test_pass_through(self):
+
+        """Function:  test_pass_through
+
+        Description:  Test the events are passed through.
+
+        Arguments:
+
+        """
+
+        events = list(binlog_reader.index_events(
+            binlog_reader.read_binlog_events(self.binlog), self.index_file,
+            294))
+
+        self.assertEqual(len(events), 10)
+
+    @mock.patch("binlog_reader.INDEX_EVENTS", 2)
+    def test_index_events(self):
+
+        """Function:  test_index_events
+
+        Description:  Test with the checkpoints written.
+
+        Arguments:
+
+        """
+
+        collections.deque(binlog_reader.index_events(
+            binlog_reader.read_binlog_events(self.binlog), self.index_file,
+            294), maxlen=0)
+
+        with open(self.index_file, "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertEqual(
+            (data[:16], [struct.unpack_from("<IQIQ", data, 16 + cnt * 24)
+                         for cnt in range(4)]),
+            (b"MLAIDX01" + struct.pack("<Q", 294),
+             [(0, 4, 0, 0), (100, 120, 100, 91), (110, 207, 110, 178),
+              (120, 294, 120, 265)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
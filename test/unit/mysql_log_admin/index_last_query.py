@@ -0,0 +1,157 @@
+# Classification (U)
+
+"""Program:  index_last_query.py
+
+    Description:  Unit testing of index_last_query in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/index_last_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_query
+        test_tail_scan
+        test_checkpoint
+        test_start_ts
+        test_index_last_query
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.index_file = self.binlog + ".idx"
+        self.layout = [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)]
+        binlog_files.crt_binlog(self.binlog, self.layout)
+
+        with mock.patch("binlog_reader.INDEX_EVENTS", 2):
+            binlog_reader.build_binlog_index(self.binlog, self.index_file)
+
+        self.data = binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000001", 294)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.data.close()
+        self.tmp_dir.cleanup()
+
+    def test_no_query(self):
+
+        """Function:  test_no_query
+
+        Description:  Test with no Query between the timestamps.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_reader.index_last_query(
+            self.binlog, self.data, 111, 115))
+
+    def test_tail_scan(self):
+
+        """Function:  test_tail_scan
+
+        Description:  Test with the Query found after the checkpoint.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.index_last_query(self.binlog, self.data, 100, 121),
+            265)
+
+    def test_checkpoint(self):
+
+        """Function:  test_checkpoint
+
+        Description:  Test with the Query found in the checkpoint.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.index_last_query(
+                self.binlog, self.data, stop_ts=115), 178)
+
+    def test_start_ts(self):
+
+        """Function:  test_start_ts
+
+        Description:  Test with only start timestamp passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.index_last_query(
+                self.binlog, self.data, start_ts=115), 265)
+
+    def test_index_last_query(self):
+
+        """Function:  test_index_last_query
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.index_last_query(self.binlog, self.data), 265)
+
+
+if __name__ == "__main__":
+    unittest.main()
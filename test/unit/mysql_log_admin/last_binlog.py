@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  last_binlog.py
+
+    Description:  Unit testing of last_binlog in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/last_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_stop
+        test_stop_middle
+        test_stop_before_first
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.first_ts = [100, 200, 300, 400]
+        self.probe = self.first_ts.__getitem__
+
+    def test_no_stop(self):
+
+        """Function:  test_no_stop
+
+        Description:  Test with no stop time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.last_binlog(self.probe, 1, 4, None), 3)
+
+    def test_stop_middle(self):
+
+        """Function:  test_stop_middle
+
+        Description:  Test with a stop time in a middle binary log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.last_binlog(self.probe, 0, 4, 250), 1)
+
+    def test_stop_before_first(self):
+
+        """Function:  test_stop_before_first
+
+        Description:  Test with a stop time before the first binary log
+            starts.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_fetch.last_binlog(self.probe, 0, 4, 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# Classification (U)
+
+"""Program:  last_query_pos.py
+
+    Description:  Unit testing of last_query_pos in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/last_query_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def event(tstamp, type_code, log_pos):
+
+    """Function:  event
+
+    Description:  Create a BinlogEvent.
+
+    Arguments:
+        (input) tstamp -> Event timestamp
+        (input) type_code -> Event type code
+        (input) log_pos -> End log position
+
+    """
+
+    return binlog_reader.BinlogEvent(
+        tstamp, type_code, 1, 29, log_pos, 0, log_pos - 29, None)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_events
+        test_stop_early
+        test_stop_ts
+        test_start_ts
+        test_last_query_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.events = [
+            event(100, 15, 33), event(100, 2, 62), event(110, 2, 91),
+            event(120, 16, 120)]
+
+    def test_no_events(self):
+
+        """Function:  test_no_events
+
+        Description:  Test with no events.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_reader.last_query_pos([]))
+
+    def test_stop_early(self):
+
+        """Function:  test_stop_early
+
+        Description:  Test that no events are read after the first event at
+            or after the stop timestamp.
+
+        Arguments:
+
+        """
+
+        events = iter(self.events + [event(105, 2, 149)])
+
+        self.assertEqual(
+            binlog_reader.last_query_pos(events, stop_ts=110), 62)
+        self.assertEqual(next(events), event(120, 16, 120))
+
+    def test_stop_ts(self):
+
+        """Function:  test_stop_ts
+
+        Description:  Test with a stop timestamp.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.last_query_pos(self.events, stop_ts=110), 62)
+
+    def test_start_ts(self):
+
+        """Function:  test_start_ts
+
+        Description:  Test with a start timestamp after the Query events.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            binlog_reader.last_query_pos(self.events, start_ts=111))
+
+    def test_last_query_pos(self):
+
+        """Function:  test_last_query_pos
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_reader.last_query_pos(self.events), 91)
+
+
+if __name__ == "__main__":
+    unittest.main()
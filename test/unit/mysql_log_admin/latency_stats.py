@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  latency_stats.py
+
+    Description:  Unit testing of latency_stats in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/latency_stats.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import collections
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_latency
+        test_latency_stats
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {"events": 0, "latency": collections.deque()}
+
+    def test_no_latency(self):
+
+        """Function:  test_no_latency
+
+        Description:  Test with no events.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_display.latency_stats(self.state), "Events: 0")
+
+    def test_latency_stats(self):
+
+        """Function:  test_latency_stats
+
+        Description:  Test with event latencies.
+
+        Arguments:
+
+        """
+
+        self.state["events"] = 4
+        self.state["latency"].extend([0.004, 0.001, 0.002, 0.009])
+
+        self.assertEqual(
+            binlog_display.latency_stats(self.state),
+            "Events: 4, Latency ms: avg 4, p50 2, p99 4, max 9")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  latest_in_ranges.py
+
+    Description:  Unit testing of latest_in_ranges in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/latest_in_ranges.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_range
+        test_single_value
+        test_all_ranges
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.values = [(0, 5), (-1, -1), (2, 7), (1, 9), (2, 3), (-1, -1),
+                       (0, 1)]
+
+    def test_empty_range(self):
+
+        """Function:  test_empty_range
+
+        Description:  Test with a range with no values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.latest_in_ranges(self.values, [(3, 2)]), [None])
+
+    def test_single_value(self):
+
+        """Function:  test_single_value
+
+        Description:  Test with a list of one value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.latest_in_ranges([(0, 5)], [(0, 0)]), [(0, 5)])
+
+    def test_all_ranges(self):
+
+        """Function:  test_all_ranges
+
+        Description:  Test every range against the largest value found by a
+            linear scan.
+
+        Arguments:
+
+        """
+
+        ranges = [(first, last) for first in range(len(self.values))
+                  for last in range(first, len(self.values))]
+
+        self.assertEqual(
+            binlog_search.latest_in_ranges(self.values, ranges),
+            [max(self.values[first:last + 1]) for first, last in ranges])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  length_prefix.py
+
+    Description:  Unit testing of length_prefix in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/length_prefix.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_blob
+        test_varchar
+        test_long_varchar
+        test_char
+        test_long_char
+
+    """
+
+    def test_blob(self):
+
+        """Function:  test_blob
+
+        Description:  Test with a MEDIUMBLOB column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.length_prefix(252, b"\x03"), 3)
+
+    def test_varchar(self):
+
+        """Function:  test_varchar
+
+        Description:  Test with a VARCHAR(64) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.length_prefix(15, b"\x40\x00"), 1)
+
+    def test_long_varchar(self):
+
+        """Function:  test_long_varchar
+
+        Description:  Test with a VARCHAR(300) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.length_prefix(15, b"\x2c\x01"), 2)
+
+    def test_char(self):
+
+        """Function:  test_char
+
+        Description:  Test with a CHAR(10) column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.length_prefix(254, b"\xfe\x0a"), 1)
+
+    def test_long_char(self):
+
+        """Function:  test_long_char
+
+        Description:  Test with a CHAR column longer than 255 bytes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_catalog.length_prefix(254, b"\xee\x2c"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
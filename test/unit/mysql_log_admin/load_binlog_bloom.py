@@ -0,0 +1,154 @@
+# Classification (U)
+
+"""Program:  load_binlog_bloom.py
+
+    Description:  Unit testing of load_binlog_bloom in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/load_binlog_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_local
+        test_partial
+        test_existing
+        test_load_binlog_bloom
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index_dir = os.path.join(self.tmp_dir.name, "index")
+        self.binlog_dir = os.path.join(self.tmp_dir.name, "binlogs")
+        os.mkdir(self.index_dir)
+        os.mkdir(self.binlog_dir)
+
+        with open(os.path.join(self.binlog_dir, "binlog.000001"),
+                  "wb") as f_hdlr:
+            f_hdlr.write(b"\0" * 100)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_filter.build_binlog_bloom")
+    def test_not_local(self, mock_build):
+
+        """Function:  test_not_local
+
+        Description:  Test with no Bloom filter and no local copy.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_filter.load_binlog_bloom(
+            self.index_dir, "binlog.000001", 100))
+        mock_build.assert_not_called()
+
+    @mock.patch("binlog_filter.build_binlog_bloom")
+    def test_partial(self, mock_build):
+
+        """Function:  test_partial
+
+        Description:  Test that a local copy of another size is not read.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_filter.load_binlog_bloom(
+            self.index_dir, "binlog.000001", 200, self.binlog_dir))
+        mock_build.assert_not_called()
+
+    @mock.patch("binlog_filter.build_binlog_bloom")
+    @mock.patch("binlog_filter.open_binlog_bloom")
+    def test_existing(self, mock_open, mock_build):
+
+        """Function:  test_existing
+
+        Description:  Test that an existing Bloom filter is not built again.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = b"bloom"
+
+        self.assertEqual(
+            binlog_filter.load_binlog_bloom(
+                self.index_dir, "binlog.000001", 100, self.binlog_dir),
+            b"bloom")
+        mock_build.assert_not_called()
+
+    @mock.patch("binlog_filter.build_binlog_bloom")
+    @mock.patch("binlog_filter.open_binlog_bloom")
+    def test_load_binlog_bloom(self, mock_open, mock_build):
+
+        """Function:  test_load_binlog_bloom
+
+        Description:  Test that a missing Bloom filter is built from the
+            complete local copy and opened.
+
+        Arguments:
+
+        """
+
+        mock_open.side_effect = [None, b"bloom"]
+
+        self.assertEqual(
+            binlog_filter.load_binlog_bloom(
+                self.index_dir, "binlog.000001", 100, self.binlog_dir, 50),
+            b"bloom")
+        mock_build.assert_called_once_with(
+            os.path.join(self.binlog_dir, "binlog.000001"),
+            os.path.join(self.index_dir, "binlog.000001.blm"), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@
 
 """Program:  load_log.py
 
-    Description:  Unit testing of load_log in mysql_log_admin.py.
+    Description:  Unit testing of load_log in binlog_restore.py.
 
     Usage:
         test/unit/mysql_log_admin/load_log.py
@@ -21,13 +21,36 @@ import mock
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_restore                           # pylint:disable=E0401,C0413
+import binlog_filter                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_tee                               # pylint:disable=E0401,C0413
+import binlog_apply                             # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
 
 
+def plan_binlog_pos(server, args, binlog_list, *opt_args):
+
+    """Function:  plan_binlog_pos
+
+    Description:  Stub holder for binlog_search.plan_binlog_pos function.
+
+    Arguments:
+
+    """
+
+    status = True
+
+    if server and args and opt_args:
+        status = True
+
+    return (binlog_list, [], []) if status else ([], [], [])
+
+
 class ArgParser():
 
     """Class:  ArgParser
@@ -52,7 +75,7 @@ class ArgParser():
         """
 
         self.args_array = {
-            "-e": "mysql_cfg", "-d": "config", "-s": "start_time",
+            "-e": ["mysql_cfg"], "-d": "config", "-s": "start_time",
             "-t": "end_time", "-p": "/path"}
 
     def get_val(self, skey, def_val=None):
@@ -84,43 +107,6 @@ class ArgParser():
         return path
 
 
-class SubProcess():                                     # pylint:disable=R0903
-
-    """Class:  SubProcess
-
-    Description:  Class stub holder for subprocess class.
-
-    Methods:
-        __init__
-        wait
-
-    """
-
-    def __init__(self):
-
-        """Method:  __init__
-
-        Description:  Class initialization.
-
-        Arguments:
-
-        """
-
-        self.stdout = ["binlog1"]
-
-    def wait(self):
-
-        """Method:  wait
-
-        Description:  Wait method.
-
-        Arguments:
-
-        """
-
-        return True
-
-
 class Server():                                         # pylint:disable=R0903
 
     """Class:  Server
@@ -178,6 +164,18 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_apply
+        test_apply_error
+        test_resume
+        test_resume_missing
+        test_profile
+        test_tee
+        test_tee_applier
+        test_throttle
+        test_filter
+        test_bloom
+        test_stats
+        test_plan_pos
         test_connection_error
         test_connection_success
         test_list_fail
@@ -197,7 +195,6 @@ class UnitTest(unittest.TestCase):
         """
 
         self.server = Server()
-        self.proc = SubProcess()
         self.args = ArgParser()
         self.opt_arg_list = ["--force-read", "--read-from-remote-server"]
         self.cmd_list = ["command", "options"]
@@ -205,8 +202,418 @@ class UnitTest(unittest.TestCase):
         self.status2 = (False, "Error Message")
         self.binlog_list = ["binlog1", "binlog2"]
 
-    @mock.patch("mysql_log_admin.mysql_libs.create_instance")
-    @mock.patch("mysql_log_admin.process_logs_list")
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_apply.apply_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_apply(                                     # pylint:disable=R0913
+            self, mock_logs, mock_inst, mock_cmd, mock_apply, mock_restore):
+
+        """Function:  test_apply
+
+        Description:  Test with more than one mysql client session.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "4"
+        self.args.args_array["-x"] = True
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_apply.return_value = (1024, 10)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+        self.assertEqual(mock_apply.call_args[0][1:],
+                         (self.cmd_list, 4, [["binlog1", "binlog2"]], None,
+                          None, None, None, None))
+        mock_restore.assert_not_called()
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_apply.apply_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_apply_error(self, mock_logs, mock_inst, mock_cmd, mock_apply):
+
+        """Function:  test_apply_error
+
+        Description:  Test with a mysql client session that fails.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "2"
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_apply.side_effect = ValueError("Error Message")
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_apply.read_checkpoint")
+    @mock.patch("binlog_apply.apply_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_resume(                                    # pylint:disable=R0913
+            self, mock_logs, mock_inst, mock_cmd, mock_apply, mock_read):
+
+        """Function:  test_resume
+
+        Description:  Test that the restore continues from the checkpoint.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = "/dir/restore.ckpt"
+        self.args.args_array["-r"] = True
+        resume = {"binlog": "binlog2", "pos": 900, "applied": []}
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_read.return_value = resume
+        mock_apply.return_value = (1024, 10)
+
+        self.assertFalse(binlog_restore.load_log(
+            self.server, self.args, self.opt_arg_list))
+
+        binlog_cmds = mock_apply.call_args[0][0]
+        self.assertEqual(binlog_cmds[0][-1:], ["binlog2"])
+        self.assertIn("--start-position=900", binlog_cmds[0])
+        self.assertEqual(
+            mock_apply.call_args[0][1:],
+            (self.cmd_list, 1, [["binlog2"]], "/dir/restore.ckpt", resume,
+             None, None, None))
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_apply.read_checkpoint")
+    @mock.patch("binlog_apply.apply_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_resume_missing(                            # pylint:disable=R0913
+            self, mock_logs, mock_inst, mock_cmd, mock_apply, mock_read):
+
+        """Function:  test_resume_missing
+
+        Description:  Test with a checkpoint binary log that is not in the
+            binary logs to restore.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = "/dir/restore.ckpt"
+        self.args.args_array["-r"] = True
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_read.return_value = {"binlog": "binlog9", "pos": 4}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+        mock_apply.assert_not_called()
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_apply.apply_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_profile(                                   # pylint:disable=R0913
+            self, mock_logs, mock_inst, mock_cmd, mock_apply, mock_restore):
+
+        """Function:  test_profile
+
+        Description:  Test with the fast restore profile on one session.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-q"] = True
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_apply.return_value = (1024, 10)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+        self.assertEqual(mock_apply.call_args[0][1:],
+                         (self.cmd_list, 1, [["binlog1", "binlog2"]], None,
+                          None, True, None, None))
+        mock_restore.assert_not_called()
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_tee.tee_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_tee(self, mock_logs, mock_inst, mock_cmd, mock_tee):
+
+        """Function:  test_tee
+
+        Description:  Test that the binary logs are restored to several
+            targets from one read.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-e"] = ["mysql_cfg", "mysql_cfg2"]
+        self.args.args_array["-F"] = "8"
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.side_effect = [self.server, Server()]
+        mock_cmd.side_effect = [self.cmd_list, ["command2"], ["mysqlbinlog"]]
+        mock_tee.return_value = (None, [0, 1])
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+        self.assertEqual(mock_tee.call_args[0][1:],
+                         ([self.cmd_list, ["command2"]], None, 8388608,
+                          None, None))
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_apply.apply_binlog")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_tee_applier(self, mock_logs, mock_inst, mock_apply):
+
+        """Function:  test_tee_applier
+
+        Description:  Test with several targets and -a.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-e"] = ["mysql_cfg", "mysql_cfg2"]
+        self.args.args_array["-a"] = "2"
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.side_effect = [self.server, Server()]
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+        mock_apply.assert_not_called()
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_tee.stop_throttle",
+                mock.Mock(return_value=1048576.0))
+    @mock.patch("binlog_tee.start_throttle")
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_throttle(                                  # pylint:disable=R0913
+            self, mock_logs, mock_inst, mock_cmd, mock_restore, mock_start):
+
+        """Function:  test_throttle
+
+        Description:  Test that the restore is throttled.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = "8"
+        self.args.args_array["-x"] = True
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_restore.return_value = (1024, 10)
+        mock_start.return_value = {"rate": 1048576.0}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+        self.assertEqual(mock_restore.call_args[1],
+                         {"throttle": {"rate": 1048576.0}, "filt": None})
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_filter(self, mock_logs, mock_inst, mock_cmd, mock_restore):
+
+        """Function:  test_filter
+
+        Description:  Test that the restore is filtered.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-B"] = ["shop"]
+        self.args.args_array["-Y"] = ["Delete_rows"]
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_restore.return_value = None
+
+        self.assertFalse(binlog_restore.load_log(
+            self.server, self.args, self.opt_arg_list))
+
+        self.assertEqual(
+            mock_restore.call_args[1]["filt"],
+            {"dbs": ["shop"], "skip_types": ["delete_rows"]})
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_filter.prune_bloom_binlogs")
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_bloom(                                     # pylint:disable=R0913
+            self, mock_logs, mock_inst, mock_cmd, mock_restore, mock_prune):
+
+        """Function:  test_bloom
+
+        Description:  Test that only the binary logs the Bloom filters do not
+            rule out are restored.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-K"] = ["shop.orders"]
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_restore.return_value = None
+        mock_prune.return_value = (["binlog2"], [], [])
+
+        self.assertFalse(binlog_restore.load_log(
+            self.server, self.args, self.opt_arg_list))
+
+        mock_prune.assert_called_once_with(
+            self.server, self.args, self.binlog_list, [], [], None)
+        binlog_cmds = mock_restore.call_args[0][0]
+        self.assertEqual(len(binlog_cmds), 1)
+        self.assertIn("binlog2", binlog_cmds[0])
+        self.assertNotIn("binlog1", binlog_cmds[0])
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_stats(self, mock_logs, mock_inst, mock_cmd, mock_restore):
+
+        """Function:  test_stats
+
+        Description:  Test with the bytes and events restored printed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-x"] = True
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_restore.return_value = (1024, 10)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(binlog_restore.load_log(
+                self.server, self.args, self.opt_arg_list))
+
+        self.assertTrue(mock_restore.call_args[0][2])
+        self.assertEqual(
+            mock_restore.call_args[0][0][-1][-2:], self.binlog_list)
+
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos")
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_plan_pos(                                  # pylint:disable=R0913
+            self, mock_logs, mock_plan, mock_inst, mock_cmd, mock_restore):
+
+        """Function:  test_plan_pos
+
+        Description:  Test with start and stop positions from the planning
+            step.
+
+        Arguments:
+
+        """
+
+        mock_logs.return_value = self.status, self.binlog_list
+        mock_plan.return_value = (
+            self.binlog_list[1:], ["--start-position=207"],
+            ["--stop-position=900"])
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.cmd_list
+        mock_restore.return_value = None
+
+        self.assertFalse(binlog_restore.load_log(
+            self.server, self.args, self.opt_arg_list))
+
+        binlog_cmds = mock_restore.call_args[0][0]
+        self.assertEqual(len(binlog_cmds), 1)
+        self.assertEqual(binlog_cmds[0][-1:], self.binlog_list[1:])
+        self.assertIn("--start-position=207", binlog_cmds[0])
+        self.assertIn("--stop-position=900", binlog_cmds[0])
+
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
     def test_connection_error(self, mock_logs, mock_inst):
 
         """Function:  test_connection_error
@@ -223,18 +630,19 @@ class UnitTest(unittest.TestCase):
         mock_inst.return_value = self.server
 
         with gen_libs.no_std_out():
-            self.assertFalse(mysql_log_admin.load_log(
+            self.assertFalse(binlog_restore.load_log(
                 self.server, self.args, self.opt_arg_list))
 
-    @mock.patch("mysql_log_admin.mysql_libs.disconnect",
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_log_admin.subprocess.Popen")
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.crt_cmd")
-    @mock.patch("mysql_log_admin.mysql_libs.create_instance")
-    @mock.patch("mysql_log_admin.process_logs_list")
-    def test_connection_success(                        # pylint:disable=R0913
-            self, mock_logs, mock_inst, mock_cmd, mock_fetch, mock_popen):
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_connection_success(
+            self, mock_logs, mock_inst, mock_cmd, mock_restore):
 
         """Function:  test_connection_success
 
@@ -247,13 +655,14 @@ class UnitTest(unittest.TestCase):
         mock_logs.return_value = self.status, self.binlog_list
         mock_inst.return_value = self.server
         mock_cmd.return_value = self.cmd_list
-        mock_fetch.return_value = "Process"
-        mock_popen.return_value = self.proc
+        mock_restore.return_value = None
 
-        self.assertFalse(mysql_log_admin.load_log(
+        self.assertFalse(binlog_restore.load_log(
             self.server, self.args, self.opt_arg_list))
 
-    @mock.patch("mysql_log_admin.process_logs_list")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
     def test_list_fail(self, mock_logs):
 
         """Function:  test_list_fail
@@ -267,18 +676,19 @@ class UnitTest(unittest.TestCase):
         mock_logs.return_value = self.status2, self.binlog_list
 
         with gen_libs.no_std_out():
-            self.assertFalse(mysql_log_admin.load_log(
+            self.assertFalse(binlog_restore.load_log(
                 self.server, self.args, self.opt_arg_list))
 
-    @mock.patch("mysql_log_admin.mysql_libs.disconnect",
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_log_admin.subprocess.Popen")
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.crt_cmd")
-    @mock.patch("mysql_log_admin.mysql_libs.create_instance")
-    @mock.patch("mysql_log_admin.process_logs_list")
-    def test_no_opt_arg_lists(                          # pylint:disable=R0913
-            self, mock_logs, mock_inst, mock_cmd, mock_fetch, mock_popen):
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_no_opt_arg_lists(
+            self, mock_logs, mock_inst, mock_cmd, mock_restore):
 
         """Function:  test_no_opt_arg_lists
 
@@ -291,21 +701,21 @@ class UnitTest(unittest.TestCase):
         mock_logs.return_value = self.status, self.binlog_list
         mock_inst.return_value = self.server
         mock_cmd.return_value = self.cmd_list
-        mock_fetch.return_value = "Process"
-        mock_popen.return_value = self.proc
+        mock_restore.return_value = None
 
-        self.assertFalse(mysql_log_admin.load_log(
+        self.assertFalse(binlog_restore.load_log(
             self.server, self.args, []))
 
-    @mock.patch("mysql_log_admin.mysql_libs.disconnect",
+    @mock.patch("binlog_restore.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_log_admin.subprocess.Popen")
-    @mock.patch("mysql_log_admin.fetch_binlog")
-    @mock.patch("mysql_log_admin.mysql_libs.crt_cmd")
-    @mock.patch("mysql_log_admin.mysql_libs.create_instance")
-    @mock.patch("mysql_log_admin.process_logs_list")
-    def test_load_log(                                  # pylint:disable=R0913
-            self, mock_logs, mock_inst, mock_cmd, mock_fetch, mock_popen):
+    @mock.patch("binlog_restore.restore_binlog")
+    @mock.patch("binlog_restore.mysql_libs.crt_cmd")
+    @mock.patch("binlog_restore.mysql_libs.create_instance")
+    @mock.patch("binlog_search.plan_binlog_pos",
+                mock.Mock(side_effect=plan_binlog_pos))
+    @mock.patch("binlog_fetch.process_logs_list")
+    def test_load_log(
+            self, mock_logs, mock_inst, mock_cmd, mock_restore):
 
         """Function:  test_load_log
 
@@ -318,10 +728,9 @@ class UnitTest(unittest.TestCase):
         mock_logs.return_value = self.status, self.binlog_list
         mock_inst.return_value = self.server
         mock_cmd.return_value = self.cmd_list
-        mock_fetch.return_value = "Process"
-        mock_popen.return_value = self.proc
+        mock_restore.return_value = None
 
-        self.assertFalse(mysql_log_admin.load_log(
+        self.assertFalse(binlog_restore.load_log(
             self.server, self.args, self.opt_arg_list))
 
 
@@ -22,6 +22,7 @@ import mock
 # Local
 sys.path.append(os.getcwd())
 import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_service                           # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
@@ -153,7 +154,7 @@ class ArgParser():
 
         return self.args_array
 
-    def get_val(self, skey, def_val):
+    def get_val(self, skey, def_val=None):
 
         """Method:  get_val
 
@@ -217,6 +218,7 @@ class UnitTest(unittest.TestCase):
         test_arg_parse2_true
         test_help_true
         test_help_false
+        test_client
         test_arg_req_false
         test_arg_req_true
         test_arg_xor_false
@@ -317,6 +319,33 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_log_admin.main())
 
+    @mock.patch("mysql_log_admin.gen_class.ProgramLock")
+    @mock.patch("binlog_service.send_request")
+    @mock.patch("mysql_log_admin.gen_libs.help_func")
+    @mock.patch("mysql_log_admin.gen_class.ArgParser")
+    def test_client(self, mock_arg, mock_help, mock_send, mock_lock):
+
+        """Function:  test_client
+
+        Description:  Test that a -u request is sent to the service.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-u"] = "/dir/sock"
+        self.args.opt_req2 = False
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with mock.patch("sys.argv", ["mysql_log_admin.py", "-u", "/dir/sock",
+                                     "-L", "-s", "2024-01-01 00:00:00"]):
+            self.assertFalse(mysql_log_admin.main())
+
+        mock_send.assert_called_once_with(
+            "/dir/sock", ["-L", "-s", "2024-01-01 00:00:00"])
+        mock_lock.assert_not_called()
+
     @mock.patch("mysql_log_admin.gen_libs.help_func")
     @mock.patch("mysql_log_admin.gen_class.ArgParser")
     def test_arg_req_false(self, mock_arg, mock_help):
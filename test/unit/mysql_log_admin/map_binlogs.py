@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  map_binlogs.py
+
+    Description:  Unit testing of map_binlogs in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/map_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_single
+        test_process
+        test_threads
+        test_workers_none
+        test_map_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.arg_list = [(1, 2), (3, 4), (5, 6)]
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no arguments.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_fetch.map_binlogs(pow, []), [])
+
+    def test_single(self):
+
+        """Function:  test_single
+
+        Description:  Test with a single set of arguments and workers.
+
+        Arguments:
+
+        """
+
+        with mock.patch("binlog_fetch.concurrent.futures") as mock_pool:
+            self.assertEqual(
+                binlog_fetch.map_binlogs(pow, [(2, 3)], 4), [8])
+            mock_pool.ThreadPoolExecutor.assert_not_called()
+
+    def test_process(self):
+
+        """Function:  test_process
+
+        Description:  Test with process workers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.map_binlogs(pow, self.arg_list, 2, process=True),
+            [1, 81, 15625])
+
+    def test_threads(self):
+
+        """Function:  test_threads
+
+        Description:  Test with thread workers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.map_binlogs(pow, self.arg_list, 2),
+            [1, 81, 15625])
+
+    def test_workers_none(self):
+
+        """Function:  test_workers_none
+
+        Description:  Test with workers set to None.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.map_binlogs(pow, self.arg_list, None),
+            [1, 81, 15625])
+
+    def test_map_binlogs(self):
+
+        """Function:  test_map_binlogs
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.map_binlogs(pow, self.arg_list), [1, 81, 15625])
+
+
+if __name__ == "__main__":
+    unittest.main()
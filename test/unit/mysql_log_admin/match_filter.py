@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  match_filter.py
+
+    Description:  Unit testing of match_filter in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/match_filter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_database
+        test_exclude
+        test_table
+        test_query_table
+        test_match_filter
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.filt = {"dbs": ["shop", "sales_*"], "skip_tables": ["*.tmp_*"],
+                     "skip_types": ["delete_rows"]}
+
+    def test_no_database(self):
+
+        """Function:  test_no_database
+
+        Description:  Test with no default database and a database list.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(binlog_filter.match_filter(
+            self.filt, None, None, "query"))
+        self.assertTrue(binlog_filter.match_filter(
+            {"skip_dbs": ["shop"]}, None, None, "query"))
+
+    def test_exclude(self):
+
+        """Function:  test_exclude
+
+        Description:  Test with an excluded event type.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(binlog_filter.match_filter(
+            self.filt, "shop", "orders", "delete_rows"))
+
+    def test_table(self):
+
+        """Function:  test_table
+
+        Description:  Test with an excluded table.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(binlog_filter.match_filter(
+            self.filt, "sales_eu", "tmp_orders", "write_rows"))
+
+    def test_query_table(self):
+
+        """Function:  test_query_table
+
+        Description:  Test that the table lists are not checked for Query
+            events.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(binlog_filter.match_filter(
+            {"tables": ["shop.orders"]}, "other", None, "query"))
+
+    def test_match_filter(self):
+
+        """Function:  test_match_filter
+
+        Description:  Test with an event that passes the filter.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(binlog_filter.match_filter(
+            self.filt, "sales_eu", "orders", "write_rows"))
+        self.assertFalse(binlog_filter.match_filter(
+            self.filt, "Shop", "orders", "write_rows"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,354 @@
+# Classification (U)
+
+"""Program:  merge_binlogs.py
+
+    Description:  Unit testing of merge_binlogs in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/merge_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def mysqlbinlog(events):
+
+    """Function:  mysqlbinlog
+
+    Description:  Create the lines of a mysqlbinlog run for a list of event
+        lines.
+
+    Arguments:
+        (input) events -> List of event lines
+
+    """
+
+    return [b"/*!50530 SET @@SESSION.PSEUDO_SLAVE_MODE=1*/;\n",
+            b"DELIMITER /*!*/;\n"] + events + [
+                b"SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /* added by"
+                b" mysqlbinlog */ /*!*/;\n", b"DELIMITER ;\n",
+                b"# End of log file\n"]
+
+
+def decode(binlogs):
+
+    """Function:  decode
+
+    Description:  Create the lines of a mysqlbinlog run over binary logs of
+        queries, writing the session lines only when they change as
+        mysqlbinlog does.
+
+    Arguments:
+        (input) binlogs -> List of (binary log name, list of (database,
+            sql_mode, autocommit) queries)
+
+    """
+
+    state = {}
+    events = []
+
+    for binlog, queries in binlogs:
+        events += [b"# at 4\n", f"#{binlog} start\n".encode()]
+
+        for pos, (dbase, sql_mode, autocommit) in enumerate(queries):
+            events += [f"# at {pos * 100 + 200}\n".encode(),
+                       b"#250101 10:00:00 Query\n", b"SET TIMESTAMP=1/*!*/;\n"]
+
+            if "thread" not in state:
+                events.append(b"SET @@session.pseudo_thread_id=8/*!*/;\n")
+                state["thread"] = 8
+
+            flags = {"foreign_key_checks": 1, "autocommit": autocommit}
+            changed = [f"@@session.{name}={value}"
+                       for name, value in flags.items()
+                       if state.get(name) != value]
+
+            if changed:
+                events.append(f"SET {', '.join(changed)}/*!*/;\n".encode())
+
+            state.update(flags)
+
+            if state.get("sql_mode") != sql_mode:
+                events.append(
+                    f"SET @@session.sql_mode={sql_mode}/*!*/;\n".encode())
+                state["sql_mode"] = sql_mode
+
+            if "charset" not in state:
+                events += [b"/*!\\C utf8mb4 *//*!*/;\n",
+                           b"SET @@session.character_set_client=255/*!*/;\n"]
+                state["charset"] = 255
+
+            if state.get("use") != dbase:
+                events.append(f"use `{dbase}`/*!*/;\n".encode())
+                state["use"] = dbase
+
+            events += [b"BEGIN\n", b"/*!*/;\n"]
+
+    return mysqlbinlog(events)
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self, workers=2):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-n": workers}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def fetch_binlog(server, start_dt, stop_dt, binlog_files, *args):
+
+    """Function:  fetch_binlog
+
+    Description:  Stub holder for binlog_fetch.fetch_binlog function.
+
+    Arguments:
+
+    """
+
+    status = True
+
+    if server and start_dt and stop_dt and args:
+        status = True
+
+    return mysqlbinlog(
+        [b"# at 4\n", f"#{binlog_files[0]} event\n".encode()]
+        if status else [])
+
+
+def fetch_range(server, start_dt, stop_dt, binlog_files, opt_arg_list, *args):
+
+    """Function:  fetch_range
+
+    Description:  Stub of fetch_binlog which writes the format description
+        event and, for a range, the event at the start position.
+
+    Arguments:
+
+    """
+
+    status = True
+
+    if server and start_dt and stop_dt and args:
+        status = True
+
+    events = [b"# at 4\n", f"#{binlog_files[0]} start\n".encode()]
+
+    for arg in opt_arg_list:
+        if status and arg.startswith("--start-position="):
+            pos = arg.split("=")[1]
+            events += [f"# at {pos}\n".encode(),
+                       f"#{binlog_files[0]} {pos} event\n".encode()]
+
+    return mysqlbinlog(events)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pos_args
+        test_chunks
+        test_single_worker
+        test_session_lines
+        test_merge_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.binlog_list = ["binlog1", "binlog2", "binlog3"]
+        self.results = mysqlbinlog(
+            [b"# at 4\n", b"#binlog1 event\n", b"# at 4\n",
+             b"#binlog2 event\n", b"# at 4\n", b"#binlog3 event\n"])
+
+    @mock.patch("binlog_display.sys.stdout")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_pos_args(self, mock_fetch, mock_out):
+
+        """Function:  test_pos_args
+
+        Description:  Test the start position arguments only go to the first
+            binary log and the stop position arguments to the last.
+
+        Arguments:
+
+        """
+
+        mock_fetch.side_effect = fetch_binlog
+        mock_out.buffer = io.BytesIO()
+
+        binlog_display.merge_binlogs(
+            self.server, ArgParser(), self.binlog_list,
+            opt_arg_list=["--opt"], pos_args=["--start-position=120"],
+            stop_args=["--stop-position=900"])
+
+        self.assertEqual(
+            [cargs[0][4] for cargs in mock_fetch.call_args_list],
+            [["--opt", "--start-position=120"], ["--opt"],
+             ["--opt", "--stop-position=900"]])
+
+    @mock.patch("binlog_display.sys.stdout")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_chunks(self, mock_fetch, mock_out):
+
+        """Function:  test_chunks
+
+        Description:  Test that the ranges of a binary log are decoded
+            separately and merged in order.
+
+        Arguments:
+
+        """
+
+        mock_fetch.side_effect = fetch_range
+        mock_out.buffer = io.BytesIO()
+
+        binlog_display.merge_binlogs(
+            self.server, ArgParser(), self.binlog_list[:2],
+            opt_arg_list=["--opt"], stop_args=["--stop-position=900"],
+            chunks={"binlog2": [(None, 500), (500, None)]})
+
+        self.assertEqual(
+            sorted(cargs[0][4] for cargs in mock_fetch.call_args_list),
+            [["--opt"], ["--opt", "--start-position=500",
+                         "--stop-position=900"],
+             ["--opt", "--stop-position=500"]])
+        self.assertEqual(
+            mock_out.buffer.getvalue(), b"".join(mysqlbinlog(
+                [b"# at 4\n", b"#binlog1 start\n", b"# at 4\n",
+                 b"#binlog2 start\n", b"# at 500\n",
+                 b"#binlog2 500 event\n"])))
+
+    @mock.patch("binlog_display.sys.stdout")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_single_worker(self, mock_fetch, mock_out):
+
+        """Function:  test_single_worker
+
+        Description:  Test with a single worker.
+
+        Arguments:
+
+        """
+
+        mock_fetch.side_effect = fetch_binlog
+        mock_out.buffer = io.BytesIO()
+
+        binlog_display.merge_binlogs(
+            self.server, ArgParser(1), self.binlog_list)
+
+        self.assertEqual(mock_out.buffer.getvalue(), b"".join(self.results))
+
+    @mock.patch("binlog_display.sys.stdout")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_session_lines(self, mock_fetch, mock_out):
+
+        """Function:  test_session_lines
+
+        Description:  Test the output with session lines is byte for byte
+            the output of a single mysqlbinlog run.
+
+        Arguments:
+
+        """
+
+        binlogs = {
+            "binlog1": [("db1", 0, 1), ("db1", 0, 1)],
+            "binlog2": [("db1", 0, 1), ("db2", 0, 0)],
+            "binlog3": [("db2", 8, 0), ("db1", 8, 1)]}
+        mock_fetch.side_effect = lambda server, start_dt, stop_dt, files, \
+            *args: decode([(files[0], binlogs[files[0]])])
+        mock_out.buffer = io.BytesIO()
+
+        binlog_display.merge_binlogs(
+            self.server, ArgParser(3), self.binlog_list)
+
+        self.assertEqual(mock_out.buffer.getvalue(), b"".join(
+            decode([(binlog, binlogs[binlog])
+                    for binlog in self.binlog_list])))
+
+    @mock.patch("binlog_display.sys.stdout")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_merge_binlogs(self, mock_fetch, mock_out):
+
+        """Function:  test_merge_binlogs
+
+        Description:  Test the output matches a single mysqlbinlog run.
+
+        Arguments:
+
+        """
+
+        mock_fetch.side_effect = fetch_binlog
+        mock_out.buffer = io.BytesIO()
+
+        args = ArgParser(3)
+        args.args_array.update({"-s": "start", "-t": "stop"})
+
+        binlog_display.merge_binlogs(self.server, args, self.binlog_list)
+
+        self.assertEqual(mock_out.buffer.getvalue(), b"".join(self.results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+# Classification (U)
+
+"""Program:  mirror_binlog.py
+
+    Description:  Unit testing of mirror_binlog in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/mirror_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_binlog_cmd(server, **kwargs):                   # pylint:disable=W0613
+
+    """Function:  crt_binlog_cmd
+
+    Description:  Stub of mysqlbinlog --raw which writes ten bytes to the
+        result file.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) kwargs -> Keyword arguments of crt_binlog_cmd
+
+    """
+
+    result = kwargs["opt_arg_list"][-1].split("=", 1)[1]
+
+    return ["sh", "-c",
+            f"printf 0123456789 > {result}{kwargs['binlog_files'][0]}"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_command
+        test_size_mismatch
+        test_fetch_error
+        test_mirror_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = "Server"
+        self.binlog = "binlog.000001"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd")
+    def test_command(self, mock_cmd):
+
+        """Function:  test_command
+
+        Description:  Test the mysqlbinlog --raw arguments.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["true"]
+
+        binlog_fetch.mirror_binlog(
+            self.server, self.binlog, self.tmp_dir.name, 10, "/bin/")
+
+        opt_arg_list = mock_cmd.call_args[1]["opt_arg_list"]
+
+        self.assertEqual(
+            opt_arg_list[:2], ["--read-from-remote-server", "--raw"])
+        self.assertTrue(opt_arg_list[2].startswith(
+            "--result-file=" + os.path.join(self.tmp_dir.name, ".fetch-")))
+        self.assertEqual(mock_cmd.call_args[1]["bin_path"], "/bin/")
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd",
+                mock.Mock(side_effect=crt_binlog_cmd))
+    def test_size_mismatch(self):
+
+        """Function:  test_size_mismatch
+
+        Description:  Test with a partial binary log fetched.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(binlog_fetch.mirror_binlog(
+            self.server, self.binlog, self.tmp_dir.name, 20))
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd",
+                mock.Mock(return_value=["false"]))
+    def test_fetch_error(self):
+
+        """Function:  test_fetch_error
+
+        Description:  Test with mysqlbinlog failing.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(binlog_fetch.mirror_binlog(
+            self.server, self.binlog, self.tmp_dir.name, 10))
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    @mock.patch("binlog_fetch.crt_binlog_cmd",
+                mock.Mock(side_effect=crt_binlog_cmd))
+    def test_mirror_binlog(self):
+
+        """Function:  test_mirror_binlog
+
+        Description:  Test with the binary log moved into the mirror.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(binlog_fetch.mirror_binlog(
+            self.server, self.binlog, self.tmp_dir.name, 10))
+        self.assertEqual(os.listdir(self.tmp_dir.name), [self.binlog])
+
+        with open(os.path.join(self.tmp_dir.name, self.binlog), "rb") \
+                as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"0123456789")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+# Classification (U)
+
+"""Program:  mirror_binlogs.py
+
+    Description:  Unit testing of mirror_binlogs in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/mirror_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def mirror_binlog(                                      # pylint:disable=W0613
+        server, binlog, mirror_dir, size, bin_path=None):
+
+    """Function:  mirror_binlog
+
+    Description:  Stub of mirror_binlog which writes the binary log, except
+        for binlog.000004 which fails.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) binlog -> Binary log name
+        (input) mirror_dir -> Directory path to the mirrored binary logs
+        (input) size -> Size of the binary log on the server
+        (input) bin_path -> Path to MySQL binary directory
+
+    """
+
+    if binlog == "binlog.000004":
+        return False
+
+    with open(os.path.join(mirror_dir, binlog), "wb") as f_hdlr:
+        f_hdlr.write(b"\0" * size)
+
+    return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_purged
+        test_budget
+        test_fetch_error
+        test_mirror_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = "Server"
+        self.logs = [
+            {"Log_name": "binlog.000002", "File_size": 100},
+            {"Log_name": "binlog.000003", "File_size": 100},
+            {"Log_name": "binlog.000004", "File_size": 100},
+            {"Log_name": "binlog.000005", "File_size": 50}]
+
+        # binlog.000001 was purged and binlog.000003 is mirrored.
+        for name, size in [("binlog.000001", 100), ("binlog.000003", 100)]:
+            path = os.path.join(self.tmp_dir.name, name)
+
+            with open(path, "wb") as f_hdlr:
+                f_hdlr.write(b"\0" * size)
+
+            os.utime(path, (100, 100))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_fetch.mirror_binlog",
+                mock.Mock(side_effect=mirror_binlog))
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    def test_purged(self, mock_fetch):
+
+        """Function:  test_purged
+
+        Description:  Test that purged and changed binary logs are removed.
+
+        Arguments:
+
+        """
+
+        self.logs[1]["File_size"] = 200
+        mock_fetch.return_value = self.logs
+
+        self.assertEqual(
+            binlog_fetch.mirror_binlogs(
+                self.server, [], self.tmp_dir.name, 1000), [])
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    @mock.patch("binlog_fetch.mirror_binlog")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    def test_budget(self, mock_fetch, mock_mirror):
+
+        """Function:  test_budget
+
+        Description:  Test that only the binary logs within the disk budget
+            are mirrored.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        mock_mirror.side_effect = mirror_binlog
+
+        self.assertEqual(
+            binlog_fetch.mirror_binlogs(
+                self.server, ["binlog.000002", "binlog.000003"],
+                self.tmp_dir.name, 150), ["binlog.000002"])
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["binlog.000002"])
+
+    @mock.patch("binlog_fetch.mirror_binlog",
+                mock.Mock(side_effect=mirror_binlog))
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    def test_fetch_error(self, mock_fetch):
+
+        """Function:  test_fetch_error
+
+        Description:  Test with a binary log that could not be mirrored.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+
+        self.assertEqual(
+            binlog_fetch.mirror_binlogs(
+                self.server, ["binlog.000003", "binlog.000004"],
+                self.tmp_dir.name, 1000), ["binlog.000003"])
+
+    @mock.patch("binlog_fetch.mirror_binlog")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
+    def test_mirror_binlogs(self, mock_fetch, mock_mirror):
+
+        """Function:  test_mirror_binlogs
+
+        Description:  Test that closed binary logs are kept or fetched and
+            the active binary log is not mirrored.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        mock_mirror.side_effect = mirror_binlog
+
+        self.assertEqual(
+            binlog_fetch.mirror_binlogs(
+                self.server, ["binlog.000002", "binlog.000003",
+                              "binlog.000005"], self.tmp_dir.name, 1000),
+            ["binlog.000002", "binlog.000003"])
+        mock_mirror.assert_called_once_with(
+            self.server, "binlog.000002", self.tmp_dir.name, 100, None)
+        self.assertGreater(os.path.getmtime(
+            os.path.join(self.tmp_dir.name, "binlog.000003")), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Classification (U)
+
+"""Program:  monitor_throttle.py
+
+    Description:  Unit testing of monitor_throttle in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/monitor_throttle.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        run_monitor
+        test_error
+        test_monitor_throttle
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.throttle = {"rate": 1000000.0, "fed": 0,
+                         "lock": threading.Lock(), "stop": threading.Event(),
+                         "error": None, "targets": ["target"],
+                         "replicas": []}
+
+    def run_monitor(self):
+
+        """Function:  run_monitor
+
+        Description:  Runs the monitor for a few checks.
+
+        Arguments:
+
+        """
+
+        thread = threading.Thread(
+            target=binlog_tee.monitor_throttle,
+            args=(self.throttle, None, 8))
+        thread.start()
+        time.sleep(0.05)
+        self.throttle["stop"].set()
+        thread.join()
+
+    @mock.patch("binlog_tee.adjust_rate")
+    @mock.patch("binlog_tee.check_throttle")
+    @mock.patch("binlog_tee.THROTTLE_SECS", 0.01)
+    def test_error(self, mock_check, mock_adjust):
+
+        """Function:  test_error
+
+        Description:  Test that the rate is cut while the metrics cannot be
+            read.
+
+        Arguments:
+
+        """
+
+        mock_check.side_effect = lambda throttle, lag, threads: \
+            throttle.update(error="Lost connection")
+
+        self.run_monitor()
+
+        self.assertLess(self.throttle["rate"], 250000.0)
+        self.assertGreaterEqual(
+            self.throttle["rate"], binlog_tee.THROTTLE_MIN)
+        mock_adjust.assert_not_called()
+
+    @mock.patch("binlog_tee.check_throttle",
+                mock.Mock(return_value=2.0))
+    @mock.patch("binlog_tee.THROTTLE_SECS", 0.01)
+    def test_monitor_throttle(self):
+
+        """Function:  test_monitor_throttle
+
+        Description:  Test that the rate is adjusted until the throttle is
+            stopped.
+
+        Arguments:
+
+        """
+
+        self.throttle["fed"] = 4096
+        self.run_monitor()
+
+        self.assertLess(self.throttle["rate"], 1000000.0)
+        self.assertEqual(self.throttle["fed"], 0)
+        binlog_tee.check_throttle.assert_called_with(
+            self.throttle, None, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  open_binlog_bloom.py
+
+    Description:  Unit testing of open_binlog_bloom in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/open_binlog_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        write_bloom
+        test_no_file
+        test_size_mismatch
+        test_short
+        test_open_binlog_bloom
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.bloom_file = os.path.join(self.tmp_dir.name, "binlog.000001.blm")
+        self.data = binlog_filter.BLOOM_HEADER.pack(
+            b"MLABLM01", 1000, 16, 2, 0) + b"\x01\x80"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def write_bloom(self, data):
+
+        """Function:  write_bloom
+
+        Description:  Write the Bloom filter file.
+
+        Arguments:
+            (input) data -> Bloom filter file contents
+
+        """
+
+        with open(self.bloom_file, "wb") as f_hdlr:
+            f_hdlr.write(data)
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no Bloom filter file.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_filter.open_binlog_bloom(
+            self.tmp_dir.name, "binlog.000001", 1000))
+
+    def test_size_mismatch(self):
+
+        """Function:  test_size_mismatch
+
+        Description:  Test with a Bloom filter of a binary log of another
+            size.
+
+        Arguments:
+
+        """
+
+        self.write_bloom(self.data)
+
+        self.assertIsNone(binlog_filter.open_binlog_bloom(
+            self.tmp_dir.name, "binlog.000001", 2000))
+
+    def test_short(self):
+
+        """Function:  test_short
+
+        Description:  Test with a Bloom filter file that is cut short.
+
+        Arguments:
+
+        """
+
+        self.write_bloom(self.data[:-1])
+
+        self.assertIsNone(binlog_filter.open_binlog_bloom(
+            self.tmp_dir.name, "binlog.000001", 1000))
+
+    def test_open_binlog_bloom(self):
+
+        """Function:  test_open_binlog_bloom
+
+        Description:  Test with a Bloom filter of the binary log.
+
+        Arguments:
+
+        """
+
+        self.write_bloom(self.data)
+
+        self.assertEqual(
+            binlog_filter.open_binlog_bloom(
+                self.tmp_dir.name, "binlog.000001", 1000), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
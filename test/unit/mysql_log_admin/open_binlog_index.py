@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  open_binlog_index.py
+
+    Description:  Unit testing of open_binlog_index in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/open_binlog_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_bad_index
+        test_empty_index
+        test_no_index
+        test_size_changed
+        test_open_binlog_index
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.index_file = self.binlog + ".idx"
+        self.layout = [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)]
+        binlog_files.crt_binlog(self.binlog, self.layout)
+
+        with mock.patch("binlog_reader.INDEX_EVENTS", 2):
+            binlog_reader.build_binlog_index(self.binlog, self.index_file)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_bad_index(self):
+
+        """Function:  test_bad_index
+
+        Description:  Test with an index file that is not an index.
+
+        Arguments:
+
+        """
+
+        with open(self.index_file, "wb") as f_hdlr:
+            f_hdlr.write(b"x" * 40)
+
+        self.assertIsNone(binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000001", 294))
+
+    def test_empty_index(self):
+
+        """Function:  test_empty_index
+
+        Description:  Test with an empty index file.
+
+        Arguments:
+
+        """
+
+        with open(self.index_file, "wb") as f_hdlr:
+            f_hdlr.write(b"")
+
+        self.assertIsNone(binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000001", 294))
+
+    def test_no_index(self):
+
+        """Function:  test_no_index
+
+        Description:  Test with no index file.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000002", 294))
+
+    def test_size_changed(self):
+
+        """Function:  test_size_changed
+
+        Description:  Test with the binary log size changed.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000001", 500))
+
+    def test_open_binlog_index(self):
+
+        """Function:  test_open_binlog_index
+
+        Description:  Test with a valid index file.
+
+        Arguments:
+
+        """
+
+        data = binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000001", 294)
+
+        self.assertEqual(len(data), 16 + 4 * 24)
+        data.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  open_catalog.py
+
+    Description:  Unit testing of open_catalog in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/open_catalog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import sqlite3
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_database
+        test_old_catalog
+        test_open_catalog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.catalog_file = os.path.join(self.tmp_dir.name, "catalog.db")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_not_database(self):
+
+        """Function:  test_not_database
+
+        Description:  Test with a file that is not a SQLite database.
+
+        Arguments:
+
+        """
+
+        with open(self.catalog_file, "wb") as f_hdlr:
+            f_hdlr.write(b"not a database" * 100)
+
+        with self.assertRaises(sqlite3.Error):
+            binlog_catalog.open_catalog(self.catalog_file)
+
+    def test_old_catalog(self):
+
+        """Function:  test_old_catalog
+
+        Description:  Test that the nrows column is added to the events
+            table of a catalogue created without it.
+
+        Arguments:
+
+        """
+
+        with sqlite3.connect(self.catalog_file) as conn:
+            conn.execute(
+                "CREATE TABLE events (binlog TEXT NOT NULL, pos INTEGER NOT"
+                " NULL, txn_pos INTEGER NOT NULL, ts INTEGER NOT NULL, type"
+                " TEXT NOT NULL, server_id INTEGER NOT NULL, gtid TEXT, db"
+                " TEXT, tbl TEXT, size INTEGER NOT NULL, PRIMARY KEY (binlog,"
+                " pos)) WITHOUT ROWID")
+            conn.execute(
+                "INSERT INTO events VALUES ('binlog.000001', 4, 4, 100,"
+                " 'Rotate', 7, NULL, NULL, NULL, 40)")
+
+        conn.close()
+        conn = binlog_catalog.open_catalog(self.catalog_file)
+
+        try:
+            binlog_catalog.write_catalog(
+                conn, "binlog.000001",
+                [(44, 44, 100, "Write_rows", 7, None, "shop", "orders", 50,
+                  3)], 94, 0)
+            self.assertEqual(
+                conn.execute("SELECT pos, nrows FROM events ORDER BY pos")
+                .fetchall(), [(4, None), (44, 3)])
+
+        finally:
+            conn.close()
+
+    def test_open_catalog(self):
+
+        """Function:  test_open_catalog
+
+        Description:  Test that the tables and indexes are created once.
+
+        Arguments:
+
+        """
+
+        binlog_catalog.open_catalog(self.catalog_file).close()
+        conn = binlog_catalog.open_catalog(self.catalog_file)
+
+        try:
+            self.assertEqual(
+                sorted(row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'")),
+                ["binlogs", "events"])
+            self.assertEqual(
+                sorted(row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                    " AND name LIKE 'events_%'")),
+                ["events_gtid", "events_tbl", "events_ts", "events_txn"])
+            self.assertEqual(
+                conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
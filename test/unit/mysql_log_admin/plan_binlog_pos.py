@@ -0,0 +1,370 @@
+# Classification (U)
+
+"""Program:  plan_binlog_pos.py
+
+    Description:  Unit testing of plan_binlog_pos in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/plan_binlog_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def plan_index_start(server, binlog_list, *args):
+
+    """Function:  plan_index_start
+
+    Description:  Stub holder for binlog_search.plan_index_start function.
+
+    Arguments:
+
+    """
+
+    status = True
+
+    if server and args:
+        status = True
+
+    return (binlog_list, []) if status else ([], [])
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-p": "/dir/bin/"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_datetimes
+        test_no_overlap
+        test_start_not_found
+        test_start_first_event
+        test_start_pos
+        test_stop_single_binlog
+        test_stop_index
+        test_plan_binlog_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server = "Server"
+        self.args = ArgParser()
+        self.binlog_list = ["binlog.000001", "binlog.000002", "binlog.000003"]
+        self.start_dt = "2025-01-01 00:00:00"
+        self.stop_dt = "2025-01-01 01:00:00"
+        self.start_ts = binlog_fetch.dt_to_ts(self.start_dt)
+        self.stop_ts = binlog_fetch.dt_to_ts(self.stop_dt)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_search.binlog_ts_offset")
+    @mock.patch("binlog_search.plan_index_start",
+                mock.Mock(side_effect=plan_index_start))
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_no_datetimes(self, mock_prune, mock_offset):
+
+        """Function:  test_no_datetimes
+
+        Description:  Test with no start or stop datetime.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list),
+            (self.binlog_list, [], []))
+        mock_prune.assert_not_called()
+        mock_offset.assert_not_called()
+
+    @mock.patch("binlog_search.binlog_ts_offset",
+                mock.Mock(return_value=None))
+    @mock.patch("binlog_search.plan_index_start",
+                mock.Mock(side_effect=plan_index_start))
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_no_overlap(self, mock_prune):
+
+        """Function:  test_no_overlap
+
+        Description:  Test with no binary logs within the datetimes.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = self.stop_dt
+        self.args.args_array["-P"] = True
+        mock_prune.return_value = []
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list, ["--opt"]),
+            (["binlog.000003"], [], []))
+        mock_prune.assert_called_once_with(
+            self.server, self.binlog_list, None, self.stop_dt, ["--opt"],
+            "/dir/bin/", None, True)
+
+    @mock.patch("binlog_search.binlog_ts_offset",
+                mock.Mock(return_value=None))
+    @mock.patch("binlog_search.plan_index_start")
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_start_not_found(self, mock_prune, mock_index):
+
+        """Function:  test_start_not_found
+
+        Description:  Test that the index start position is kept when the
+            start event is not found.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-s"] = self.start_dt
+        mock_prune.return_value = self.binlog_list[1:]
+        mock_index.return_value = (
+            self.binlog_list[1:], ["--start-position=800"])
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list),
+            (self.binlog_list[1:], ["--start-position=800"], []))
+
+    @mock.patch("binlog_search.binlog_ts_offset",
+                mock.Mock(return_value=4))
+    @mock.patch("binlog_search.plan_index_start",
+                mock.Mock(side_effect=plan_index_start))
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_start_first_event(self, mock_prune):
+
+        """Function:  test_start_first_event
+
+        Description:  Test with the start at the first event of the binary
+            log.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-s"] = self.start_dt
+        mock_prune.return_value = self.binlog_list
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list),
+            (self.binlog_list, [], []))
+
+    @mock.patch("binlog_search.binlog_ts_offset")
+    @mock.patch("binlog_search.plan_index_start")
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_start_pos(self, mock_prune, mock_index, mock_offset):
+
+        """Function:  test_start_pos
+
+        Description:  Test that the start event is searched for from the
+            index start position.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-s"] = self.start_dt
+        self.args.args_array["-b"] = self.tmp_dir.name
+        mock_prune.return_value = self.binlog_list[1:]
+        mock_index.return_value = (
+            self.binlog_list[1:], ["--start-position=800"])
+        mock_offset.return_value = 950
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list),
+            (self.binlog_list[1:], ["--start-position=950"], []))
+        mock_offset.assert_called_once_with(
+            self.server, "binlog.000002", self.start_ts, 800,
+            self.tmp_dir.name, None)
+
+    @mock.patch("binlog_search.binlog_ts_offset")
+    @mock.patch("binlog_search.plan_index_start",
+                mock.Mock(side_effect=plan_index_start))
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_stop_single_binlog(self, mock_prune, mock_offset):
+
+        """Function:  test_stop_single_binlog
+
+        Description:  Test that the stop event is searched for from the start
+            event in a single binary log.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-s"] = self.start_dt
+        self.args.args_array["-t"] = self.stop_dt
+        self.args.args_array["-m"] = self.tmp_dir.name
+        mock_prune.return_value = ["binlog.000002"]
+        mock_offset.side_effect = [950, 2000]
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list),
+            (["binlog.000002"], ["--start-position=950"],
+             ["--stop-position=2000"]))
+        mock_offset.assert_called_with(
+            self.server, "binlog.000002", self.stop_ts, 950,
+            self.tmp_dir.name, None)
+
+    @mock.patch("binlog_reader.search_binlog_index")
+    @mock.patch("binlog_reader.open_binlog_index")
+    @mock.patch("binlog_search.binlog_ts_offset")
+    @mock.patch("binlog_search.plan_index_start",
+                mock.Mock(side_effect=plan_index_start))
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_stop_index(self, mock_prune, mock_offset, mock_open,
+                        mock_search):
+
+        """Function:  test_stop_index
+
+        Description:  Test that the stop event is searched for from the
+            binary log index checkpoint.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.tmp_dir.name, "binlog.000003"),
+                  "wb") as f_hdlr:
+            f_hdlr.write(b"\0" * 5000)
+
+        self.args.args_array["-t"] = self.stop_dt
+        self.args.args_array["-b"] = self.tmp_dir.name
+        self.args.args_array["-i"] = "/dir/index"
+        mock_prune.return_value = self.binlog_list
+        mock_offset.return_value = 4200
+        mock_search.return_value = (self.stop_ts - 1, 4000, 0, 0)
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list),
+            (self.binlog_list, [], ["--stop-position=4200"]))
+        mock_open.assert_called_once_with(
+            "/dir/index", "binlog.000003", 5000)
+        mock_offset.assert_called_once_with(
+            self.server, "binlog.000003", self.stop_ts, 4000,
+            self.tmp_dir.name, None)
+        mock_open.return_value.close.assert_called_once_with()
+
+    @mock.patch("binlog_search.binlog_ts_offset")
+    @mock.patch("binlog_search.plan_index_start",
+                mock.Mock(side_effect=plan_index_start))
+    @mock.patch("binlog_fetch.prune_binlogs")
+    def test_plan_binlog_pos(self, mock_prune, mock_offset):
+
+        """Function:  test_plan_binlog_pos
+
+        Description:  Test that the start position is for the first binary
+            log and the stop position for the last binary log.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-s"] = self.start_dt
+        self.args.args_array["-t"] = self.stop_dt
+        self.args.args_array["-P"] = True
+        mock_prune.return_value = self.binlog_list[:2]
+        mock_offset.side_effect = [950, 300]
+
+        self.assertEqual(
+            binlog_search.plan_binlog_pos(
+                self.server, self.args, self.binlog_list),
+            (self.binlog_list[:2], ["--start-position=950"],
+             ["--stop-position=300"]))
+        self.assertEqual(
+            mock_offset.call_args_list,
+            [mock.call(self.server, "binlog.000001", self.start_ts, None,
+                       None, True),
+             mock.call(self.server, "binlog.000002", self.stop_ts, None,
+                       None, True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
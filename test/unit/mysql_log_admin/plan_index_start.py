@@ -0,0 +1,271 @@
+# Classification (U)
+
+"""Program:  plan_index_start.py
+
+    Description:  Unit testing of plan_index_start in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/plan_index_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_active_binlog
+        test_index_built
+        test_index_missing
+        test_start_of_binlog
+        test_skip_binlog
+        test_no_start_dt
+        test_no_index_dir
+        test_purge_index
+        test_plan_index_start
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.start_dt = "2024-01-01 10:00:00"
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog_list = ["binlog.000001", "binlog.000002", "binlog.000003"]
+        self.logs = [
+            {"Log_name": name, "File_size": 294} for name in self.binlog_list]
+        self.layout = [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)]
+
+        for cnt, name in enumerate(self.binlog_list):
+            binlog = os.path.join(self.tmp_dir.name, name)
+            binlog_files.crt_binlog(binlog, [(tstamp + cnt * 100, etype)
+                                for tstamp, etype in self.layout])
+
+            with mock.patch("binlog_reader.INDEX_EVENTS", 2):
+                binlog_reader.build_binlog_index(binlog, binlog + ".idx")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_fetch.dt_to_ts", mock.Mock(return_value=215))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_active_binlog(self, mock_fetch):
+
+        """Function:  test_active_binlog
+
+        Description:  Test with only the active binary log.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, ["binlog.000003"], self.start_dt,
+                self.tmp_dir.name), (["binlog.000003"], []))
+
+    @mock.patch("binlog_reader.INDEX_EVENTS", 2)
+    @mock.patch("binlog_fetch.dt_to_ts", mock.Mock(return_value=115))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_index_built(self, mock_fetch):
+
+        """Function:  test_index_built
+
+        Description:  Test with missing index built from binary log.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        os.remove(os.path.join(self.tmp_dir.name, "binlog.000001.idx"))
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, self.binlog_list, self.start_dt,
+                self.tmp_dir.name, self.tmp_dir.name),
+            (self.binlog_list, ["--start-position=207"]))
+
+    @mock.patch("binlog_fetch.dt_to_ts", mock.Mock(return_value=115))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_index_missing(self, mock_fetch):
+
+        """Function:  test_index_missing
+
+        Description:  Test with missing index.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+        os.remove(os.path.join(self.tmp_dir.name, "binlog.000001.idx"))
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, self.binlog_list, self.start_dt,
+                self.tmp_dir.name), (self.binlog_list, []))
+
+    @mock.patch("binlog_fetch.dt_to_ts", mock.Mock(return_value=50))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_start_of_binlog(self, mock_fetch):
+
+        """Function:  test_start_of_binlog
+
+        Description:  Test with start datetime before the first event.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, self.binlog_list, self.start_dt,
+                self.tmp_dir.name), (self.binlog_list, []))
+
+    @mock.patch("binlog_fetch.dt_to_ts", mock.Mock(return_value=215))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_skip_binlog(self, mock_fetch):
+
+        """Function:  test_skip_binlog
+
+        Description:  Test with first binary log before start datetime.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, self.binlog_list, self.start_dt,
+                self.tmp_dir.name),
+            (self.binlog_list[1:], ["--start-position=207"]))
+
+    def test_no_start_dt(self):
+
+        """Function:  test_no_start_dt
+
+        Description:  Test with no start datetime.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, self.binlog_list, None, self.tmp_dir.name),
+            (self.binlog_list, []))
+
+    def test_no_index_dir(self):
+
+        """Function:  test_no_index_dir
+
+        Description:  Test with no index directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, self.binlog_list, self.start_dt, None),
+            (self.binlog_list, []))
+
+    @mock.patch("binlog_fetch.dt_to_ts", mock.Mock(return_value=215))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_purge_index(self, mock_fetch):
+
+        """Function:  test_purge_index
+
+        Description:  Test that the indexes of purged binary logs are
+            removed.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs[1:]
+        binlog_search.plan_index_start(
+            self.server, self.binlog_list[1:], self.start_dt,
+            self.tmp_dir.name)
+
+        self.assertEqual(
+            sorted(name for name in os.listdir(self.tmp_dir.name)
+                   if name.endswith(".idx")),
+            ["binlog.000002.idx", "binlog.000003.idx"])
+
+    @mock.patch("binlog_fetch.dt_to_ts", mock.Mock(return_value=115))
+    @mock.patch("binlog_search.mysql_libs.fetch_logs")
+    def test_plan_index_start(self, mock_fetch):
+
+        """Function:  test_plan_index_start
+
+        Description:  Test with start datetime inside binary log.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.logs
+
+        self.assertEqual(
+            binlog_search.plan_index_start(
+                self.server, self.binlog_list, self.start_dt,
+                self.tmp_dir.name),
+            (self.binlog_list, ["--start-position=207"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  plan_mirror.py
+
+    Description:  Unit testing of plan_mirror in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/plan_mirror.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_budget
+        test_plan_mirror
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sizes = {"binlog1": 100, "binlog2": 200, "binlog3": 300}
+        self.path = os.path.join(self.tmp_dir.name, "binlog2")
+
+        with open(self.path, "wb") as f_hdlr:
+            f_hdlr.write(b"\0" * 200)
+
+        os.utime(self.path, (1, 1))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_budget(self):
+
+        """Function:  test_budget
+
+        Description:  Test that the binary logs past the disk budget and not
+            on the server are skipped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.plan_mirror(
+                ["binlog0", "binlog1", "binlog3", "binlog2"],
+                self.tmp_dir.name, self.sizes, 350),
+            (["binlog1", "binlog2"], ["binlog1"]))
+
+    def test_plan_mirror(self):
+
+        """Function:  test_plan_mirror
+
+        Description:  Test that the mirrored binary logs are marked as
+            recently used and the others are fetched.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.plan_mirror(
+                ["binlog1", "binlog2", "binlog3"], self.tmp_dir.name,
+                self.sizes, 1000),
+            (["binlog1", "binlog2", "binlog3"], ["binlog1", "binlog3"]))
+        self.assertGreater(os.path.getmtime(self.path), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+# Classification (U)
+
+"""Program:  plan_restore.py
+
+    Description:  Unit testing of plan_restore in binlog_restore.py.
+
+    Usage:
+        test/unit/mysql_log_admin/plan_restore.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_restore                           # pylint:disable=E0401,C0413
+import binlog_filter                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_apply                             # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-e": ["mysql_cfg"], "-d": "config", "-p": "/path"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_resume_missing
+        test_resume
+        test_plan_restore
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.binlog_list = ["binlog1", "binlog2", "binlog3"]
+        self.opt_arg_list = ["--force-read"]
+
+    @mock.patch("binlog_apply.read_checkpoint",
+                mock.Mock(return_value={"binlog": "binlog9", "pos": 4}))
+    @mock.patch("binlog_search.plan_binlog_pos")
+    def test_resume_missing(self, mock_pos):
+
+        """Function:  test_resume_missing
+
+        Description:  Test with a checkpoint binary log that is not in the
+            binary logs to restore.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-k": "/dir/restore.ckpt", "-r": True})
+        mock_pos.return_value = (self.binlog_list, [], [])
+
+        with gen_libs.no_std_out():
+            self.assertIsNone(binlog_restore.plan_restore(
+                "Server", self.args, self.binlog_list, self.opt_arg_list))
+
+    @mock.patch("binlog_fetch.sync_mirror", mock.Mock(return_value=None))
+    @mock.patch("binlog_filter.prune_bloom_binlogs",
+                lambda server, args, binlogs, pos, stop, binlog_dir:
+                (binlogs, pos, stop))
+    @mock.patch("binlog_apply.read_checkpoint",
+                mock.Mock(return_value={"binlog": "binlog2", "pos": 77}))
+    @mock.patch("binlog_fetch.crt_binlog_cmd")
+    @mock.patch("binlog_search.plan_binlog_pos")
+    def test_resume(self, mock_pos, mock_cmd):
+
+        """Function:  test_resume
+
+        Description:  Test that the restore continues from the checkpoint.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-k": "/dir/restore.ckpt", "-r": True})
+        mock_pos.return_value = (
+            self.binlog_list, ["--start-position=4"], ["--stop-position=9"])
+        mock_cmd.side_effect = lambda *args: args[3]
+        plan = binlog_restore.plan_restore(
+            "Server", self.args, self.binlog_list, self.opt_arg_list)
+
+        self.assertEqual(plan["binlogs"], [["binlog2", "binlog3"]])
+        self.assertEqual(plan["resume"], {"binlog": "binlog2", "pos": 77})
+        self.assertEqual(
+            mock_cmd.call_args[0][4],
+            ["--force-read", "--start-position=77", "--stop-position=9"])
+
+    @mock.patch("binlog_fetch.sync_mirror", mock.Mock(return_value="/m"))
+    @mock.patch("binlog_filter.prune_bloom_binlogs",
+                lambda server, args, binlogs, pos, stop, binlog_dir:
+                (binlogs, pos, stop))
+    @mock.patch("binlog_fetch.group_binlogs")
+    @mock.patch("binlog_fetch.crt_binlog_cmd")
+    @mock.patch("binlog_search.plan_binlog_pos")
+    def test_plan_restore(self, mock_pos, mock_cmd, mock_group):
+
+        """Function:  test_plan_restore
+
+        Description:  Test that each run of binary logs gets a command with
+            the start position on the first and the stop position on the
+            last.
+
+        Arguments:
+
+        """
+
+        mock_pos.return_value = (
+            self.binlog_list, ["--start-position=4"], ["--stop-position=9"])
+        mock_group.return_value = [
+            ("/m", ["binlog1", "binlog2"]), (None, ["binlog3"])]
+        mock_cmd.side_effect = lambda *args: list(args[3:])
+
+        self.assertEqual(
+            binlog_restore.plan_restore(
+                "Server", self.args, self.binlog_list, self.opt_arg_list),
+            {"cmds": [
+                [["binlog1", "binlog2"],
+                 ["--force-read", "--start-position=4"], "/path", "/m"],
+                [["binlog3"], ["--force-read", "--stop-position=9"], "/path",
+                 None]],
+             "binlogs": [["binlog1", "binlog2"], ["binlog3"]],
+             "resume": None})
+        mock_group.assert_called_once_with(self.binlog_list, "/m")
+
+
+if __name__ == "__main__":
+    unittest.main()
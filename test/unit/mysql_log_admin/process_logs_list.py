@@ -2,7 +2,7 @@
 
 """Program:  process_logs_list.py
 
-    Description:  Unit testing of process_logs_list in mysql_log_admin.py.
+    Description:  Unit testing of process_logs_list in binlog_fetch.py.
 
     Usage:
         test/unit/mysql_log_admin/process_logs_list.py
@@ -21,7 +21,7 @@ import mock
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -161,7 +161,7 @@ class UnitTest(unittest.TestCase):
             False, f'Error:  Option -g: {self.args_array2["-g"]} is before -f'
             f' {self.args_array2["-f"]}')
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
     def test_last_missing(self, mock_fetch):
 
         """Function:  test_last_missing
@@ -177,10 +177,10 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.fetch_logs
 
         self.assertEqual(
-            mysql_log_admin.process_logs_list(
+            binlog_fetch.process_logs_list(
                 self.server, self.args), (self.status3, self.loglist))
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
     def test_last_only(self, mock_fetch):
 
         """Function:  test_last_only
@@ -196,10 +196,10 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.fetch_logs
 
         self.assertEqual(
-            mysql_log_admin.process_logs_list(
+            binlog_fetch.process_logs_list(
                 self.server, self.args), (self.status, self.loglist4))
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
     def test_first_missing(self, mock_fetch):
 
         """Function:  test_first_missing
@@ -215,10 +215,10 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.fetch_logs
 
         self.assertEqual(
-            mysql_log_admin.process_logs_list(
+            binlog_fetch.process_logs_list(
                 self.server, self.args), (self.status2, self.loglist))
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
     def test_first_only(self, mock_fetch):
 
         """Function:  test_first_only
@@ -234,7 +234,7 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.fetch_logs
 
         self.assertEqual(
-            mysql_log_admin.process_logs_list(
+            binlog_fetch.process_logs_list(
                 self.server, self.args), (self.status, self.loglist3))
 
     def test_last_first(self):
@@ -250,10 +250,10 @@ class UnitTest(unittest.TestCase):
         self.args.args_array = self.args_array2
 
         self.assertEqual(
-            mysql_log_admin.process_logs_list(
+            binlog_fetch.process_logs_list(
                 self.server, self.args), (self.status4, []))
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
     def test_first_last(self, mock_fetch):
 
         """Function:  test_first_last
@@ -269,10 +269,10 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.fetch_logs
 
         self.assertEqual(
-            mysql_log_admin.process_logs_list(
+            binlog_fetch.process_logs_list(
                 self.server, self.args), (self.status, self.loglist2))
 
-    @mock.patch("mysql_log_admin.mysql_libs.fetch_logs")
+    @mock.patch("binlog_fetch.mysql_libs.fetch_logs")
     def test_process_logs_list(self, mock_fetch):
 
         """Function:  test_process_logs_list
@@ -286,7 +286,7 @@ class UnitTest(unittest.TestCase):
         mock_fetch.return_value = self.fetch_logs
 
         self.assertEqual(
-            mysql_log_admin.process_logs_list(
+            binlog_fetch.process_logs_list(
                 self.server, self.args), (self.status, self.loglist))
 
 
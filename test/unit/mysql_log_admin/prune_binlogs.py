@@ -0,0 +1,270 @@
+# Classification (U)
+
+"""Program:  prune_binlogs.py
+
+    Description:  Unit testing of prune_binlogs in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/prune_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.sql_user = "mysql"
+        self.host = "hostname"
+        self.port = 3306
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        fetch_first_ts
+        test_probe_failed
+        test_probe_count
+        test_after_last
+        test_before_first
+        test_stop_dt
+        test_start_dt
+        test_no_datetimes
+        test_no_binlogs
+        test_prune_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.log_files = [f"binlog.{cnt:06d}" for cnt in range(1, 501)]
+        self.start_dt = "2024-01-01 10:00:00"
+        self.stop_dt = "2024-01-01 11:00:00"
+        self.start_ts = binlog_fetch.dt_to_ts(self.start_dt)
+        self.probed = []
+
+        # One binary log every 30 minutes, binlog.000100 starts at start_dt.
+        self.first_ts = {
+            name: self.start_ts + (cnt - 99) * 1800
+            for cnt, name in enumerate(self.log_files)}
+
+    def fetch_first_ts(self, server, binlog, *args):
+
+        """Function:  fetch_first_ts
+
+        Description:  Stub holder for binlog_fetch.fetch_first_ts.
+
+        Arguments:
+
+        """
+
+        if server and args:
+            self.probed.append(binlog)
+
+        return self.first_ts.get(binlog)
+
+    @mock.patch("binlog_fetch.fetch_first_ts")
+    def test_probe_failed(self, mock_probe):
+
+        """Function:  test_probe_failed
+
+        Description:  Test with first event timestamps not available.
+
+        Arguments:
+
+        """
+
+        mock_probe.return_value = None
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(
+                self.server, self.log_files, self.start_dt, self.stop_dt),
+            self.log_files)
+
+    @mock.patch("binlog_fetch.fetch_first_ts")
+    def test_probe_count(self, mock_probe):
+
+        """Function:  test_probe_count
+
+        Description:  Test only a few binary logs are probed.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.fetch_first_ts
+
+        binlog_fetch.prune_binlogs(
+            self.server, self.log_files, self.start_dt, self.stop_dt)
+
+        self.assertLess(len(self.probed), 25)
+
+    @mock.patch("binlog_fetch.fetch_first_ts")
+    def test_after_last(self, mock_probe):
+
+        """Function:  test_after_last
+
+        Description:  Test with datetimes after the last binary log started.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.fetch_first_ts
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(
+                self.server, self.log_files, "2030-01-01 10:00:00"),
+            ["binlog.000500"])
+
+    @mock.patch("binlog_fetch.fetch_first_ts")
+    def test_before_first(self, mock_probe):
+
+        """Function:  test_before_first
+
+        Description:  Test with datetimes before the first binary log.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.fetch_first_ts
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(
+                self.server, self.log_files, stop_dt="2020-01-01 10:00:00"),
+            [])
+
+    @mock.patch("binlog_fetch.fetch_first_ts")
+    def test_stop_dt(self, mock_probe):
+
+        """Function:  test_stop_dt
+
+        Description:  Test with only stop datetime passed.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.fetch_first_ts
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(
+                self.server, self.log_files, stop_dt=self.stop_dt),
+            self.log_files[:101])
+
+    @mock.patch("binlog_fetch.fetch_first_ts")
+    def test_start_dt(self, mock_probe):
+
+        """Function:  test_start_dt
+
+        Description:  Test with only start datetime passed.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.fetch_first_ts
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(
+                self.server, self.log_files, start_dt=self.start_dt),
+            self.log_files[98:])
+
+    def test_no_datetimes(self):
+
+        """Function:  test_no_datetimes
+
+        Description:  Test with no start or stop datetimes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(self.server, self.log_files),
+            self.log_files)
+
+    def test_no_binlogs(self):
+
+        """Function:  test_no_binlogs
+
+        Description:  Test with empty binary log list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(
+                self.server, [], self.start_dt, self.stop_dt), [])
+
+    @mock.patch("binlog_fetch.fetch_first_ts")
+    def test_prune_binlogs(self, mock_probe):
+
+        """Function:  test_prune_binlogs
+
+        Description:  Test with start and stop datetimes passed.
+
+        Arguments:
+
+        """
+
+        mock_probe.side_effect = self.fetch_first_ts
+
+        self.assertEqual(
+            binlog_fetch.prune_binlogs(
+                self.server, self.log_files, self.start_dt, self.stop_dt),
+            ["binlog.000099", "binlog.000100", "binlog.000101"])
+
+
+if __name__ == "__main__":
+    unittest.main()
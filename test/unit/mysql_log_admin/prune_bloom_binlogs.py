@@ -0,0 +1,249 @@
+# Classification (U)
+
+"""Program:  prune_bloom_binlogs.py
+
+    Description:  Unit testing of prune_bloom_binlogs in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/prune_bloom_binlogs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self, index_dir):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) index_dir -> Directory path to the binary log indexes
+
+        """
+
+        self.args_array = {"-i": index_dir, "-K": ["shop.orders"],
+                           "-Q": "50"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def build_binlog_bloom(binlog, bloom_file, rate):
+
+    """Function:  build_binlog_bloom
+
+    Description:  Stub of build_binlog_bloom which writes a Bloom filter
+        with shop.orders only for binlog.000002.
+
+    Arguments:
+        (input) binlog -> Path to a binary log file
+        (input) bloom_file -> Path to the Bloom filter file
+        (input) rate -> False positive rate as one in this many look ups
+
+    """
+
+    bits = bytearray(2)
+
+    if rate == 50 and binlog.endswith("binlog.000002"):
+        for bit in binlog_filter.bloom_bits("shop.orders", 16, 2):
+            bits[bit >> 3] |= 1 << (bit & 7)
+
+    with open(bloom_file, "wb") as f_hdlr:
+        f_hdlr.write(binlog_filter.BLOOM_HEADER.pack(
+            b"MLABLM01", os.path.getsize(binlog), 16, 2, 0) + bits)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_filter
+        test_not_local
+        test_first_last
+        test_prune_bloom_binlogs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index_dir = os.path.join(self.tmp_dir.name, "index")
+        self.binlog_dir = os.path.join(self.tmp_dir.name, "binlogs")
+        os.mkdir(self.index_dir)
+        os.mkdir(self.binlog_dir)
+        self.args = ArgParser(self.index_dir)
+        self.binlog_list = [f"binlog.00000{num}" for num in range(1, 5)]
+        self.logs = [{"Log_name": name, "File_size": 100}
+                     for name in self.binlog_list]
+
+        for name in self.binlog_list[:3]:
+            with open(os.path.join(self.binlog_dir, name), "wb") as f_hdlr:
+                f_hdlr.write(b"\0" * 100)
+
+        with open(os.path.join(self.index_dir, "binlog.000000.blm"),
+                  "wb") as f_hdlr:
+            f_hdlr.write(b"")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_filter.mysql_libs.fetch_logs")
+    def test_no_filter(self, mock_logs):
+
+        """Function:  test_no_filter
+
+        Description:  Test with no filter options.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-K"]
+
+        self.assertEqual(
+            binlog_filter.prune_bloom_binlogs(
+                "Server", self.args, self.binlog_list, ["--start"],
+                ["--stop"], self.binlog_dir),
+            (self.binlog_list, ["--start"], ["--stop"]))
+        mock_logs.assert_not_called()
+
+    @mock.patch("binlog_filter.build_binlog_bloom",
+                mock.Mock(side_effect=build_binlog_bloom))
+    @mock.patch("binlog_filter.mysql_libs.fetch_logs")
+    def test_not_local(self, mock_logs):
+
+        """Function:  test_not_local
+
+        Description:  Test that a binary log without a local copy is read.
+
+        Arguments:
+
+        """
+
+        mock_logs.return_value = self.logs + [
+            {"Log_name": "binlog.000005", "File_size": 100}]
+
+        self.assertEqual(
+            binlog_filter.prune_bloom_binlogs(
+                "Server", self.args, self.binlog_list[1:], [], [],
+                self.binlog_dir),
+            (["binlog.000002", "binlog.000004"], [], []))
+
+    @mock.patch("binlog_filter.build_binlog_bloom",
+                mock.Mock(side_effect=build_binlog_bloom))
+    @mock.patch("binlog_filter.mysql_libs.fetch_logs")
+    def test_first_last(self, mock_logs):
+
+        """Function:  test_first_last
+
+        Description:  Test that the start and stop positions are dropped with
+            the first and last binary logs.
+
+        Arguments:
+
+        """
+
+        mock_logs.return_value = self.logs
+
+        self.assertEqual(
+            binlog_filter.prune_bloom_binlogs(
+                "Server", self.args, self.binlog_list[:3], ["--start"],
+                ["--stop"], self.binlog_dir),
+            (["binlog.000002"], [], []))
+
+    @mock.patch("binlog_filter.build_binlog_bloom",
+                mock.Mock(side_effect=build_binlog_bloom))
+    @mock.patch("binlog_filter.mysql_libs.fetch_logs")
+    def test_prune_bloom_binlogs(self, mock_logs):
+
+        """Function:  test_prune_bloom_binlogs
+
+        Description:  Test that the Bloom filters are built once and the
+            binary logs they rule out are dropped, but not the active binary
+            log.
+
+        Arguments:
+
+        """
+
+        mock_logs.return_value = self.logs
+
+        self.assertEqual(
+            binlog_filter.prune_bloom_binlogs(
+                "Server", self.args, self.binlog_list, ["--start"],
+                ["--stop"], self.binlog_dir),
+            (["binlog.000002", "binlog.000004"], [], ["--stop"]))
+        self.assertEqual(
+            sorted(os.listdir(self.index_dir)),
+            ["binlog.000001.blm", "binlog.000002.blm", "binlog.000003.blm"])
+        self.assertEqual(binlog_filter.build_binlog_bloom.call_count, 3)
+
+        binlog_filter.prune_bloom_binlogs(
+            "Server", self.args, self.binlog_list, [], [], self.binlog_dir)
+
+        self.assertEqual(binlog_filter.build_binlog_bloom.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  purge_binlog_index.py
+
+    Description:  Unit testing of purge_binlog_index in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/purge_binlog_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_binlogs
+        test_purge_binlog_index
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        self.names = [
+            "binlog.000001.idx", "binlog.000001.blm", "binlog.000002.idx",
+            "binlog.000002.blm", "binlog.000002.idx.tmp",
+            "binlog.000003.blm.tmp", "relay.000001.idx", "other.file"]
+
+        for name in self.names:
+            with open(os.path.join(self.tmp_dir.name, name), "wb") as f_hdlr:
+                f_hdlr.write(b"")
+
+        mtime = time.time() - binlog_reader.INDEX_TMP_AGE - 10
+        os.utime(os.path.join(self.tmp_dir.name, "binlog.000002.idx.tmp"),
+                 (mtime, mtime))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_no_binlogs(self):
+
+        """Function:  test_no_binlogs
+
+        Description:  Test that nothing is removed without binary logs.
+
+        Arguments:
+
+        """
+
+        binlog_reader.purge_binlog_index(self.tmp_dir.name, [])
+
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir.name)), sorted(self.names))
+
+    def test_purge_binlog_index(self):
+
+        """Function:  test_purge_binlog_index
+
+        Description:  Test with indexes and Bloom filters of purged binary
+            logs and partial ones, with the files of other servers and other
+            files kept.
+
+        Arguments:
+
+        """
+
+        binlog_reader.purge_binlog_index(
+            self.tmp_dir.name, ["binlog.000002", "binlog.000003"])
+
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir.name)),
+            ["binlog.000002.blm", "binlog.000002.idx",
+             "binlog.000003.blm.tmp", "other.file", "relay.000001.idx"])
+
+
+if __name__ == "__main__":
+    unittest.main()
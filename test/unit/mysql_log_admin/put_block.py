@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  put_block.py
+
+    Description:  Unit testing of put_block in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/put_block.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import queue
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_none
+        test_large_block
+        test_wait
+        test_put_block
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tee = {"blocks": queue.Queue(), "held": 0, "max": 10,
+                    "cond": threading.Condition()}
+
+    def test_none(self):
+
+        """Function:  test_none
+
+        Description:  Test that None is queued with the buffer full.
+
+        Arguments:
+
+        """
+
+        self.tee["held"] = 10
+        binlog_tee.put_block(self.tee, None)
+
+        self.assertIsNone(self.tee["blocks"].get_nowait())
+        self.assertEqual(self.tee["held"], 10)
+
+    def test_large_block(self):
+
+        """Function:  test_large_block
+
+        Description:  Test that a block larger than the buffer is queued
+            when nothing is held.
+
+        Arguments:
+
+        """
+
+        binlog_tee.put_block(self.tee, b"x" * 25)
+
+        self.assertEqual(self.tee["held"], 25)
+
+    def test_wait(self):
+
+        """Function:  test_wait
+
+        Description:  Test that a block waits until the bytes written leave
+            room for it.
+
+        Arguments:
+
+        """
+
+        binlog_tee.put_block(self.tee, b"block1")
+        thread = threading.Thread(
+            target=binlog_tee.put_block, args=(self.tee, b"block2"))
+        thread.start()
+        thread.join(0.1)
+
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(self.tee["blocks"].qsize(), 1)
+
+        with self.tee["cond"]:
+            self.tee["held"] -= len(self.tee["blocks"].get_nowait())
+            self.tee["cond"].notify()
+
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.tee["blocks"].get_nowait(), b"block2")
+        self.assertEqual(self.tee["held"], 6)
+
+    def test_put_block(self):
+
+        """Function:  test_put_block
+
+        Description:  Test that the blocks that fit the buffer are queued
+            and their bytes held.
+
+        Arguments:
+
+        """
+
+        binlog_tee.put_block(self.tee, b"12345")
+        binlog_tee.put_block(self.tee, b"67890")
+
+        self.assertEqual(self.tee["held"], 10)
+        self.assertEqual(self.tee["blocks"].qsize(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  query_event.py
+
+    Description:  Unit testing of query_event in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/query_event.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import struct
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def query_body(dbase, stmt):
+
+    """Function:  query_body
+
+    Description:  Create the body of a Query event.
+
+    Arguments:
+        (input) dbase -> Default database
+        (input) stmt -> Statement
+
+    """
+
+    return struct.pack("<IIBHH", 5, 0, len(dbase), 0, 3) + b"\x01\x02\x03" \
+        + dbase + b"\0" + stmt
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_database
+        test_checksum
+        test_query_event
+
+    """
+
+    def test_no_database(self):
+
+        """Function:  test_no_database
+
+        Description:  Test with no default database.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.query_event(query_body(b"", b"BEGIN")),
+            ("", b"BEGIN"))
+
+    def test_checksum(self):
+
+        """Function:  test_checksum
+
+        Description:  Test that the checksum is not in the statement.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.query_event(
+                query_body(b"shop", b"COMMIT") + b"\xaa\xbb\xcc\xdd", 4),
+            ("shop", b"COMMIT"))
+
+    def test_query_event(self):
+
+        """Function:  test_query_event
+
+        Description:  Test with the default database and statement.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.query_event(
+                query_body(b"shop", b"\nDROP TABLE t1\n")),
+            ("shop", b"DROP TABLE t1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
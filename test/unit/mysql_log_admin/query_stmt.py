@@ -0,0 +1,75 @@
+# Classification (U)
+
+"""Program:  query_stmt.py
+
+    Description:  Unit testing of query_stmt in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/query_stmt.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_stmt
+        test_query_stmt
+
+    """
+
+    def test_no_stmt(self):
+
+        """Function:  test_no_stmt
+
+        Description:  Test with an event without a statement.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_filter.query_stmt([b"# at 4\n"]), b"")
+
+    def test_query_stmt(self):
+
+        """Function:  test_query_stmt
+
+        Description:  Test that the comments and session state lines are
+            left out of the statement.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_filter.query_stmt([
+                b"# at 204\n",
+                b"#240101 10:00:01 server id 1  end_log_pos 280 \tQuery\n",
+                b"use `db1`/*!*/;\n", b"SET TIMESTAMP=1704103201/*!*/;\n",
+                b"/*!\\C utf8mb4 *//*!*/;\n", b"INSERT INTO t1\n",
+                b"VALUES (1)\n", b"/*!*/;\n"]),
+            b"INSERT INTO t1\nVALUES (1)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Classification (U)
+
+"""Program:  range_query_pos.py
+
+    Description:  Unit testing of range_query_pos in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/range_query_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def event(tstamp, type_code, log_pos):
+
+    """Function:  event
+
+    Description:  Create a BinlogEvent.
+
+    Arguments:
+        (input) tstamp -> Event timestamp
+        (input) type_code -> Event type code
+        (input) log_pos -> End log position
+
+    """
+
+    return binlog_reader.BinlogEvent(
+        tstamp, type_code, 1, 29, log_pos, 0, log_pos - 29, None)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_events
+        test_stop_ts
+        test_start_ts
+        test_range_query_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.events = [
+            event(100, 2, 33), event(110, 2, 62), event(90, 2, 91),
+            event(120, 16, 120)]
+
+    def test_no_events(self):
+
+        """Function:  test_no_events
+
+        Description:  Test with no events.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_reader.range_query_pos([]), (None, False))
+
+    def test_stop_ts(self):
+
+        """Function:  test_stop_ts
+
+        Description:  Test that the events after the first event at or after
+            the stop timestamp are not read.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.range_query_pos(self.events, stop_ts=110),
+            (33, True))
+
+    def test_start_ts(self):
+
+        """Function:  test_start_ts
+
+        Description:  Test that the Query events before the start timestamp
+            are skipped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.range_query_pos(self.events, 100, 130),
+            (62, False))
+
+    def test_range_query_pos(self):
+
+        """Function:  test_range_query_pos
+
+        Description:  Test with no start and stop timestamps.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.range_query_pos(self.events), (91, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
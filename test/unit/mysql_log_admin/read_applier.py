@@ -0,0 +1,79 @@
+# Classification (U)
+
+"""Program:  read_applier.py
+
+    Description:  Unit testing of read_applier in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_applier.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import queue
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_output
+        test_read_applier
+
+    """
+
+    def test_no_output(self):
+
+        """Function:  test_no_output
+
+        Description:  Test with a session that exits with no output.
+
+        Arguments:
+
+        """
+
+        acks = queue.Queue()
+        binlog_apply.read_applier(1, io.BytesIO(b""), acks)
+
+        self.assertEqual(acks.get_nowait(), (1, None))
+        self.assertTrue(acks.empty())
+
+    def test_read_applier(self):
+
+        """Function:  test_read_applier
+
+        Description:  Test that only the markers are queued.
+
+        Arguments:
+
+        """
+
+        acks = queue.Queue()
+        binlog_apply.read_applier(
+            0, io.BytesIO(b"mla:1\nother\nmla:12\n"), acks)
+
+        self.assertEqual(
+            [acks.get_nowait() for _ in range(3)],
+            [(0, 1), (0, 12), (0, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
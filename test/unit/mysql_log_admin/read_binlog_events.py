@@ -0,0 +1,196 @@
+# Classification (U)
+
+"""Program:  read_binlog_events.py
+
+    Description:  Unit testing of read_binlog_events in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_binlog_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_binlog
+        test_empty_file
+        test_partial_event
+        test_body
+        test_stop_pos
+        test_start_pos
+        test_read_binlog_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.event1 = binlog_files.crt_event(100, 15, 4, b"x" * 10)
+        self.event2 = binlog_files.crt_event(
+            101, 2, 4 + len(self.event1), b"BEGIN")
+        self.data = b"\xfebin" + self.event1 + self.event2
+
+        with open(self.binlog, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_not_binlog(self):
+
+        """Function:  test_not_binlog
+
+        Description:  Test with a file that is not a binary log.
+
+        Arguments:
+
+        """
+
+        with open(self.binlog, "wb") as f_hdlr:
+            f_hdlr.write(b"not a binlog")
+
+        with self.assertRaises(ValueError):
+            list(binlog_reader.read_binlog_events(self.binlog))
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        with open(self.binlog, "wb") as f_hdlr:
+            f_hdlr.write(b"")
+
+        self.assertEqual(
+            list(binlog_reader.read_binlog_events(self.binlog)), [])
+
+    def test_partial_event(self):
+
+        """Function:  test_partial_event
+
+        Description:  Test with a partial event at the end of the file.
+
+        Arguments:
+
+        """
+
+        with open(self.binlog, "ab") as f_hdlr:
+            f_hdlr.write(binlog_files.crt_event(
+                102, 16, len(self.data), b"12345678")[:25])
+
+        self.assertEqual(
+            len(list(binlog_reader.read_binlog_events(self.binlog))), 2)
+
+    def test_body(self):
+
+        """Function:  test_body
+
+        Description:  Test with the event bodies returned.
+
+        Arguments:
+
+        """
+
+        events = list(
+            binlog_reader.read_binlog_events(self.binlog, body=True))
+
+        self.assertEqual(events[1].body, b"BEGIN")
+
+    def test_stop_pos(self):
+
+        """Function:  test_stop_pos
+
+        Description:  Test with a stop position.
+
+        Arguments:
+
+        """
+
+        events = list(binlog_reader.read_binlog_events(
+            self.binlog, stop_pos=4 + len(self.event1)))
+
+        self.assertEqual([event.type_code for event in events], [15])
+
+    def test_start_pos(self):
+
+        """Function:  test_start_pos
+
+        Description:  Test with a start position.
+
+        Arguments:
+
+        """
+
+        events = list(binlog_reader.read_binlog_events(
+            self.binlog, start_pos=4 + len(self.event1)))
+
+        self.assertEqual([event.type_code for event in events], [2])
+
+    def test_read_binlog_events(self):
+
+        """Function:  test_read_binlog_events
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        events = list(binlog_reader.read_binlog_events(self.binlog))
+
+        self.assertEqual(
+            [(event.timestamp, event.type_code, event.log_pos, event.offset,
+              event.body) for event in events],
+            [(100, 15, 33, 4, None), (101, 2, len(self.data), 33, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  read_blocks.py
+
+    Description:  Unit testing of read_blocks in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_blocks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import binlog_filter                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_filter
+        test_filter_blocks
+        test_read_blocks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.read_fd, self.write_fd = os.pipe()
+        self.data = b"DELIMITER /*!*/;\n# at 4\nevent\n# at 120\nevent\n"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        os.close(self.read_fd)
+
+    @mock.patch("binlog_fetch.COPY_BYTES", 20)
+    def test_no_filter(self):
+
+        """Function:  test_no_filter
+
+        Description:  Test that the pipe is read in blocks.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.data)
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            list(binlog_tee.read_blocks(self.read_fd)),
+            [self.data[:20], self.data[20:40], self.data[40:]])
+
+    @mock.patch("binlog_fetch.COPY_BYTES", 20)
+    @mock.patch("binlog_filter.filter_binlog")
+    def test_filter_blocks(self, mock_filter):
+
+        """Function:  test_filter_blocks
+
+        Description:  Test that the kept lines are joined into blocks.
+
+        Arguments:
+
+        """
+
+        mock_filter.return_value = iter(
+            [b"DELIMITER /*!*/;\n", b"# at 4\n", b"event\n"])
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            list(binlog_tee.read_blocks(self.read_fd, "filter")),
+            [b"DELIMITER /*!*/;\n# at 4\n", b"event\n"])
+
+    def test_read_blocks(self):
+
+        """Function:  test_read_blocks
+
+        Description:  Test that the filter is passed the lines of the pipe
+            and the pipe is left open.
+
+        Arguments:
+
+        """
+
+        os.write(self.write_fd, self.data)
+        os.close(self.write_fd)
+
+        self.assertEqual(
+            list(binlog_tee.read_blocks(
+                self.read_fd, {"dbs": ["shop"]})), [self.data])
+        os.fstat(self.read_fd)
+
+
+if __name__ == "__main__":
+    unittest.main()
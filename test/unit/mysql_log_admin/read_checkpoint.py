@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  read_checkpoint.py
+
+    Description:  Unit testing of read_checkpoint in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_checkpoint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import shutil
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_file
+        test_read_checkpoint
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.ckpt_file = os.path.join(self.tmp_dir, "restore.ckpt")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with no checkpoint file.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_apply.read_checkpoint(self.ckpt_file))
+
+    def test_read_checkpoint(self):
+
+        """Function:  test_read_checkpoint
+
+        Description:  Test that the checkpoint is read.
+
+        Arguments:
+
+        """
+
+        with open(self.ckpt_file, "w", encoding="UTF-8") as fhdr:
+            fhdr.write('{"binlog": "binlog1", "pos": 400, "applied": []}')
+
+        self.assertEqual(
+            binlog_apply.read_checkpoint(self.ckpt_file),
+            {"binlog": "binlog1", "pos": 400, "applied": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  read_packed_int.py
+
+    Description:  Unit testing of read_packed_int in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_packed_int.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_one_byte
+        test_two_bytes
+        test_three_bytes
+        test_eight_bytes
+        test_not_valid
+
+    """
+
+    def test_one_byte(self):
+
+        """Function:  test_one_byte
+
+        Description:  Test with an integer in the first byte.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.read_packed_int(b"\x00\xfa", 1), (250, 2))
+
+    def test_two_bytes(self):
+
+        """Function:  test_two_bytes
+
+        Description:  Test with a two byte integer.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.read_packed_int(b"\xfc\x00\x01", 0), (256, 3))
+
+    def test_three_bytes(self):
+
+        """Function:  test_three_bytes
+
+        Description:  Test with a three byte integer.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.read_packed_int(b"\xfd\x00\x00\x01", 0),
+            (65536, 4))
+
+    def test_eight_bytes(self):
+
+        """Function:  test_eight_bytes
+
+        Description:  Test with an eight byte integer.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.read_packed_int(
+                b"\xfe" + (1 << 32).to_bytes(8, "little"), 0), (1 << 32, 9))
+
+    def test_not_valid(self):
+
+        """Function:  test_not_valid
+
+        Description:  Test with a first byte that is not valid.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            binlog_catalog.read_packed_int(b"\xff", 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  read_packet.py
+
+    Description:  Unit testing of read_packet in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_packet.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_stream                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_closed_body
+        test_closed
+        test_split_payload
+        test_read_packet
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.payload = b"\x00event"
+
+    def test_closed_body(self):
+
+        """Function:  test_closed_body
+
+        Description:  Test with the connection closed in the payload.
+
+        Arguments:
+
+        """
+
+        conn = io.BytesIO(b"\x06\x00\x00\x01\x00ev")
+
+        with self.assertRaises(ConnectionError):
+            binlog_stream.read_packet(conn)
+
+    def test_closed(self):
+
+        """Function:  test_closed
+
+        Description:  Test with the connection closed.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ConnectionError):
+            binlog_stream.read_packet(io.BytesIO(b""))
+
+    @mock.patch("binlog_stream.MAX_PACKET", 3)
+    def test_split_payload(self):
+
+        """Function:  test_split_payload
+
+        Description:  Test with a payload split over two packets.
+
+        Arguments:
+
+        """
+
+        conn = io.BytesIO(b"\x03\x00\x00\x00abc\x00\x00\x00\x01")
+
+        self.assertEqual(binlog_stream.read_packet(conn), b"abc")
+
+    def test_read_packet(self):
+
+        """Function:  test_read_packet
+
+        Description:  Test with a single packet.
+
+        Arguments:
+
+        """
+
+        conn = io.BytesIO(b"\x06\x00\x00\x01" + self.payload)
+
+        self.assertEqual(binlog_stream.read_packet(conn), self.payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
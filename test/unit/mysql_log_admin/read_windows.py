@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  read_windows.py
+
+    Description:  Unit testing of read_windows in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_windows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_missing_file
+        test_read_windows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.windows_file = os.path.join(self.tmp_dir.name, "windows.txt")
+
+        with open(self.windows_file, "w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write(
+                "# PITR windows\n"
+                "2025-01-01 00:00:00,2025-01-01 00:15:00\n"
+                "\n"
+                " 2025-01-01 00:15:00 , \n"
+                ",2025-01-01 00:30:00\n")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a windows file that does not exist.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(OSError):
+            binlog_search.read_windows(self.windows_file + ".missing")
+
+    def test_read_windows(self):
+
+        """Function:  test_read_windows
+
+        Description:  Test that the windows are read in file order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.read_windows(self.windows_file),
+            [("2025-01-01 00:00:00", "2025-01-01 00:15:00"),
+             ("2025-01-01 00:15:00", None),
+             (None, "2025-01-01 00:30:00")])
+
+
+if __name__ == "__main__":
+    unittest.main()
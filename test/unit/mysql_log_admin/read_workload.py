@@ -0,0 +1,223 @@
+# Classification (U)
+
+"""Program:  read_workload.py
+
+    Description:  Unit testing of read_workload in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/read_workload.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-A": True, "-s": "2024-01-01 10:00:00"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def catalog_events(events, crc=0, count=False):
+
+    """Function:  catalog_events
+
+    Description:  Stub of catalog_events which yields a transaction of one
+        Write_rows event per timestamp, of two rows with count.
+
+    Arguments:
+        (input) events -> List of timestamps
+        (input) crc -> Checksum length of the events
+        (input) count -> True|False - Count the rows of rows events
+
+    """
+
+    for tstamp in events:
+        yield [(4, 4, tstamp, "Write_rows", 7, None, "shop", "orders", 10,
+                2 if count else None)], 14, crc
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_read_error
+        test_count
+        test_read_workload
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.tstamp = int(time.mktime(time.strptime(
+            "2024-01-01 10:00", "%Y-%m-%d %H:%M")))
+
+    @mock.patch("binlog_fetch.sync_mirror", mock.Mock())
+    @mock.patch("binlog_workload.workload_events")
+    @mock.patch("binlog_search.plan_binlog_pos")
+    def test_read_error(self, mock_plan, mock_events):
+
+        """Function:  test_read_error
+
+        Description:  Test that a binary log that cannot be read raises
+            the error.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = ["binlog1"], [], []
+        mock_events.side_effect = ValueError("Binary log binlog1 is not local")
+
+        with self.assertRaises(ValueError):
+            binlog_workload.read_workload(
+                self.server, self.args, ["binlog1"], [])
+
+    @mock.patch("binlog_fetch.sync_mirror", mock.Mock())
+    @mock.patch("binlog_catalog.catalog_events",
+                mock.Mock(side_effect=catalog_events))
+    @mock.patch("binlog_workload.workload_events")
+    @mock.patch("binlog_search.plan_binlog_pos")
+    def test_count(self, mock_plan, mock_events):
+
+        """Function:  test_count
+
+        Description:  Test that the rows are counted with -U.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-U"] = True
+        mock_plan.return_value = ["binlog1"], [], []
+        mock_events.return_value = [self.tstamp], 0
+
+        stats = binlog_workload.read_workload(
+            self.server, self.args, ["binlog1"], [])
+
+        self.assertTrue(stats["count"])
+        self.assertEqual(list(stats["rows"]), [2])
+        self.assertEqual(stats["undecoded"], 0)
+
+    @mock.patch("binlog_fetch.sync_mirror")
+    @mock.patch("binlog_catalog.catalog_events",
+                mock.Mock(side_effect=catalog_events))
+    @mock.patch("binlog_workload.workload_events")
+    @mock.patch("binlog_search.plan_binlog_pos")
+    def test_read_workload(self, mock_plan, mock_events, mock_sync):
+
+        """Function:  test_read_workload
+
+        Description:  Test that the start and stop positions bound the first
+            and last binary logs, the transactions before the start datetime
+            are skipped and the rows are not counted without -U.
+
+        Arguments:
+
+        """
+
+        mock_plan.return_value = (
+            ["binlog1", "binlog2"], ["--start-position=100"],
+            ["--stop-position=500"])
+        mock_events.side_effect = [
+            ([self.tstamp - 1, self.tstamp], 0),
+            ([self.tstamp + 60], 0)]
+
+        stats = binlog_workload.read_workload(
+            self.server, self.args, ["binlog0", "binlog1", "binlog2"],
+            ["--force"])
+
+        mock_plan.assert_called_once_with(
+            self.server, self.args, ["binlog0", "binlog1", "binlog2"],
+            ["--force"])
+        mock_sync.assert_called_once_with(
+            self.server, self.args, ["binlog1", "binlog2"])
+        self.assertEqual(
+            mock_events.call_args_list,
+            [mock.call(self.server, self.args, "binlog1", 100, None),
+             mock.call(self.server, self.args, "binlog2", None, 500)])
+        self.assertFalse(stats["count"])
+        self.assertEqual(list(stats["events"]), [1, 1])
+        self.assertEqual(list(stats["rows"]), [0, 0])
+        self.assertEqual(stats["undecoded"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  reduce_ranges.py
+
+    Description:  Unit testing of reduce_ranges in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/reduce_ranges.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_search                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_query
+        test_stop_reached
+        test_reduce_ranges
+
+    """
+
+    def test_no_query(self):
+
+        """Function:  test_no_query
+
+        Description:  Test with no Query in the ranges.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.reduce_ranges(
+                [("binlog1", None, 500), ("binlog1", 500, None)],
+                [(None, False), (None, False)]), {"binlog1": None})
+
+    def test_stop_reached(self):
+
+        """Function:  test_stop_reached
+
+        Description:  Test that the ranges after the one that reached the
+            stop timestamp are not used.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.reduce_ranges(
+                [("binlog1", None, 500), ("binlog1", 500, 900),
+                 ("binlog1", 900, None)],
+                [(400, False), (None, True), (950, False)]),
+            {"binlog1": 400})
+
+    def test_reduce_ranges(self):
+
+        """Function:  test_reduce_ranges
+
+        Description:  Test that the last position of each binary log is
+            returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_search.reduce_ranges(
+                [("binlog1", None, 500), ("binlog1", 500, None),
+                 ("binlog2", None, None)],
+                [(400, False), (600, False), (None, False)]),
+            {"binlog1": 600, "binlog2": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
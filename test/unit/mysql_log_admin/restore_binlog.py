@@ -0,0 +1,218 @@
+# Classification (U)
+
+"""Program:  restore_binlog.py
+
+    Description:  Unit testing of restore_binlog in binlog_restore.py.
+
+    Usage:
+        test/unit/mysql_log_admin/restore_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_restore                           # pylint:disable=E0401,C0413
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def count_pipe(read_fd, *args):
+
+    """Function:  count_pipe
+
+    Description:  Stub of count_pipe which reads the pipe to its end.
+
+    Arguments:
+
+    """
+
+    while os.read(read_fd, 65536) and args is not None:
+        pass
+
+    return 0, 0
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_client_exit
+        test_client_error
+        test_binlog_error
+        test_count
+        test_throttle
+        test_filter
+        test_restore_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.out_file = os.path.join(self.tmp_dir.name, "restore.sql")
+        self.binlog_cmds = [["printf", "# at 4\\nevent\\n"],
+                            ["printf", "# at 120\\nevent\\n"]]
+        self.cmd = ["sh", "-c", "cat > " + self.out_file]
+        self.data = b"# at 4\nevent\n# at 120\nevent\n"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    @mock.patch("binlog_tee.count_pipe",
+                mock.Mock(side_effect=BrokenPipeError))
+    def test_client_exit(self):
+
+        """Function:  test_client_exit
+
+        Description:  Test with the mysql client exiting early.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "mysql client exited"):
+            binlog_restore.restore_binlog(self.binlog_cmds, ["false"], True)
+
+    def test_client_error(self):
+
+        """Function:  test_client_error
+
+        Description:  Test that a failed mysql client is an error.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "mysql client exited"):
+            binlog_restore.restore_binlog(
+                self.binlog_cmds, ["sh", "-c", "cat > /dev/null; exit 1"])
+
+    def test_binlog_error(self):
+
+        """Function:  test_binlog_error
+
+        Description:  Test that a failed mysqlbinlog command is an error.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "mysqlbinlog exited"):
+            binlog_restore.restore_binlog(
+                self.binlog_cmds[:1] + [["false"]], self.cmd)
+
+        with open(self.out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"# at 4\nevent\n")
+
+    def test_count(self):
+
+        """Function:  test_count
+
+        Description:  Test with the bytes and events counted.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_restore.restore_binlog(self.binlog_cmds, self.cmd, True),
+            (len(self.data), 1))
+
+        with open(self.out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("binlog_tee.throttle_wait")
+    def test_throttle(self, mock_wait):
+
+        """Function:  test_throttle
+
+        Description:  Test that a throttled restore is copied through the
+            throttle without the counts.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            binlog_restore.restore_binlog(
+                self.binlog_cmds, self.cmd, throttle="throttle"))
+        self.assertEqual(
+            sum(call[0][1] for call in mock_wait.call_args_list),
+            len(self.data))
+
+        with open(self.out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("binlog_tee.count_pipe")
+    def test_filter(self, mock_count):
+
+        """Function:  test_filter
+
+        Description:  Test that a filtered restore is copied through the
+            filter without the counts.
+
+        Arguments:
+
+        """
+
+        mock_count.side_effect = count_pipe
+
+        self.assertIsNone(
+            binlog_restore.restore_binlog(
+                self.binlog_cmds, self.cmd, filt="filter"))
+        self.assertEqual(mock_count.call_args[0][2:], (None, "filter"))
+
+    def test_restore_binlog(self):
+
+        """Function:  test_restore_binlog
+
+        Description:  Test with mysqlbinlog piped to the mysql client.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            binlog_restore.restore_binlog(self.binlog_cmds, self.cmd))
+
+        with open(self.out_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# Classification (U)
+
+"""Program:  restore_stats.py
+
+    Description:  Unit testing of restore_stats in binlog_restore.py.
+
+    Usage:
+        test/unit/mysql_log_admin/restore_stats.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_restore                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_time
+        test_restore_stats
+
+    """
+
+    @mock.patch("binlog_restore.time.time", mock.Mock(return_value=100.0))
+    def test_no_time(self):
+
+        """Function:  test_no_time
+
+        Description:  Test with a restore that took no measurable time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_restore.restore_stats((0, 0), "events", 100.0),
+            "Restored: 0 bytes, 0 events in 0.001 seconds (0.0 MB/s,"
+            " 0.0 events/s)")
+
+    @mock.patch("binlog_restore.time.time", mock.Mock(return_value=104.0))
+    def test_restore_stats(self):
+
+        """Function:  test_restore_stats
+
+        Description:  Test that the throughput is printed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_restore.restore_stats((8388608, 200), "transactions",
+                                          100.0),
+            "Restored: 8388608 bytes, 200 transactions in 4.000 seconds"
+            " (2.0 MB/s, 50.0 transactions/s)")
+
+
+if __name__ == "__main__":
+    unittest.main()
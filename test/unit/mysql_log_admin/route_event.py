@@ -0,0 +1,334 @@
+# Classification (U)
+
+"""Program:  route_event.py
+
+    Description:  Unit testing of route_event in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/route_event.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import collections
+import queue
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_state(workers):
+
+    """Function:  crt_state
+
+    Description:  Creates the parallel applier state with mysql client
+        sessions that write to memory.
+
+    Arguments:
+        (input) workers -> Number of mysql client sessions
+        (output) -> Dictionary of the parallel applier state
+
+    """
+
+    procs = [mock.Mock(stdin=io.BytesIO()) for _ in range(workers)]
+
+    return {"procs": procs, "acks": queue.Queue(), "outstanding": {},
+            "depth": [0] * workers,
+            "sessions": [{} for _ in range(workers)], "session": {},
+            "unit": None, "targets": [], "txns": 0, "bytes": 0,
+            "binlog": "binlog1", "skipped": 0, "ckpt": None,
+            "units": collections.OrderedDict(), "skip": set(),
+            "profile": False, "files": [], "gtid": False, "closed": False,
+            "in_txn": False}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_barrier
+        test_next_file
+        test_no_clock
+        test_no_gtid_begin
+        test_no_gtid
+        test_same_unit
+        test_skip
+        test_checkpoint
+        test_profile
+        test_route_event
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = crt_state(2)
+        self.gtid = [
+            b"# at 125\n",
+            b"#240101 10:00:01 server id 1  end_log_pos 204 CRC32 0x02"
+            b" \tAnonymous_GTID\tlast_committed=4\tsequence_number=6\n"]
+        self.query = [
+            b"# at 204\n",
+            b"#240101 10:00:01 server id 1  end_log_pos 280 CRC32 0x03"
+            b" \tQuery\tthread_id=8\n",
+            b"use `db1`/*!*/;\n", b"BEGIN\n", b"/*!*/;\n"]
+
+    @mock.patch("binlog_apply.start_unit")
+    def test_barrier(self, mock_start):
+
+        """Function:  test_barrier
+
+        Description:  Test that the header is written to every session.
+
+        Arguments:
+
+        """
+
+        mock_start.side_effect = lambda state, clock=None, barrier=False: \
+            state.update(unit=0, targets=[0, 1])
+        binlog_apply.route_event(
+            self.state, b"header", [b"DELIMITER /*!*/;\n"])
+
+        mock_start.assert_called_once_with(self.state, barrier=True)
+        self.assertEqual(self.state["procs"][1].stdin.getvalue(),
+                         b"DELIMITER /*!*/;\n")
+        self.assertEqual(self.state["bytes"], 17)
+
+    @mock.patch("binlog_apply.start_unit", mock.Mock())
+    def test_next_file(self):
+
+        """Function:  test_next_file
+
+        Description:  Test that a format description moves on to the next
+            binary log of the command.
+
+        Arguments:
+
+        """
+
+        self.state["files"] = ["binlog2", "binlog3"]
+        binlog_apply.route_event(
+            self.state, b"Start",
+            [b"# at 4\n",
+             b"#240101 10:00:00 server id 1  end_log_pos 125 CRC32 0x01"
+             b" \tStart: binlog v 4\n"])
+
+        self.assertEqual(self.state["binlog"], "binlog2")
+        self.assertEqual(self.state["files"], ["binlog3"])
+
+    @mock.patch("binlog_apply.start_unit")
+    def test_no_clock(self, mock_start):
+
+        """Function:  test_no_clock
+
+        Description:  Test that an event after a barrier starts a
+            transaction without a logical clock.
+
+        Arguments:
+
+        """
+
+        self.state["unit"] = 0
+        binlog_apply.route_event(self.state, b"Query", self.query)
+
+        mock_start.assert_called_once_with(self.state, clock=None)
+
+    @mock.patch("binlog_apply.start_unit")
+    def test_no_gtid_begin(self, mock_start):
+
+        """Function:  test_no_gtid_begin
+
+        Description:  Test that the events of a transaction without a GTID
+            event stay in its unit until the transaction ends.
+
+        Arguments:
+
+        """
+
+        self.state["unit"], self.state["targets"] = 3, [1]
+        binlog_apply.route_event(self.state, b"Query", self.query)
+        binlog_apply.route_event(
+            self.state, b"Query",
+            self.query[:2] + [b"INSERT INTO t1 VALUES (1)\n", b"/*!*/;\n"])
+
+        mock_start.assert_not_called()
+        self.assertTrue(self.state["in_txn"])
+        self.assertFalse(self.state["closed"])
+
+    def test_no_gtid(self):
+
+        """Function:  test_no_gtid
+
+        Description:  Test that a binary log without GTID events is split
+            into a unit per transaction at the Xid events and statements
+            outside a transaction, and each is kept for the checkpoint.
+
+        Arguments:
+
+        """
+
+        self.state["ckpt"] = {"path": "/dir/restore.ckpt"}
+        events = [
+            (b"Start", [b"# at 4\n", b"#240101 10:00:00 server id 1"
+                        b"  end_log_pos 120 \tStart: binlog v 4\n"])]
+
+        for pos, kind, stmt in [
+                (120, b"Query", b"BEGIN\n"),
+                (190, b"Write_rows", None),
+                (250, b"Xid", b"COMMIT/*!*/;\n"),
+                (281, b"Query", b"BEGIN\n"),
+                (351, b"Query", b"INSERT INTO t1 VALUES (2)\n"),
+                (451, b"Query", b"COMMIT\n"),
+                (520, b"Query", b"CREATE TABLE t2 (a INT)\n"),
+                (620, b"Query", b"DROP TABLE t2\n")]:
+            events.append((kind, [
+                f"# at {pos}\n".encode(),
+                f"#240101 10:00:01 server id 1  end_log_pos {pos + 50}"
+                f" \t{kind.decode()}\n".encode()]
+                + ([stmt, b"/*!*/;\n"] if kind == b"Query" else [])
+                + ([stmt] if kind == b"Xid" else [])))
+
+        for kind, lines in events:
+            binlog_apply.route_event(self.state, kind, lines)
+
+        self.assertEqual(self.state["txns"], 4)
+        self.assertEqual(
+            self.state["procs"][0].stdin.getvalue().count(b"SELECT 'mla:"), 3)
+        self.assertEqual(
+            list(self.state["units"].items()),
+            [(1, ["binlog1", 120, 300, False]),
+             (2, ["binlog1", 281, 501, False]),
+             (3, ["binlog1", 520, 570, False]),
+             (4, ["binlog1", 620, 670, False])])
+
+    @mock.patch("binlog_apply.start_unit")
+    def test_same_unit(self, mock_start):
+
+        """Function:  test_same_unit
+
+        Description:  Test that an event is added to the current transaction
+            and its session state is kept.
+
+        Arguments:
+
+        """
+
+        self.state["unit"], self.state["targets"] = 3, [1]
+        binlog_apply.route_event(self.state, b"Query", self.query)
+
+        mock_start.assert_not_called()
+        self.assertEqual(self.state["procs"][1].stdin.getvalue(),
+                         b"".join(self.query))
+        self.assertEqual(self.state["session"],
+                         {b"use": b"use `db1`/*!*/;\n"})
+
+    @mock.patch("binlog_apply.start_unit")
+    def test_skip(self, mock_start):
+
+        """Function:  test_skip
+
+        Description:  Test that a transaction committed past the checkpoint
+            is not applied again.
+
+        Arguments:
+
+        """
+
+        self.state["skip"] = {("binlog1", 125)}
+        binlog_apply.route_event(self.state, b"Anonymous_GTID", self.gtid)
+
+        mock_start.assert_not_called()
+        self.assertEqual(self.state["unit"], -1)
+        self.assertEqual(self.state["targets"], [])
+
+    @mock.patch("binlog_apply.track_unit")
+    def test_checkpoint(self, mock_track):
+
+        """Function:  test_checkpoint
+
+        Description:  Test that the transaction positions are kept with a
+            checkpoint.
+
+        Arguments:
+
+        """
+
+        self.state["ckpt"] = {"path": "/dir/restore.ckpt"}
+        self.state["unit"], self.state["targets"] = 3, [1]
+        binlog_apply.route_event(self.state, b"Query", self.query)
+
+        mock_track.assert_called_once_with(self.state, 204, self.query)
+
+    def test_profile(self):
+
+        """Function:  test_profile
+
+        Description:  Test that the checks the event turns on are left off
+            with the fast restore profile.
+
+        Arguments:
+
+        """
+
+        self.state["profile"] = True
+        self.state["unit"], self.state["targets"] = 3, [0]
+        flags = (b"SET @@session.foreign_key_checks=1,"
+                 b" @@session.sql_auto_is_null=0,"
+                 b" @@session.unique_checks=1/*!*/;\n")
+        binlog_apply.route_event(
+            self.state, b"Query", self.query[:2] + [flags])
+
+        self.assertTrue(self.state["procs"][0].stdin.getvalue().endswith(
+            b"SET @@session.foreign_key_checks=0,"
+            b" @@session.sql_auto_is_null=0,"
+            b" @@session.unique_checks=0/*!*/;\n"))
+
+    def test_route_event(self):
+
+        """Function:  test_route_event
+
+        Description:  Test that a GTID event ends the current transaction
+            and starts one with its logical clock.
+
+        Arguments:
+
+        """
+
+        self.state["unit"], self.state["targets"] = 1, [0]
+        self.state["outstanding"], self.state["depth"] = {1: (0, 5)}, [1, 0]
+        self.state["txns"] = 1
+        binlog_apply.route_event(self.state, b"Anonymous_GTID", self.gtid)
+
+        self.assertEqual(self.state["procs"][0].stdin.getvalue(),
+                         b"SELECT 'mla:1'/*!*/;\n")
+        self.assertEqual(self.state["procs"][1].stdin.getvalue(),
+                         b"".join(self.gtid))
+        self.assertEqual(self.state["outstanding"][2], (1, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
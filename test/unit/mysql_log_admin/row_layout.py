@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  row_layout.py
+
+    Description:  Unit testing of row_layout in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/row_layout.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fixed
+        test_row_layout
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.columns = [(3, b""), (15, b"\x40\x00"), (18, b"\x00"),
+                        (246, b"\x0a\x02"), (252, b"\x02"), (8, b"")]
+
+    def test_fixed(self):
+
+        """Function:  test_fixed
+
+        Description:  Test with a row image of fixed size columns only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.row_layout([0, 2, 5], self.columns),
+            ([], 17, [(4, 0), (5, 0), (8, 0)]))
+
+    def test_row_layout(self):
+
+        """Function:  test_row_layout
+
+        Description:  Test that the fixed sizes between the length prefixed
+            values are added together.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.row_layout(list(range(6)), self.columns),
+            ([(4, 1), (10, 2)], 8,
+             [(4, 0), (0, 1), (5, 0), (5, 0), (0, 2), (8, 0)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
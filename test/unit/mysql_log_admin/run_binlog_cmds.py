@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  run_binlog_cmds.py
+
+    Description:  Unit testing of run_binlog_cmds in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/run_binlog_cmds.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_cmds
+        test_failed_cmd
+        test_run_binlog_cmds
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.read_fd, self.write_fd = os.pipe()
+
+    def test_no_cmds(self):
+
+        """Function:  test_no_cmds
+
+        Description:  Test that the pipe is closed with no commands.
+
+        Arguments:
+
+        """
+
+        codes = []
+        binlog_tee.run_binlog_cmds([], self.write_fd, codes)
+
+        with os.fdopen(self.read_fd, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"")
+
+        self.assertEqual(codes, [])
+
+    def test_failed_cmd(self):
+
+        """Function:  test_failed_cmd
+
+        Description:  Test that the commands after a failed command are not
+            run.
+
+        Arguments:
+
+        """
+
+        codes = []
+        binlog_tee.run_binlog_cmds(
+            [["printf", "first\\n"], ["false"], ["printf", "second\\n"]],
+            self.write_fd, codes)
+
+        with os.fdopen(self.read_fd, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"first\n")
+
+        self.assertEqual(codes, [0, 1])
+
+    def test_run_binlog_cmds(self):
+
+        """Function:  test_run_binlog_cmds
+
+        Description:  Test that the commands are run in order into the pipe.
+
+        Arguments:
+
+        """
+
+        codes = []
+        binlog_tee.run_binlog_cmds(
+            [["printf", "first\\n"], ["printf", "second\\n"]], self.write_fd,
+            codes)
+
+        with os.fdopen(self.read_fd, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"first\nsecond\n")
+
+        self.assertEqual(codes, [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,6 +22,8 @@ import mock
 # Local
 sys.path.append(os.getcwd())
 import mysql_log_admin                          # pylint:disable=E0401,C0413
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_service                           # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
@@ -32,7 +34,7 @@ def fetch_log_pos(server, args_array, opt_arg_list):
 
     """Method:  fetch_log_pos
 
-    Description:  Stub holder for mysql_log_admin.fetch_log_pos function.
+    Description:  Stub holder for binlog_search.fetch_log_pos function.
 
     Arguments:
 
@@ -168,6 +170,7 @@ class UnitTest(unittest.TestCase):
         setUp
         test_connect_failure
         test_connect_successful
+        test_service
         test_run_program
 
     """
@@ -229,6 +232,33 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(mysql_log_admin.run_program(
             self.args, self.func_list, self.opt_arg_list))
 
+    @mock.patch("binlog_search.fetch_log_pos")
+    @mock.patch("binlog_service.serve_requests")
+    @mock.patch("mysql_log_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_log_admin.mysql_libs.create_instance")
+    def test_service(self, mock_server, mock_serve, mock_func):
+
+        """Function:  test_service
+
+        Description:  Test that the service is run with -S.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-S"] = "/dir/sock"
+        self.args.args_array["-L"] = True
+        self.func_list = {"-L": mock_func}
+        mock_server.return_value = self.server
+
+        self.assertFalse(mysql_log_admin.run_program(
+            self.args, self.func_list, self.opt_arg_list, "ReqOpts"))
+        mock_serve.assert_called_once_with(
+            self.server, self.args, self.func_list, self.opt_arg_list,
+            "ReqOpts")
+        mock_func.assert_not_called()
+
     @mock.patch("mysql_log_admin.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_log_admin.mysql_libs.create_instance")
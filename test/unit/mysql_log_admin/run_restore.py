@@ -0,0 +1,239 @@
+# Classification (U)
+
+"""Program:  run_restore.py
+
+    Description:  Unit testing of run_restore in binlog_restore.py.
+
+    Usage:
+        test/unit/mysql_log_admin/run_restore.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_restore                           # pylint:disable=E0401,C0413
+import binlog_tee                               # pylint:disable=E0401,C0413
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-e": ["mysql_cfg"], "-d": "config", "-p": "/path"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Server name
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_error
+        test_apply
+        test_tee
+        test_throttle
+        test_run_restore
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.targets = [Server("target1"), Server("target2")]
+        self.cmds = [["mysql", "target1"], ["mysql", "target2"]]
+        self.plan = {"cmds": [["mysqlbinlog", "binlog1"]],
+                     "binlogs": [["binlog1"]], "resume": None}
+
+    @mock.patch("binlog_restore.restore_binlog")
+    def test_error(self, mock_restore):
+
+        """Function:  test_error
+
+        Description:  Test that an error of the restore is printed.
+
+        Arguments:
+
+        """
+
+        mock_restore.side_effect = ValueError("mysqlbinlog exited with 2")
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            binlog_restore.run_restore(
+                self.args, self.targets[:1], self.cmds[:1], self.plan)
+
+        self.assertIn("mysqlbinlog exited with 2", mock_out.getvalue())
+
+    @mock.patch("binlog_tee.tee_binlog")
+    @mock.patch("binlog_apply.apply_binlog")
+    def test_apply(self, mock_apply, mock_tee):
+
+        """Function:  test_apply
+
+        Description:  Test that -k restores through the parallel applier.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = "/dir/restore.ckpt"
+        binlog_restore.run_restore(
+            self.args, self.targets, self.cmds, self.plan)
+
+        self.assertEqual(
+            mock_apply.call_args[0][:6],
+            (self.plan["cmds"], self.cmds[0], 1, [["binlog1"]],
+             "/dir/restore.ckpt", None))
+        mock_tee.assert_not_called()
+
+    @mock.patch("binlog_tee.tee_binlog")
+    def test_tee(self, mock_tee):
+
+        """Function:  test_tee
+
+        Description:  Test that more than one target are restored to at once
+            and a failed target is printed.
+
+        Arguments:
+
+        """
+
+        mock_tee.return_value = (None, [0, 1])
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            binlog_restore.run_restore(
+                self.args, self.targets, self.cmds, self.plan)
+
+        self.assertEqual(
+            mock_tee.call_args[0][:4],
+            (self.plan["cmds"], self.cmds, None, 64 * 1048576))
+        self.assertEqual(
+            mock_out.getvalue(), "load_log:  Error encountered on slave"
+            " target2: mysql exited with 1\n")
+
+    @mock.patch("binlog_tee.stop_throttle",
+                mock.Mock(return_value=2097152))
+    @mock.patch("binlog_tee.start_throttle",
+                mock.Mock(return_value="throttle"))
+    @mock.patch("binlog_restore.restore_binlog")
+    def test_throttle(self, mock_restore):
+
+        """Function:  test_throttle
+
+        Description:  Test that the restore is throttled and the rate is
+            printed with -x.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-x"] = True
+        mock_restore.return_value = (100, 2)
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            binlog_restore.run_restore(
+                self.args, self.targets[:1], self.cmds[:1], self.plan)
+
+        self.assertEqual(mock_restore.call_args[1]["throttle"], "throttle")
+        self.assertIn("Throttle: 2.0 MB/s", mock_out.getvalue())
+
+    @mock.patch("binlog_restore.restore_binlog")
+    def test_run_restore(self, mock_restore):
+
+        """Function:  test_run_restore
+
+        Description:  Test that a single target is restored through a pipe.
+
+        Arguments:
+
+        """
+
+        mock_restore.return_value = None
+        binlog_restore.run_restore(
+            self.args, self.targets[:1], self.cmds[:1], self.plan)
+
+        mock_restore.assert_called_once_with(
+            self.plan["cmds"], self.cmds[0], None, throttle=None, filt=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
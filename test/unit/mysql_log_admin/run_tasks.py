@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  run_tasks.py
+
+    Description:  Unit testing of run_tasks in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/run_tasks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def task(delay, name):
+
+    """Function:  task
+
+    Description:  Task which waits and returns its name.
+
+    Arguments:
+        (input) delay -> Seconds to wait
+        (input) name -> Task name
+        (output) name -> Task name
+
+    """
+
+    time.sleep(delay)
+
+    return name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_close
+        test_run_tasks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.arg_list = [(0.1, "a"), (0.01, "b"), (0.05, "c")]
+        self.sched = {"pending": [0, 2, 1], "futures": {}, "running": set(),
+                      "held": 0, "began": {}, "ended": {},
+                      "sizes": [3, 1, 2], "workers": 2, "mem_bytes": None,
+                      "max_held": None}
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test that closing the generator leaves no task held.
+
+        Arguments:
+
+        """
+
+        results = binlog_fetch.run_tasks(
+            task, self.arg_list, False, self.sched)
+
+        self.assertEqual(next(results), "a")
+        results.close()
+        self.assertEqual(
+            sorted(self.sched["ended"]), sorted(self.sched["began"]))
+
+    def test_run_tasks(self):
+
+        """Function:  test_run_tasks
+
+        Description:  Test that the results are yielded in argument order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_fetch.run_tasks(
+                task, self.arg_list, False, self.sched)), ["a", "b", "c"])
+        self.assertEqual(self.sched["held"], 0)
+        self.assertEqual(self.sched["futures"], {})
+        self.assertEqual(sorted(self.sched["ended"]), [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  save_checkpoint.py
+
+    Description:  Unit testing of save_checkpoint in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/save_checkpoint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import collections
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_nothing_committed
+        test_not_due
+        test_save_checkpoint
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {
+            "ckpt": {"path": "/dir/restore.ckpt", "time": time.time(),
+                     "binlog": None, "pos": None},
+            "units": collections.OrderedDict([
+                (1, ["binlog1", 100, 200, True]),
+                (2, ["binlog1", 200, 300, False]),
+                (-1, ["binlog1", 300, 400, True])])}
+
+    @mock.patch("binlog_apply.write_checkpoint")
+    def test_nothing_committed(self, mock_write):
+
+        """Function:  test_nothing_committed
+
+        Description:  Test that no checkpoint is written before a
+            transaction is committed.
+
+        Arguments:
+
+        """
+
+        self.state["units"][1][3] = False
+        binlog_apply.save_checkpoint(self.state, force=True)
+
+        mock_write.assert_not_called()
+
+    @mock.patch("binlog_apply.write_checkpoint")
+    def test_not_due(self, mock_write):
+
+        """Function:  test_not_due
+
+        Description:  Test that the checkpoint is moved but not written
+            within CHECKPOINT_SECS.
+
+        Arguments:
+
+        """
+
+        binlog_apply.save_checkpoint(self.state)
+
+        mock_write.assert_not_called()
+        self.assertEqual(self.state["ckpt"]["pos"], 200)
+        self.assertEqual(list(self.state["units"]), [2, -1])
+
+    @mock.patch("binlog_apply.write_checkpoint")
+    def test_save_checkpoint(self, mock_write):
+
+        """Function:  test_save_checkpoint
+
+        Description:  Test that the checkpoint has the transactions
+            committed past its position.
+
+        Arguments:
+
+        """
+
+        binlog_apply.save_checkpoint(self.state, force=True)
+
+        mock_write.assert_called_once_with(
+            "/dir/restore.ckpt", {"binlog": "binlog1", "pos": 200,
+                                  "applied": [["binlog1", 300]]})
+
+
+if __name__ == "__main__":
+    unittest.main()
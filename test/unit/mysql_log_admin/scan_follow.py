@@ -0,0 +1,217 @@
+# Classification (U)
+
+"""Program:  scan_follow.py
+
+    Description:  Unit testing of scan_follow in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/scan_follow.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import collections
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_offset
+        test_ddl
+        test_xid
+        test_open_txn
+        test_position
+        test_no_lines
+        test_scan_follow
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.head = (
+            b"DELIMITER /*!*/;\n# at 4\n"
+            b"#240102  3:04:05 server id 1  end_log_pos 126 CRC32 0x1a2b3c4d"
+            b" \tStart: binlog v 4, server v 8.0.36 created\n"
+            b"#700101  0:00:00 server id 1  end_log_pos 0 CRC32 0x1a2b3c4d"
+            b" \tRotate to binlog.000002  pos: 4\n")
+        self.txn = (
+            b"# at 157\n"
+            b"#240102  3:04:06 server id 1  end_log_pos 236 CRC32 0x1a2b3c4d"
+            b" \tAnonymous_GTID\tlast_committed=0\n# at 236\n"
+            b"#240102  3:04:06 server id 1  end_log_pos 315"
+            b" \tQuery\tthread_id=8\nBEGIN\n/*!*/;\n# at 315\n"
+            b"#240102  3:04:06 server id 1  end_log_pos 400"
+            b" \tWrite_rows: table id 90 flags: STMT_END_F\n# at 400\n"
+            b"#240102  3:04:06 server id 1  end_log_pos 431"
+            b" \tXid = 12\nCOMMIT/*!*/;\n")
+        self.ddl = (
+            b"# at 431\n"
+            b"#240102  3:04:07 server id 1  end_log_pos 510 CRC32 0x1a2b3c4d"
+            b" \tAnonymous_GTID\tlast_committed=1\n# at 510\n"
+            b"#240102  3:04:07 server id 1  end_log_pos 600"
+            b" \tQuery\tthread_id=8\nCREATE TABLE t1 (a INT)\n/*!*/;\n")
+        self.rotate = (
+            b"# at 600\n"
+            b"#240102  3:04:08 server id 1  end_log_pos 0 CRC32 0x1a2b3c4d"
+            b" \tRotate to binlog.000003  pos: 4\n")
+        self.state = {"binlog": None, "pos": None, "events": 0,
+                      "latency": collections.deque(), "scanned": 0,
+                      "at": None, "open": False, "closing": False,
+                      "end": None}
+
+    def test_offset(self):
+
+        """Function:  test_offset
+
+        Description:  Test that the boundary offset counts the lines already
+            scanned.
+
+        Arguments:
+
+        """
+
+        data = self.head + self.txn + self.ddl[:60]
+        binlog_display.scan_follow(self.head, self.state)
+
+        self.assertEqual(
+            binlog_display.scan_follow(data[len(self.head):], self.state),
+            len(self.head) + len(self.txn))
+        self.assertEqual(self.state["scanned"], len(data))
+
+    def test_ddl(self):
+
+        """Function:  test_ddl
+
+        Description:  Test that a statement outside a transaction ends at
+            its terminator.
+
+        Arguments:
+
+        """
+
+        data = self.head + self.txn + self.ddl
+
+        self.assertEqual(
+            binlog_display.scan_follow(data, self.state), len(data))
+        self.assertEqual(self.state["pos"], 600)
+
+    def test_xid(self):
+
+        """Function:  test_xid
+
+        Description:  Test that a transaction ends after its Xid commit.
+
+        Arguments:
+
+        """
+
+        data = self.head + self.txn
+
+        self.assertEqual(
+            binlog_display.scan_follow(data, self.state), len(data))
+        self.assertEqual(
+            (self.state["binlog"], self.state["pos"]), ("binlog.000002", 431))
+
+    def test_open_txn(self):
+
+        """Function:  test_open_txn
+
+        Description:  Test that an open transaction keeps the start of its
+            GTID event as the boundary.
+
+        Arguments:
+
+        """
+
+        data = self.head + self.txn[:self.txn.index(b"# at 400")]
+
+        self.assertEqual(
+            binlog_display.scan_follow(data, self.state), len(self.head))
+        self.assertEqual(self.state["pos"], 157)
+        self.assertTrue(self.state["open"])
+
+    def test_position(self):
+
+        """Function:  test_position
+
+        Description:  Test with the start of the last transaction in a
+            binary log.
+
+        Arguments:
+
+        """
+
+        binlog_display.scan_follow(
+            self.head + self.txn[:self.txn.index(b"BEGIN")], self.state)
+
+        self.assertEqual(
+            (self.state["binlog"], self.state["pos"]), ("binlog.000002", 157))
+
+    def test_no_lines(self):
+
+        """Function:  test_no_lines
+
+        Description:  Test with no complete lines.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_display.scan_follow(b"", self.state))
+        self.assertEqual(
+            self.state, {"binlog": None, "pos": None, "events": 0,
+                         "latency": collections.deque(), "scanned": 0,
+                         "at": None, "open": False, "closing": False,
+                         "end": None})
+
+    def test_scan_follow(self):
+
+        """Function:  test_scan_follow
+
+        Description:  Test that rotations, positions and event latencies are
+            tracked.
+
+        Arguments:
+
+        """
+
+        data = self.head + self.txn + self.ddl + self.rotate
+
+        self.assertEqual(
+            binlog_display.scan_follow(data, self.state), len(data))
+        self.assertEqual(
+            (self.state["binlog"], self.state["pos"]), ("binlog.000003", 4))
+        self.assertEqual(self.state["events"], 6)
+        self.assertEqual(len(self.state["latency"]), 6)
+        self.assertGreater(min(self.state["latency"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
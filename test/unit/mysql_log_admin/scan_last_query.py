@@ -0,0 +1,158 @@
+# Classification (U)
+
+"""Program:  scan_last_query.py
+
+    Description:  Unit testing of scan_last_query in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/scan_last_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_query
+        test_index_stop_ts
+        test_stop_ts
+        test_start_ts
+        test_scan_last_query
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        data = b"\xfebin"
+
+        for tstamp, etype in [(100, 15), (110, 2), (120, 16), (130, 2),
+                              (140, 16)]:
+            data += binlog_files.crt_event(tstamp, etype, len(data), b"body")
+
+        with open(self.binlog, "wb") as f_hdlr:
+            f_hdlr.write(data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_no_query(self):
+
+        """Function:  test_no_query
+
+        Description:  Test with no Query between the timestamps.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            binlog_reader.scan_last_query(self.binlog, 111, 129))
+
+    def test_index_stop_ts(self):
+
+        """Function:  test_index_stop_ts
+
+        Description:  Test that the whole binary log is indexed when the scan
+            stops at the stop timestamp.
+
+        Arguments:
+
+        """
+
+        index_file = os.path.join(self.tmp_dir.name, "binlog.000001.idx")
+
+        self.assertEqual(
+            binlog_reader.scan_last_query(
+                self.binlog, stop_ts=130, index_file=index_file), 50)
+
+        data = binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000001", os.path.getsize(self.binlog))
+        self.assertEqual(
+            binlog_reader.search_binlog_index(data)[:2], (140, 119))
+        data.close()
+
+    def test_stop_ts(self):
+
+        """Function:  test_stop_ts
+
+        Description:  Test with stop timestamp passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.scan_last_query(self.binlog, stop_ts=130), 50)
+
+    def test_start_ts(self):
+
+        """Function:  test_start_ts
+
+        Description:  Test with start timestamp passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.scan_last_query(self.binlog, start_ts=111), 96)
+
+    def test_scan_last_query(self):
+
+        """Function:  test_scan_last_query
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_reader.scan_last_query(self.binlog), 96)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  scan_spool.py
+
+    Description:  Unit testing of scan_spool in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/scan_spool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_events
+        test_start_pos
+        test_scan_spool
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.spool = io.BytesIO()
+        self.lines = [
+            b"DELIMITER /*!*/;\n", b"# at 4\n",
+            b"SET @@session.pseudo_thread_id=8/*!*/;\n",
+            b"/*!\\C utf8mb4 *//*!*/;\n",
+            b"SET @@session.character_set_client=255/*!*/;\n",
+            b"# at 200\n", b"SET @@session.pseudo_thread_id=9/*!*/;\n",
+            b"SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /*!*/;\n",
+            b"DELIMITER ;\n"]
+
+    def test_no_events(self):
+
+        """Function:  test_no_events
+
+        Description:  Test with no events in the output.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_display.scan_spool(["DELIMITER /*!*/;\n"], self.spool),
+            (None, None, ({}, {})))
+        self.assertEqual(self.spool.getvalue(), b"DELIMITER /*!*/;\n")
+
+    def test_start_pos(self):
+
+        """Function:  test_start_pos
+
+        Description:  Test that session lines before the start position are
+            not recorded.
+
+        Arguments:
+
+        """
+
+        start, _, (first, last) = binlog_display.scan_spool(
+            self.lines, self.spool, 200)
+
+        self.assertEqual(start, 131)
+        self.assertEqual(
+            first, {b"pseudo_thread_id": (140, 179, self.lines[6])})
+        self.assertEqual(last, {b"pseudo_thread_id": self.lines[6]})
+
+    def test_scan_spool(self):
+
+        """Function:  test_scan_spool
+
+        Description:  Test the offsets and session lines of the output.
+
+        Arguments:
+
+        """
+
+        start, end, (first, last) = binlog_display.scan_spool(
+            self.lines, self.spool)
+
+        self.assertEqual((start, end), (17, 179))
+        self.assertEqual(first, {
+            b"pseudo_thread_id": (24, 63, self.lines[2]),
+            b"character_set_client": (63, 131, self.lines[4])})
+        self.assertEqual(last, {
+            b"pseudo_thread_id": self.lines[6],
+            b"character_set_client": self.lines[4]})
+        self.assertEqual(self.spool.getvalue(), b"".join(self.lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
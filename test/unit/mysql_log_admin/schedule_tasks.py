@@ -0,0 +1,284 @@
+# Classification (U)
+
+"""Program:  schedule_tasks.py
+
+    Description:  Unit testing of schedule_tasks in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/schedule_tasks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Recorder():
+
+    """Class:  Recorder
+
+    Description:  Records the order the tasks start in and the most tasks
+        running at the same time.
+
+    Methods:
+        __init__
+        run
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.lock = threading.Lock()
+        self.started = []
+        self.running = 0
+        self.most = 0
+
+    def run(self, name):
+
+        """Method:  run
+
+        Description:  Task which records its start and returns its name.
+
+        Arguments:
+            (input) name -> Task name
+
+        """
+
+        with self.lock:
+            self.started.append(name)
+            self.running += 1
+            self.most = max(self.most, self.running)
+
+        time.sleep(0.05)
+
+        with self.lock:
+            self.running -= 1
+
+        return name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_inline
+        test_process
+        test_largest_first
+        test_memory_budget
+        test_next_forced
+        test_max_held
+        test_inline_stats
+        test_stats
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.recorder = Recorder()
+        self.arg_list = [("a",), ("b",), ("c",), ("d",)]
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no arguments.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_fetch.schedule_tasks(pow, [], 4)), [])
+
+    def test_inline(self):
+
+        """Function:  test_inline
+
+        Description:  Test that a single worker runs the tasks inline in
+            argument order.
+
+        Arguments:
+
+        """
+
+        with mock.patch("binlog_fetch.concurrent.futures") as mock_pool:
+            self.assertEqual(
+                list(binlog_fetch.schedule_tasks(
+                    self.recorder.run, self.arg_list,
+                    sizes=[1, 4, 2, 3])), ["a", "b", "c", "d"])
+            mock_pool.ThreadPoolExecutor.assert_not_called()
+
+        self.assertEqual(self.recorder.started, ["a", "b", "c", "d"])
+
+    def test_process(self):
+
+        """Function:  test_process
+
+        Description:  Test with process workers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_fetch.schedule_tasks(
+                pow, [(1, 2), (3, 4), (5, 6)], 2, process=True,
+                sizes=[1, 3, 2])), [1, 81, 15625])
+
+    def test_largest_first(self):
+
+        """Function:  test_largest_first
+
+        Description:  Test that the largest tasks are started first and the
+            results are in argument order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_fetch.schedule_tasks(
+                self.recorder.run, self.arg_list, 2, sizes=[1, 4, 2, 3])),
+            ["a", "b", "c", "d"])
+        self.assertEqual(set(self.recorder.started[:2]), {"b", "d"})
+        self.assertEqual(set(self.recorder.started[2:]), {"a", "c"})
+
+    def test_memory_budget(self):
+
+        """Function:  test_memory_budget
+
+        Description:  Test that tasks are not started past the memory
+            budget.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_fetch.schedule_tasks(
+                self.recorder.run, self.arg_list, 4, sizes=[100] * 4,
+                mem_bytes=150)), ["a", "b", "c", "d"])
+        self.assertEqual(self.recorder.most, 1)
+
+    def test_next_forced(self):
+
+        """Function:  test_next_forced
+
+        Description:  Test that the next task to be yielded is started past
+            the memory budget.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_fetch.schedule_tasks(
+                self.recorder.run, self.arg_list[:2], 2, sizes=[10, 100],
+                mem_bytes=100)), ["a", "b"])
+        self.assertEqual(self.recorder.started[0], "b")
+        self.assertEqual(self.recorder.most, 2)
+
+    def test_max_held(self):
+
+        """Function:  test_max_held
+
+        Description:  Test that tasks are not started past the maximum
+            number of tasks held, except for the next task to be yielded.
+
+        Arguments:
+
+        """
+
+        results = binlog_fetch.schedule_tasks(
+            self.recorder.run, self.arg_list, 4, sizes=[1, 2, 3, 4],
+            max_held=2)
+
+        self.assertEqual(next(results), "a")
+        self.assertEqual(self.recorder.started[:3], ["d", "c", "a"])
+        self.assertEqual(list(results), ["b", "c", "d"])
+        self.assertEqual(self.recorder.most, 3)
+
+    def test_inline_stats(self):
+
+        """Function:  test_inline_stats
+
+        Description:  Test that a single worker is held for the wall time,
+            not only the time it is busy.
+
+        Arguments:
+
+        """
+
+        with mock.patch.dict(binlog_fetch.WORKER_STATS,
+                             {"tasks": 0, "busy": 0.0, "slots": 0.0}):
+            for _ in binlog_fetch.schedule_tasks(
+                    self.recorder.run, self.arg_list):
+                time.sleep(0.05)
+
+            self.assertEqual(binlog_fetch.WORKER_STATS["tasks"], 4)
+            self.assertGreaterEqual(
+                binlog_fetch.WORKER_STATS["slots"],
+                binlog_fetch.WORKER_STATS["busy"] + 0.2)
+
+    def test_stats(self):
+
+        """Function:  test_stats
+
+        Description:  Test that the worker time is added to WORKER_STATS.
+
+        Arguments:
+
+        """
+
+        with mock.patch.dict(binlog_fetch.WORKER_STATS,
+                             {"tasks": 0, "busy": 0.0, "slots": 0.0}):
+            list(binlog_fetch.schedule_tasks(
+                self.recorder.run, self.arg_list, 2))
+
+            self.assertEqual(binlog_fetch.WORKER_STATS["tasks"], 4)
+            self.assertGreaterEqual(
+                binlog_fetch.WORKER_STATS["busy"], 0.2)
+            self.assertGreaterEqual(
+                binlog_fetch.WORKER_STATS["slots"],
+                binlog_fetch.WORKER_STATS["busy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  scramble_password.py
+
+    Description:  Unit testing of scramble_password in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/scramble_password.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import hashlib
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_server                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_password
+        test_unknown_plugin
+        test_caching_sha2
+        test_scramble_password
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.nonce = b"abcdefgh01234567890A"
+
+    def test_no_password(self):
+
+        """Function:  test_no_password
+
+        Description:  Test with no password.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_stream.scramble_password(
+            "mysql_native_password", "", self.nonce), b"")
+
+    def test_unknown_plugin(self):
+
+        """Function:  test_unknown_plugin
+
+        Description:  Test with an unsupported plugin.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            binlog_stream.scramble_password(
+                "sha256_password", "pw", self.nonce)
+
+    def test_caching_sha2(self):
+
+        """Function:  test_caching_sha2
+
+        Description:  Test with caching_sha2_password.
+
+        Arguments:
+
+        """
+
+        stage1 = hashlib.sha256(b"pw").digest()
+        stage2 = hashlib.sha256(
+            hashlib.sha256(stage1).digest() + self.nonce).digest()
+
+        self.assertEqual(
+            binlog_stream.scramble_password(
+                "caching_sha2_password", "pw", self.nonce),
+            bytes(x ^ y for x, y in zip(stage1, stage2)))
+
+    def test_scramble_password(self):
+
+        """Function:  test_scramble_password
+
+        Description:  Test with mysql_native_password.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_stream.scramble_password(
+                "mysql_native_password", "pw", self.nonce),
+            binlog_server.native_password("pw", self.nonce))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Classification (U)
+
+"""Program:  search_binlog_bloom.py
+
+    Description:  Unit testing of search_binlog_bloom in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/search_binlog_bloom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_found
+        test_search_binlog_bloom
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = binlog_filter.BLOOM_HEADER.pack(
+            b"MLABLM01", 1000, 16, 2, 0) + b"\x05\x00"
+
+    @mock.patch("binlog_filter.bloom_bits", mock.Mock(return_value=[0, 8]))
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with a name with a bit that is not set.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            binlog_filter.search_binlog_bloom(self.data, "shop.orders"))
+
+    @mock.patch("binlog_filter.bloom_bits")
+    def test_search_binlog_bloom(self, mock_bits):
+
+        """Function:  test_search_binlog_bloom
+
+        Description:  Test with a name with all its bits set.
+
+        Arguments:
+
+        """
+
+        mock_bits.return_value = [0, 2]
+
+        self.assertTrue(
+            binlog_filter.search_binlog_bloom(self.data, "shop.orders"))
+        mock_bits.assert_called_once_with("shop.orders", 16, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
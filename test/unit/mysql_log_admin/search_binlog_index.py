@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  search_binlog_index.py
+
+    Description:  Unit testing of search_binlog_index in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/search_binlog_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_before_first
+        test_after_last
+        test_no_timestamp
+        test_search_binlog_index
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.binlog = os.path.join(self.tmp_dir.name, "binlog.000001")
+        self.index_file = self.binlog + ".idx"
+        self.layout = [
+            (100, 15), (100, 34), (100, 2), (100, 16), (110, 34), (110, 2),
+            (110, 16), (120, 34), (120, 2), (120, 16)]
+        binlog_files.crt_binlog(self.binlog, self.layout)
+
+        with mock.patch("binlog_reader.INDEX_EVENTS", 2):
+            binlog_reader.build_binlog_index(self.binlog, self.index_file)
+
+        self.data = binlog_reader.open_binlog_index(
+            self.tmp_dir.name, "binlog.000001", 294)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.data.close()
+        self.tmp_dir.cleanup()
+
+    def test_before_first(self):
+
+        """Function:  test_before_first
+
+        Description:  Test with timestamp at the first event.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.search_binlog_index(self.data, 100),
+            (0, 4, 0, 0))
+
+    def test_after_last(self):
+
+        """Function:  test_after_last
+
+        Description:  Test with timestamp after the last event.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.search_binlog_index(self.data, 121),
+            (120, 294, 120, 265))
+
+    def test_no_timestamp(self):
+
+        """Function:  test_no_timestamp
+
+        Description:  Test with no timestamp passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.search_binlog_index(self.data),
+            (120, 294, 120, 265))
+
+    def test_search_binlog_index(self):
+
+        """Function:  test_search_binlog_index
+
+        Description:  Test with timestamp inside the index.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.search_binlog_index(self.data, 115),
+            (110, 207, 110, 178))
+
+
+if __name__ == "__main__":
+    unittest.main()
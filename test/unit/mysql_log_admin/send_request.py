@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  send_request.py
+
+    Description:  Unit testing of send_request in binlog_service.py.
+
+    Usage:
+        test/unit/mysql_log_admin/send_request.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import socket
+import tempfile
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_service                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        service
+        test_send_request
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sock_path = os.path.join(self.tmp_dir.name, "service.sock")
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.sock_path)
+        self.sock.listen()
+        self.request = []
+        self.argv = ["-L", "-s", "2024-01-01 00:00:00"]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+        self.tmp_dir.cleanup()
+
+    def service(self):
+
+        """Function:  service
+
+        Description:  Answers one request with binary log output on
+            standard out and a line on standard error.
+
+        Arguments:
+
+        """
+
+        conn, _ = self.sock.accept()
+
+        with conn:
+            self.request.append(conn.makefile("rb").readline())
+
+            for channel, data in [(1, b"# at 4\n" * 10000),
+                                  (2, b"Binary logs: 1\n"), (1, b"end\n")]:
+                conn.sendall(binlog_service.SERVICE_FRAME.pack(
+                    channel, len(data)) + data)
+
+    def test_send_request(self):
+
+        """Function:  test_send_request
+
+        Description:  Test that the request is sent and the response is
+            copied to standard out and standard error.
+
+        Arguments:
+
+        """
+
+        out = io.TextIOWrapper(io.BytesIO())
+        err = io.TextIOWrapper(io.BytesIO())
+        service = threading.Thread(target=self.service)
+        service.start()
+
+        with mock.patch("sys.stdout", out), mock.patch("sys.stderr", err):
+            binlog_service.send_request(self.sock_path, self.argv)
+
+        service.join()
+
+        self.assertEqual(
+            self.request, [b'["-L", "-s", "2024-01-01 00:00:00"]\n'])
+        self.assertEqual(
+            out.buffer.getvalue(), b"# at 4\n" * 10000 + b"end\n")
+        self.assertEqual(err.buffer.getvalue(), b"Binary logs: 1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,350 @@
+# Classification (U)
+
+"""Program:  serve_request.py
+
+    Description:  Unit testing of serve_request in binlog_service.py.
+
+    Usage:
+        test/unit/mysql_log_admin/serve_request.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_service                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def fetch_log_pos(server, args, opt_arg_list):
+
+    """Function:  fetch_log_pos
+
+    Description:  Stub of fetch_log_pos which prints its arguments.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list ->  Arguments to be added to command line
+
+    """
+
+    print(f"Filename: {server.name}, Position: {args.get_val('-s')}"
+          f" {opt_arg_list[0]}")
+
+
+def fetch_log_entries(server, args, opt_arg_list):
+
+    """Function:  fetch_log_entries
+
+    Description:  Stub of fetch_log_entries which writes bytes and fails.
+
+    Arguments:
+        (input) server -> Server instance
+        (input) args -> ArgParser class instance
+        (input) opt_arg_list ->  Arguments to be added to command line
+
+    """
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(b"# at 4\n")
+    print("Binary logs: 1", file=sys.stderr)
+    raise ValueError(f"{server.name} {args.get_val('-s')} {opt_arg_list[0]}")
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        get_args_keys
+
+    """
+
+    def __init__(self, args_array):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) args_array -> Dictionary of arguments
+
+        """
+
+        self.args_array = args_array
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        is_connected
+        reconnect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Server_Name"
+        self.connected = True
+        self.reconnects = 0
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Method stub holder for mysql_class.Server.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def reconnect(self):
+
+        """Method:  reconnect
+
+        Description:  Method stub holder for mysql_class.Server.reconnect.
+
+        Arguments:
+
+        """
+
+        self.reconnects += 1
+        self.connected = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        request
+        test_not_valid
+        test_follow
+        test_error
+        test_reconnect
+        test_serve_request
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser({"-S": "/dir/sock"})
+        self.func_dict = {"-L": fetch_log_pos, "-D": fetch_log_entries}
+        self.opt_arg_list = ["--force-read"]
+        self.req_opts = "ReqOpts"
+        self.argv = ["-L", "-s", "2024-01-01 00:00:00"]
+        self.stderr = b""
+
+    def request(self, argv):
+
+        """Function:  request
+
+        Description:  Sends a request over a socket pair, serves it and
+            returns the standard out of the response.  The standard error
+            is kept in stderr.
+
+        Arguments:
+            (input) argv -> List of command line arguments of the request
+            (output) out -> Standard out bytes
+
+        """
+
+        client, conn = socket.socketpair()
+        out = b""
+
+        with client:
+            client.sendall(b'["' + '", "'.join(argv).encode() + b'"]\n')
+            binlog_service.serve_request(
+                self.server, self.args, conn, self.func_dict,
+                self.opt_arg_list, self.req_opts)
+            data = client.makefile("rb").read()
+
+        while data:
+            channel, size = binlog_service.SERVICE_FRAME.unpack_from(data)
+            start = binlog_service.SERVICE_FRAME.size
+
+            if channel == binlog_service.SERVICE_STDERR:
+                self.stderr += data[start:start + size]
+
+            else:
+                out += data[start:start + size]
+
+            data = data[start + size:]
+
+        return out
+
+    @mock.patch("binlog_service.crt_request_args",
+                mock.Mock(return_value=None))
+    def test_not_valid(self):
+
+        """Function:  test_not_valid
+
+        Description:  Test with request arguments that are not valid.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.request(self.argv), b"")
+
+    @mock.patch("binlog_service.crt_request_args")
+    def test_follow(self, mock_req):
+
+        """Function:  test_follow
+
+        Description:  Test that -w is not run by the service.
+
+        Arguments:
+
+        """
+
+        mock_req.return_value = ArgParser({"-D": True, "-w": True})
+
+        self.assertEqual(
+            self.request(["-D", "-w"]),
+            b"serve_request:  Error:  -w is not used with -u.\n")
+
+    @mock.patch("binlog_service.crt_request_args")
+    def test_error(self, mock_req):
+
+        """Function:  test_error
+
+        Description:  Test that an error in a request and its standard
+            error are sent to the client.
+
+        Arguments:
+
+        """
+
+        mock_req.return_value = ArgParser({"-D": True, "-s": "start"})
+
+        self.assertEqual(
+            self.request(["-D", "-s", "start"]),
+            b"# at 4\nserve_request:  Error encountered: Server_Name start"
+            b" --force-read\n")
+        self.assertEqual(self.stderr, b"Binary logs: 1\n")
+        self.assertIs(sys.stdout, sys.__stdout__)
+        self.assertIs(sys.stderr, sys.__stderr__)
+
+    @mock.patch("binlog_service.crt_request_args")
+    def test_reconnect(self, mock_req):
+
+        """Function:  test_reconnect
+
+        Description:  Test that a lost server connection is reconnected.
+
+        Arguments:
+
+        """
+
+        self.server.connected = False
+        mock_req.return_value = ArgParser({"-L": True, "-s": "start"})
+
+        self.request(["-L", "-s", "start"])
+
+        self.assertEqual(self.server.reconnects, 1)
+
+    @mock.patch("binlog_service.crt_request_args")
+    def test_serve_request(self, mock_req):
+
+        """Function:  test_serve_request
+
+        Description:  Test that the request output is sent to the client.
+
+        Arguments:
+
+        """
+
+        mock_req.return_value = ArgParser({"-L": True, "-s": "start"})
+
+        self.assertEqual(
+            self.request(self.argv),
+            b"Filename: Server_Name, Position: start --force-read\n")
+        mock_req.assert_called_once_with(
+            self.args, self.argv, self.req_opts)
+        self.assertEqual(self.server.reconnects, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
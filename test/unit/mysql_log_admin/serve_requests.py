@@ -0,0 +1,251 @@
+# Classification (U)
+
+"""Program:  serve_requests.py
+
+    Description:  Unit testing of serve_requests in binlog_service.py.
+
+    Usage:
+        test/unit/mysql_log_admin/serve_requests.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+import stat
+import tempfile
+import threading
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_service                           # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self, sock_path):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) sock_path -> Path to the unix socket
+
+        """
+
+        self.args_array = {"-S": sock_path}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def connect(sock_path):
+
+    """Function:  connect
+
+    Description:  Connects to the unix socket once it is listening.
+
+    Arguments:
+        (input) sock_path -> Path to the unix socket
+
+    """
+
+    for _ in range(500):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(sock_path)
+                return
+
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(0.01)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        serve_request
+        test_not_socket
+        test_listening
+        test_stale_socket
+        test_serve_requests
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sock_path = os.path.join(self.tmp_dir.name, "service.sock")
+        self.args = ArgParser(self.sock_path)
+        self.modes = []
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def serve_request(self, *args):
+
+        """Function:  serve_request
+
+        Description:  Stub of serve_request which records the socket mode
+            and then stops the service.
+
+        Arguments:
+
+        """
+
+        args[2].close()
+        self.modes.append(stat.S_IMODE(os.stat(self.sock_path).st_mode))
+
+        raise KeyboardInterrupt
+
+    @mock.patch("binlog_service.serve_request")
+    def test_not_socket(self, mock_serve):
+
+        """Function:  test_not_socket
+
+        Description:  Test that a file at the socket path is not removed.
+
+        Arguments:
+
+        """
+
+        with open(self.sock_path, "w", encoding="UTF-8"):
+            pass
+
+        with gen_libs.no_std_out():
+            binlog_service.serve_requests("Server", self.args, {}, [], {})
+
+        self.assertTrue(os.path.isfile(self.sock_path))
+        mock_serve.assert_not_called()
+
+    @mock.patch("binlog_service.serve_request")
+    def test_listening(self, mock_serve):
+
+        """Function:  test_listening
+
+        Description:  Test that the socket of a running service is not
+            removed.
+
+        Arguments:
+
+        """
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(self.sock_path)
+            sock.listen()
+
+            with gen_libs.no_std_out():
+                binlog_service.serve_requests(
+                    "Server", self.args, {}, [], {})
+
+            self.assertTrue(os.path.exists(self.sock_path))
+            mock_serve.assert_not_called()
+
+    @mock.patch("binlog_service.signal.signal", mock.Mock())
+    @mock.patch("binlog_service.serve_request")
+    def test_stale_socket(self, mock_serve):
+
+        """Function:  test_stale_socket
+
+        Description:  Test that a socket left over is replaced.
+
+        Arguments:
+
+        """
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(self.sock_path)
+
+        mock_serve.side_effect = self.serve_request
+        client = threading.Thread(target=connect, args=(self.sock_path,))
+        client.start()
+        binlog_service.serve_requests(
+            "Server", self.args, {}, [], {})
+        client.join()
+
+        self.assertEqual(self.modes, [0o600])
+
+    @mock.patch("binlog_service.signal.signal")
+    @mock.patch("binlog_service.serve_request")
+    def test_serve_requests(self, mock_serve, mock_signal):
+
+        """Function:  test_serve_requests
+
+        Description:  Test that requests are served on a private socket
+            which is removed on shut down.
+
+        Arguments:
+
+        """
+
+        mock_serve.side_effect = self.serve_request
+        client = threading.Thread(target=connect, args=(self.sock_path,))
+        client.start()
+        binlog_service.serve_requests(
+            "Server", self.args, {"-L": "fetch"}, ["--force-read"], "Opts")
+        client.join()
+
+        self.assertEqual(self.modes, [0o600])
+        self.assertFalse(os.path.exists(self.sock_path))
+        self.assertEqual(mock_serve.call_args[0][4], ["--force-read"])
+        mock_signal.assert_called_once_with(
+            binlog_service.signal.SIGTERM,
+            binlog_service.signal.default_int_handler)
+
+
+if __name__ == "__main__":
+    unittest.main()
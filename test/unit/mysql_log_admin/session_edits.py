@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  session_edits.py
+
+    Description:  Unit testing of session_edits in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/session_edits.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first_run
+        test_same_state
+        test_changed_state
+        test_thread_id
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.flags = b"SET @@session.foreign_key_checks=1," \
+            b" @@session.autocommit=1/*!*/;\n"
+        self.mode = b"SET @@session.sql_mode=0/*!*/;\n"
+        self.thread = b"SET @@session.pseudo_thread_id=8/*!*/;\n"
+        self.first = {b"pseudo_thread_id": (10, 20, self.thread),
+                      b"flags": (20, 30, self.flags),
+                      b"sql_mode": (30, 40, self.mode)}
+
+    def test_first_run(self):
+
+        """Function:  test_first_run
+
+        Description:  Test that nothing is edited with no session state.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_display.session_edits(self.first, {}), [])
+
+    def test_same_state(self):
+
+        """Function:  test_same_state
+
+        Description:  Test that the lines are dropped with the same session
+            state.
+
+        Arguments:
+
+        """
+
+        state = {b"pseudo_thread_id": self.thread, b"sql_mode": self.mode,
+                 b"foreign_key_checks": b"1", b"autocommit": b"1"}
+
+        self.assertEqual(
+            binlog_display.session_edits(self.first, state),
+            [(10, 20, b""), (20, 30, b""), (30, 40, b"")])
+
+    def test_changed_state(self):
+
+        """Function:  test_changed_state
+
+        Description:  Test that only the changed flags are kept and a
+            changed line is not edited.
+
+        Arguments:
+
+        """
+
+        state = {b"sql_mode": b"SET @@session.sql_mode=8/*!*/;\n",
+                 b"foreign_key_checks": b"1", b"autocommit": b"0"}
+
+        self.assertEqual(
+            binlog_display.session_edits(self.first, state),
+            [(20, 30, b"SET @@session.autocommit=1/*!*/;\n")])
+
+    def test_thread_id(self):
+
+        """Function:  test_thread_id
+
+        Description:  Test that the thread id is dropped once it has been
+            written, even if it differs.
+
+        Arguments:
+
+        """
+
+        state = {b"pseudo_thread_id": b"SET @@session.pseudo_thread_id=9"
+                                      b"/*!*/;\n"}
+        first = {b"pseudo_thread_id": (10, 20, self.thread)}
+
+        self.assertEqual(
+            binlog_display.session_edits(first, state), [(10, 20, b"")])
+
+
+if __name__ == "__main__":
+    unittest.main()
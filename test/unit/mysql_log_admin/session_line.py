@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  session_line.py
+
+    Description:  Unit testing of session_line in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/session_line.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_session
+        test_not_tracked
+        test_flags
+        test_versioned
+        test_use
+        test_session_line
+
+    """
+
+    def test_not_session(self):
+
+        """Function:  test_not_session
+
+        Description:  Test with a line that does not set the session.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_display.session_line(b"SET TIMESTAMP=1/*!*/;\n"),
+            (None, {}))
+
+    def test_not_tracked(self):
+
+        """Function:  test_not_tracked
+
+        Description:  Test with a session line written for every event.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_display.session_line(
+                b"/*!80001 SET @@session.original_commit_timestamp=1*/"
+                b"/*!*/;\n"), (None, {}))
+
+    def test_flags(self):
+
+        """Function:  test_flags
+
+        Description:  Test with the flags line.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_display.session_line(
+                b"SET @@session.unique_checks=1, @@session.autocommit=0"
+                b"/*!*/;\n"),
+            (b"flags", {b"unique_checks": b"1", b"autocommit": b"0"}))
+
+    def test_versioned(self):
+
+        """Function:  test_versioned
+
+        Description:  Test with a session line in a version comment.
+
+        Arguments:
+
+        """
+
+        line = b"/*!80011 SET @@session.default_collation_for_utf8mb4=255*/" \
+            b"/*!*/;\n"
+
+        self.assertEqual(
+            binlog_display.session_line(line),
+            (b"default_collation_for_utf8mb4",
+             {b"default_collation_for_utf8mb4": line}))
+
+    def test_use(self):
+
+        """Function:  test_use
+
+        Description:  Test with the default database line.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_display.session_line(b"use `db1`/*!*/;\n"),
+            (b"use", {b"use": b"use `db1`/*!*/;\n"}))
+
+    def test_session_line(self):
+
+        """Function:  test_session_line
+
+        Description:  Test with a session line.
+
+        Arguments:
+
+        """
+
+        line = b"SET @@session.sql_mode=1436549152/*!*/;\n"
+
+        self.assertEqual(
+            binlog_display.session_line(line),
+            (b"sql_mode", {b"sql_mode": line}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  skip_image.py
+
+    Description:  Unit testing of skip_image in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/skip_image.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fixed
+        test_nulls
+        test_skip_image
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.layout = binlog_catalog.row_layout(
+            [0, 1, 2], [(3, b""), (15, b"\x40\x00"), (8, b"")])
+
+    def test_fixed(self):
+
+        """Function:  test_fixed
+
+        Description:  Test with a row image of fixed size columns only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.skip_image(
+                b"\xff\0" + b"\x01" * 12, 1,
+                binlog_catalog.row_layout([0, 1], [(3, b""), (8, b"")])), 14)
+
+    def test_nulls(self):
+
+        """Function:  test_nulls
+
+        Description:  Test that the NULL values are skipped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.skip_image(
+                b"\x02" + b"\x01" * 12, 0, self.layout), 13)
+
+    def test_skip_image(self):
+
+        """Function:  test_skip_image
+
+        Description:  Test with a row image without NULL values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.skip_image(
+                b"\0" + b"\x01" * 4 + b"\x03abc" + b"\x01" * 8, 0,
+                self.layout), 17)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  split_binlog_events.py
+
+    Description:  Unit testing of split_binlog_events in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/split_binlog_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_str_lines
+        test_split_binlog_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lines = [
+            b"DELIMITER /*!*/;\n",
+            b"# at 4\n",
+            b"#240101 10:00:00 server id 1  end_log_pos 125 CRC32 0x01"
+            b" \tStart: binlog v 4\n",
+            b"BINLOG 'AAAA'/*!*/;\n",
+            b"# at 125\n",
+            b"#240101 10:00:01 server id 1  end_log_pos 204 CRC32 0x02"
+            b" \tAnonymous_GTID\tlast_committed=0\tsequence_number=1\n",
+            b"SET @@SESSION.GTID_NEXT= 'ANONYMOUS'/*!*/;\n",
+            b"# at 204\n",
+            b"#240101 10:00:01 server id 1  end_log_pos 280 CRC32 0x03"
+            b" \tQuery\tthread_id=8\n",
+            b"BEGIN\n",
+            b"/*!*/;\n",
+            b"SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /* added by mysqlbinlog */"
+            b" /*!*/;\n",
+            b"DELIMITER ;\n",
+            b"# End of log file\n"]
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no lines.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(list(binlog_filter.split_binlog_events([])), [])
+
+    def test_str_lines(self):
+
+        """Function:  test_str_lines
+
+        Description:  Test that text lines are returned as bytes.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.split_binlog_events(
+                [line.decode("utf-8") for line in self.lines[:4]])),
+            [(b"header", self.lines[:1]), (b"Start", self.lines[1:4])])
+
+    def test_split_binlog_events(self):
+
+        """Function:  test_split_binlog_events
+
+        Description:  Test that the lines are grouped into the header, the
+            events and the trailer.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_filter.split_binlog_events(iter(self.lines))),
+            [(b"header", self.lines[:1]), (b"Start", self.lines[1:4]),
+             (b"Anonymous_GTID", self.lines[4:7]),
+             (b"Query", self.lines[7:11]), (b"trailer", self.lines[11:])])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+# Classification (U)
+
+"""Program:  spool_binlog.py
+
+    Description:  Unit testing of spool_binlog in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/spool_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import binlog_filter                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def mysqlbinlog(events):
+
+    """Function:  mysqlbinlog
+
+    Description:  Create the lines of a mysqlbinlog run for a list of event
+        lines.
+
+    Arguments:
+        (input) events -> List of event lines
+
+    """
+
+    return [b"/*!50530 SET @@SESSION.PSEUDO_SLAVE_MODE=1*/;\n",
+            b"DELIMITER /*!*/;\n"] + events + [
+                b"SET @@SESSION.GTID_NEXT= 'AUTOMATIC' /* added by"
+                b" mysqlbinlog */ /*!*/;\n", b"DELIMITER ;\n",
+                b"# End of log file\n"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_trailer
+        test_no_events
+        test_no_gtid
+        test_str_lines
+        test_start_pos
+        test_single_binlog
+        test_filter
+        test_spool_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.events = [b"# at 4\n", b"#250101 10:00:00 Start\n"]
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_no_trailer(self, mock_fetch):
+
+        """Function:  test_no_trailer
+
+        Description:  Test with no mysqlbinlog trailer.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.events
+
+        spool, start, end, _ = binlog_display.spool_binlog(
+            self.server, "binlog1")
+        spool.seek(0)
+        data = spool.read()
+        spool.close()
+
+        self.assertEqual((start, end, data), (0, 30, b"".join(self.events)))
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_no_events(self, mock_fetch):
+
+        """Function:  test_no_events
+
+        Description:  Test with no events in the output.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = mysqlbinlog([])
+
+        spool, start, end, _ = binlog_display.spool_binlog(
+            self.server, "binlog1")
+        spool.seek(0)
+        data = spool.read()
+        spool.close()
+
+        self.assertEqual((start, end), (63, 63))
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_no_gtid(self, mock_fetch):
+
+        """Function:  test_no_gtid
+
+        Description:  Test with no GTID_NEXT line before the trailer.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = \
+            mysqlbinlog(self.events)[:4] + [b"DELIMITER ;\n"]
+
+        spool, start, end, _ = binlog_display.spool_binlog(
+            self.server, "binlog1")
+        spool.seek(0)
+        data = spool.read()
+        spool.close()
+
+        self.assertEqual((start, end), (63, 93))
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_str_lines(self, mock_fetch):
+
+        """Function:  test_str_lines
+
+        Description:  Test with str lines from mysqlbinlog.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = ["# at 4\n"]
+
+        spool, start, end, _ = binlog_display.spool_binlog(
+            self.server, "binlog1")
+        spool.seek(0)
+        data = spool.read()
+        spool.close()
+
+        self.assertEqual((start, end, data), (0, 7, b"# at 4\n"))
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_start_pos(self, mock_fetch):
+
+        """Function:  test_start_pos
+
+        Description:  Test that the events before the start position of a
+            range are not merged.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = mysqlbinlog(
+            self.events + [b"# at 120\n", b"#250101 10:00:00 Query\n"])
+
+        spool, start, end, _ = binlog_display.spool_binlog(
+            self.server, "binlog1", start_pos=120)
+        spool.close()
+
+        self.assertEqual((start, end), (93, 125))
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_single_binlog(self, mock_fetch):
+
+        """Function:  test_single_binlog
+
+        Description:  Test that only the one binary log is passed.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = []
+
+        spool = binlog_display.spool_binlog(
+            self.server, "binlog1", "start", "stop", ["--opt"], "/bin")[0]
+        spool.close()
+
+        mock_fetch.assert_called_once_with(
+            self.server, "start", "stop", ["binlog1"], ["--opt"], "/bin",
+            None)
+
+    @mock.patch("binlog_filter.filter_binlog")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_filter(self, mock_fetch, mock_filter):
+
+        """Function:  test_filter
+
+        Description:  Test that only the lines the filter keeps are spooled.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = mysqlbinlog(self.events)
+        mock_filter.return_value = mysqlbinlog([])
+
+        spool, start, end, _ = binlog_display.spool_binlog(
+            self.server, "binlog1", filt="filter")
+        spool.close()
+
+        self.assertEqual((start, end), (63, 63))
+        mock_filter.assert_called_once_with(
+            mock_fetch.return_value, "filter")
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_spool_binlog(self, mock_fetch):
+
+        """Function:  test_spool_binlog
+
+        Description:  Test with the offsets of the first event and trailer.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = mysqlbinlog(self.events)
+
+        spool, start, end, _ = binlog_display.spool_binlog(
+            self.server, "binlog1")
+        spool.seek(0)
+        data = spool.read()
+        spool.close()
+
+        self.assertEqual((start, end, len(data)), (63, 93, 194))
+
+
+if __name__ == "__main__":
+    unittest.main()
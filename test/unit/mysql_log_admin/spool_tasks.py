@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  spool_tasks.py
+
+    Description:  Unit testing of spool_tasks in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/spool_tasks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        get_val
+
+    """
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return {"-s": "start", "-t": "stop", "-p": "/bin/"}.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_binlogs
+        test_spool_tasks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.sizes = {"binlog1": 1000, "binlog2": 2000}
+
+    def test_binlogs(self):
+
+        """Function:  test_binlogs
+
+        Description:  Test with a run per binary log.
+
+        Arguments:
+
+        """
+
+        arg_list, sizes = binlog_display.spool_tasks(
+            "Server", self.args, ["binlog1", "binlog2"], ["--opt"],
+            ["--start-position=120"], "/dir", ["--stop-position=900"],
+            sizes=self.sizes)
+
+        self.assertEqual(arg_list, [
+            ("Server", "binlog1", "start", "stop",
+             ["--opt", "--start-position=120"], "/bin/", "/dir", None, None),
+            ("Server", "binlog2", "start", "stop",
+             ["--opt", "--stop-position=900"], "/bin/", "/dir", None, None)])
+        self.assertEqual(sizes, [996, 1996])
+
+    def test_spool_tasks(self):
+
+        """Function:  test_spool_tasks
+
+        Description:  Test with a binary log split into ranges.
+
+        Arguments:
+
+        """
+
+        arg_list, sizes = binlog_display.spool_tasks(
+            "Server", self.args, ["binlog1"], [],
+            chunks={"binlog1": [(None, 500), (500, None)]}, sizes=self.sizes,
+            filt="Filter")
+
+        self.assertEqual(arg_list, [
+            ("Server", "binlog1", "start", "stop", ["--stop-position=500"],
+             "/bin/", None, None, "Filter"),
+            ("Server", "binlog1", "start", "stop", ["--start-position=500"],
+             "/bin/", None, 500, "Filter")])
+        self.assertEqual(sizes, [496, 500])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  start_appliers.py
+
+    Description:  Unit testing of start_appliers in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/start_appliers.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import queue
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_profile
+        test_start_appliers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {"procs": [], "acks": queue.Queue(), "profile": False}
+        self.cmd = [sys.executable, "-c",
+                    "import sys; sys.stdout.write(sys.stdin.read())"]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for proc in self.state["procs"]:
+            proc.stdin.close()
+            proc.wait()
+
+    @mock.patch("binlog_apply.APPLY_OPTS", [])
+    @mock.patch("binlog_apply.PROFILE_OPTS", [])
+    @mock.patch("binlog_apply.read_applier")
+    def test_profile(self, mock_read):
+
+        """Function:  test_profile
+
+        Description:  Test that the fast restore profile is set at the start
+            of each session.
+
+        Arguments:
+
+        """
+
+        self.state["profile"] = True
+        binlog_apply.start_appliers(self.state, self.cmd, 1)
+        proc = self.state["procs"][0]
+        proc.stdin.close()
+        proc.wait()
+
+        self.assertEqual(proc.stdout.read(), binlog_apply.PROFILE_START)
+        self.assertEqual(mock_read.call_count, 1)
+
+    @mock.patch("binlog_apply.APPLY_OPTS", [])
+    @mock.patch("binlog_apply.read_applier")
+    def test_start_appliers(self, mock_read):
+
+        """Function:  test_start_appliers
+
+        Description:  Test that a session and a reader thread are started
+            for each worker.
+
+        Arguments:
+
+        """
+
+        binlog_apply.start_appliers(self.state, self.cmd, 2)
+
+        self.assertEqual(len(self.state["procs"]), 2)
+        self.assertEqual(
+            sorted(call[0][0] for call in mock_read.call_args_list), [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  start_tees.py
+
+    Description:  Unit testing of start_tees in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/start_tees.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import shutil
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_start_tees
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.out = [os.path.join(self.tmp_dir, name)
+                    for name in ["target1", "target2"]]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_start_tees(self):
+
+        """Function:  test_start_tees
+
+        Description:  Test that each target gets a mysql client and a writer
+            of the blocks queued for it.
+
+        Arguments:
+
+        """
+
+        tees = binlog_tee.start_tees(
+            [["sh", "-c", "cat > " + name] for name in self.out], 1024)
+
+        for tee in tees:
+            binlog_tee.put_block(tee, b"block\n")
+            binlog_tee.put_block(tee, None)
+            tee["writer"].join()
+            tee["proc"].wait()
+
+        self.assertEqual([tee["max"] for tee in tees], [1024, 1024])
+        self.assertEqual([tee["held"] for tee in tees], [0, 0])
+
+        for name in self.out:
+            with open(name, "rb") as fhdr:
+                self.assertEqual(fhdr.read(), b"block\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+# Classification (U)
+
+"""Program:  start_throttle.py
+
+    Description:  Unit testing of start_throttle in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/start_throttle.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-e": ["target"], "-d": "config", "-T": "30",
+                           "-W": ["replica1", "replica2"]}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, name, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Server name
+            (input) conn_msg -> Connection error message
+
+        """
+
+        self.name = name
+        self.conn_msg = conn_msg
+
+    def connect(self, silent):
+
+        """Method:  connect
+
+        Description:  Connect method.
+
+        Arguments:
+            (input) silent
+
+        """
+
+        return silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_throttled
+        test_start_throttle
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("binlog_tee.mysql_libs.create_instance")
+    def test_not_throttled(self, mock_inst):
+
+        """Function:  test_not_throttled
+
+        Description:  Test with no -T or -E option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-T"]
+
+        self.assertIsNone(binlog_tee.start_throttle(self.args))
+        mock_inst.assert_not_called()
+
+    @mock.patch("binlog_tee.threading.Thread")
+    @mock.patch("binlog_tee.mysql_libs.create_instance")
+    def test_start_throttle(self, mock_inst, mock_thread):
+
+        """Function:  test_start_throttle
+
+        Description:  Test that the throttle connections are opened and the
+            monitor is started, leaving out a replica that cannot be
+            connected to.
+
+        Arguments:
+
+        """
+
+        target = Server("target")
+        replica = Server("replica1")
+        mock_inst.side_effect = [
+            target, replica, Server("replica2", "Error Message")]
+
+        with gen_libs.no_std_out():
+            throttle = binlog_tee.start_throttle(self.args)
+
+        self.assertEqual(throttle["targets"], [target])
+        self.assertEqual(throttle["replicas"], [replica])
+        self.assertEqual(throttle["rate"], binlog_tee.THROTTLE_START)
+        mock_thread.assert_called_once_with(
+            target=binlog_tee.monitor_throttle, args=(throttle, 30, 0),
+            daemon=True)
+        mock_thread.return_value.start.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
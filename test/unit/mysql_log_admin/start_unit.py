@@ -0,0 +1,235 @@
+# Classification (U)
+
+"""Program:  start_unit.py
+
+    Description:  Unit testing of start_unit in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/start_unit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import collections
+import queue
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_state(workers):
+
+    """Function:  crt_state
+
+    Description:  Creates the parallel applier state with mysql client
+        sessions that write to memory.
+
+    Arguments:
+        (input) workers -> Number of mysql client sessions
+        (output) -> Dictionary of the parallel applier state
+
+    """
+
+    procs = [mock.Mock(stdin=io.BytesIO()) for _ in range(workers)]
+
+    return {"procs": procs, "acks": queue.Queue(), "outstanding": {},
+            "depth": [0] * workers,
+            "sessions": [{} for _ in range(workers)], "session": {},
+            "unit": None, "targets": [], "txns": 0, "bytes": 0,
+            "binlog": "binlog1", "skipped": 0, "ckpt": None,
+            "units": collections.OrderedDict(), "skip": set(),
+            "profile": False, "files": [], "gtid": False, "closed": False,
+            "in_txn": False}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_barrier
+        test_least_busy
+        test_queued_behind
+        test_wait_commit
+        test_no_clock
+        test_depth
+        test_session_lines
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = crt_state(3)
+
+    def test_barrier(self):
+
+        """Function:  test_barrier
+
+        Description:  Test that a barrier waits for all sessions and goes to
+            every session.
+
+        Arguments:
+
+        """
+
+        self.state["outstanding"] = {1: (0, 1), 2: (1, 2)}
+        self.state["depth"] = [1, 1, 0]
+        self.state["acks"].put((1, 2))
+        self.state["acks"].put((0, 1))
+        binlog_apply.start_unit(self.state, barrier=True)
+
+        self.assertEqual(self.state["outstanding"], {})
+        self.assertEqual(self.state["unit"], 0)
+        self.assertEqual(self.state["targets"], [0, 1, 2])
+
+    def test_least_busy(self):
+
+        """Function:  test_least_busy
+
+        Description:  Test that a transaction with no queued dependencies
+            goes to the least busy session.
+
+        Arguments:
+
+        """
+
+        self.state["outstanding"] = {1: (0, 1), 2: (2, 2)}
+        self.state["depth"] = [1, 0, 1]
+        self.state["txns"] = 2
+        binlog_apply.start_unit(self.state, clock=(0, 3))
+
+        self.assertEqual(self.state["targets"], [1])
+        self.assertEqual(self.state["outstanding"][3], (1, 3))
+        self.assertEqual(self.state["depth"], [1, 1, 1])
+
+    def test_queued_behind(self):
+
+        """Function:  test_queued_behind
+
+        Description:  Test that a transaction is queued behind the
+            transactions it depends on on one session.
+
+        Arguments:
+
+        """
+
+        self.state["outstanding"] = {1: (2, 1), 2: (2, 2)}
+        self.state["depth"] = [0, 0, 2]
+        self.state["txns"] = 2
+        binlog_apply.start_unit(self.state, clock=(2, 3))
+
+        self.assertEqual(self.state["targets"], [2])
+        self.assertEqual(self.state["unit"], 3)
+
+    def test_wait_commit(self):
+
+        """Function:  test_wait_commit
+
+        Description:  Test that a transaction waits for the transactions it
+            depends on queued on more than one session.
+
+        Arguments:
+
+        """
+
+        self.state["outstanding"] = {1: (0, 1), 2: (1, 2)}
+        self.state["depth"] = [1, 1, 0]
+        self.state["txns"] = 2
+        self.state["acks"].put((0, 1))
+        binlog_apply.start_unit(self.state, clock=(2, 3))
+
+        self.assertTrue(self.state["acks"].empty())
+        self.assertEqual(self.state["targets"], [1])
+
+    def test_no_clock(self):
+
+        """Function:  test_no_clock
+
+        Description:  Test that a transaction without a logical clock goes
+            to the first session once the other sessions are idle.
+
+        Arguments:
+
+        """
+
+        self.state["outstanding"] = {1: (0, 1), 2: (1, 2)}
+        self.state["depth"] = [1, 1, 0]
+        self.state["txns"] = 2
+        self.state["acks"].put((1, 2))
+        binlog_apply.start_unit(self.state)
+
+        self.assertEqual(self.state["targets"], [0])
+        self.assertEqual(self.state["outstanding"],
+                         {1: (0, 1), 3: (0, -1)})
+
+    def test_depth(self):
+
+        """Function:  test_depth
+
+        Description:  Test that a session with APPLY_DEPTH transactions
+            queued is not given more.
+
+        Arguments:
+
+        """
+
+        self.state["outstanding"] = {1: (0, 1), 2: (0, 2)}
+        self.state["depth"] = [2, 0, 0]
+        self.state["txns"] = 2
+        self.state["acks"].put((0, 1))
+
+        with mock.patch("binlog_apply.APPLY_DEPTH", 2):
+            binlog_apply.start_unit(self.state, clock=(2, 3))
+
+        self.assertEqual(self.state["targets"], [0])
+        self.assertEqual(self.state["depth"], [2, 0, 0])
+
+    def test_session_lines(self):
+
+        """Function:  test_session_lines
+
+        Description:  Test that the session state lines the session is
+            missing are written.
+
+        Arguments:
+
+        """
+
+        self.state["session"] = {
+            b"use": b"use `db2`/*!*/;\n",
+            b"SET @@session.sql_mode": b"SET @@session.sql_mode=0/*!*/;\n"}
+        self.state["sessions"][0] = {
+            b"use": b"use `db1`/*!*/;\n",
+            b"SET @@session.sql_mode": b"SET @@session.sql_mode=0/*!*/;\n"}
+        binlog_apply.start_unit(self.state, clock=(0, 1))
+
+        self.assertEqual(self.state["procs"][0].stdin.getvalue(),
+                         b"use `db2`/*!*/;\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
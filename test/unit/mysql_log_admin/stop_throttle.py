@@ -0,0 +1,78 @@
+# Classification (U)
+
+"""Program:  stop_throttle.py
+
+    Description:  Unit testing of stop_throttle in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/stop_throttle.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_throttle
+        test_stop_throttle
+
+    """
+
+    def test_no_throttle(self):
+
+        """Function:  test_no_throttle
+
+        Description:  Test with no throttle.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_tee.stop_throttle(None))
+
+    @mock.patch("binlog_tee.mysql_libs.disconnect")
+    def test_stop_throttle(self, mock_disconnect):
+
+        """Function:  test_stop_throttle
+
+        Description:  Test that the monitor is stopped and the connections
+            are closed.
+
+        Arguments:
+
+        """
+
+        throttle = {"rate": 2048.0, "stop": threading.Event(),
+                    "thread": mock.Mock(), "targets": ["target"],
+                    "replicas": ["replica"]}
+
+        self.assertEqual(binlog_tee.stop_throttle(throttle), 2048.0)
+        self.assertTrue(throttle["stop"].is_set())
+        throttle["thread"].join.assert_called_once_with()
+        self.assertEqual(mock_disconnect.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
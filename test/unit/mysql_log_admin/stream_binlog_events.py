@@ -0,0 +1,194 @@
+# Classification (U)
+
+"""Program:  stream_binlog_events.py
+
+    Description:  Unit testing of stream_binlog_events in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/stream_binlog_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import binlog_server                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, host, port):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.host = host
+        self.port = port
+        self.sql_user = "mysql"
+        self.sql_pass = "japd"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_missing_binlog
+        test_body
+        test_last_binlog
+        test_start_pos
+        test_stream_binlog_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        binlog_files.crt_binlog(
+            os.path.join(self.tmp_dir.name, "binlog1"),
+            [(100, 15), (100, 2), (110, 2)], "binlog2")
+        binlog_files.crt_binlog(
+            os.path.join(self.tmp_dir.name, "binlog2"), [(120, 15), (130, 2)])
+        self.binlog_srv = binlog_server.BinlogServer(
+            self.tmp_dir.name, password="japd")
+        self.binlog_srv.start()
+        self.server = Server(self.binlog_srv.host, self.binlog_srv.port)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.binlog_srv.stop()
+        self.tmp_dir.cleanup()
+
+    def test_missing_binlog(self):
+
+        """Function:  test_missing_binlog
+
+        Description:  Test with a binary log not on the server.
+
+        Arguments:
+
+        """
+
+        with self.assertRaisesRegex(ValueError, "1236"):
+            list(binlog_stream.stream_binlog_events(self.server, "binlog9"))
+
+    def test_body(self):
+
+        """Function:  test_body
+
+        Description:  Test with the event body included.
+
+        Arguments:
+
+        """
+
+        events = list(binlog_stream.stream_binlog_events(
+            self.server, "binlog2", body=True))
+
+        self.assertEqual([event.body for event in events], [b"\0" * 10] * 2)
+
+    def test_last_binlog(self):
+
+        """Function:  test_last_binlog
+
+        Description:  Test with the last binary log, ending with EOF.
+
+        Arguments:
+
+        """
+
+        events = binlog_stream.stream_binlog_events(self.server, "binlog2")
+
+        self.assertEqual(
+            [(event.timestamp, event.type_code, event.offset, event.log_pos)
+             for event in events],
+            [(120, 15, 4, 33), (130, 2, 33, 62)])
+
+    def test_start_pos(self):
+
+        """Function:  test_start_pos
+
+        Description:  Test with a start position.
+
+        Arguments:
+
+        """
+
+        events = binlog_stream.stream_binlog_events(
+            self.server, "binlog1", 33)
+
+        self.assertEqual(
+            [(event.timestamp, event.type_code, event.offset, event.log_pos)
+             for event in events],
+            [(100, 2, 33, 62), (110, 2, 62, 91), (110, 4, 91, 125)])
+
+    def test_stream_binlog_events(self):
+
+        """Function:  test_stream_binlog_events
+
+        Description:  Test with the stream stopped at the Rotate event.
+
+        Arguments:
+
+        """
+
+        events = binlog_stream.stream_binlog_events(self.server, "binlog1")
+
+        self.assertEqual(
+            [(event.timestamp, event.type_code, event.offset, event.log_pos)
+             for event in events],
+            [(100, 15, 4, 33), (100, 2, 33, 62), (110, 2, 62, 91),
+             (110, 4, 91, 125)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  stream_file_pos.py
+
+    Description:  Unit testing of stream_file_pos in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/stream_file_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import binlog_server                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, host, port):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.host = host
+        self.port = port
+        self.sql_user = "mysql"
+        self.sql_pass = "japd"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_window
+        test_no_query
+        test_stream_file_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        binlog_files.crt_binlog(
+            os.path.join(self.tmp_dir.name, "binlog1"),
+            [(100, 15), (100, 2), (110, 2)], "binlog2")
+        binlog_files.crt_binlog(
+            os.path.join(self.tmp_dir.name, "binlog2"), [(120, 15), (130, 2)])
+        self.binlog_srv = binlog_server.BinlogServer(
+            self.tmp_dir.name, password="japd")
+        self.binlog_srv.start()
+        self.server = Server(self.binlog_srv.host, self.binlog_srv.port)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.binlog_srv.stop()
+        self.tmp_dir.cleanup()
+
+    def test_window(self):
+
+        """Function:  test_window
+
+        Description:  Test with start and stop timestamps.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_stream.stream_file_pos(
+            self.server, "binlog1", 100, 110), 62)
+
+    def test_no_query(self):
+
+        """Function:  test_no_query
+
+        Description:  Test with no Query in the window.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_stream.stream_file_pos(
+            self.server, "binlog2", 200))
+
+    def test_stream_file_pos(self):
+
+        """Function:  test_stream_file_pos
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_stream.stream_file_pos(self.server, "binlog1"), 91)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+# Classification (U)
+
+"""Program:  submit_tasks.py
+
+    Description:  Unit testing of submit_tasks in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/submit_tasks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import concurrent.futures
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Executor():
+
+    """Class:  Executor
+
+    Description:  Class stub holder for concurrent.futures.Executor class.
+
+    Methods:
+        __init__
+        submit
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.submitted = []
+
+    def submit(self, func, *args):
+
+        """Method:  submit
+
+        Description:  Records the task and returns a future not yet done.
+
+        Arguments:
+
+        """
+
+        self.submitted.append((func, args))
+
+        return concurrent.futures.Future()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_next_held
+        test_max_held
+        test_memory_budget
+        test_submit_tasks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.executor = Executor()
+        self.arg_list = [("a",), ("b",), ("c",), ("d",)]
+        self.sched = {"pending": [1, 3, 2, 0], "futures": {},
+                      "running": set(), "held": 0, "began": {}, "ended": {},
+                      "sizes": [1, 4, 2, 3], "workers": 2, "mem_bytes": None,
+                      "max_held": None}
+
+    def test_next_held(self):
+
+        """Function:  test_next_held
+
+        Description:  Test that nothing is submitted over the budget when
+            the next task is already held.
+
+        Arguments:
+
+        """
+
+        self.sched.update(mem_bytes=4, held=4, pending=[3, 2])
+        self.sched["futures"] = {0: concurrent.futures.Future()}
+        binlog_fetch.submit_tasks(
+            self.executor, str, self.arg_list, self.sched, 0)
+
+        self.assertEqual(self.executor.submitted, [])
+
+    def test_max_held(self):
+
+        """Function:  test_max_held
+
+        Description:  Test that only the next task is submitted over the
+            maximum number of tasks held.
+
+        Arguments:
+
+        """
+
+        self.sched["max_held"] = 1
+        binlog_fetch.submit_tasks(
+            self.executor, str, self.arg_list, self.sched, 0)
+
+        self.assertEqual(
+            self.executor.submitted, [(str, ("b",)), (str, ("a",))])
+        self.assertEqual(self.sched["pending"], [3, 2])
+
+    def test_memory_budget(self):
+
+        """Function:  test_memory_budget
+
+        Description:  Test that the next task is submitted over the memory
+            budget.
+
+        Arguments:
+
+        """
+
+        self.sched["mem_bytes"] = 5
+        binlog_fetch.submit_tasks(
+            self.executor, str, self.arg_list, self.sched, 0)
+
+        self.assertEqual(
+            self.executor.submitted, [(str, ("b",)), (str, ("a",))])
+        self.assertEqual(self.sched["held"], 5)
+
+    def test_submit_tasks(self):
+
+        """Function:  test_submit_tasks
+
+        Description:  Test that the largest tasks are submitted while a
+            worker is free.
+
+        Arguments:
+
+        """
+
+        binlog_fetch.submit_tasks(
+            self.executor, str, self.arg_list, self.sched, 0)
+
+        self.assertEqual(
+            self.executor.submitted, [(str, ("b",)), (str, ("d",))])
+        self.assertEqual(sorted(self.sched["began"]), [1, 3])
+        self.assertEqual(len(self.sched["running"]), 2)
+        self.assertEqual(self.sched["held"], 7)
+        self.assertEqual(self.sched["pending"], [2, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Classification (U)
+
+"""Program:  sweep_fetch_pos.py
+
+    Description:  Unit testing of sweep_fetch_pos in binlog_search.py.
+
+    Usage:
+        test/unit/mysql_log_admin/sweep_fetch_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_search                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_query
+        test_crc_none
+        test_sweep_fetch_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.bounds = [binlog_fetch.dt_to_ts("2025-01-01 10:00:02")]
+        self.lines = [
+            "#250101 10:00:00 server id 1  end_log_pos 120 CRC32 0x1 Start",
+            "#250101 10:00:01 server id 1  end_log_pos 200 CRC32 0x2 Query",
+            b"#250101 10:00:01 server id 1  end_log_pos 250 CRC32 0x3 Query",
+            "#250101  9:59:59 server id 1  end_log_pos 280 CRC32 0x4 Query",
+            "#250101 10:00:02 server id 1  end_log_pos 300 CRC32 0x5 Query",
+            "#250101 10:00:03 server id 1  end_log_pos 350 CRC32 0x6 Xid"]
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_no_query(self, mock_fetch):
+
+        """Function:  test_no_query
+
+        Description:  Test with no Query lines from mysqlbinlog.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = [self.lines[0], self.lines[5]]
+
+        self.assertEqual(binlog_search.sweep_fetch_pos(
+            self.server, "binlog1", self.bounds), {})
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_crc_none(self, mock_fetch):
+
+        """Function:  test_crc_none
+
+        Description:  Test with no checksums in the binary log.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = [
+            "#250101 10:00:01 server id 1  end_log_pos 200 Query",
+            "#250101 10:00:03 server id 1  end_log_pos 250 Xid"]
+
+        self.assertEqual(binlog_search.sweep_fetch_pos(
+            self.server, "binlog1", self.bounds), {0: 200})
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_sweep_fetch_pos(self, mock_fetch):
+
+        """Function:  test_sweep_fetch_pos
+
+        Description:  Test that the whole binary log is read once and the
+            last Query of each segment is found.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = self.lines
+
+        self.assertEqual(
+            binlog_search.sweep_fetch_pos(
+                self.server, "binlog1", self.bounds, ["--opt"], "/bin/"),
+            {0: 280, 1: 300})
+        mock_fetch.assert_called_once_with(
+            self.server, binlog_files=["binlog1"], opt_arg_list=["--opt"],
+            bin_path="/bin/")
+
+
+if __name__ == "__main__":
+    unittest.main()
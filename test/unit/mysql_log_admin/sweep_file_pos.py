@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  sweep_file_pos.py
+
+    Description:  Unit testing of sweep_file_pos in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/sweep_file_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_sweep_file_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        data = b"\xfebin"
+
+        for tstamp, etype in [(100, 15), (110, 2), (120, 16), (130, 2),
+                              (140, 16)]:
+            data += binlog_files.crt_event(tstamp, etype, len(data), b"body")
+
+        with open(os.path.join(self.tmp_dir.name, "binlog.000001"),
+                  "wb") as f_hdlr:
+            f_hdlr.write(data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_sweep_file_pos(self):
+
+        """Function:  test_sweep_file_pos
+
+        Description:  Test that the last Query of each segment is found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.sweep_file_pos(
+                self.tmp_dir.name, "binlog.000001", [120]), {0: 50, 1: 96})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  sweep_query_pos.py
+
+    Description:  Unit testing of sweep_query_pos in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/sweep_query_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def event(tstamp, type_code, log_pos):
+
+    """Function:  event
+
+    Description:  Create a BinlogEvent.
+
+    Arguments:
+        (input) tstamp -> Event timestamp
+        (input) type_code -> Event type code
+        (input) log_pos -> End log position
+
+    """
+
+    return binlog_reader.BinlogEvent(
+        tstamp, type_code, 1, 19, log_pos, 0, log_pos - 19, None)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_events
+        test_no_bounds
+        test_sweep_query_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.events = [
+            event(100, 15, 120), event(110, 2, 200), event(115, 2, 250),
+            event(120, 16, 300), event(120, 2, 350), event(130, 2, 400),
+            event(140, 16, 450)]
+
+    def test_no_events(self):
+
+        """Function:  test_no_events
+
+        Description:  Test with no events.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(binlog_reader.sweep_query_pos([], [110]), {})
+
+    def test_no_bounds(self):
+
+        """Function:  test_no_bounds
+
+        Description:  Test with no window boundaries.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.sweep_query_pos(self.events, []), {0: 400})
+
+    def test_sweep_query_pos(self):
+
+        """Function:  test_sweep_query_pos
+
+        Description:  Test that the last Query of each segment is found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.sweep_query_pos(self.events, [110, 120, 200]),
+            {1: 250, 2: 400})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Classification (U)
+
+"""Program:  sweep_stream_pos.py
+
+    Description:  Unit testing of sweep_stream_pos in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/sweep_stream_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sweep_stream_pos
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.events = [
+            binlog_reader.BinlogEvent(100, 15, 1, 19, 120, 0, 101, None),
+            binlog_reader.BinlogEvent(110, 2, 1, 80, 200, 0, 120, None),
+            binlog_reader.BinlogEvent(130, 2, 1, 100, 300, 0, 200, None)]
+
+    @mock.patch("binlog_stream.stream_binlog_events")
+    def test_sweep_stream_pos(self, mock_stream):
+
+        """Function:  test_sweep_stream_pos
+
+        Description:  Test that the streamed binary log is swept.
+
+        Arguments:
+
+        """
+
+        mock_stream.return_value = iter(self.events)
+
+        self.assertEqual(
+            binlog_stream.sweep_stream_pos(
+                self.server, "binlog.000001", [120]), {0: 200, 1: 300})
+        mock_stream.assert_called_once_with(self.server, "binlog.000001")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  sync_mirror.py
+
+    Description:  Unit testing of sync_mirror in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/sync_mirror.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-p": "/dir/path"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_mirror
+        test_budget
+        test_sync_mirror
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.binlog_list = ["binlog1", "binlog2"]
+
+    @mock.patch("binlog_fetch.mirror_binlogs")
+    def test_no_mirror(self, mock_mirror):
+
+        """Function:  test_no_mirror
+
+        Description:  Test with no -m option.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_fetch.sync_mirror(
+            self.server, self.args, self.binlog_list))
+        mock_mirror.assert_not_called()
+
+    @mock.patch("binlog_fetch.mirror_binlogs")
+    def test_budget(self, mock_mirror):
+
+        """Function:  test_budget
+
+        Description:  Test with the -z and -n options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "/mirror"
+        self.args.args_array["-z"] = "2"
+        self.args.args_array["-n"] = "4"
+
+        binlog_fetch.sync_mirror(self.server, self.args, self.binlog_list)
+
+        mock_mirror.assert_called_once_with(
+            self.server, self.binlog_list, "/mirror", 2097152, "/dir/path", 4)
+
+    @mock.patch("binlog_fetch.mirror_binlogs")
+    def test_sync_mirror(self, mock_mirror):
+
+        """Function:  test_sync_mirror
+
+        Description:  Test with the default disk budget.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "/mirror"
+
+        self.assertEqual(
+            binlog_fetch.sync_mirror(
+                self.server, self.args, self.binlog_list), "/mirror")
+        mock_mirror.assert_called_once_with(
+            self.server, self.binlog_list, "/mirror",
+            binlog_fetch.MIRROR_MBYTES * 1048576, "/dir/path", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
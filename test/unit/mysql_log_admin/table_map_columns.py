@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  table_map_columns.py
+
+    Description:  Unit testing of table_map_columns in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/table_map_columns.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_short
+        test_unknown_type
+        test_table_map_columns
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.head = b"\x6c\0\0\0\0\0\x01\0\x04shop\0\x06orders\0"
+
+    def test_short(self):
+
+        """Function:  test_short
+
+        Description:  Test with a Table_map event that is cut short.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            binlog_catalog.table_map_columns(self.head + b"\x03\x03"))
+
+    def test_unknown_type(self):
+
+        """Function:  test_unknown_type
+
+        Description:  Test with a column type that is not known.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(binlog_catalog.table_map_columns(
+            self.head + b"\x02\x03\xf2\x01\x04\x00"))
+
+    def test_table_map_columns(self):
+
+        """Function:  test_table_map_columns
+
+        Description:  Test with the metadata of the column types.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_catalog.table_map_columns(
+                self.head + b"\x04\x03\x0f\xfc\xf6\x05\x40\x00\x02\x0a\x02"
+                + b"\x07"),
+            [(3, b""), (15, b"\x40\x00"), (252, b"\x02"),
+             (246, b"\x0a\x02")])
+
+
+if __name__ == "__main__":
+    unittest.main()
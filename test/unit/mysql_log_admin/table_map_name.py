@@ -0,0 +1,58 @@
+# Classification (U)
+
+"""Program:  table_map_name.py
+
+    Description:  Unit testing of table_map_name in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/table_map_name.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_table_map_name
+
+    """
+
+    def test_table_map_name(self):
+
+        """Function:  test_table_map_name
+
+        Description:  Test with the database and table names of a Table_map
+            event.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_reader.table_map_name(
+                b"\x6c\0\0\0\0\0\x01\0\x04shop\0\x06orders\0\x01\x03\0"),
+            ("shop", "orders"))
+
+
+if __name__ == "__main__":
+    unittest.main()
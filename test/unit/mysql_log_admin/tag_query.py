@@ -0,0 +1,149 @@
+# Classification (U)
+
+"""Program:  tag_query.py
+
+    Description:  Unit testing of tag_query in binlog_filter.py.
+
+    Usage:
+        test/unit/mysql_log_admin/tag_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_filter                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_begin
+        test_commit
+        test_ddl
+        test_in_txn
+        test_tag_query
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {"dbase": None, "tables": {}, "tags": [],
+                      "in_txn": False, "closed": False}
+        self.head = [
+            b"# at 204\n",
+            b"#240101 10:00:01 server id 1  end_log_pos 280 CRC32 0x03"
+            b" \tQuery\tthread_id=8\n",
+            b"SET TIMESTAMP=1704103201/*!*/;\n"]
+
+    def test_begin(self):
+
+        """Function:  test_begin
+
+        Description:  Test that BEGIN opens a transaction.
+
+        Arguments:
+
+        """
+
+        binlog_filter.tag_query(self.head + [b"BEGIN\n"], self.state)
+
+        self.assertTrue(self.state["in_txn"])
+        self.assertEqual(self.state["tags"], [])
+
+    def test_commit(self):
+
+        """Function:  test_commit
+
+        Description:  Test that COMMIT closes the transaction.
+
+        Arguments:
+
+        """
+
+        self.state["in_txn"] = True
+        binlog_filter.tag_query(self.head + [b"COMMIT\n"], self.state)
+
+        self.assertTrue(self.state["closed"])
+
+    def test_ddl(self):
+
+        """Function:  test_ddl
+
+        Description:  Test that DDL on a single table is tagged with the
+            table.
+
+        Arguments:
+
+        """
+
+        binlog_filter.tag_query(
+            self.head + [b"use `db1`/*!*/;\n", b"DROP TABLE db2.t1\n"],
+            self.state)
+
+        self.assertEqual(self.state["tags"], [("db2", "t1", "query")])
+        self.assertEqual(self.state["dbase"], "db1")
+
+    def test_in_txn(self):
+
+        """Function:  test_in_txn
+
+        Description:  Test that a statement in a transaction does not close
+            it.
+
+        Arguments:
+
+        """
+
+        self.state.update(dbase="db1", in_txn=True)
+        binlog_filter.tag_query(
+            self.head + [b"INSERT INTO t1 VALUES (1)\n"], self.state)
+
+        self.assertEqual(self.state["tags"], [("db1", None, "query")])
+        self.assertFalse(self.state["closed"])
+
+    def test_tag_query(self):
+
+        """Function:  test_tag_query
+
+        Description:  Test that a statement outside a transaction is tagged
+            with the default database and closes its transaction.
+
+        Arguments:
+
+        """
+
+        binlog_filter.tag_query(
+            self.head + [b"use `d``b`/*!*/;\n",
+                         b"INSERT INTO t1 VALUES (1)\n"], self.state)
+
+        self.assertEqual(self.state["tags"], [("d`b", None, "query")])
+        self.assertTrue(self.state["closed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  tee_binlog.py
+
+    Description:  Unit testing of tee_binlog in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/tee_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import shutil
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def drain(read_fd):
+
+    """Function:  drain
+
+    Description:  Reads a pipe to its end, so the mysqlbinlog commands into
+        it do not fail.
+
+    Arguments:
+        (input) read_fd -> Pipe to read from
+
+    """
+
+    while os.read(read_fd, 65536):
+        pass
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_target_fails
+        test_throttle
+        test_filter
+        test_tee_binlog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data = b"DELIMITER /*!*/;\n# at 4\nevent1\n# at 125\nevent2\n"
+        binlog = os.path.join(self.tmp_dir, "binlog.txt")
+
+        with open(binlog, "wb") as fhdr:
+            fhdr.write(self.data)
+
+        self.binlog_cmds = [["cat", binlog], ["cat", binlog]]
+        self.out = [os.path.join(self.tmp_dir, name)
+                    for name in ["target1", "target2"]]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_target_fails(self):
+
+        """Function:  test_target_fails
+
+        Description:  Test that a target that fails does not hold up the
+            other target.
+
+        Arguments:
+
+        """
+
+        stats, codes = binlog_tee.tee_binlog(
+            self.binlog_cmds,
+            [["sh", "-c", "exit 3"], ["sh", "-c", "cat > " + self.out[1]]],
+            buf_bytes=1)
+
+        self.assertIsNone(stats)
+        self.assertEqual(codes, [3, 0])
+
+        with open(self.out[1], "rb") as fhdr:
+            self.assertEqual(fhdr.read(), self.data * 2)
+
+    @mock.patch("binlog_tee.throttle_wait")
+    def test_throttle(self, mock_wait):
+
+        """Function:  test_throttle
+
+        Description:  Test that the blocks are passed to the throttle once.
+
+        Arguments:
+
+        """
+
+        binlog_tee.tee_binlog(
+            self.binlog_cmds,
+            [["sh", "-c", "cat > " + name] for name in self.out],
+            throttle="throttle")
+
+        self.assertEqual(
+            sum(call[0][1] for call in mock_wait.call_args_list),
+            len(self.data) * 2)
+
+    @mock.patch("binlog_tee.read_blocks")
+    def test_filter(self, mock_read):
+
+        """Function:  test_filter
+
+        Description:  Test that the blocks the filter keeps are copied to
+            each target.
+
+        Arguments:
+
+        """
+
+        mock_read.side_effect = lambda read_fd, filt: \
+            drain(read_fd) or [self.data[:31]]
+
+        self.assertEqual(
+            binlog_tee.tee_binlog(
+                self.binlog_cmds,
+                [["sh", "-c", "cat > " + name] for name in self.out], True,
+                filt="filter"), ((31, 1), [0, 0]))
+        self.assertEqual(mock_read.call_args[0][1], "filter")
+
+        for name in self.out:
+            with open(name, "rb") as fhdr:
+                self.assertEqual(fhdr.read(), self.data[:31])
+
+    def test_tee_binlog(self):
+
+        """Function:  test_tee_binlog
+
+        Description:  Test that every target gets the binary logs and the
+            bytes and events are counted once.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_tee.tee_binlog(
+                self.binlog_cmds,
+                [["sh", "-c", "cat > " + name] for name in self.out], True),
+            ((len(self.data) * 2, 4), [0, 0]))
+
+        for name in self.out:
+            with open(name, "rb") as fhdr:
+                self.assertEqual(fhdr.read(), self.data * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
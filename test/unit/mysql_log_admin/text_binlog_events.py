@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  text_binlog_events.py
+
+    Description:  Unit testing of text_binlog_events in binlog_reader.py.
+
+    Usage:
+        test/unit/mysql_log_admin/text_binlog_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_reader                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_events
+        test_bytes
+        test_text_binlog_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lines = [
+            "# at 120\n",
+            "#240101 10:00:00 server id 1  end_log_pos 199 CRC32 0x1a2b3c4d"
+            " \tGTID\tlast_committed=0\n",
+            "# at 199\n",
+            "#240101 10:00:05 server id 1  end_log_pos 280 CRC32 0x1a2b3c4d"
+            " \tQuery\tthread_id=8\n",
+            "BEGIN\n"]
+        self.tstamp = int(time.mktime(time.strptime(
+            "240101 10:00:00", "%y%m%d %H:%M:%S")))
+
+    def test_no_events(self):
+
+        """Function:  test_no_events
+
+        Description:  Test with no event header lines.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(binlog_reader.text_binlog_events(["BEGIN\n"])), [])
+
+    def test_bytes(self):
+
+        """Function:  test_bytes
+
+        Description:  Test with byte lines.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [event.log_pos for event in binlog_reader.text_binlog_events(
+                [line.encode() for line in self.lines])], [199, 280])
+
+    def test_text_binlog_events(self):
+
+        """Function:  test_text_binlog_events
+
+        Description:  Test that the timestamp, end log position and Query
+            type code are parsed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [(event.timestamp, event.type_code, event.log_pos) for event
+             in binlog_reader.text_binlog_events(self.lines)],
+            [(self.tstamp, 0, 199),
+             (self.tstamp + 5, binlog_reader.QUERY_EVENT, 280)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  throttle_pressure.py
+
+    Description:  Unit testing of throttle_pressure in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/throttle_pressure.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, threads):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) threads -> Value of the Threads_running status
+
+        """
+
+        self.threads = threads
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Method stub holder for mysql_class.Server.col_sql.
+            Only the global status has Threads_running.
+
+        Arguments:
+            (input) cmd -> SQL statement
+
+        """
+
+        self.cmds.append(cmd)
+
+        return [{"Variable_name": "Threads_running", "Value": self.threads}] \
+            if cmd.upper().startswith("SHOW GLOBAL STATUS") else []
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_limits
+        test_not_replicating
+        test_threads
+        test_throttle_pressure
+
+    """
+
+    @mock.patch("binlog_tee.mysql_class.show_slave_stat")
+    def test_no_limits(self, mock_slave):
+
+        """Function:  test_no_limits
+
+        Description:  Test with no limits.
+
+        Arguments:
+
+        """
+
+        target = Server("4")
+
+        self.assertIsNone(binlog_tee.throttle_pressure(
+            [target], ["replica"]))
+        self.assertEqual(target.cmds, [])
+        mock_slave.assert_not_called()
+
+    @mock.patch("binlog_tee.mysql_class.show_slave_stat")
+    def test_not_replicating(self, mock_slave):
+
+        """Function:  test_not_replicating
+
+        Description:  Test with a replica that is not replicating.
+
+        Arguments:
+
+        """
+
+        mock_slave.return_value = [{"Seconds_Behind_Source": None}]
+
+        self.assertIsNone(binlog_tee.throttle_pressure(
+            ["target"], ["replica"], lag=10))
+
+    def test_threads(self):
+
+        """Function:  test_threads
+
+        Description:  Test that the threads running on the targets are read
+            from the global status.
+
+        Arguments:
+
+        """
+
+        target = Server("12")
+
+        self.assertEqual(binlog_tee.throttle_pressure(
+            [Server("4"), target], [], threads=8), 1.5)
+        self.assertEqual(
+            target.cmds, ["SHOW GLOBAL STATUS LIKE 'Threads_running'"])
+
+    @mock.patch("binlog_tee.mysql_class.show_slave_stat")
+    def test_throttle_pressure(self, mock_slave):
+
+        """Function:  test_throttle_pressure
+
+        Description:  Test that the highest of the lag and threads is
+            returned.
+
+        Arguments:
+
+        """
+
+        mock_slave.side_effect = [[{"Seconds_Behind_Master": 5}],
+                                  [{"Seconds_Behind_Source": 30}]]
+
+        self.assertEqual(binlog_tee.throttle_pressure(
+            [Server("4")], ["replica1", "replica2"], lag=20, threads=8), 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
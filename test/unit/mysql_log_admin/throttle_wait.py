@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  throttle_wait.py
+
+    Description:  Unit testing of throttle_wait in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/throttle_wait.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_burst
+        test_throttle_wait
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.throttle = {"rate": 1000.0, "avail": 0.0, "last": 100.0,
+                         "fed": 0, "lock": threading.Lock()}
+
+    @mock.patch("binlog_tee.time.sleep")
+    @mock.patch("binlog_tee.time.time", mock.Mock(return_value=110.0))
+    def test_burst(self, mock_sleep):
+
+        """Function:  test_burst
+
+        Description:  Test that at most a second of unused rate is kept.
+
+        Arguments:
+
+        """
+
+        binlog_tee.throttle_wait(self.throttle, 500)
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(self.throttle["avail"], 500.0)
+        self.assertEqual(self.throttle["fed"], 500)
+
+    @mock.patch("binlog_tee.time.sleep")
+    @mock.patch("binlog_tee.time.time", mock.Mock(return_value=100.5))
+    def test_throttle_wait(self, mock_sleep):
+
+        """Function:  test_throttle_wait
+
+        Description:  Test that the feed waits for the bytes over the rate.
+
+        Arguments:
+
+        """
+
+        binlog_tee.throttle_wait(self.throttle, 2500)
+
+        mock_sleep.assert_called_once_with(2.0)
+        self.assertEqual(self.throttle["last"], 100.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
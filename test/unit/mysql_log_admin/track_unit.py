@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  track_unit.py
+
+    Description:  Unit testing of track_unit in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/track_unit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import collections
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_barrier
+        test_skipped
+        test_rotate
+        test_track_unit
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {"unit": 3, "binlog": "binlog1",
+                      "units": collections.OrderedDict()}
+        self.lines = [
+            b"# at 204\n",
+            b"#240101 10:00:01 server id 1  end_log_pos 280 CRC32 0x03"
+            b" \tQuery\tthread_id=8\n"]
+
+    def test_barrier(self):
+
+        """Function:  test_barrier
+
+        Description:  Test that a barrier is not kept.
+
+        Arguments:
+
+        """
+
+        self.state["unit"] = 0
+        binlog_apply.track_unit(self.state, 204, self.lines)
+
+        self.assertEqual(self.state["units"], {})
+
+    def test_skipped(self):
+
+        """Function:  test_skipped
+
+        Description:  Test that a skipped transaction is kept as committed.
+
+        Arguments:
+
+        """
+
+        self.state["unit"] = -1
+        binlog_apply.track_unit(self.state, 204, self.lines)
+
+        self.assertEqual(self.state["units"],
+                         {-1: ["binlog1", 204, 280, True]})
+
+    def test_rotate(self):
+
+        """Function:  test_rotate
+
+        Description:  Test that a rotation ends the transaction at the start
+            of the next binary log.
+
+        Arguments:
+
+        """
+
+        self.state["units"][3] = ["binlog1", 100, 204, False]
+        binlog_apply.track_unit(self.state, 280, [
+            b"# at 280\n",
+            b"#240101 10:00:02 server id 1  end_log_pos 327 CRC32 0x04"
+            b" \tRotate to binlog2  pos: 4\n"])
+
+        self.assertEqual(self.state["binlog"], "binlog2")
+        self.assertEqual(self.state["units"][3], ["binlog2", 100, 4, False])
+
+    def test_track_unit(self):
+
+        """Function:  test_track_unit
+
+        Description:  Test that the start and end of the transaction are
+            kept.
+
+        Arguments:
+
+        """
+
+        binlog_apply.track_unit(self.state, 204, self.lines)
+
+        self.assertEqual(self.state["units"],
+                         {3: ["binlog1", 204, 280, False]})
+
+
+if __name__ == "__main__":
+    unittest.main()
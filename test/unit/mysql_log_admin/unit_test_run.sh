@@ -6,12 +6,160 @@
 
 echo ""
 echo "Unit testing..."
+/usr/bin/python ./test/unit/mysql_log_admin/add_workload.py
+/usr/bin/python ./test/unit/mysql_log_admin/adjust_rate.py
+/usr/bin/python ./test/unit/mysql_log_admin/analyse_log.py
+/usr/bin/python ./test/unit/mysql_log_admin/apply_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/binlog_tables.py
+/usr/bin/python ./test/unit/mysql_log_admin/binlog_ts_offset.py
+/usr/bin/python ./test/unit/mysql_log_admin/bloom_bits.py
+/usr/bin/python ./test/unit/mysql_log_admin/bloom_rules_out.py
+/usr/bin/python ./test/unit/mysql_log_admin/build_binlog_bloom.py
+/usr/bin/python ./test/unit/mysql_log_admin/build_binlog_index.py
+/usr/bin/python ./test/unit/mysql_log_admin/catalog_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/catalog_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/catalog_log.py
+/usr/bin/python ./test/unit/mysql_log_admin/catalog_query.py
+/usr/bin/python ./test/unit/mysql_log_admin/check_binlog_cmds.py
+/usr/bin/python ./test/unit/mysql_log_admin/check_packet.py
+/usr/bin/python ./test/unit/mysql_log_admin/check_throttle.py
+/usr/bin/python ./test/unit/mysql_log_admin/chunk_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/chunk_binlogs.py
+/usr/bin/python ./test/unit/mysql_log_admin/close_unit.py
+/usr/bin/python ./test/unit/mysql_log_admin/column_size.py
+/usr/bin/python ./test/unit/mysql_log_admin/connect_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/connect_targets.py
+/usr/bin/python ./test/unit/mysql_log_admin/copy_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/copy_binlogs.py
+/usr/bin/python ./test/unit/mysql_log_admin/count_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/count_pipe.py
+/usr/bin/python ./test/unit/mysql_log_admin/count_rows.py
+/usr/bin/python ./test/unit/mysql_log_admin/crt_binlog_cmd.py
+/usr/bin/python ./test/unit/mysql_log_admin/crt_filter.py
+/usr/bin/python ./test/unit/mysql_log_admin/crt_pipe.py
+/usr/bin/python ./test/unit/mysql_log_admin/crt_request_args.py
+/usr/bin/python ./test/unit/mysql_log_admin/crt_workload.py
+/usr/bin/python ./test/unit/mysql_log_admin/ddl_table.py
+/usr/bin/python ./test/unit/mysql_log_admin/dt_to_ts.py
+/usr/bin/python ./test/unit/mysql_log_admin/end_unit.py
+/usr/bin/python ./test/unit/mysql_log_admin/evict_mirror.py
+/usr/bin/python ./test/unit/mysql_log_admin/fde_checksum.py
+/usr/bin/python ./test/unit/mysql_log_admin/feed_applier.py
 /usr/bin/python ./test/unit/mysql_log_admin/fetch_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/fetch_file_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/fetch_first_ts.py
 /usr/bin/python ./test/unit/mysql_log_admin/fetch_log_entries.py
 /usr/bin/python ./test/unit/mysql_log_admin/fetch_log_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/fetch_range_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/filter_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/filter_binlog_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/filter_group.py
 /usr/bin/python ./test/unit/mysql_log_admin/find_dt_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/find_file_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/find_window_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/first_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/fixed_size.py
+/usr/bin/python ./test/unit/mysql_log_admin/flush_checkpoint.py
+/usr/bin/python ./test/unit/mysql_log_admin/follow_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/follow_log_entries.py
+/usr/bin/python ./test/unit/mysql_log_admin/group_binlogs.py
 /usr/bin/python ./test/unit/mysql_log_admin/help_message.py
+/usr/bin/python ./test/unit/mysql_log_admin/index_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/index_last_query.py
+/usr/bin/python ./test/unit/mysql_log_admin/last_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/last_query_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/latency_stats.py
+/usr/bin/python ./test/unit/mysql_log_admin/latest_in_ranges.py
+/usr/bin/python ./test/unit/mysql_log_admin/length_prefix.py
+/usr/bin/python ./test/unit/mysql_log_admin/load_binlog_bloom.py
 /usr/bin/python ./test/unit/mysql_log_admin/load_log.py
 /usr/bin/python ./test/unit/mysql_log_admin/main.py
+/usr/bin/python ./test/unit/mysql_log_admin/map_binlogs.py
+/usr/bin/python ./test/unit/mysql_log_admin/match_filter.py
+/usr/bin/python ./test/unit/mysql_log_admin/merge_binlogs.py
+/usr/bin/python ./test/unit/mysql_log_admin/mirror_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/mirror_binlogs.py
+/usr/bin/python ./test/unit/mysql_log_admin/monitor_throttle.py
+/usr/bin/python ./test/unit/mysql_log_admin/open_binlog_bloom.py
+/usr/bin/python ./test/unit/mysql_log_admin/open_binlog_index.py
+/usr/bin/python ./test/unit/mysql_log_admin/open_catalog.py
+/usr/bin/python ./test/unit/mysql_log_admin/plan_binlog_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/plan_index_start.py
+/usr/bin/python ./test/unit/mysql_log_admin/plan_mirror.py
+/usr/bin/python ./test/unit/mysql_log_admin/plan_restore.py
 /usr/bin/python ./test/unit/mysql_log_admin/process_logs_list.py
+/usr/bin/python ./test/unit/mysql_log_admin/prune_binlogs.py
+/usr/bin/python ./test/unit/mysql_log_admin/prune_bloom_binlogs.py
+/usr/bin/python ./test/unit/mysql_log_admin/purge_binlog_index.py
+/usr/bin/python ./test/unit/mysql_log_admin/put_block.py
+/usr/bin/python ./test/unit/mysql_log_admin/query_event.py
+/usr/bin/python ./test/unit/mysql_log_admin/query_stmt.py
+/usr/bin/python ./test/unit/mysql_log_admin/range_query_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_applier.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_binlog_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_blocks.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_checkpoint.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_packed_int.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_packet.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_windows.py
+/usr/bin/python ./test/unit/mysql_log_admin/read_workload.py
+/usr/bin/python ./test/unit/mysql_log_admin/reduce_ranges.py
+/usr/bin/python ./test/unit/mysql_log_admin/restore_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/restore_stats.py
+/usr/bin/python ./test/unit/mysql_log_admin/route_event.py
+/usr/bin/python ./test/unit/mysql_log_admin/row_layout.py
+/usr/bin/python ./test/unit/mysql_log_admin/run_binlog_cmds.py
 /usr/bin/python ./test/unit/mysql_log_admin/run_program.py
+/usr/bin/python ./test/unit/mysql_log_admin/run_restore.py
+/usr/bin/python ./test/unit/mysql_log_admin/run_tasks.py
+/usr/bin/python ./test/unit/mysql_log_admin/save_checkpoint.py
+/usr/bin/python ./test/unit/mysql_log_admin/scan_follow.py
+/usr/bin/python ./test/unit/mysql_log_admin/scan_last_query.py
+/usr/bin/python ./test/unit/mysql_log_admin/scan_spool.py
+/usr/bin/python ./test/unit/mysql_log_admin/schedule_tasks.py
+/usr/bin/python ./test/unit/mysql_log_admin/scramble_password.py
+/usr/bin/python ./test/unit/mysql_log_admin/search_binlog_bloom.py
+/usr/bin/python ./test/unit/mysql_log_admin/search_binlog_index.py
+/usr/bin/python ./test/unit/mysql_log_admin/send_request.py
+/usr/bin/python ./test/unit/mysql_log_admin/serve_request.py
+/usr/bin/python ./test/unit/mysql_log_admin/serve_requests.py
+/usr/bin/python ./test/unit/mysql_log_admin/session_edits.py
+/usr/bin/python ./test/unit/mysql_log_admin/session_line.py
+/usr/bin/python ./test/unit/mysql_log_admin/skip_image.py
+/usr/bin/python ./test/unit/mysql_log_admin/split_binlog_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/spool_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/spool_tasks.py
+/usr/bin/python ./test/unit/mysql_log_admin/start_appliers.py
+/usr/bin/python ./test/unit/mysql_log_admin/start_tees.py
+/usr/bin/python ./test/unit/mysql_log_admin/start_throttle.py
+/usr/bin/python ./test/unit/mysql_log_admin/start_unit.py
+/usr/bin/python ./test/unit/mysql_log_admin/stop_throttle.py
+/usr/bin/python ./test/unit/mysql_log_admin/stream_binlog_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/stream_file_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/submit_tasks.py
+/usr/bin/python ./test/unit/mysql_log_admin/sweep_fetch_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/sweep_file_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/sweep_query_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/sweep_stream_pos.py
+/usr/bin/python ./test/unit/mysql_log_admin/sync_mirror.py
+/usr/bin/python ./test/unit/mysql_log_admin/table_map_columns.py
+/usr/bin/python ./test/unit/mysql_log_admin/table_map_name.py
+/usr/bin/python ./test/unit/mysql_log_admin/tag_query.py
+/usr/bin/python ./test/unit/mysql_log_admin/tee_binlog.py
+/usr/bin/python ./test/unit/mysql_log_admin/text_binlog_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/throttle_pressure.py
+/usr/bin/python ./test/unit/mysql_log_admin/throttle_wait.py
+/usr/bin/python ./test/unit/mysql_log_admin/track_unit.py
+/usr/bin/python ./test/unit/mysql_log_admin/wait_applier.py
+/usr/bin/python ./test/unit/mysql_log_admin/worker_stats.py
+/usr/bin/python ./test/unit/mysql_log_admin/workload_events.py
+/usr/bin/python ./test/unit/mysql_log_admin/workload_minute.py
+/usr/bin/python ./test/unit/mysql_log_admin/workload_report.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_catalog.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_checkpoint.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_log_entries.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_packet.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_spool.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_spools.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_target.py
+/usr/bin/python ./test/unit/mysql_log_admin/write_workload.py
@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  wait_applier.py
+
+    Description:  Unit testing of wait_applier in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/wait_applier.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import queue
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exited
+        test_wait_applier
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.proc = mock.Mock()
+        self.proc.wait.return_value = 1
+        self.state = {"procs": [self.proc, self.proc], "acks": queue.Queue(),
+                      "outstanding": {1: (0, 1), 2: (1, 2)}, "depth": [1, 1],
+                      "ckpt": None}
+
+    def test_exited(self):
+
+        """Function:  test_exited
+
+        Description:  Test with a session that exited.
+
+        Arguments:
+
+        """
+
+        self.state["acks"].put((1, None))
+
+        with self.assertRaisesRegex(ValueError, "session 2 exited with 1"):
+            binlog_apply.wait_applier(self.state)
+
+    def test_wait_applier(self):
+
+        """Function:  test_wait_applier
+
+        Description:  Test that the committed transaction is removed.
+
+        Arguments:
+
+        """
+
+        self.state["acks"].put((1, 2))
+        binlog_apply.wait_applier(self.state)
+
+        self.assertEqual(self.state["outstanding"], {1: (0, 1)})
+        self.assertEqual(self.state["depth"], [1, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Classification (U)
+
+"""Program:  worker_stats.py
+
+    Description:  Unit testing of worker_stats in binlog_fetch.py.
+
+    Usage:
+        test/unit/mysql_log_admin/worker_stats.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_tasks
+        test_worker_stats
+
+    """
+
+    @mock.patch.dict(binlog_fetch.WORKER_STATS,
+                     {"tasks": 0, "busy": 0.0, "slots": 0.0})
+    def test_no_tasks(self):
+
+        """Function:  test_no_tasks
+
+        Description:  Test with no tasks scheduled.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.worker_stats(),
+            "Tasks: 0, Worker busy: 0.0 s, Utilisation: 0%")
+
+    @mock.patch.dict(binlog_fetch.WORKER_STATS,
+                     {"tasks": 4, "busy": 3.0, "slots": 4.0})
+    def test_worker_stats(self):
+
+        """Function:  test_worker_stats
+
+        Description:  Test the summary and that the stats are reset.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_fetch.worker_stats(),
+            "Tasks: 4, Worker busy: 3.0 s, Utilisation: 75%")
+        self.assertEqual(
+            binlog_fetch.WORKER_STATS,
+            {"tasks": 0, "busy": 0.0, "slots": 0.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
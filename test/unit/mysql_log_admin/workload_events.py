@@ -0,0 +1,223 @@
+# Classification (U)
+
+"""Program:  workload_events.py
+
+    Description:  Unit testing of workload_events in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/workload_events.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.join(os.getcwd(), "test"))
+import binlog_workload                          # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_stream                            # pylint:disable=E0401,C0413
+import binlog_files                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self, binlog_dir):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) binlog_dir -> Directory path to local binary log files
+
+        """
+
+        self.args_array = {"-b": binlog_dir}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.crc = "CRC32"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_local
+        test_stream
+        test_start_pos
+        test_workload_events
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.args = ArgParser(self.tmp_dir.name)
+        self.server = Server()
+
+        with open(os.path.join(self.tmp_dir.name, "binlog.000001"),
+                  "wb") as f_hdlr:
+            f_hdlr.write(
+                binlog_files.BINLOG_MAGIC
+                + binlog_files.crt_event(100, 15, 4, server_id=7)
+                + binlog_files.crt_event(100, 33, 23, server_id=7)
+                + binlog_files.crt_event(100, 16, 42, server_id=7))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir.cleanup()
+
+    def test_not_local(self):
+
+        """Function:  test_not_local
+
+        Description:  Test with a binary log that is not local and no -P.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            binlog_workload.workload_events(
+                self.server, self.args, "binlog.000002")
+
+    @mock.patch("binlog_stream.stream_binlog_events")
+    def test_stream(self, mock_stream):
+
+        """Function:  test_stream
+
+        Description:  Test that a binary log that is not local is streamed
+            up to the stop position with the checksum of the server.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = True
+        mock_stream.return_value = iter(
+            binlog_reader.BinlogEvent(100, 2, 7, 10, pos + 10, 0, pos, b"")
+            for pos in (100, 110, 120))
+        events, crc = binlog_workload.workload_events(
+            self.server, self.args, "binlog.000002", 100, 120)
+
+        self.assertEqual([event.offset for event in events], [100, 110])
+        self.assertEqual(crc, 4)
+        mock_stream.assert_called_once_with(
+            self.server, "binlog.000002", 100, body=True)
+
+    def test_start_pos(self):
+
+        """Function:  test_start_pos
+
+        Description:  Test that the Format_description event is read before
+            the start position.
+
+        Arguments:
+
+        """
+
+        events, crc = binlog_workload.workload_events(
+            self.server, self.args, "binlog.000001", 42)
+
+        self.assertEqual([event.offset for event in events], [4, 42])
+        self.assertEqual(crc, 0)
+
+    def test_workload_events(self):
+
+        """Function:  test_workload_events
+
+        Description:  Test with a local binary log read up to the stop
+            position.
+
+        Arguments:
+
+        """
+
+        events, crc = binlog_workload.workload_events(
+            self.server, self.args, "binlog.000001", None, 42)
+
+        self.assertEqual(
+            [(event.offset, event.body) for event in events],
+            [(4, b""), (23, b"")])
+        self.assertEqual(crc, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
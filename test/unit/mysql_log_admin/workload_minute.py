@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  workload_minute.py
+
+    Description:  Unit testing of workload_minute in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/workload_minute.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first
+        test_later
+        test_earlier
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.stats = binlog_workload.crt_workload()
+
+    def test_first(self):
+
+        """Function:  test_first
+
+        Description:  Test that the first timestamp is the first minute.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_workload.workload_minute(self.stats, 6030), 0)
+        self.assertEqual(self.stats["minute"], 100)
+        self.assertEqual(list(self.stats["events"]), [0])
+
+    def test_later(self):
+
+        """Function:  test_later
+
+        Description:  Test that the minutes up to a later timestamp are
+            added.
+
+        Arguments:
+
+        """
+
+        binlog_workload.workload_minute(self.stats, 6030)
+
+        self.assertEqual(
+            binlog_workload.workload_minute(self.stats, 6150), 2)
+        self.assertEqual(
+            [list(self.stats[key])
+             for key in binlog_workload.WORKLOAD_MINUTES], [[0, 0, 0]] * 4)
+
+    def test_earlier(self):
+
+        """Function:  test_earlier
+
+        Description:  Test that the minutes back to an earlier timestamp are
+            added before the first minute.
+
+        Arguments:
+
+        """
+
+        binlog_workload.workload_minute(self.stats, 6030)
+        self.stats["events"][0] = 5
+
+        self.assertEqual(
+            binlog_workload.workload_minute(self.stats, 5900), 0)
+        self.assertEqual(self.stats["minute"], 98)
+        self.assertEqual(list(self.stats["events"]), [0, 0, 5])
+        self.assertEqual(list(self.stats["rows"]), [0, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
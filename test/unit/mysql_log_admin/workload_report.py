@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  workload_report.py
+
+    Description:  Unit testing of workload_report in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/workload_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_workload_report
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.stats = binlog_workload.crt_workload()
+        self.tstamp = int(time.mktime(time.strptime(
+            "2024-01-01 10:00", "%Y-%m-%d %H:%M")))
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no events.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            binlog_workload.workload_report(self.stats),
+            {"minutes": [], "types": [], "tables": [],
+             "transaction_sizes": [], "undecoded_rows_events": 0})
+
+    def test_workload_report(self):
+
+        """Function:  test_workload_report
+
+        Description:  Test that the types are sorted by events, the tables
+            by rows and only the size buckets with transactions are listed.
+
+        Arguments:
+
+        """
+
+        binlog_workload.add_workload(self.stats, [
+            (100, 100, self.tstamp, "GTID", 7, None, None, None, 60, None),
+            (160, 100, self.tstamp, "Write_rows", 7, None, "shop", "items",
+             40, 1),
+            (200, 100, self.tstamp, "Write_rows", 7, None, "shop", "orders",
+             100, 3),
+            (300, 100, self.tstamp + 60, "Xid", 7, None, None, None, 30,
+             None)])
+
+        self.assertEqual(
+            binlog_workload.workload_report(self.stats),
+            {"minutes": [
+                {"minute": "2024-01-01 10:00", "events": 3,
+                 "transactions": 0, "rows": 4, "bytes": 200},
+                {"minute": "2024-01-01 10:01", "events": 1,
+                 "transactions": 1, "rows": 0, "bytes": 30}],
+             "types": [
+                 {"type": "Write_rows", "events": 2, "bytes": 140},
+                 {"type": "GTID", "events": 1, "bytes": 60},
+                 {"type": "Xid", "events": 1, "bytes": 30}],
+             "tables": [
+                 {"table": "shop.orders", "events": 1, "rows": 3,
+                  "bytes": 100},
+                 {"table": "shop.items", "events": 1, "rows": 1,
+                  "bytes": 40}],
+             "transaction_sizes": [
+                 {"max_bytes": 255, "transactions": 1, "bytes": 230}],
+             "undecoded_rows_events": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  write_catalog.py
+
+    Description:  Unit testing of write_catalog in binlog_catalog.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_catalog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import sqlite3
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_catalog                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_error
+        test_write_catalog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.conn = binlog_catalog.open_catalog(
+            os.path.join(self.tmp_dir.name, "catalog.db"))
+        self.rows = [(4, 4, 100, "Start", 7, None, None, None, 120, None),
+                     (124, 124, 100, "Rotate", 7, None, None, None, 40, None)]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test that the position is not moved if the rows are
+            not added.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(sqlite3.Error):
+            binlog_catalog.write_catalog(
+                self.conn, "binlog.000001", self.rows + [(1, 2)], 164, 4)
+
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0], 0)
+        self.assertEqual(
+            self.conn.execute("SELECT * FROM binlogs").fetchall(), [])
+
+    def test_write_catalog(self):
+
+        """Function:  test_write_catalog
+
+        Description:  Test that the rows are added and the position moved.
+
+        Arguments:
+
+        """
+
+        binlog_catalog.write_catalog(
+            self.conn, "binlog.000001", self.rows, 164, 4, True)
+
+        self.assertEqual(
+            self.conn.execute(
+                "SELECT binlog, pos, type FROM events").fetchall(),
+            [("binlog.000001", 4, "Start"), ("binlog.000001", 124, "Rotate")])
+        self.assertEqual(
+            self.conn.execute("SELECT * FROM binlogs").fetchall(),
+            [("binlog.000001", 164, 4, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  write_checkpoint.py
+
+    Description:  Unit testing of write_checkpoint in binlog_apply.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_checkpoint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import shutil
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_apply                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_write_checkpoint
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.ckpt_file = os.path.join(self.tmp_dir, "restore.ckpt")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_write_checkpoint(self):
+
+        """Function:  test_write_checkpoint
+
+        Description:  Test that the checkpoint replaces the old one and no
+            temporary file is left.
+
+        Arguments:
+
+        """
+
+        binlog_apply.write_checkpoint(self.ckpt_file, {"pos": 1})
+        binlog_apply.write_checkpoint(self.ckpt_file, {"pos": 2})
+
+        with open(self.ckpt_file, encoding="UTF-8") as fhdr:
+            self.assertEqual(json.load(fhdr), {"pos": 2})
+
+        self.assertEqual(os.listdir(self.tmp_dir), ["restore.ckpt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
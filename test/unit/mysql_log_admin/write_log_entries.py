@@ -0,0 +1,328 @@
+# Classification (U)
+
+"""Program:  write_log_entries.py
+
+    Description:  Unit testing of write_log_entries in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_log_entries.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import binlog_reader                            # pylint:disable=E0401,C0413
+import binlog_filter                            # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-s": "start", "-t": "stop", "-p": "/dir/path"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_follow
+        test_mirror
+        test_single_binlog
+        test_workers
+        test_chunks
+        test_filter
+        test_bloom
+        test_write_log_entries
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.binlog_list = ["binlog1", "binlog2"]
+        self.opt_arg_list = ["--force-read"]
+        self.pos_args = ["--start-position=120"]
+        self.out = "Out"
+        self.logs = [{"Log_name": "binlog1", "File_size": 1000},
+                     {"Log_name": "binlog2", "File_size": 500}]
+        self.sizes = {"binlog1": 1000, "binlog2": 500}
+
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_display.follow_log_entries")
+    def test_follow(self, mock_follow, mock_fetch):
+
+        """Function:  test_follow
+
+        Description:  Test with the binary logs followed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-w"] = True
+
+        binlog_display.write_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_follow.assert_called_once_with(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+        mock_fetch.assert_not_called()
+
+    @mock.patch("binlog_display.copy_binlog")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    @mock.patch("binlog_fetch.sync_mirror")
+    def test_mirror(self, mock_sync, mock_fetch, mock_copy):
+
+        """Function:  test_mirror
+
+        Description:  Test with the mirrored binary log read locally and the
+            active binary log read from the server.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = "Lines"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "binlog1"), "wb") as f_hdlr:
+                f_hdlr.write(b"")
+
+            mock_sync.return_value = tmp_dir
+
+            binlog_display.write_log_entries(
+                self.server, self.args, self.binlog_list, self.opt_arg_list,
+                self.pos_args, self.out)
+
+        mock_fetch.assert_has_calls([
+            mock.call(
+                self.server, opt_arg_list=self.opt_arg_list + self.pos_args,
+                start_dt="start", stop_dt="stop", binlog_files=["binlog1"],
+                bin_path="/dir/path", binlog_dir=tmp_dir),
+            mock.call(
+                self.server, opt_arg_list=self.opt_arg_list,
+                start_dt="start", stop_dt="stop", binlog_files=["binlog2"],
+                bin_path="/dir/path", binlog_dir=None)])
+        self.assertEqual(mock_copy.call_count, 2)
+
+    @mock.patch("binlog_display.mysql_libs.fetch_logs",
+                mock.Mock(return_value=[]))
+    @mock.patch("binlog_display.copy_binlog")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_single_binlog(self, mock_fetch, mock_copy):
+
+        """Function:  test_single_binlog
+
+        Description:  Test with workers and a single binary log.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = "4"
+        mock_fetch.return_value = "Lines"
+
+        binlog_display.write_log_entries(
+            self.server, self.args, self.binlog_list[:1], self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_copy.assert_called_once_with("Lines", self.out)
+
+    @mock.patch("binlog_display.mysql_libs.fetch_logs")
+    @mock.patch("binlog_display.merge_binlogs")
+    def test_workers(self, mock_merge, mock_logs):
+
+        """Function:  test_workers
+
+        Description:  Test with binary logs decoded at the same time within
+            the -M memory budget.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = "4"
+        self.args.args_array["-M"] = "256"
+        mock_logs.return_value = self.logs
+
+        binlog_display.write_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_merge.assert_called_once_with(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out, None, [], {}, self.sizes, None)
+
+    @mock.patch("binlog_display.mysql_libs.fetch_logs")
+    @mock.patch("binlog_display.merge_binlogs")
+    @mock.patch("binlog_reader.chunk_binlogs")
+    def test_chunks(self, mock_chunk, mock_merge, mock_logs):
+
+        """Function:  test_chunks
+
+        Description:  Test that a single binary log split into ranges is
+            decoded at the same time.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = "4"
+        mock_logs.return_value = self.logs
+        mock_chunk.return_value = {"binlog1": [(120, 500), (500, None)]}
+
+        binlog_display.write_log_entries(
+            self.server, self.args, self.binlog_list[:1], self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_chunk.assert_called_once_with(
+            self.args, self.binlog_list[:1], self.sizes, self.pos_args, [])
+        mock_merge.assert_called_once_with(
+            self.server, self.args, self.binlog_list[:1], self.opt_arg_list,
+            self.pos_args, self.out, None, [],
+            {"binlog1": [(120, 500), (500, None)]}, self.sizes, None)
+
+    @mock.patch("binlog_filter.filter_binlog")
+    @mock.patch("binlog_display.copy_binlog")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_filter(self, mock_fetch, mock_copy, mock_filter):
+
+        """Function:  test_filter
+
+        Description:  Test that the lines the filter keeps are written.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-B"] = ["shop"]
+        mock_fetch.return_value = "Lines"
+        mock_filter.return_value = "Kept"
+
+        binlog_display.write_log_entries(
+            self.server, self.args, self.binlog_list[:1], self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_filter.assert_called_once_with("Lines", {"dbs": ["shop"]})
+        mock_copy.assert_called_once_with("Kept", self.out)
+
+    @mock.patch("binlog_filter.prune_bloom_binlogs")
+    @mock.patch("binlog_display.copy_binlog")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_bloom(self, mock_fetch, mock_copy, mock_prune):
+
+        """Function:  test_bloom
+
+        Description:  Test that only the binary logs the Bloom filters do not
+            rule out are read.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-K"] = ["shop.orders"]
+        mock_fetch.return_value = "Lines"
+        mock_prune.return_value = (["binlog2"], [], [])
+
+        binlog_display.write_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_prune.assert_called_once_with(
+            self.server, self.args, self.binlog_list, self.pos_args, [],
+            None)
+        mock_fetch.assert_called_once_with(
+            self.server, opt_arg_list=self.opt_arg_list, start_dt="start",
+            stop_dt="stop", binlog_files=["binlog2"], bin_path="/dir/path",
+            binlog_dir=None)
+        mock_copy.assert_called_once()
+
+    @mock.patch("binlog_display.copy_binlog")
+    @mock.patch("binlog_fetch.fetch_binlog")
+    def test_write_log_entries(self, mock_fetch, mock_copy):
+
+        """Function:  test_write_log_entries
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        mock_fetch.return_value = "Lines"
+
+        binlog_display.write_log_entries(
+            self.server, self.args, self.binlog_list, self.opt_arg_list,
+            self.pos_args, self.out)
+
+        mock_fetch.assert_called_once_with(
+            self.server, opt_arg_list=self.opt_arg_list + self.pos_args,
+            start_dt="start", stop_dt="stop", binlog_files=self.binlog_list,
+            bin_path="/dir/path", binlog_dir=None)
+        mock_copy.assert_called_once_with("Lines", self.out)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  write_packet.py
+
+    Description:  Unit testing of write_packet in binlog_stream.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_packet.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_stream                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_seq_wrap
+        test_write_packet
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.payload = b"\x00event"
+
+    def test_seq_wrap(self):
+
+        """Function:  test_seq_wrap
+
+        Description:  Test with a sequence number over 255.
+
+        Arguments:
+
+        """
+
+        conn = io.BytesIO()
+        binlog_stream.write_packet(conn, self.payload, 257)
+
+        self.assertEqual(conn.getvalue()[3], 1)
+
+    def test_write_packet(self):
+
+        """Function:  test_write_packet
+
+        Description:  Test with a packet written.
+
+        Arguments:
+
+        """
+
+        conn = io.BytesIO()
+        binlog_stream.write_packet(conn, self.payload, 2)
+
+        self.assertEqual(conn.getvalue(), b"\x06\x00\x00\x02" + self.payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  write_spool.py
+
+    Description:  Unit testing of write_spool in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_spool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import binlog_fetch                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_range
+        test_small_blocks
+        test_write_spool
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.spool = io.BytesIO(b"0123456789")
+        self.out = io.BytesIO()
+
+    def test_range(self):
+
+        """Function:  test_range
+
+        Description:  Test copying a range with no edits.
+
+        Arguments:
+
+        """
+
+        binlog_display.write_spool(self.spool, self.out, 2, 8)
+
+        self.assertEqual(self.out.getvalue(), b"234567")
+
+    @mock.patch("binlog_fetch.COPY_BYTES", 3)
+    def test_small_blocks(self):
+
+        """Function:  test_small_blocks
+
+        Description:  Test copying in blocks smaller than the range.
+
+        Arguments:
+
+        """
+
+        binlog_display.write_spool(
+            self.spool, self.out, 0, 10, [(4, 5, b"x")])
+
+        self.assertEqual(self.out.getvalue(), b"0123x56789")
+
+    def test_write_spool(self):
+
+        """Function:  test_write_spool
+
+        Description:  Test copying a range with edits.
+
+        Arguments:
+
+        """
+
+        binlog_display.write_spool(
+            self.spool, self.out, 1, 9, [(2, 4, b""), (6, 7, b"ab")])
+
+        self.assertEqual(self.out.getvalue(), b"145ab78")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# Classification (U)
+
+"""Program:  write_spools.py
+
+    Description:  Unit testing of write_spools in binlog_display.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_spools.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_display                           # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_single_run
+        test_write_spools
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.out = io.BytesIO()
+        self.mode = b"SET @@session.sql_mode=0/*!*/;\n"
+
+    def spool(self, data):
+
+        """Function:  spool
+
+        Description:  Create a spool file positioned at its end.
+
+        Arguments:
+            (input) data -> Spool file contents
+
+        """
+
+        spool = io.BytesIO(data)
+        spool.seek(0, io.SEEK_END)
+
+        return spool
+
+    def test_single_run(self):
+
+        """Function:  test_single_run
+
+        Description:  Test that a single run is written whole.
+
+        Arguments:
+
+        """
+
+        binlog_display.write_spools(
+            [(self.spool(b"head|body|tail"), 5, 10, ({}, {}))], self.out, 1)
+
+        self.assertEqual(self.out.getvalue(), b"head|body|tail")
+
+    def test_write_spools(self):
+
+        """Function:  test_write_spools
+
+        Description:  Test that the header, trailer and repeated session
+            lines of the runs are dropped.
+
+        Arguments:
+
+        """
+
+        first = b"H|" + self.mode + b"a|T"
+        second = b"H|" + self.mode + b"b|T"
+        session = ({b"sql_mode": (2, 2 + len(self.mode), self.mode)},
+                   {b"sql_mode": self.mode})
+
+        binlog_display.write_spools(
+            [(self.spool(first), 2, len(first) - 1, session),
+             (self.spool(second), 2, len(second) - 1, session)],
+            self.out, 2)
+
+        self.assertEqual(
+            self.out.getvalue(), b"H|" + self.mode + b"a|b|T")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Classification (U)
+
+"""Program:  write_target.py
+
+    Description:  Unit testing of write_target in binlog_tee.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_target.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import queue
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_tee                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exited
+        test_write_target
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tee = {"blocks": queue.Queue(), "held": 12, "max": 100,
+                    "cond": threading.Condition()}
+
+        for block in [b"block1", b"block2", None]:
+            self.tee["blocks"].put(block)
+
+    def test_exited(self):
+
+        """Function:  test_exited
+
+        Description:  Test that the blocks are dropped after the mysql
+            client exits.
+
+        Arguments:
+
+        """
+
+        proc = mock.Mock()
+        proc.stdin.write.side_effect = BrokenPipeError
+        proc.stdin.close.side_effect = BrokenPipeError
+        binlog_tee.write_target(proc, self.tee)
+
+        proc.stdin.write.assert_called_once_with(b"block1")
+        self.assertTrue(self.tee["blocks"].empty())
+        self.assertEqual(self.tee["held"], 0)
+
+    def test_write_target(self):
+
+        """Function:  test_write_target
+
+        Description:  Test that the blocks are written, their bytes are
+            released and the pipe is closed.
+
+        Arguments:
+
+        """
+
+        proc = mock.Mock(stdin=io.BytesIO())
+        proc.stdin.close = mock.Mock()
+        binlog_tee.write_target(proc, self.tee)
+
+        self.assertEqual(proc.stdin.getvalue(), b"block1block2")
+        self.assertEqual(self.tee["held"], 0)
+        proc.stdin.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  write_workload.py
+
+    Description:  Unit testing of write_workload in binlog_workload.py.
+
+    Usage:
+        test/unit/mysql_log_admin/write_workload.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import binlog_workload                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_json
+        test_write_workload
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.report = {
+            "minutes": [{"minute": "2024-01-01 10:00", "events": 3,
+                         "transactions": 1, "rows": 4, "bytes": 200}],
+            "types": [{"type": "Write_rows", "events": 2, "bytes": 140}],
+            "tables": [{"table": "shop.orders", "events": 1, "rows": 3,
+                        "bytes": 100}],
+            "transaction_sizes": [
+                {"max_bytes": 255, "transactions": 1, "bytes": 230}],
+            "undecoded_rows_events": 2}
+        self.out = io.StringIO()
+
+    def test_json(self):
+
+        """Function:  test_json
+
+        Description:  Test with the JSON report.
+
+        Arguments:
+
+        """
+
+        binlog_workload.write_workload(self.report, self.out)
+
+        self.assertEqual(json.loads(self.out.getvalue()), self.report)
+
+    def test_write_workload(self):
+
+        """Function:  test_write_workload
+
+        Description:  Test with the CSV report.
+
+        Arguments:
+
+        """
+
+        binlog_workload.write_workload(self.report, self.out, "csv")
+
+        self.assertEqual(
+            self.out.getvalue(),
+            "section,key,events,transactions,rows,bytes\n"
+            "minute,2024-01-01 10:00,3,1,4,200\n"
+            "type,Write_rows,2,,,140\n"
+            "table,shop.orders,1,,3,100\n"
+            "size,255,,1,,230\n"
+            "undecoded,,2,,,\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
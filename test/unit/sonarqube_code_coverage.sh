@@ -4,19 +4,22 @@
 # This will show the amount of code that was tested and which lines of code
 #       that was skipped during the test.
 
+# Program modules.
+SOURCE=mysql_log_admin,binlog_reader,binlog_stream,binlog_filter,binlog_fetch,binlog_search,binlog_display,binlog_tee,binlog_apply,binlog_restore,binlog_catalog,binlog_workload,binlog_service
+
 coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/fetch_binlog.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/fetch_log_entries.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/fetch_log_pos.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/find_dt_pos.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/help_message.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/load_log.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/main.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/process_logs_list.py
-coverage run -a --source=mysql_log_admin test/unit/mysql_log_admin/run_program.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_binlog.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_log_entries.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/fetch_log_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/find_dt_pos.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/help_message.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/load_log.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/main.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/process_logs_list.py
+coverage run -a --source=$SOURCE test/unit/mysql_log_admin/run_program.py
 
 echo ""
 echo "Producing code coverage report"